@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the observation rate and latency between the LeKiwi host and client, over the loopback interface.
+
+The host side is `LeKiwiHost.send_observation` fed with synthetic camera frames at a fixed rate, and the client
+side is `LeKiwiClient.get_observation` called in a loop, so that both the JSON and binary protocols run the code
+of the robot.
+
+See the provided README.md or run `python benchmarks/lekiwi/transport_benchmark.py --help` for usage info.
+"""
+
+import argparse
+import threading
+import time
+
+import numpy as np
+
+from lerobot.cameras.opencv.configuration_opencv import OpenCVCameraConfig
+from lerobot.robots.lekiwi import LeKiwiClient, LeKiwiClientConfig
+from lerobot.robots.lekiwi.config_lekiwi import LeKiwiHostConfig
+from lerobot.robots.lekiwi.lekiwi_host import LeKiwiHost
+from lerobot.utils.robot_utils import RateScheduler
+
+# The state value carrying the sequence number of the observation, to match sent and received observations
+SEQ_KEY = "arm_gripper.pos"
+
+
+def make_frames(num_frames: int, height: int, width: int, seed: int = 0) -> list[np.ndarray]:
+    """Camera-like frames: a smooth background with sensor noise and a moving object, which JPEG compresses
+    about as well as real images (unlike uniformly random frames)."""
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:height, 0:width]
+    background = np.stack([x * 255 / width, y * 255 / height, (x + y) * 127 / (width + height)], axis=-1)
+    frames = []
+    for i in range(num_frames):
+        frame = background + rng.normal(0, 4, background.shape)
+        cx = int((i / num_frames) * (width - width // 4))
+        frame[height // 3 : height // 3 + height // 4, cx : cx + width // 4] = (200, 40, 40)
+        frames.append(np.clip(frame, 0, 255).astype(np.uint8))
+    return frames
+
+
+def run(args: argparse.Namespace, protocol: str, port: int) -> dict[str, float]:
+    camera_keys = [f"camera_{i}" for i in range(args.num_cameras)]
+    cameras = {
+        key: OpenCVCameraConfig(index_or_path=i, fps=args.fps, width=args.width, height=args.height)
+        for i, key in enumerate(camera_keys)
+    }
+    host = LeKiwiHost(
+        LeKiwiHostConfig(
+            port_zmq_cmd=port,
+            port_zmq_observations=port + 1,
+            protocol=protocol,
+            jpeg_quality=args.jpeg_quality,
+            encoder_workers=args.workers,
+        )
+    )
+    client = LeKiwiClient(
+        LeKiwiClientConfig(
+            remote_ip="127.0.0.1",
+            port_zmq_cmd=port,
+            port_zmq_observations=port + 1,
+            cameras=cameras,
+            protocol=protocol,
+            decoder_workers=args.workers,
+            polling_timeout_ms=int(1e3 / args.fps),
+        )
+    )
+    frames = make_frames(args.fps, args.height, args.width)
+    capture_times: dict[int, float] = {}
+    encode_times: list[float] = []
+    stop = threading.Event()
+
+    def stream():
+        scheduler = RateScheduler(args.fps)
+        seq = 0
+        while not stop.is_set():
+            capture_times[seq] = time.perf_counter()
+            observation = dict.fromkeys(client._state_order, 0.0)
+            observation[SEQ_KEY] = float(seq)
+            for key in camera_keys:
+                observation[key] = frames[seq % len(frames)]
+            host.send_observation(observation, camera_keys)
+            encode_times.append(time.perf_counter() - capture_times[seq])
+            seq += 1
+            scheduler.wait()
+
+    streamer = threading.Thread(target=stream, daemon=True)
+    streamer.start()
+    client.connect()
+
+    latencies = []
+    last_seq = None
+    start = time.perf_counter()
+    while time.perf_counter() - start < args.duration_s:
+        obs = client.get_observation()
+        seq = int(obs[SEQ_KEY])
+        if seq != last_seq:
+            latencies.append(time.perf_counter() - capture_times[seq])
+            last_seq = seq
+    elapsed_s = time.perf_counter() - start
+
+    stop.set()
+    streamer.join()
+    client.disconnect()
+    host.disconnect()
+
+    latencies_ms = np.array(latencies) * 1e3
+    return {
+        "hz": len(latencies) / elapsed_s,
+        "encode_ms": float(np.mean(encode_times) * 1e3),
+        "p50_ms": float(np.percentile(latencies_ms, 50)),
+        "p99_ms": float(np.percentile(latencies_ms, 99)),
+    }
+
+
+def main(args: argparse.Namespace):
+    print(
+        f"{args.num_cameras} cameras at {args.width}x{args.height}, {args.fps} fps, JPEG quality "
+        f"{args.jpeg_quality}, {args.workers} codec workers"
+    )
+    print(f"{'protocol':<10}{'Hz':>8}{'host (ms)':>11}{'p50 (ms)':>10}{'p99 (ms)':>10}")
+    for i, protocol in enumerate(args.protocols):
+        r = run(args, protocol, args.port + 2 * i)
+        print(f"{protocol:<10}{r['hz']:>8.1f}{r['encode_ms']:>11.2f}{r['p50_ms']:>10.2f}{r['p99_ms']:>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--protocols", nargs="+", choices=["json", "binary"], default=["json", "binary"], help="Protocols."
+    )
+    parser.add_argument("--num-cameras", type=int, default=2, help="Number of cameras.")
+    parser.add_argument("--width", type=int, default=640, help="Frame width.")
+    parser.add_argument("--height", type=int, default=480, help="Frame height.")
+    parser.add_argument("--fps", type=int, default=30, help="Rate at which the host sends observations.")
+    parser.add_argument("--jpeg-quality", type=int, default=90, help="JPEG quality of the camera images.")
+    parser.add_argument(
+        "--workers", type=int, default=0, help="Threads (de)compressing the images on each side."
+    )
+    parser.add_argument("--duration-s", type=float, default=5.0, help="Duration of each run.")
+    parser.add_argument("--port", type=int, default=5655, help="First of the loopback ports to use.")
+    main(parser.parse_args())
@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the rate and latency of the teleop, record and replay control loops on simulated motor buses.
+
+The follower and leader arms are the real robot and teleoperator classes, with their motor buses attached to
+a `ServoBusSimulator`: every `sync_read` and `sync_write` goes through the vendor SDK and the simulated wire,
+at the bus baud rate and with the configured USB latency, jitter and packet loss.
+
+See the provided README.md or run `python benchmarks/motors/control_loop_benchmark.py --help` for usage info.
+"""
+
+import argparse
+import math
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+
+from lerobot.motors import MotorCalibration
+from lerobot.motors.simulated_bus import LinkModel, simulate_bus
+from lerobot.processor import make_default_processors
+from lerobot.robots.koch_follower import KochFollower, KochFollowerConfig
+from lerobot.robots.so101_follower import SO101Follower, SO101FollowerConfig
+from lerobot.scripts.lerobot_record import record_loop
+from lerobot.teleoperators.koch_leader import KochLeader, KochLeaderConfig
+from lerobot.teleoperators.so101_leader import SO101Leader, SO101LeaderConfig
+from lerobot.utils.robot_utils import RateScheduler
+
+ARMS = {
+    "so101": (SO101Follower, SO101FollowerConfig, SO101Leader, SO101LeaderConfig),
+    "koch": (KochFollower, KochFollowerConfig, KochLeader, KochLeaderConfig),
+}
+
+
+def attach_simulator(device, link: LinkModel, baudrate: int | None):
+    """Simulates the bus of a robot or teleoperator, with motors calibrated over their full range."""
+    bus = device.bus
+    if baudrate is not None:
+        bus.default_baudrate = baudrate
+    simulator = simulate_bus(bus, link)
+    calibration = {
+        motor: MotorCalibration(
+            id=m.id,
+            drive_mode=0,
+            homing_offset=0,
+            range_min=0,
+            range_max=bus.model_resolution_table[m.model] - 1,
+        )
+        for motor, m in bus.motors.items()
+    }
+    device.calibration = calibration
+    bus.calibration = calibration
+    return simulator
+
+
+class LoopStats:
+    """Times the iterations of a control loop."""
+
+    def __init__(self):
+        self.periods: list[float] = []
+        self.latencies: list[float] = []
+        self.errors = 0
+
+    def summary(self) -> dict[str, float]:
+        periods_ms = np.array(self.periods) * 1e3
+        latencies_ms = np.array(self.latencies) * 1e3
+        return {
+            "hz": 1e3 / periods_ms.mean(),
+            "p50_ms": np.percentile(latencies_ms, 50),
+            "p99_ms": np.percentile(latencies_ms, 99),
+            "max_ms": latencies_ms.max(),
+            "jitter_ms": periods_ms.std(),
+            "errors": self.errors,
+        }
+
+
+def run_loop(step: Callable[[], None], fps: int, duration_s: float) -> LoopStats:
+    """Runs `step` at `fps` like the control scripts do, recording the step latency and the loop period."""
+    stats = LoopStats()
+    loop_starts = []
+    scheduler = RateScheduler(fps)
+    start = time.perf_counter()
+    while time.perf_counter() - start < duration_s:
+        loop_start = time.perf_counter()
+        loop_starts.append(loop_start)
+        try:
+            step()
+        except ConnectionError:
+            stats.errors += 1
+        stats.latencies.append(time.perf_counter() - loop_start)
+        scheduler.wait()
+    stats.periods = list(np.diff(loop_starts))
+    return stats
+
+
+def run(args: argparse.Namespace, fps: int, calibration_dir: Path) -> dict[str, dict[str, float]]:
+    follower_cls, follower_config_cls, leader_cls, leader_config_cls = ARMS[args.arm]
+    follower = follower_cls(
+        follower_config_cls(port="/dev/simulated-follower", id="benchmark", calibration_dir=calibration_dir)
+    )
+    leader = leader_cls(
+        leader_config_cls(port="/dev/simulated-leader", id="benchmark", calibration_dir=calibration_dir)
+    )
+    link = LinkModel(usb_latency_ms=args.usb_latency_ms, jitter_ms=args.jitter_ms, seed=0)
+    attach_simulator(follower, link, args.baudrate)
+    attach_simulator(leader, link, args.baudrate)
+    follower.connect(calibrate=False)
+    leader.connect(calibrate=False)
+    # Packets are only lost during the loops, not while the arms are configured or disconnected
+    link.loss_rate = args.loss_rate
+    teleop_action_processor, robot_action_processor, robot_observation_processor = make_default_processors()
+
+    def teleop_step():
+        # Same bus traffic as `teleop_loop`
+        obs = follower.get_observation()
+        action = teleop_action_processor((leader.get_action(), obs))
+        follower.send_action(robot_action_processor((action, obs)))
+
+    def replay_step():
+        # Same bus traffic as `lerobot-replay`: the actions come from a dataset instead of a leader arm
+        t = time.perf_counter()
+        action = {key: 20 * math.sin(t + i) for i, key in enumerate(follower.action_features)}
+        obs = follower.get_observation()
+        follower.send_action(robot_action_processor((action, obs)))
+
+    results = {
+        "teleop": run_loop(teleop_step, fps, args.duration_s).summary(),
+        "replay": run_loop(replay_step, fps, args.duration_s).summary(),
+    }
+
+    # The record loop is run as is, without a dataset (see benchmarks/record for the dataset side)
+    stats = LoopStats()
+    get_observation = follower.get_observation
+
+    def timed_get_observation():
+        stats.periods.append(time.perf_counter())
+        return get_observation()
+
+    follower.get_observation = timed_get_observation
+    send_action = follower.send_action
+
+    def timed_send_action(action):
+        sent = send_action(action)
+        stats.latencies.append(time.perf_counter() - stats.periods[-1])
+        return sent
+
+    follower.send_action = timed_send_action
+    events = {"exit_early": False, "rerecord_episode": False, "stop_recording": False}
+    try:
+        record_loop(
+            robot=follower,
+            events=events,
+            fps=fps,
+            teleop_action_processor=teleop_action_processor,
+            robot_action_processor=robot_action_processor,
+            robot_observation_processor=robot_observation_processor,
+            teleop=leader,
+            control_time_s=args.duration_s,
+        )
+    except ConnectionError:
+        # Like `lerobot-record`, the record loop stops at the first communication error
+        stats.errors += 1
+        stats.periods = stats.periods[: len(stats.latencies)]
+    stats.periods = list(np.diff(stats.periods))
+    results["record"] = stats.summary()
+
+    link.loss_rate = 0.0
+    follower.disconnect()
+    leader.disconnect()
+    return results
+
+
+def main(args: argparse.Namespace):
+    print(
+        f"{args.arm} arms, baud rate {args.baudrate or 'default'}, USB latency {args.usb_latency_ms}ms "
+        f"(jitter {args.jitter_ms}ms), loss rate {args.loss_rate}"
+    )
+    print(
+        f"{'loop':<8}{'fps':>6}{'Hz':>9}{'p50 (ms)':>10}{'p99 (ms)':>10}{'max (ms)':>10}"
+        f"{'jitter (ms)':>13}{'errors':>8}"
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for fps in args.fps:
+            for loop, r in run(args, fps, Path(tmp_dir)).items():
+                print(
+                    f"{loop:<8}{fps:>6}{r['hz']:>9.1f}{r['p50_ms']:>10.2f}{r['p99_ms']:>10.2f}"
+                    f"{r['max_ms']:>10.2f}{r['jitter_ms']:>13.2f}{r['errors']:>8}"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--arm", choices=list(ARMS), default="so101", help="Follower and leader arms.")
+    parser.add_argument(
+        "--fps",
+        type=int,
+        nargs="+",
+        default=[30, 100, 1000],
+        help="Loop frame rates to measure, in turn. A high value measures the highest achievable rate.",
+    )
+    parser.add_argument(
+        "--baudrate", type=int, default=None, help="Bus baud rate. Defaults to that of the motors bus."
+    )
+    parser.add_argument(
+        "--usb-latency-ms", type=float, default=0.5, help="One-way latency of the USB-serial adapter."
+    )
+    parser.add_argument("--jitter-ms", type=float, default=0.1, help="Standard deviation of the USB latency.")
+    parser.add_argument("--loss-rate", type=float, default=0.0, help="Probability to lose a status packet.")
+    parser.add_argument("--duration-s", type=float, default=3.0, help="Duration of each loop.")
+    main(parser.parse_args())
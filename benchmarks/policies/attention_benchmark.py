@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compare the latency of the eager and SDPA attention backends of pi0, pi05 and SmolVLA at inference.
+
+The attention layers are run with random inputs of the shapes of the default configurations, with the masks
+built by the policies, so that no pretrained weights are needed: the prefix attention runs once per action
+chunk and the suffix attention once per denoising step, in every layer.
+
+See the provided README.md or run `python benchmarks/policies/attention_benchmark.py --help` for usage info.
+"""
+
+import argparse
+import time
+from types import SimpleNamespace
+
+import torch
+from transformers.integrations.sdpa_attention import sdpa_attention_forward
+from transformers.models.gemma.modeling_gemma import eager_attention_forward
+
+from lerobot.policies.pi0.modeling_pi0 import make_att_2d_masks
+from lerobot.policies.smolvla.smolvlm_with_expert import SmolVLMWithExpertModel
+from lerobot.utils.constants import OPENPI_ATTENTION_MASK_VALUE
+
+# num_heads, num_kv_heads, head_dim, num_layers, number of prefix tokens, number of suffix tokens
+POLICIES = {
+    # 3 cameras of 256 SigLIP tokens and 48 language tokens, then the state and 50 action tokens
+    "pi0": (8, 1, 256, 18, 3 * 256 + 48, 51),
+    # 3 cameras and 200 tokens of language and discretized state, then 50 action tokens
+    "pi05": (8, 1, 256, 18, 3 * 256 + 200, 50),
+    # 3 cameras of 64 tokens, 48 language tokens and the state, then 50 action tokens
+    "smolvla": (15, 5, 64, 16, 3 * 64 + 48 + 1, 50),
+}
+
+
+def make_masks(batch_size: int, prefix_len: int, suffix_len: int) -> tuple[torch.Tensor, torch.Tensor]:
+    """Boolean masks of the prefix and suffix attentions, with 10 padded language tokens."""
+    pad_masks = torch.ones(batch_size, prefix_len + suffix_len, dtype=torch.bool)
+    pad_masks[:, prefix_len - 10 : prefix_len] = False
+    att_masks = torch.zeros(batch_size, prefix_len + suffix_len, dtype=torch.bool)
+    att_masks[:, prefix_len] = True
+    masks = make_att_2d_masks(pad_masks, att_masks)
+    return masks[:, :prefix_len, :prefix_len], masks[:, prefix_len:]
+
+
+def time_ms(fn, num_iters: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(num_iters):
+        fn()
+    return (time.perf_counter() - start) / num_iters * 1e3
+
+
+def make_attention_fn(
+    policy: str, implementation: str, mask: torch.Tensor, num_heads, num_kv_heads, head_dim
+):
+    """Attention of one layer over random inputs, as called by the policy for the given `mask`."""
+    batch_size, query_len, key_len = mask.shape
+    if policy == "smolvla":
+        model = SimpleNamespace(num_attention_heads=num_heads, num_key_value_heads=num_kv_heads)
+        query = torch.randn(batch_size, query_len, num_heads, head_dim)
+        key, value = torch.randn(2, batch_size, key_len, num_kv_heads, head_dim)
+        forward = getattr(SmolVLMWithExpertModel, f"{implementation}_attention_forward")
+        return lambda: forward(model, mask, batch_size, head_dim, query, key, value)
+
+    # pi0 and pi05 call the attention of the transformers Gemma models, with an additive mask
+    module = SimpleNamespace(num_key_value_groups=num_heads // num_kv_heads, training=False, is_causal=False)
+    query = torch.randn(batch_size, num_heads, query_len, head_dim)
+    key, value = torch.randn(2, batch_size, num_kv_heads, key_len, head_dim)
+    additive_mask = torch.where(mask[:, None], 0.0, OPENPI_ATTENTION_MASK_VALUE)
+    forward = eager_attention_forward if implementation == "eager" else sdpa_attention_forward
+    return lambda: forward(module, query, key, value, additive_mask, scaling=head_dim**-0.5)
+
+
+def main(args: argparse.Namespace):
+    torch.set_num_threads(args.num_threads)
+    print(
+        f"batch size {args.batch_size}, {args.num_steps} denoising steps, {torch.get_num_threads()} threads"
+    )
+    print(f"{'policy':<9}{'backend':<8}{'prefix (ms)':>12}{'step (ms)':>11}{'chunk (ms)':>12}{'speedup':>9}")
+    for policy in args.policies:
+        num_heads, num_kv_heads, head_dim, num_layers, prefix_len, suffix_len = POLICIES[policy]
+        prefix_mask, suffix_mask = make_masks(args.batch_size, prefix_len, suffix_len)
+        eager_chunk_ms = None
+        with torch.no_grad():
+            for implementation in ["eager", "sdpa"]:
+                prefix_ms, step_ms = (
+                    time_ms(
+                        make_attention_fn(policy, implementation, mask, num_heads, num_kv_heads, head_dim),
+                        args.num_iters,
+                    )
+                    for mask in [prefix_mask, suffix_mask]
+                )
+                chunk_ms = num_layers * (prefix_ms + args.num_steps * step_ms)
+                eager_chunk_ms = eager_chunk_ms or chunk_ms
+                print(
+                    f"{policy:<9}{implementation:<8}{num_layers * prefix_ms:>12.2f}{num_layers * step_ms:>11.2f}"
+                    f"{chunk_ms:>12.2f}{eager_chunk_ms / chunk_ms:>8.2f}x"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--policies", nargs="+", choices=list(POLICIES), default=list(POLICIES), help="Policies to benchmark."
+    )
+    parser.add_argument("--batch-size", type=int, default=1, help="Batch size.")
+    parser.add_argument("--num-steps", type=int, default=10, help="Number of denoising steps per chunk.")
+    parser.add_argument("--num-iters", type=int, default=20, help="Number of timed calls of each attention.")
+    parser.add_argument("--num-threads", type=int, default=torch.get_num_threads(), help="CPU threads.")
+    main(parser.parse_args())
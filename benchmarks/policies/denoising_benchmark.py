@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the latency of an action chunk of pi0, pi05 or SmolVLA, with and without `compile_denoising`.
+
+The policy is built from its default configuration with random weights (SmolVLA only downloads the config of
+its VLM) and run on random observations, and the chunks of both modes are checked to match.
+
+See the provided README.md or run `python benchmarks/policies/denoising_benchmark.py --help` for usage info.
+"""
+
+import argparse
+import time
+
+import numpy as np
+import torch
+
+from lerobot.configs.types import FeatureType, PolicyFeature
+from lerobot.utils.constants import ACTION, OBS_STATE
+
+
+def make_policy(name: str, device: str, num_steps: int):
+    features = {
+        "input_features": {
+            OBS_STATE: PolicyFeature(type=FeatureType.STATE, shape=(14,)),
+            **{
+                f"observation.images.camera_{i}": PolicyFeature(type=FeatureType.VISUAL, shape=(3, 224, 224))
+                for i in range(3)
+            },
+        },
+        "output_features": {ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(14,))},
+    }
+    if name == "smolvla":
+        from lerobot.policies.smolvla.configuration_smolvla import SmolVLAConfig
+        from lerobot.policies.smolvla.modeling_smolvla import SmolVLAPolicy
+
+        config = SmolVLAConfig(device=device, load_vlm_weights=False, num_steps=num_steps, **features)
+        return SmolVLAPolicy(config)
+    if name == "pi0":
+        from lerobot.policies.pi0 import PI0Config, PI0Policy
+
+        config = PI0Config(device=device, num_inference_steps=num_steps, **features)
+        return PI0Policy(config)
+    from lerobot.policies.pi05 import PI05Config, PI05Policy
+
+    config = PI05Config(device=device, num_inference_steps=num_steps, **features)
+    return PI05Policy(config)
+
+
+def make_inputs(policy, batch_size: int, device: str) -> tuple[list, dict]:
+    """Arguments of `sample_actions`, as prepared by the policy from an observation."""
+    config = policy.config
+    resolution = getattr(config, "image_resolution", getattr(config, "resize_imgs_with_padding", None))
+    images = [torch.rand(batch_size, 3, *resolution, device=device) * 2 - 1 for _ in range(3)]
+    img_masks = [torch.ones(batch_size, dtype=torch.bool, device=device) for _ in range(3)]
+    tokens = torch.randint(0, 1000, (batch_size, config.tokenizer_max_length), device=device)
+    masks = torch.ones_like(tokens, dtype=torch.bool)
+    args = [images, img_masks, tokens, masks]
+    if policy.name != "pi05":
+        args.append(torch.randn(batch_size, config.max_state_dim, device=device))
+    noise = torch.randn(batch_size, config.chunk_size, config.max_action_dim, device=device)
+    return args, {"noise": noise}
+
+
+def time_chunks(policy, args: list, kwargs: dict, num_chunks: int) -> tuple[np.ndarray, torch.Tensor]:
+    with torch.no_grad():
+        # The first chunks compile the loop and record the CUDA graphs
+        for _ in range(3):
+            actions = policy.model.sample_actions(*args, **kwargs)
+        latencies = []
+        for _ in range(num_chunks):
+            start = time.perf_counter()
+            actions = policy.model.sample_actions(*args, **kwargs)
+            if actions.is_cuda:
+                torch.cuda.synchronize()
+            latencies.append(time.perf_counter() - start)
+    return np.array(latencies) * 1e3, actions
+
+
+def main(args: argparse.Namespace):
+    torch.manual_seed(0)
+    policy = make_policy(args.policy, args.device, args.num_steps).eval()
+    inputs, kwargs = make_inputs(policy, args.batch_size, args.device)
+
+    eager_ms, eager_actions = time_chunks(policy, inputs, kwargs, args.num_chunks)
+    # Same as setting `compile_denoising` in the configuration, without building the policy again
+    policy.config.compile_denoising = True
+    policy.model.denoise_loop = torch.compile(
+        policy.model.denoise_loop, mode="reduce-overhead", dynamic=False
+    )
+    compiled_ms, compiled_actions = time_chunks(policy, inputs, kwargs, args.num_chunks)
+
+    print(f"{args.policy} on {args.device}, batch size {args.batch_size}, {args.num_steps} denoising steps")
+    print(f"{'mode':<10}{'mean (ms)':>11}{'p50 (ms)':>10}{'p90 (ms)':>10}")
+    for mode, latencies_ms in [("eager", eager_ms), ("compiled", compiled_ms)]:
+        print(
+            f"{mode:<10}{latencies_ms.mean():>11.1f}{np.percentile(latencies_ms, 50):>10.1f}"
+            f"{np.percentile(latencies_ms, 90):>10.1f}"
+        )
+    max_diff = (compiled_actions - eager_actions).abs().max().item()
+    print(f"max absolute difference between the actions of both modes: {max_diff:.2e}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--policy", choices=["smolvla", "pi0", "pi05"], default="smolvla", help="Policy.")
+    parser.add_argument("--device", default="cuda" if torch.cuda.is_available() else "cpu", help="Device.")
+    parser.add_argument("--batch-size", type=int, default=1, help="Batch size.")
+    parser.add_argument("--num-steps", type=int, default=10, help="Number of denoising steps per chunk.")
+    parser.add_argument("--num-chunks", type=int, default=20, help="Number of timed action chunks.")
+    main(parser.parse_args())
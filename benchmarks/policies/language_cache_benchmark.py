@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the latency of the prefix embedding and of an action chunk of pi0, with and without the language
+embeddings cached by task.
+
+The policy is built from its default configuration with random weights and run on random observations with the
+same task for all the chunks, and the chunks of both modes are checked to match.
+
+See the provided README.md or run `python benchmarks/policies/language_cache_benchmark.py --help` for usage info.
+"""
+
+import argparse
+import time
+
+import numpy as np
+import torch
+
+from lerobot.configs.types import FeatureType, PolicyFeature
+from lerobot.policies.pi0 import PI0Config, PI0Policy
+from lerobot.utils.constants import ACTION, OBS_STATE
+
+
+def make_inputs(config: PI0Config, batch_size: int, device: str) -> tuple[list, dict]:
+    """Arguments of `sample_actions`, as prepared by the policy from an observation."""
+    images = [torch.rand(batch_size, 3, *config.image_resolution, device=device) * 2 - 1 for _ in range(3)]
+    img_masks = [torch.ones(batch_size, dtype=torch.bool, device=device) for _ in range(3)]
+    tokens = torch.randint(0, 1000, (batch_size, config.tokenizer_max_length), device=device)
+    masks = torch.ones_like(tokens, dtype=torch.bool)
+    state = torch.randn(batch_size, config.max_state_dim, device=device)
+    noise = torch.randn(batch_size, config.chunk_size, config.max_action_dim, device=device)
+    return [images, img_masks, tokens, masks, state], {"noise": noise}
+
+
+def time_calls(fn, num_calls: int) -> tuple[np.ndarray, object]:
+    with torch.no_grad():
+        output = fn()
+        latencies = []
+        for _ in range(num_calls):
+            start = time.perf_counter()
+            output = fn()
+            if torch.cuda.is_available():
+                torch.cuda.synchronize()
+            latencies.append(time.perf_counter() - start)
+    return np.array(latencies) * 1e3, output
+
+
+def main(args: argparse.Namespace):
+    torch.manual_seed(0)
+    features = {
+        "input_features": {
+            OBS_STATE: PolicyFeature(type=FeatureType.STATE, shape=(14,)),
+            **{
+                f"observation.images.camera_{i}": PolicyFeature(type=FeatureType.VISUAL, shape=(3, 224, 224))
+                for i in range(3)
+            },
+        },
+        "output_features": {ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(14,))},
+    }
+    config = PI0Config(device=args.device, num_inference_steps=args.num_steps, **features)
+    model = PI0Policy(config).eval().model
+    inputs, kwargs = make_inputs(config, args.batch_size, args.device)
+    tasks = ["Pick up the cube and place it in the box"] * args.batch_size
+
+    results = {}
+    for mode, mode_tasks in [("uncached", None), ("cached", tasks)]:
+        model.clear_language_cache()
+        prefix_ms, _ = time_calls(lambda t=mode_tasks: model.embed_prefix(*inputs[:4], t), args.num_chunks)
+        chunk_ms, actions = time_calls(
+            lambda t=mode_tasks: model.sample_actions(*inputs, **kwargs, tasks=t), args.num_chunks
+        )
+        results[mode] = (prefix_ms, chunk_ms, actions)
+
+    print(f"pi0 on {args.device}, batch size {args.batch_size}, {args.num_steps} denoising steps")
+    print(f"{'mode':<10}{'prefix mean (ms)':>18}{'chunk mean (ms)':>17}{'chunk p90 (ms)':>16}")
+    for mode, (prefix_ms, chunk_ms, _) in results.items():
+        print(
+            f"{mode:<10}{prefix_ms.mean():>18.2f}{chunk_ms.mean():>17.1f}{np.percentile(chunk_ms, 90):>16.1f}"
+        )
+    max_diff = (results["cached"][2] - results["uncached"][2]).abs().max().item()
+    print(f"max absolute difference between the actions of both modes: {max_diff:.2e}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--device", default="cuda" if torch.cuda.is_available() else "cpu", help="Device.")
+    parser.add_argument("--batch-size", type=int, default=1, help="Batch size.")
+    parser.add_argument("--num-steps", type=int, default=10, help="Number of denoising steps per chunk.")
+    parser.add_argument("--num-chunks", type=int, default=20, help="Number of timed action chunks.")
+    main(parser.parse_args())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the cold start of a pretrained policy (the time of `from_pretrained` and the peak memory of the process),
+with and without `lazy_load`.
+
+Each load runs in a new process, so that the peak resident memory of the process is that of the load, and the
+files of the checkpoint are downloaded once before the first run.
+
+See the provided README.md or run `python benchmarks/policies/loading_benchmark.py --help` for usage info.
+"""
+
+import argparse
+import multiprocessing as mp
+import resource
+import time
+
+import numpy as np
+
+
+def peak_rss_mb() -> float:
+    # `ru_maxrss` is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def load(policy_path: str, device: str, lazy_load: bool, results: mp.Queue):
+    import torch
+
+    from lerobot.configs.policies import PreTrainedConfig
+    from lerobot.policies.factory import get_policy_class
+
+    config = PreTrainedConfig.from_pretrained(policy_path)
+    config.device = device
+    policy_cls = get_policy_class(config.type)
+    baseline_mb = peak_rss_mb()
+
+    start = time.perf_counter()
+    policy = policy_cls.from_pretrained(policy_path, config=config, lazy_load=lazy_load)
+    if device.startswith("cuda"):
+        torch.cuda.synchronize()
+    seconds = time.perf_counter() - start
+
+    num_params = sum(p.numel() for p in policy.parameters())
+    results.put((seconds, peak_rss_mb() - baseline_mb, num_params))
+
+
+def main(args: argparse.Namespace):
+    context = mp.get_context("spawn")
+    results = context.Queue()
+    timings = {"eager": [], "lazy": []}
+    memory_mb = {"eager": [], "lazy": []}
+    # The first run downloads the checkpoint and warms up the page cache of the files
+    for i in range(args.num_runs + 1):
+        for mode in timings:
+            process = context.Process(
+                target=load, args=(args.policy_path, args.device, mode == "lazy", results)
+            )
+            process.start()
+            seconds, peak_mb, num_params = results.get()
+            process.join()
+            if i > 0:
+                timings[mode].append(seconds)
+                memory_mb[mode].append(peak_mb)
+
+    print(f"{args.policy_path} ({num_params / 1e6:.0f}M parameters) on {args.device}, {args.num_runs} runs")
+    print(f"{'mode':<7}{'mean (s)':>10}{'p50 (s)':>9}{'peak RSS increase (MB)':>24}")
+    for mode, seconds in timings.items():
+        seconds = np.array(seconds)
+        print(
+            f"{mode:<7}{seconds.mean():>10.2f}{np.percentile(seconds, 50):>9.2f}"
+            f"{np.mean(memory_mb[mode]):>24.0f}"
+        )
+    print(f"speedup: {np.mean(timings['eager']) / np.mean(timings['lazy']):.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--policy-path", required=True, help="Repo id or directory of the pretrained policy.")
+    parser.add_argument("--device", default="cpu", help="Device on which the weights are loaded.")
+    parser.add_argument("--num-runs", type=int, default=3, help="Number of timed loads of each mode.")
+    main(parser.parse_args())
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compare the actions and the CPU latency of a quantized policy (ACT, Diffusion or VQ-BeT) with the float32 one
+on frames of a dataset, and optionally save the quantized policy.
+
+See the provided README.md or run `python benchmarks/policies/quantization_benchmark.py --help` for usage info.
+"""
+
+import argparse
+import time
+from copy import deepcopy
+
+import numpy as np
+import torch
+
+from lerobot.configs.policies import PreTrainedConfig
+from lerobot.datasets.lerobot_dataset import LeRobotDataset
+from lerobot.policies.factory import get_policy_class, make_pre_post_processors
+from lerobot.policies.quantization import QUANTIZATION_MODES
+from lerobot.utils.constants import ACTION, OBS_STR
+
+
+def predict(policy, preprocessor, postprocessor, observation: dict, seed: int) -> tuple[torch.Tensor, float]:
+    """First action predicted from `observation`, and the latency of the policy in ms.
+
+    The policy is reset first, so that its observation queues are filled with `observation` and a whole chunk is
+    predicted. Diffusion and VQ-BeT sample their actions: both policies are seeded the same way.
+    """
+    batch = preprocessor(dict(observation))
+    policy.reset()
+    torch.manual_seed(seed)
+    start = time.perf_counter()
+    with torch.no_grad():
+        action = policy.select_action(batch)
+    latency_ms = (time.perf_counter() - start) * 1e3
+    return postprocessor(action).squeeze(0), latency_ms
+
+
+def main(args: argparse.Namespace):
+    if args.num_threads is not None:
+        torch.set_num_threads(args.num_threads)
+
+    config = PreTrainedConfig.from_pretrained(args.policy_path)
+    config.device = "cpu"
+    policy_cls = get_policy_class(config.type)
+    reference = policy_cls.from_pretrained(args.policy_path, config=config)
+    quantize = None if args.quantize == "none" else args.quantize
+    quantized = policy_cls.from_pretrained(
+        args.policy_path, config=deepcopy(config), quantize=quantize, channels_last=args.channels_last
+    )
+    preprocessor, postprocessor = make_pre_post_processors(
+        config,
+        pretrained_path=args.policy_path,
+        preprocessor_overrides={"device_processor": {"device": "cpu"}},
+    )
+
+    dataset = LeRobotDataset(args.dataset_repo_id, root=args.dataset_root)
+    indices = np.linspace(0, len(dataset) - 1, min(args.num_frames, len(dataset))).astype(int)
+
+    errors, latencies_ms = [], {"float32": [], "quantized": []}
+    for i, index in enumerate(indices):
+        item = dataset[int(index)]
+        observation = {key: value for key, value in item.items() if key.startswith(OBS_STR)}
+        observation["task"] = item["task"]
+        reference_action, reference_ms = predict(reference, preprocessor, postprocessor, observation, i)
+        quantized_action, quantized_ms = predict(quantized, preprocessor, postprocessor, observation, i)
+        errors.append((quantized_action - reference_action).abs())
+        # The first frame warms up both policies
+        if i > 0 or len(indices) == 1:
+            latencies_ms["float32"].append(reference_ms)
+            latencies_ms["quantized"].append(quantized_ms)
+    errors = torch.stack(errors)
+
+    print(
+        f"{config.type} on {len(indices)} frames of {args.dataset_repo_id}, {torch.get_num_threads()} threads, "
+        f"quantize={args.quantize}, channels_last={args.channels_last}, "
+        f"engine={torch.backends.quantized.engine}"
+    )
+    print(f"{'mode':<11}{'mean (ms)':>11}{'p50 (ms)':>10}{'p90 (ms)':>10}")
+    for mode, values in latencies_ms.items():
+        values = np.array(values)
+        print(
+            f"{mode:<11}{values.mean():>11.1f}{np.percentile(values, 50):>10.1f}{np.percentile(values, 90):>10.1f}"
+        )
+    speedup = np.mean(latencies_ms["float32"]) / np.mean(latencies_ms["quantized"])
+    print(f"speedup: {speedup:.2f}x")
+    print(f"action error: mean {errors.mean():.2e}, max {errors.max():.2e}")
+    action_std = dataset.meta.stats.get(ACTION, {}).get("std")
+    if action_std is not None:
+        relative_errors = errors / torch.as_tensor(action_std, dtype=errors.dtype).clamp_min(1e-8)
+        print(f"action error relative to the std of the dataset actions: mean {relative_errors.mean():.2e}")
+
+    if args.output_dir is not None:
+        quantized.save_pretrained(args.output_dir)
+        preprocessor.save_pretrained(args.output_dir)
+        postprocessor.save_pretrained(args.output_dir)
+        print(f"quantized policy saved to {args.output_dir}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--policy-path", required=True, help="Repo id or directory of the float32 policy.")
+    parser.add_argument("--dataset-repo-id", required=True, help="Dataset whose frames are used as inputs.")
+    parser.add_argument("--dataset-root", default=None, help="Local directory of the dataset.")
+    parser.add_argument("--num-frames", type=int, default=100, help="Number of frames, evenly spaced.")
+    parser.add_argument(
+        "--quantize", choices=[*QUANTIZATION_MODES, "none"], default=QUANTIZATION_MODES[0], help="Mode."
+    )
+    parser.add_argument(
+        "--channels-last", action="store_true", help="Convert the convolutions to channels-last."
+    )
+    parser.add_argument("--num-threads", type=int, default=None, help="Number of CPU threads.")
+    parser.add_argument("--output-dir", default=None, help="Where to save the quantized policy.")
+    main(parser.parse_args())
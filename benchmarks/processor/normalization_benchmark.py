@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compare the per-call latency of the normalization processor steps against the per-mode reference.
+
+The reference re-implements the previous `_apply_transform`, which re-derives the denominator (including the
+epsilon substitution) on every call and moves all stats whenever the input device or dtype changes. The
+current implementation applies cached (shift, scale, offset) coefficients with a single `addcmul` per key.
+
+See the provided README.md or run `python benchmarks/processor/normalization_benchmark.py --help` for usage
+info.
+"""
+
+import argparse
+import time
+
+import numpy as np
+import torch
+from torch import Tensor
+
+from lerobot.configs.types import FeatureType, NormalizationMode, PolicyFeature
+from lerobot.processor import NormalizerProcessorStep, UnnormalizerProcessorStep
+from lerobot.processor.converters import create_transition
+from lerobot.utils.constants import ACTION, OBS_STATE
+
+MODE_STATS = {
+    NormalizationMode.MEAN_STD: ("mean", "std"),
+    NormalizationMode.MIN_MAX: ("min", "max"),
+    NormalizationMode.QUANTILES: ("q01", "q99"),
+    NormalizationMode.QUANTILE10: ("q10", "q90"),
+}
+
+
+def reference_apply_transform(
+    self, tensor: Tensor, key: str, feature_type: FeatureType, *, inverse: bool = False
+) -> Tensor:
+    """Per-mode transformation, as implemented before the coefficients were cached."""
+    norm_mode = self.norm_map.get(feature_type, NormalizationMode.IDENTITY)
+    if norm_mode == NormalizationMode.IDENTITY or key not in self._tensor_stats:
+        return tensor
+
+    first_stat = next(iter(self._tensor_stats[key].values()))
+    if first_stat.device != tensor.device or first_stat.dtype != tensor.dtype:
+        self.to(device=tensor.device, dtype=tensor.dtype)
+
+    stats = self._tensor_stats[key]
+    if norm_mode == NormalizationMode.MEAN_STD:
+        mean, std = stats["mean"], stats["std"]
+        if inverse:
+            return tensor * std + mean
+        return (tensor - mean) / (std + self.eps)
+
+    low_name, high_name = MODE_STATS[norm_mode]
+    low, high = stats[low_name], stats[high_name]
+    denom = high - low
+    denom = torch.where(denom == 0, torch.tensor(self.eps, device=tensor.device, dtype=tensor.dtype), denom)
+    if inverse:
+        return (tensor + 1) / 2 * denom + low
+    return 2 * (tensor - low) / denom - 1
+
+
+class ReferenceNormalizerProcessorStep(NormalizerProcessorStep):
+    _apply_transform = reference_apply_transform
+
+
+class ReferenceUnnormalizerProcessorStep(UnnormalizerProcessorStep):
+    _apply_transform = reference_apply_transform
+
+
+def make_stats(dim: int, norm_mode: NormalizationMode) -> dict[str, dict[str, np.ndarray]]:
+    low_name, high_name = MODE_STATS[norm_mode]
+    rng = np.random.default_rng(0)
+    low = rng.uniform(-1.0, 0.0, dim).astype(np.float32)
+    high = low + rng.uniform(0.5, 2.0, dim).astype(np.float32)
+    # Some constant dimensions exercise the epsilon substitution.
+    high[::8] = low[::8]
+    if norm_mode == NormalizationMode.MEAN_STD:
+        high = high - low
+    return {key: {low_name: low, high_name: high} for key in (OBS_STATE, ACTION)}
+
+
+def time_step(step, transitions: list[dict], num_calls: int, num_warmup: int, device: torch.device) -> float:
+    """Returns the mean latency of a call in microseconds, cycling through `transitions`."""
+    for i in range(num_warmup):
+        step(transitions[i % len(transitions)])
+    if device.type == "cuda":
+        torch.cuda.synchronize()
+    start = time.perf_counter()
+    for i in range(num_calls):
+        step(transitions[i % len(transitions)])
+    if device.type == "cuda":
+        torch.cuda.synchronize()
+    return (time.perf_counter() - start) / num_calls * 1e6
+
+
+def main(
+    dim: int,
+    batch_size: int,
+    devices: list[str],
+    dtypes: list[str],
+    num_calls: int,
+    num_warmup: int,
+):
+    features = {
+        OBS_STATE: PolicyFeature(FeatureType.STATE, (dim,)),
+        ACTION: PolicyFeature(FeatureType.ACTION, (dim,)),
+    }
+    transitions = []
+    for device in devices:
+        for dtype in dtypes:
+            transitions.append(
+                create_transition(
+                    observation={
+                        OBS_STATE: torch.randn(batch_size, dim, device=device).to(getattr(torch, dtype))
+                    },
+                    action=torch.randn(batch_size, dim, device=device).to(getattr(torch, dtype)),
+                )
+            )
+    sync_device = torch.device(devices[-1])
+
+    print(f"{'mode':<12}{'step':<14}{'reference (us)':>16}{'cached (us)':>14}{'speedup':>10}")
+    for norm_mode in MODE_STATS:
+        norm_map = {FeatureType.STATE: norm_mode, FeatureType.ACTION: norm_mode}
+        stats = make_stats(dim, norm_mode)
+        for name, reference_cls, cached_cls in (
+            ("normalize", ReferenceNormalizerProcessorStep, NormalizerProcessorStep),
+            ("unnormalize", ReferenceUnnormalizerProcessorStep, UnnormalizerProcessorStep),
+        ):
+            reference = reference_cls(features=features, norm_map=norm_map, stats=stats)
+            cached = cached_cls(features=features, norm_map=norm_map, stats=stats)
+            reference_us = time_step(reference, transitions, num_calls, num_warmup, sync_device)
+            cached_us = time_step(cached, transitions, num_calls, num_warmup, sync_device)
+            print(
+                f"{norm_mode.value:<12}{name:<14}{reference_us:>16.1f}{cached_us:>14.1f}"
+                f"{reference_us / cached_us:>9.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dim", type=int, default=14, help="Dimension of the state and action features.")
+    parser.add_argument("--batch-size", type=int, default=1, help="Batch size of the processed tensors.")
+    parser.add_argument(
+        "--devices",
+        type=str,
+        nargs="*",
+        default=["cpu"],
+        help="Devices the inputs are cycled through, e.g. `cpu cuda` to measure mixed-device inputs.",
+    )
+    parser.add_argument(
+        "--dtypes",
+        type=str,
+        nargs="*",
+        default=["float32"],
+        help="Dtypes the inputs are cycled through, e.g. `float32 bfloat16` to measure mixed-dtype inputs.",
+    )
+    parser.add_argument("--num-calls", type=int, default=2000, help="Number of timed calls per step.")
+    parser.add_argument("--num-warmup", type=int, default=100, help="Number of untimed warmup calls.")
+    args = parser.parse_args()
+    main(**vars(args))
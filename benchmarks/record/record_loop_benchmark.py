@@ -0,0 +1,340 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Drive `record_loop` end to end without hardware, to find the throughput ceiling of recording.
+
+The robot has in-memory motors, with a configurable bus latency, and synthetic (or replay) cameras with a
+realistic timing model. A teleoperator generates smooth actions. Episodes are recorded into a temporary
+dataset, so the measured loop includes the camera read threads, image post-processing, `add_frame`, the image
+writer and, after each episode, video encoding.
+
+See the provided README.md or run `python benchmarks/record/record_loop_benchmark.py --help` for usage info.
+"""
+
+import argparse
+import math
+import tempfile
+import time
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from lerobot.cameras import CameraConfig
+from lerobot.cameras.camera_group import CameraGroup
+from lerobot.cameras.synthetic import ReplayCameraConfig, SyntheticCameraConfig
+from lerobot.cameras.utils import make_cameras_from_configs
+from lerobot.datasets.lerobot_dataset import LeRobotDataset
+from lerobot.datasets.pipeline_features import aggregate_pipeline_dataset_features, create_initial_features
+from lerobot.datasets.utils import combine_feature_dicts
+from lerobot.datasets.video_utils import VideoEncodingManager
+from lerobot.processor import make_default_processors
+from lerobot.robots import Robot, RobotConfig
+from lerobot.scripts.lerobot_record import record_loop
+from lerobot.teleoperators import Teleoperator, TeleoperatorConfig
+
+
+@RobotConfig.register_subclass("benchmark_robot")
+@dataclass
+class BenchmarkRobotConfig(RobotConfig):
+    num_motors: int = 6
+    # Simulated duration of a motor bus read or write
+    bus_latency_ms: float = 2.0
+    cameras: dict[str, CameraConfig] = field(default_factory=dict)
+
+
+class BenchmarkRobot(Robot):
+    """Robot with in-memory motors, reached after `bus_latency_ms`, and the configured cameras."""
+
+    config_class = BenchmarkRobotConfig
+    name = "benchmark_robot"
+
+    def __init__(self, config: BenchmarkRobotConfig):
+        super().__init__(config)
+        self.config = config
+        self.motors = [f"motor_{i + 1}" for i in range(config.num_motors)]
+        self.positions = dict.fromkeys(self.motors, 0.0)
+        self.cameras = make_cameras_from_configs(config.cameras)
+        self.camera_group = CameraGroup(self.cameras)
+        self._is_connected = False
+
+    @cached_property
+    def observation_features(self) -> dict[str, type | tuple]:
+        cameras_ft = {key: (cfg.height, cfg.width, 3) for key, cfg in self.config.cameras.items()}
+        return {**{f"{motor}.pos": float for motor in self.motors}, **cameras_ft}
+
+    @cached_property
+    def action_features(self) -> dict[str, type]:
+        return {f"{motor}.pos": float for motor in self.motors}
+
+    @property
+    def is_connected(self) -> bool:
+        return self._is_connected
+
+    def connect(self, calibrate: bool = True) -> None:
+        for cam in self.cameras.values():
+            cam.connect()
+        self._is_connected = True
+
+    @property
+    def is_calibrated(self) -> bool:
+        return True
+
+    def calibrate(self) -> None:
+        pass
+
+    def configure(self) -> None:
+        pass
+
+    def _bus_transfer(self) -> None:
+        time.sleep(self.config.bus_latency_ms / 1e3)
+
+    def get_observation(self) -> dict[str, Any]:
+        self._bus_transfer()
+        obs_dict = {f"{motor}.pos": pos for motor, pos in self.positions.items()}
+        if self.cameras:
+            obs_dict.update(self.camera_group.read().frames)
+        return obs_dict
+
+    def send_action(self, action: dict[str, Any]) -> dict[str, Any]:
+        self._bus_transfer()
+        self.positions = {motor: action[f"{motor}.pos"] for motor in self.motors}
+        return action
+
+    def disconnect(self) -> None:
+        for cam in self.cameras.values():
+            cam.disconnect()
+        self.camera_group.close()
+        self._is_connected = False
+
+
+@TeleoperatorConfig.register_subclass("benchmark_teleop")
+@dataclass
+class BenchmarkTeleopConfig(TeleoperatorConfig):
+    num_motors: int = 6
+
+
+class BenchmarkTeleop(Teleoperator):
+    """Teleoperator generating sinusoidal goal positions."""
+
+    config_class = BenchmarkTeleopConfig
+    name = "benchmark_teleop"
+
+    def __init__(self, config: BenchmarkTeleopConfig):
+        super().__init__(config)
+        self.motors = [f"motor_{i + 1}" for i in range(config.num_motors)]
+        self._start = time.perf_counter()
+
+    @property
+    def action_features(self) -> dict[str, type]:
+        return {f"{motor}.pos": float for motor in self.motors}
+
+    @property
+    def feedback_features(self) -> dict:
+        return {}
+
+    @property
+    def is_connected(self) -> bool:
+        return True
+
+    def connect(self, calibrate: bool = True) -> None:
+        pass
+
+    @property
+    def is_calibrated(self) -> bool:
+        return True
+
+    def calibrate(self) -> None:
+        pass
+
+    def configure(self) -> None:
+        pass
+
+    def get_action(self) -> dict[str, Any]:
+        t = time.perf_counter() - self._start
+        return {f"{motor}.pos": 50 * math.sin(t + i) for i, motor in enumerate(self.motors)}
+
+    def send_feedback(self, feedback: dict[str, Any]) -> None:
+        pass
+
+    def disconnect(self) -> None:
+        pass
+
+
+class LoopTimer:
+    """Wraps `robot.get_observation`, called once per iteration of `record_loop`, to time the iterations."""
+
+    def __init__(self, robot: Robot):
+        self.timestamps: list[float] = []
+        get_observation = robot.get_observation
+
+        def timed_get_observation():
+            self.timestamps.append(time.perf_counter())
+            return get_observation()
+
+        robot.get_observation = timed_get_observation
+
+
+def make_camera_configs(args: argparse.Namespace, fps: int) -> dict[str, CameraConfig]:
+    configs = {}
+    for i in range(args.num_cameras):
+        timing = {"latency_ms": args.camera_latency_ms, "jitter_ms": args.camera_jitter_ms, "seed": i}
+        if args.replay_path is not None:
+            configs[f"cam_{i}"] = ReplayCameraConfig(
+                args.replay_path, fps=fps, width=args.width, height=args.height, preload=True, **timing
+            )
+        else:
+            configs[f"cam_{i}"] = SyntheticCameraConfig(
+                fps=fps, width=args.width, height=args.height, **timing
+            )
+    return configs
+
+
+def run(args: argparse.Namespace, fps: int, root: Path) -> dict[str, float]:
+    robot = BenchmarkRobot(
+        BenchmarkRobotConfig(
+            id="benchmark",
+            calibration_dir=root / "calibration",
+            num_motors=args.num_motors,
+            bus_latency_ms=args.bus_latency_ms,
+            cameras=make_camera_configs(args, fps),
+        )
+    )
+    teleop = BenchmarkTeleop(
+        BenchmarkTeleopConfig(
+            id="benchmark", calibration_dir=root / "calibration", num_motors=args.num_motors
+        )
+    )
+    teleop_action_processor, robot_action_processor, robot_observation_processor = make_default_processors()
+    features = combine_feature_dicts(
+        aggregate_pipeline_dataset_features(
+            pipeline=teleop_action_processor,
+            initial_features=create_initial_features(action=robot.action_features),
+            use_videos=args.video,
+        ),
+        aggregate_pipeline_dataset_features(
+            pipeline=robot_observation_processor,
+            initial_features=create_initial_features(observation=robot.observation_features),
+            use_videos=args.video,
+        ),
+    )
+    dataset = LeRobotDataset.create(
+        "benchmark/record_loop",
+        fps,
+        root=root / f"dataset_{fps}",
+        robot_type=robot.name,
+        features=features,
+        use_videos=args.video,
+        image_writer_threads=args.image_writer_threads * args.num_cameras,
+    )
+    events = {"exit_early": False, "rerecord_episode": False, "stop_recording": False}
+
+    robot.connect()
+    timer = LoopTimer(robot)
+    periods, save_times = [], []
+    with VideoEncodingManager(dataset):
+        for _ in range(args.num_episodes):
+            timer.timestamps.clear()
+            record_loop(
+                robot=robot,
+                events=events,
+                fps=fps,
+                teleop_action_processor=teleop_action_processor,
+                robot_action_processor=robot_action_processor,
+                robot_observation_processor=robot_observation_processor,
+                teleop=teleop,
+                dataset=dataset,
+                control_time_s=args.episode_time_s,
+                single_task="benchmark",
+                pipelined=args.pipelined,
+            )
+            periods.extend(np.diff(timer.timestamps))
+            start = time.perf_counter()
+            dataset.save_episode()
+            save_times.append(time.perf_counter() - start)
+    frames_dropped = sum(cam.frame_buffer.stats().frames_dropped for cam in robot.cameras.values())
+    robot.disconnect()
+
+    periods_ms = np.array(periods) * 1e3
+    return {
+        "achieved_fps": 1e3 / periods_ms.mean(),
+        "p50_ms": np.percentile(periods_ms, 50),
+        "p99_ms": np.percentile(periods_ms, 99),
+        "max_ms": periods_ms.max(),
+        "overruns": (periods_ms > 1.1e3 / fps).mean() * 100,
+        "frames_dropped": frames_dropped,
+        "save_s": float(np.mean(save_times)),
+    }
+
+
+def main(args: argparse.Namespace):
+    print(
+        f"{args.num_cameras} camera(s) {args.width}x{args.height}, {args.num_motors} motors, "
+        f"bus latency {args.bus_latency_ms}ms, video={args.video}, pipelined={args.pipelined}"
+    )
+    print(
+        f"{'fps':>5}{'achieved':>10}{'p50 (ms)':>10}{'p99 (ms)':>10}{'max (ms)':>10}"
+        f"{'overruns':>10}{'dropped':>9}{'save (s)':>10}"
+    )
+    ceiling = None
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for fps in sorted(args.fps):
+            r = run(args, fps, Path(tmp_dir))
+            print(
+                f"{fps:>5}{r['achieved_fps']:>10.1f}{r['p50_ms']:>10.2f}{r['p99_ms']:>10.2f}{r['max_ms']:>10.2f}"
+                f"{r['overruns']:>9.1f}%{r['frames_dropped']:>9}{r['save_s']:>10.2f}"
+            )
+            if r["achieved_fps"] >= 0.98 * fps:
+                ceiling = fps
+    print(f"Highest sustained fps: {ceiling if ceiling is not None else 'none'}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--fps", type=int, nargs="+", default=[30, 60, 90], help="Loop frame rates to measure, in turn."
+    )
+    parser.add_argument("--num-cameras", type=int, default=2, help="Number of cameras.")
+    parser.add_argument("--width", type=int, default=640, help="Frame width of the cameras.")
+    parser.add_argument("--height", type=int, default=480, help="Frame height of the cameras.")
+    parser.add_argument("--camera-latency-ms", type=float, default=10.0, help="Mean camera frame latency.")
+    parser.add_argument("--camera-jitter-ms", type=float, default=1.0, help="Camera frame latency std.")
+    parser.add_argument(
+        "--replay-path",
+        type=Path,
+        default=None,
+        help="Video file replayed by the cameras (e.g. a dataset mp4), instead of synthetic frames.",
+    )
+    parser.add_argument("--num-motors", type=int, default=6, help="Number of motors.")
+    parser.add_argument(
+        "--bus-latency-ms", type=float, default=2.0, help="Duration of a motor bus read or write."
+    )
+    parser.add_argument("--episode-time-s", type=float, default=5.0, help="Duration of an episode.")
+    parser.add_argument("--num-episodes", type=int, default=1, help="Number of episodes per frame rate.")
+    parser.add_argument(
+        "--video", action=argparse.BooleanOptionalAction, default=True, help="Encode the frames to videos."
+    )
+    parser.add_argument(
+        "--pipelined",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Run the observation, inference, actuation and dataset stages in their own threads.",
+    )
+    parser.add_argument(
+        "--image-writer-threads", type=int, default=4, help="Number of image writer threads per camera."
+    )
+    main(parser.parse_args())
@@ -17,9 +17,15 @@
 """
 Web server for controlling SO-101 Follower arm via touchscreen interface.
 This provides a browser-based control panel for manual servo control.
+
+A single bus thread owns the serial bus: at BUS_RATE_HZ it sends the commands queued by the HTTP handlers
+(merged into one action) and reads the motor positions into a shared snapshot. The browsers receive the
+position changes through a Server-Sent Events stream, so the number of viewers does not add bus traffic.
 """
 
-from flask import Flask, render_template_string, jsonify, request
+from flask import Flask, Response, render_template_string, jsonify, request, stream_with_context
+import json
+import queue
 import threading
 import time
 import logging
@@ -59,6 +65,17 @@ cycle_active = False
 cycle_thread = None
 cycle_interval = 15.0  # Default 15 seconds
 
+# Bus thread: commands are queued by the HTTP handlers and applied at the next bus cycle
+BUS_RATE_HZ = 30
+command_queue = queue.Queue()
+bus_thread = None
+bus_stop = threading.Event()
+
+# Latest motor positions, published by the bus thread to the position streams
+STREAM_KEEPALIVE_S = 15.0
+state_condition = threading.Condition()
+state_snapshot = {'seq': 0, 'timestamp': 0.0, 'positions': current_positions.copy(), 'changes': {}}
+
 # HTML template for the control interface
 HTML_TEMPLATE = """
 <!DOCTYPE html>
@@ -852,23 +869,25 @@ HTML_TEMPLATE = """
             .catch(error => console.error('Error:', error));
         }
 
-        // Poll positions
-        setInterval(() => {
-            fetch('/api/positions')
-                .then(response => response.json())
-                .then(data => {
-                    if (data.success) {
-                        Object.keys(data.positions).forEach(motor => {
-                            positions[motor] = Math.round(data.positions[motor]);
-                        });
-                        shoulderPad.updateCursor();
-                        wristPad.updateCursor();
-                        elbowSlider.updateSlider();
-                        gripperSlider.updateSlider();
-                    }
-                })
-                .catch(error => console.error('Error:', error));
-        }, 2000);
+        // Position stream: the server pushes the positions which changed
+        // Motors commanded in the last second are skipped, so that the stream does not fight the user
+        const STREAM_HOLD_MS = 1000;
+        const positionStream = new EventSource('/api/stream');
+        positionStream.onmessage = (event) => {
+            const data = JSON.parse(event.data);
+            const now = Date.now();
+            Object.keys(data.positions).forEach(motor => {
+                if (!(motor in positions) || pendingUpdates[motor] !== null || now - lastUpdateTime[motor] < STREAM_HOLD_MS) {
+                    return;
+                }
+                positions[motor] = Math.round(data.positions[motor]);
+            });
+            shoulderPad.updateCursor();
+            wristPad.updateCursor();
+            elbowSlider.updateSlider();
+            gripperSlider.updateSlider();
+        };
+        positionStream.onerror = (error) => console.error('Position stream error:', error);
 
         // Position Recording and Cycling Functions
         function recordPosition(posNum) {
@@ -1020,31 +1039,9 @@ def control_motor():
         if motor_name not in current_positions:
             return jsonify({'success': False, 'error': f'Invalid motor: {motor_name}'}), 400
 
-        # Update current position
-        with robot_lock:
-            current_positions[motor_name] = position
-
-            # Send command to robot - use send_action() like teleop does
-            if robot and robot.is_connected:
-                action = {f"{motor_name}.pos": position}
-                logger.debug(f"Sending action: {action}")
-                robot.send_action(action)
-                
-                # Check motor status after sending command (only in verbose mode)
-                if logger.isEnabledFor(logging.DEBUG):
-                    time.sleep(0.05)  # 50ms delay to let motor start moving
-                    try:
-                        status = robot.bus.read("Status", motor_name, normalize=False)
-                        moving = robot.bus.read("Moving", motor_name, normalize=False)
-                        goal_pos_actual = robot.bus.read("Goal_Position", motor_name, normalize=False)
-                        goal_vel_actual = robot.bus.read("Goal_Velocity", motor_name, normalize=False)
-                        present_pos = robot.bus.read("Present_Position", motor_name, normalize=False)
-                        lock = robot.bus.read("Lock", motor_name, normalize=False)
-                        logger.debug(f"Motor {motor_name} | Target={position} | GoalPos={goal_pos_actual} | PresentPos={present_pos} | GoalVel={goal_vel_actual} | Lock={lock} | Status={status:#04x} | Moving={moving}")
-                    except Exception as e:
-                        logger.warning(f"Could not read motor status: {e}")
-            else:
-                logger.warning("Robot not connected, storing position only")
+        # Update current position and queue the command for the bus thread
+        current_positions[motor_name] = position
+        send_command({f"{motor_name}.pos": position})
 
         return jsonify({'success': True, 'motor': motor_name, 'position': position})
 
@@ -1057,28 +1054,24 @@ def control_motor():
 def center_all():
     """Return all motors to center position."""
     try:
-        with robot_lock:
-            # Set all motors to center
-            for motor in current_positions:
-                if motor == 'gripper':
-                    current_positions[motor] = 50.0
-                else:
-                    current_positions[motor] = 0.0
-
-            # Send command to robot
-            if robot and robot.is_connected:
-                action = {
-                    "shoulder_pan.pos": 0.0,
-                    "shoulder_lift.pos": 0.0,
-                    "elbow_flex.pos": 0.0,
-                    "wrist_flex.pos": 0.0,
-                    "wrist_roll.pos": 0.0,
-                    "gripper.pos": 50.0
-                }
-                robot.send_action(action)
-                logger.debug("All motors centered")
+        # Set all motors to center
+        for motor in current_positions:
+            if motor == 'gripper':
+                current_positions[motor] = 50.0
             else:
-                logger.warning("Robot not connected, storing positions only")
+                current_positions[motor] = 0.0
+
+        # Queue the command for the bus thread
+        action = {
+            "shoulder_pan.pos": 0.0,
+            "shoulder_lift.pos": 0.0,
+            "elbow_flex.pos": 0.0,
+            "wrist_flex.pos": 0.0,
+            "wrist_roll.pos": 0.0,
+            "gripper.pos": 50.0
+        }
+        send_command(action)
+        logger.debug("All motors centered")
 
         return jsonify({'success': True, 'message': 'All motors centered'})
 
@@ -1089,22 +1082,10 @@ def center_all():
 
 @app.route('/api/positions', methods=['GET'])
 def get_positions():
-    """Get current positions of all motors."""
+    """Get current positions of all motors, as last sampled by the bus thread."""
     try:
-        with robot_lock:
-            if robot and robot.is_connected:
-                # Read actual positions from robot
-                obs = robot.get_observation()
-                positions = {}
-                for motor in current_positions.keys():
-                    key = f"{motor}.pos"
-                    if key in obs:
-                        positions[motor] = obs[key]
-                        current_positions[motor] = obs[key]
-                    else:
-                        positions[motor] = current_positions[motor]
-            else:
-                positions = current_positions.copy()
+        with state_condition:
+            positions = state_snapshot['positions'].copy()
 
         return jsonify({'success': True, 'positions': positions})
 
@@ -1113,6 +1094,35 @@ def get_positions():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@app.route('/api/stream', methods=['GET'])
+def stream_positions():
+    """
+    Server-Sent Events stream of the motor positions.
+
+    The first event carries all positions, and the next ones only the positions which changed, e.g.
+    data: {"seq": 42, "positions": {"gripper": 12.5}}
+    All the clients are served from the snapshot of the bus thread, without accessing the bus.
+    """
+    def events():
+        last_seq = None
+        while True:
+            with state_condition:
+                state_condition.wait_for(lambda seq=last_seq: state_snapshot['seq'] != seq, timeout=STREAM_KEEPALIVE_S)
+                snapshot = state_snapshot
+            if snapshot['seq'] == last_seq:
+                # Keep the connection open through proxies
+                yield ": keepalive\n\n"
+                continue
+            # A client which missed an update gets all the positions again
+            delta = last_seq is not None and snapshot['seq'] == last_seq + 1
+            positions = snapshot['changes'] if delta else snapshot['positions']
+            last_seq = snapshot['seq']
+            yield f"data: {json.dumps({'seq': last_seq, 'positions': positions})}\n\n"
+
+    headers = {'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    return Response(stream_with_context(events()), mimetype='text/event-stream', headers=headers)
+
+
 @app.route('/api/record_position', methods=['POST'])
 def record_position():
     """Record the current position as position 1 or 2."""
@@ -1125,23 +1135,13 @@ def record_position():
         if pos_num not in [1, 2]:
             return jsonify({'success': False, 'error': 'Position number must be 1 or 2'}), 400
         
-        with robot_lock:
-            # Get current positions
-            if robot and robot.is_connected:
-                obs = robot.get_observation()
-                position = {}
-                for motor in current_positions.keys():
-                    key = f"{motor}.pos"
-                    if key in obs:
-                        position[motor] = obs[key]
-                    else:
-                        position[motor] = current_positions[motor]
-            else:
-                position = current_positions.copy()
-            
-            # Store the position
-            recorded_positions[f'position_{pos_num}'] = position
-            logger.info(f"Recorded position {pos_num}: {position}")
+        # Get current positions, as last sampled by the bus thread
+        with state_condition:
+            position = state_snapshot['positions'].copy()
+
+        # Store the position
+        recorded_positions[f'position_{pos_num}'] = position
+        logger.info(f"Recorded position {pos_num}: {position}")
         
         return jsonify({'success': True, 'position': position})
     
@@ -1255,15 +1255,13 @@ def cycle_loop():
                 break
             
             # Send robot to target position
-            with robot_lock:
-                if robot and robot.is_connected:
-                    action = {f"{motor}.pos": pos for motor, pos in target_position.items()}
-                    robot.send_action(action)
-                    logger.info(f"Moving to position {current_target}")
-                else:
-                    logger.warning("Robot not connected, stopping cycle")
-                    cycle_active = False
-                    break
+            if robot and robot.is_connected:
+                send_command({f"{motor}.pos": pos for motor, pos in target_position.items()})
+                logger.info(f"Moving to position {current_target}")
+            else:
+                logger.warning("Robot not connected, stopping cycle")
+                cycle_active = False
+                break
             
             # Toggle target for next iteration
             current_target = 2 if current_target == 1 else 1
@@ -1282,6 +1280,98 @@ def cycle_loop():
     logger.info("Cycle loop stopped")
 
 
+def send_command(action):
+    """Queue an action for the bus thread, which sends it at its next cycle."""
+    if not (robot and robot.is_connected):
+        logger.warning("Robot not connected, storing position only")
+    command_queue.put(action)
+
+
+def log_motor_status(motor_name, position):
+    """Log the registers of a motor after a command (only in verbose mode)."""
+    time.sleep(0.05)  # 50ms delay to let motor start moving
+    try:
+        status = robot.bus.read("Status", motor_name, normalize=False)
+        moving = robot.bus.read("Moving", motor_name, normalize=False)
+        goal_pos_actual = robot.bus.read("Goal_Position", motor_name, normalize=False)
+        goal_vel_actual = robot.bus.read("Goal_Velocity", motor_name, normalize=False)
+        present_pos = robot.bus.read("Present_Position", motor_name, normalize=False)
+        lock = robot.bus.read("Lock", motor_name, normalize=False)
+        logger.debug(f"Motor {motor_name} | Target={position} | GoalPos={goal_pos_actual} | PresentPos={present_pos} | GoalVel={goal_vel_actual} | Lock={lock} | Status={status:#04x} | Moving={moving}")
+    except Exception as e:
+        logger.warning(f"Could not read motor status: {e}")
+
+
+def publish_positions(positions):
+    """Update the shared snapshot and wake up the position streams if a position changed."""
+    global state_snapshot
+
+    # Rounded so that sensor noise does not produce an update at every cycle
+    positions = {motor: round(float(value), 1) for motor, value in positions.items()}
+    with state_condition:
+        changes = {
+            motor: value for motor, value in positions.items()
+            if state_snapshot['positions'].get(motor) != value
+        }
+        if changes:
+            state_snapshot = {
+                'seq': state_snapshot['seq'] + 1,
+                'timestamp': time.time(),
+                'positions': {**state_snapshot['positions'], **changes},
+                'changes': changes,
+            }
+            state_condition.notify_all()
+
+
+def bus_loop():
+    """Background thread owning the serial bus: sends the queued commands, then samples the positions."""
+    logger.info("Bus loop started")
+    period = 1.0 / BUS_RATE_HZ
+
+    while not bus_stop.is_set():
+        start = time.perf_counter()
+
+        # Merge the queued commands, the latest one winning for each motor
+        action = {}
+        while True:
+            try:
+                action.update(command_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        try:
+            with robot_lock:
+                if robot and robot.is_connected:
+                    if action:
+                        logger.debug(f"Sending action: {action}")
+                        robot.send_action(action)
+                        if logger.isEnabledFor(logging.DEBUG):
+                            for key, position in action.items():
+                                log_motor_status(key.removesuffix('.pos'), position)
+
+                    # Motor positions only, without the camera reads of get_observation()
+                    positions = robot.bus.sync_read("Present_Position")
+                    current_positions.update(positions)
+                else:
+                    positions = current_positions.copy()
+            publish_positions(positions)
+        except Exception as e:
+            logger.error(f"Error in bus loop: {e}")
+
+        bus_stop.wait(max(period - (time.perf_counter() - start), 0.0))
+
+    logger.info("Bus loop stopped")
+
+
+def start_bus_thread():
+    """Start the bus thread."""
+    global bus_thread
+
+    bus_stop.clear()
+    bus_thread = threading.Thread(target=bus_loop, daemon=True)
+    bus_thread.start()
+
+
 def initialize_robot(port=None):
     """Initialize the SO-101 follower robot."""
     global robot
@@ -1338,6 +1428,11 @@ def cleanup():
         cycle_active = False
         if cycle_thread and cycle_thread.is_alive():
             cycle_thread.join(timeout=2.0)
+
+    # Stop the bus thread before releasing the bus
+    bus_stop.set()
+    if bus_thread and bus_thread.is_alive():
+        bus_thread.join(timeout=2.0)
     
     # Disconnect robot
     if robot and robot.is_connected:
@@ -1381,6 +1476,7 @@ if __name__ == '__main__':
     try:
         # Initialize robot in main thread
         initialize_robot(port=robot_port)
+        start_bus_thread()
 
         # Start web server
         print("\n" + "="*60)
@@ -23,6 +23,7 @@ from .constants import (
     DEFAULT_FPS,
     DEFAULT_INFERENCE_LATENCY,
     DEFAULT_OBS_QUEUE_TIMEOUT,
+    RTC_POLICIES,
 )
 
 # Aggregate function registry for CLI usage
@@ -64,6 +65,18 @@ class PolicyServerConfig:
         default=DEFAULT_OBS_QUEUE_TIMEOUT, metadata={"help": "Timeout for observation queue in seconds"}
     )
 
+    # Policy loading configuration
+    lazy_load: bool = field(
+        default=False,
+        metadata={
+            "help": "Load the policy weights from the memory-mapped checkpoint without initializing them"
+        },
+    )
+    compile_pipelines: bool = field(
+        default=False,
+        metadata={"help": "Run the pre- and post-processors in their compiled execution mode"},
+    )
+
     def __post_init__(self):
         """Validate configuration after initialization."""
         if self.port < 1 or self.port > 65535:
@@ -96,6 +109,8 @@ class PolicyServerConfig:
             "fps": self.fps,
             "environment_dt": self.environment_dt,
             "inference_latency": self.inference_latency,
+            "lazy_load": self.lazy_load,
+            "compile_pipelines": self.compile_pipelines,
         }
 
 
@@ -137,6 +152,12 @@ class RobotClientConfig:
         metadata={"help": f"Name of aggregate function to use. Options: {list(AGGREGATE_FUNCTIONS.keys())}"},
     )
 
+    # Real-time chunking: the server guides each chunk towards the actions left in the previous one, and freezes
+    # those executed during the inference. The overlapping actions then agree, so `latest_only` is enough.
+    real_time_chunking: bool = field(
+        default=False, metadata={"help": f"Guide chunks with real-time chunking. Policies: {RTC_POLICIES}"}
+    )
+
     # Debug configuration
     debug_visualize_queue_size: bool = field(
         default=False, metadata={"help": "Visualize the action queue size"}
@@ -170,6 +191,11 @@ class RobotClientConfig:
         if self.actions_per_chunk <= 0:
             raise ValueError(f"actions_per_chunk must be positive, got {self.actions_per_chunk}")
 
+        if self.real_time_chunking and self.policy_type not in RTC_POLICIES:
+            raise ValueError(
+                f"real_time_chunking is only supported for {RTC_POLICIES}, got policy_type={self.policy_type}"
+            )
+
         self.aggregate_fn = get_aggregate_function(self.aggregate_fn_name)
 
     @classmethod
@@ -190,4 +216,5 @@ class RobotClientConfig:
             "task": self.task,
             "debug_visualize_queue_size": self.debug_visualize_queue_size,
             "aggregate_fn_name": self.aggregate_fn_name,
+            "real_time_chunking": self.real_time_chunking,
         }
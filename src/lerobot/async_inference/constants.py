@@ -25,5 +25,8 @@ DEFAULT_OBS_QUEUE_TIMEOUT = 2
 # All action chunking policies
 SUPPORTED_POLICIES = ["act", "smolvla", "diffusion", "tdmpc", "vqbet", "pi0", "pi05"]
 
+# Flow matching policies supporting real-time chunking (see lerobot/policies/rtc.py)
+RTC_POLICIES = ["smolvla", "pi0", "pi05"]
+
 # TODO: Add all other robots
 SUPPORTED_ROBOTS = ["so100_follower", "so101_follower", "bi_so100_follower"]
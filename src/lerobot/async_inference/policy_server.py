@@ -25,6 +25,7 @@ python -m lerobot.async_inference.policy_server \
 """
 
 import logging
+import math
 import pickle  # nosec
 import threading
 import time
@@ -38,6 +39,7 @@ import draccus
 import grpc
 import torch
 
+from lerobot.configs.policies import PreTrainedConfig
 from lerobot.policies.factory import get_policy_class, make_pre_post_processors
 from lerobot.processor import (
     PolicyAction,
@@ -50,7 +52,7 @@ from lerobot.transport import (
 from lerobot.transport.utils import receive_bytes_in_chunks
 
 from .configs import PolicyServerConfig
-from .constants import SUPPORTED_POLICIES
+from .constants import RTC_POLICIES, SUPPORTED_POLICIES
 from .helpers import (
     FPSTracker,
     Observation,
@@ -81,11 +83,18 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
 
         self.last_processed_obs = None
 
+        # Last chunk predicted (normalized), its first timestep and the duration of its inference, to guide the
+        # next chunk with real-time chunking
+        self._last_chunk = None
+        self._last_chunk_timestep = 0
+        self._last_inference_time = 0.0
+
         # Attributes will be set by SendPolicyInstructions
         self.device = None
         self.policy_type = None
         self.lerobot_features = None
         self.actions_per_chunk = None
+        self.real_time_chunking = False
         self.policy = None
         self.preprocessor: PolicyProcessorPipeline[dict[str, Any], dict[str, Any]] | None = None
         self.postprocessor: PolicyProcessorPipeline[PolicyAction, PolicyAction] | None = None
@@ -107,6 +116,8 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
         with self._predicted_timesteps_lock:
             self._predicted_timesteps = set()
 
+        self._last_chunk = None
+
     def Ready(self, request, context):  # noqa: N802
         client_id = context.peer()
         self.logger.info(f"Client {client_id} connected and ready")
@@ -135,6 +146,12 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
                 f"Supported policies: {SUPPORTED_POLICIES}"
             )
 
+        if policy_specs.real_time_chunking and policy_specs.policy_type not in RTC_POLICIES:
+            raise ValueError(
+                f"Real-time chunking is not supported by {policy_specs.policy_type}. "
+                f"Supported policies: {RTC_POLICIES}"
+            )
+
         self.logger.info(
             f"Receiving policy instructions from {client_id} | "
             f"Policy type: {policy_specs.policy_type} | "
@@ -147,11 +164,18 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
         self.policy_type = policy_specs.policy_type  # act, pi0, etc.
         self.lerobot_features = policy_specs.lerobot_features
         self.actions_per_chunk = policy_specs.actions_per_chunk
+        self.real_time_chunking = policy_specs.real_time_chunking
+        self._last_chunk = None
 
         policy_class = get_policy_class(self.policy_type)
 
         start = time.perf_counter()
-        self.policy = policy_class.from_pretrained(policy_specs.pretrained_name_or_path)
+        # The weights are loaded directly on the requested device
+        policy_config = PreTrainedConfig.from_pretrained(policy_specs.pretrained_name_or_path)
+        policy_config.device = self.device
+        self.policy = policy_class.from_pretrained(
+            policy_specs.pretrained_name_or_path, config=policy_config, lazy_load=self.config.lazy_load
+        )
         self.policy.to(self.device)
 
         # Load preprocessor and postprocessor, overriding device to match requested device
@@ -160,10 +184,11 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
             self.policy.config,
             pretrained_path=policy_specs.pretrained_name_or_path,
             preprocessor_overrides={
-                "device_processor": device_override,
+                "device_processor": {**device_override, "pin_memory": True},
                 "rename_observations_processor": {"rename_map": policy_specs.rename_map},
             },
             postprocessor_overrides={"device_processor": device_override},
+            compile_pipelines=self.config.compile_pipelines,
         )
 
         end = time.perf_counter()
@@ -321,13 +346,37 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
             for i, action in enumerate(action_chunk)
         ]
 
+    def _real_time_chunking_inputs(self) -> dict[str, Any]:
+        """Remaining actions of the last chunk from the timestep of the current observation, and the number of
+        actions executed by the client until the next chunk is received, for `predict_action_chunk`."""
+        if self._last_chunk is None:
+            return {}
+
+        start = self.last_processed_obs.get_timestep() - self._last_chunk_timestep
+        if start < 0:
+            return {}
+
+        # The action at the timestep of the observation is already executed, and the next ones are executed
+        # during the inference, which is assumed to take as long as the previous one
+        inference_delay = 1 + math.ceil(self._last_inference_time / self.config.environment_dt)
+        return {"prev_chunk": self._last_chunk[:, start:], "inference_delay": inference_delay}
+
     def _get_action_chunk(self, observation: dict[str, torch.Tensor]) -> torch.Tensor:
         """Get an action chunk from the policy. The chunk contains only"""
-        chunk = self.policy.predict_action_chunk(observation)
+        rtc_inputs = self._real_time_chunking_inputs() if self.real_time_chunking else {}
+
+        start = time.perf_counter()
+        chunk = self.policy.predict_action_chunk(observation, **rtc_inputs)
         if chunk.ndim != 3:
             chunk = chunk.unsqueeze(0)  # adding batch dimension, now shape is (B, chunk_size, action_dim)
+        chunk = chunk[:, : self.actions_per_chunk, :]
+
+        if self.real_time_chunking:
+            self._last_chunk = chunk
+            self._last_chunk_timestep = self.last_processed_obs.get_timestep()
+            self._last_inference_time = time.perf_counter() - start
 
-        return chunk[:, : self.actions_per_chunk, :]
+        return chunk
 
     def _predict_action_chunk(self, observation_t: TimedObservation) -> list[TimedAction]:
         """Predict an action chunk based on an observation.
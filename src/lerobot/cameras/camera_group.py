@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Provides the CameraGroup class, collecting time-aligned sets of frames from several cameras in one call.
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from numpy.typing import NDArray  # type: ignore  # TODO: add type stubs for numpy.typing
+
+from .camera import Camera
+from .frame_buffer import TimestampedFrame
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SynchronizedFrames:
+    """A set of frames collected from all the cameras of a group.
+
+    Attributes:
+        frames: The frame of each camera.
+        timestamps: The capture time of each frame, in the `time.perf_counter()` clock.
+        skew_ms: Time between the oldest and the most recent frame of the set.
+    """
+
+    frames: dict[str, NDArray[Any]]
+    timestamps: dict[str, float]
+    skew_ms: float
+
+
+@dataclass(frozen=True)
+class CameraGroupStats:
+    """Skew counters of a `CameraGroup`.
+
+    Attributes:
+        num_sets: Number of sets of frames returned.
+        mean_skew_ms: Mean skew of the returned sets.
+        max_skew_ms: Maximum skew of the returned sets.
+        skew_violations: Number of sets returned with a skew above the tolerance.
+    """
+
+    num_sets: int
+    mean_skew_ms: float
+    max_skew_ms: float
+    skew_violations: int
+
+
+class CameraGroup:
+    """
+    Collects time-aligned sets of frames from several cameras in one call.
+
+    Cameras with a background frame buffer (`frame_buffer`, e.g. `OpenCVCamera` and `RealSenseCamera`) capture
+    continuously, so the group only has to pick one buffered frame per camera: by default the frames nearest to
+    the capture time of the least recent of the latest frames, i.e. the most recent instant covered by all the
+    cameras. If the skew of the set exceeds `max_skew_ms`, the group waits for the lagging camera to capture a
+    newer frame and aligns again, until the timeout. Other cameras are read in parallel with `async_read`, and
+    dated at reception.
+
+    Example:
+        ```python
+        group = CameraGroup(robot.cameras, max_skew_ms=10)
+        synced = group.read()
+        synced.frames["front"], synced.skew_ms
+        ```
+    """
+
+    def __init__(self, cameras: dict[str, Camera], max_skew_ms: float | None = None, timeout_ms: float = 200):
+        """
+        Initializes the group.
+
+        Args:
+            cameras: The cameras of the group, by name. They are connected and disconnected by their owner.
+            max_skew_ms: Skew tolerance of a set of frames. If None, the first aligned set is returned.
+            timeout_ms: Default maximum time to wait for a set of frames.
+        """
+        self.cameras = cameras
+        self.max_skew_ms = max_skew_ms
+        self.timeout_ms = timeout_ms
+
+        self._buffered = {key: cam for key, cam in cameras.items() if hasattr(cam, "frame_buffer")}
+        self._unbuffered = {key: cam for key, cam in cameras.items() if key not in self._buffered}
+        self._executor: ThreadPoolExecutor | None = None
+
+        self._num_sets = 0
+        self._skew_sum_ms = 0.0
+        self._max_skew_ms = 0.0
+        self._skew_violations = 0
+
+    def read(self, timestamp: float | None = None, timeout_ms: float | None = None) -> SynchronizedFrames:
+        """
+        Returns a time-aligned set of frames from all the cameras.
+
+        Args:
+            timestamp: If given, the buffered frames captured closest to this time (in the `time.perf_counter()`
+                clock) are returned, e.g. to align the frames with a motor reading.
+            timeout_ms: Maximum time to wait for the frames. Defaults to the group's `timeout_ms`.
+
+        Returns:
+            SynchronizedFrames: The frames with their capture times and the skew of the set. When the skew
+                tolerance could not be met within the timeout, the best aligned set is returned anyway.
+
+        Raises:
+            TimeoutError: If a camera provides no frame within the timeout.
+        """
+        timeout_ms = self.timeout_ms if timeout_ms is None else timeout_ms
+        deadline = time.perf_counter() + timeout_ms / 1e3
+
+        futures = {}
+        if self._unbuffered:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=len(self._unbuffered), thread_name_prefix="camera_group"
+                )
+            futures = {
+                key: self._executor.submit(self._timestamped_async_read, cam, timeout_ms)
+                for key, cam in self._unbuffered.items()
+            }
+
+        entries: dict[str, TimestampedFrame] = {}
+        if self._buffered:
+            latest = {key: cam.read_latest(timeout_ms=timeout_ms) for key, cam in self._buffered.items()}
+            while True:
+                target = timestamp if timestamp is not None else min(e.timestamp for e in latest.values())
+                entries = {key: cam.frame_buffer.nearest(target) for key, cam in self._buffered.items()}
+                remaining_s = deadline - time.perf_counter()
+                if self.max_skew_ms is None or _skew_ms(entries) <= self.max_skew_ms or remaining_s <= 0:
+                    break
+                # Wait for the lagging camera to capture a frame closer to the others.
+                lagging = min(latest, key=lambda key: latest[key].timestamp)
+                newer = self._buffered[lagging].frame_buffer.wait_for_newer(latest[lagging].seq, remaining_s)
+                if newer is None:
+                    break
+                latest[lagging] = newer
+
+        for key, future in futures.items():
+            entries[key] = future.result()
+
+        entries = {key: entries[key] for key in self.cameras}
+        synced = SynchronizedFrames(
+            frames={key: entry.frame for key, entry in entries.items()},
+            timestamps={key: entry.timestamp for key, entry in entries.items()},
+            skew_ms=_skew_ms(entries),
+        )
+        self._record(synced.skew_ms)
+        return synced
+
+    @staticmethod
+    def _timestamped_async_read(cam: Camera, timeout_ms: float) -> TimestampedFrame:
+        frame = cam.async_read(timeout_ms=timeout_ms)
+        return TimestampedFrame(frame=frame, timestamp=time.perf_counter(), seq=-1)
+
+    def _record(self, skew_ms: float) -> None:
+        self._num_sets += 1
+        self._skew_sum_ms += skew_ms
+        self._max_skew_ms = max(self._max_skew_ms, skew_ms)
+        if self.max_skew_ms is not None and skew_ms > self.max_skew_ms:
+            self._skew_violations += 1
+            logger.warning(
+                f"Camera frames skew of {skew_ms:.1f}ms exceeds the tolerance of {self.max_skew_ms:.1f}ms."
+            )
+
+    def stats(self) -> CameraGroupStats:
+        """Returns the skew counters of the sets returned so far."""
+        return CameraGroupStats(
+            num_sets=self._num_sets,
+            mean_skew_ms=self._skew_sum_ms / self._num_sets if self._num_sets else 0.0,
+            max_skew_ms=self._max_skew_ms,
+            skew_violations=self._skew_violations,
+        )
+
+    def close(self) -> None:
+        """Stops the threads reading the cameras without a frame buffer."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+def _skew_ms(entries: dict[str, TimestampedFrame]) -> float:
+    if not entries:
+        return 0.0
+    timestamps = [entry.timestamp for entry in entries.values()]
+    return (max(timestamps) - min(timestamps)) * 1e3
@@ -0,0 +1,231 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Provides a fixed-size ring buffer of timestamped frames, shared by the background read thread of a camera and
+any number of consumers.
+"""
+
+import time
+from dataclasses import dataclass
+from threading import Condition
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray  # type: ignore  # TODO: add type stubs for numpy.typing
+
+
+@dataclass(frozen=True)
+class TimestampedFrame:
+    """A captured frame with its capture time and sequence number.
+
+    Attributes:
+        frame: The captured frame. It is shared with the other consumers and must be treated as read-only.
+        timestamp: Capture time, in the `time.perf_counter()` clock.
+        seq: Sequence number of the frame, incremented by one for every frame written to the buffer.
+    """
+
+    frame: NDArray[Any]
+    timestamp: float
+    seq: int
+
+
+@dataclass(frozen=True)
+class FrameBufferStats:
+    """Counters of a `FrameRingBuffer`.
+
+    Attributes:
+        frames_captured: Number of frames written to the buffer.
+        frames_dropped: Number of frames overwritten before being returned to any consumer.
+        frames_missed: Number of frames the camera is estimated to have skipped, from the gaps between capture
+            timestamps (only counted when the buffer knows the camera FPS).
+        mean_latency_ms: Mean age of the frames when they were returned to a consumer.
+        max_latency_ms: Maximum age of the frames when they were returned to a consumer.
+    """
+
+    frames_captured: int
+    frames_dropped: int
+    frames_missed: int
+    mean_latency_ms: float
+    max_latency_ms: float
+
+
+class FrameRingBuffer:
+    """
+    Fixed-size ring of the most recent frames of a camera, with their capture time and sequence number.
+
+    The buffer is written by the background read thread of a camera and can be read concurrently by any number
+    of consumers, which never consume the frames for each other. Frames are stored and returned by reference,
+    without copying; a returned frame stays valid after it is overwritten in the ring.
+
+    Example:
+        ```python
+        buffer = FrameRingBuffer(capacity=8, fps=30)
+        buffer.push(frame)  # From the read thread
+
+        latest = buffer.latest()
+        aligned = buffer.nearest(action_timestamp)
+        new_frames = buffer.since(latest.seq)
+        ```
+    """
+
+    def __init__(self, capacity: int = 16, fps: float | None = None):
+        """
+        Initializes the buffer.
+
+        Args:
+            capacity: Number of frames kept in the ring.
+            fps: Expected frame rate of the camera, used to count the frames it misses.
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        self.capacity = capacity
+        self.fps = fps
+
+        self._frames: list[NDArray[Any] | None] = [None] * capacity
+        self._timestamps = np.full(capacity, np.nan, dtype=np.float64)
+        self._seqs = np.full(capacity, -1, dtype=np.int64)
+        self._returned = np.zeros(capacity, dtype=bool)
+        self._next_seq = 0
+        self._condition = Condition()
+
+        self._frames_dropped = 0
+        self._frames_missed = 0
+        self._latency_sum_s = 0.0
+        self._latency_max_s = 0.0
+        self._latency_count = 0
+
+    def __len__(self) -> int:
+        return min(self._next_seq, self.capacity)
+
+    def push(self, frame: NDArray[Any], timestamp: float | None = None) -> int:
+        """
+        Writes a frame into the ring, overwriting the oldest one when full, and wakes up waiting consumers.
+
+        Args:
+            frame: The captured frame.
+            timestamp: Capture time in the `time.perf_counter()` clock. Defaults to now.
+
+        Returns:
+            The sequence number of the frame.
+        """
+        timestamp = time.perf_counter() if timestamp is None else timestamp
+        with self._condition:
+            seq = self._next_seq
+            slot = seq % self.capacity
+            if self._seqs[slot] >= 0 and not self._returned[slot]:
+                self._frames_dropped += 1
+            if self.fps and seq > 0:
+                previous_timestamp = self._timestamps[(seq - 1) % self.capacity]
+                self._frames_missed += max(0, round((timestamp - previous_timestamp) * self.fps) - 1)
+
+            self._frames[slot] = frame
+            self._timestamps[slot] = timestamp
+            self._seqs[slot] = seq
+            self._returned[slot] = False
+            self._next_seq = seq + 1
+            self._condition.notify_all()
+        return seq
+
+    def _entry(self, slot: int) -> TimestampedFrame:
+        # Must be called with the condition held.
+        timestamp = float(self._timestamps[slot])
+        latency_s = time.perf_counter() - timestamp
+        self._latency_sum_s += latency_s
+        self._latency_max_s = max(self._latency_max_s, latency_s)
+        self._latency_count += 1
+        self._returned[slot] = True
+        return TimestampedFrame(frame=self._frames[slot], timestamp=timestamp, seq=int(self._seqs[slot]))
+
+    def latest(self) -> TimestampedFrame | None:
+        """Returns the most recent frame, or None if no frame was written yet."""
+        with self._condition:
+            if self._next_seq == 0:
+                return None
+            return self._entry((self._next_seq - 1) % self.capacity)
+
+    def wait_for_newer(self, seq: int, timeout_s: float | None = None) -> TimestampedFrame | None:
+        """
+        Returns the most recent frame once its sequence number is greater than `seq`.
+
+        Args:
+            seq: Sequence number of the last frame seen by the consumer, -1 if none.
+            timeout_s: Maximum time to wait, in seconds. None waits indefinitely.
+
+        Returns:
+            The most recent frame, or None if no newer frame was written within the timeout.
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._next_seq - 1 > seq, timeout=timeout_s):
+                return None
+            return self._entry((self._next_seq - 1) % self.capacity)
+
+    def nearest(self, timestamp: float) -> TimestampedFrame | None:
+        """
+        Returns the frame in the ring captured closest to `timestamp`.
+
+        Args:
+            timestamp: Target time in the `time.perf_counter()` clock.
+
+        Returns:
+            The frame with the closest capture time, or None if no frame was written yet.
+        """
+        with self._condition:
+            if self._next_seq == 0:
+                return None
+            distances = np.abs(self._timestamps - timestamp)
+            return self._entry(int(np.nanargmin(distances)))
+
+    def since(self, seq: int) -> list[TimestampedFrame]:
+        """
+        Returns the frames in the ring with a sequence number greater than `seq`, oldest first.
+
+        Frames which were already overwritten are not returned; consumers can detect them from the gaps in the
+        sequence numbers.
+
+        Args:
+            seq: Sequence number of the last frame seen by the consumer, -1 if none.
+        """
+        with self._condition:
+            first_seq = max(seq + 1, self._next_seq - self.capacity)
+            return [self._entry(s % self.capacity) for s in range(first_seq, self._next_seq)]
+
+    def stats(self) -> FrameBufferStats:
+        """Returns the frame drop and latency counters of the buffer."""
+        with self._condition:
+            return FrameBufferStats(
+                frames_captured=self._next_seq,
+                frames_dropped=self._frames_dropped,
+                frames_missed=self._frames_missed,
+                mean_latency_ms=(
+                    self._latency_sum_s / self._latency_count * 1e3 if self._latency_count else 0.0
+                ),
+                max_latency_ms=self._latency_max_s * 1e3,
+            )
+
+    def clear(self) -> None:
+        """Removes all frames and resets the counters."""
+        with self._condition:
+            self._frames = [None] * self.capacity
+            self._timestamps.fill(np.nan)
+            self._seqs.fill(-1)
+            self._returned.fill(False)
+            self._next_seq = 0
+            self._frames_dropped = 0
+            self._frames_missed = 0
+            self._latency_sum_s = 0.0
+            self._latency_max_s = 0.0
+            self._latency_count = 0
@@ -22,7 +22,7 @@ import os
 import platform
 import time
 from pathlib import Path
-from threading import Event, Lock, Thread
+from threading import Event, Thread
 from typing import Any
 
 from numpy.typing import NDArray  # type: ignore  # TODO: add type stubs for numpy.typing
@@ -35,6 +35,7 @@ import cv2  # type: ignore  # TODO: add type stubs for OpenCV
 from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
 
 from ..camera import Camera
+from ..frame_buffer import FrameRingBuffer, TimestampedFrame
 from ..utils import get_cv2_backend, get_cv2_rotation
 from .configuration_opencv import ColorMode, OpenCVCameraConfig
 
@@ -44,6 +45,8 @@ from .configuration_opencv import ColorMode, OpenCVCameraConfig
 # When you change the USB port or reboot the computer, the operating system might
 # treat the same cameras as new devices. Thus we select a higher bound to search indices.
 MAX_OPENCV_INDEX = 60
+# Number of frames kept by the background read thread.
+FRAME_BUFFER_CAPACITY = 16
 
 logger = logging.getLogger(__name__)
 
@@ -121,9 +124,9 @@ class OpenCVCamera(Camera):
 
         self.thread: Thread | None = None
         self.stop_event: Event | None = None
-        self.frame_lock: Lock = Lock()
-        self.latest_frame: NDArray[Any] | None = None
-        self.new_frame_event: Event = Event()
+        self.frame_buffer = FrameRingBuffer(capacity=FRAME_BUFFER_CAPACITY, fps=self.fps)
+        self._last_async_seq = -1
+        self._last_capture_time: float | None = None
 
         self.rotation: int | None = get_cv2_rotation(config.rotation)
         self.backend: int = get_cv2_backend()
@@ -170,6 +173,7 @@ class OpenCVCamera(Camera):
             )
 
         self._configure_capture_settings()
+        self.frame_buffer.fps = self.fps
 
         if warmup:
             start_time = time.time()
@@ -371,6 +375,7 @@ class OpenCVCamera(Camera):
             raise DeviceNotConnectedError(f"{self} videocapture is not initialized")
 
         ret, frame = self.videocapture.read()
+        self._last_capture_time = time.perf_counter()
 
         if not ret or frame is None:
             raise RuntimeError(f"{self} read failed (status={ret}).")
@@ -431,8 +436,7 @@ class OpenCVCamera(Camera):
 
         On each iteration:
         1. Reads a color frame
-        2. Stores result in latest_frame (thread-safe)
-        3. Sets new_frame_event to notify listeners
+        2. Pushes it to frame_buffer with its capture time, notifying waiting consumers
 
         Stops on DeviceNotConnectedError, logs other errors and continues.
         """
@@ -442,10 +446,7 @@ class OpenCVCamera(Camera):
         while not self.stop_event.is_set():
             try:
                 color_image = self.read()
-
-                with self.frame_lock:
-                    self.latest_frame = color_image
-                self.new_frame_event.set()
+                self.frame_buffer.push(color_image, self._last_capture_time)
 
             except DeviceNotConnectedError:
                 break
@@ -481,7 +482,11 @@ class OpenCVCamera(Camera):
 
         This method retrieves the most recent frame captured by the background
         read thread. It does not block waiting for the camera hardware directly,
-        but may wait up to timeout_ms for the background thread to provide a frame.
+        but may wait up to timeout_ms for the background thread to provide a frame
+        newer than the one returned by the previous call.
+
+        Consumers sharing the camera, or needing capture timestamps, should use
+        `read_latest` or `frame_buffer` instead.
 
         Args:
             timeout_ms (float): Maximum time in milliseconds to wait for a frame
@@ -502,21 +507,47 @@ class OpenCVCamera(Camera):
         if self.thread is None or not self.thread.is_alive():
             self._start_read_thread()
 
-        if not self.new_frame_event.wait(timeout=timeout_ms / 1000.0):
+        entry = self.frame_buffer.wait_for_newer(self._last_async_seq, timeout_s=timeout_ms / 1000.0)
+        if entry is None:
             thread_alive = self.thread is not None and self.thread.is_alive()
             raise TimeoutError(
                 f"Timed out waiting for frame from camera {self} after {timeout_ms} ms. "
                 f"Read thread alive: {thread_alive}."
             )
+        self._last_async_seq = entry.seq
+
+        return entry.frame
+
+    def read_latest(self, timeout_ms: float = 200) -> TimestampedFrame:
+        """
+        Returns the most recent frame captured by the background read thread, with its capture time.
+
+        Unlike `async_read`, this does not wait for a frame newer than the one previously returned, so any
+        number of consumers can share the camera. It only waits (up to timeout_ms) when no frame was captured
+        yet. Older frames remain available through `frame_buffer` (e.g., `frame_buffer.nearest(t)` to align a
+        frame with an action timestamp).
+
+        Args:
+            timeout_ms (float): Maximum time in milliseconds to wait for a first frame. Defaults to 200ms.
+
+        Returns:
+            TimestampedFrame: The frame, its capture time in the `time.perf_counter()` clock and its sequence
+                number.
 
-        with self.frame_lock:
-            frame = self.latest_frame
-            self.new_frame_event.clear()
+        Raises:
+            DeviceNotConnectedError: If the camera is not connected.
+            TimeoutError: If no frame becomes available within the specified timeout.
+        """
+        if not self.is_connected:
+            raise DeviceNotConnectedError(f"{self} is not connected.")
 
-        if frame is None:
-            raise RuntimeError(f"Internal error: Event set but no frame available for {self}.")
+        if self.thread is None or not self.thread.is_alive():
+            self._start_read_thread()
 
-        return frame
+        entry = self.frame_buffer.wait_for_newer(-1, timeout_s=timeout_ms / 1000.0)
+        if entry is None:
+            raise TimeoutError(f"Timed out waiting for frame from camera {self} after {timeout_ms} ms.")
+        return entry
 
     def disconnect(self) -> None:
         """
@@ -533,6 +564,8 @@ class OpenCVCamera(Camera):
 
         if self.thread is not None:
             self._stop_read_thread()
+        self.frame_buffer.clear()
+        self._last_async_seq = -1
 
         if self.videocapture is not None:
             self.videocapture.release()
@@ -18,7 +18,7 @@ Provides the RealSenseCamera class for capturing frames from Intel RealSense cam
 
 import logging
 import time
-from threading import Event, Lock, Thread
+from threading import Event, Thread
 from typing import Any
 
 import cv2  # type: ignore  # TODO: add type stubs for OpenCV
@@ -34,11 +34,15 @@ from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnected
 
 from ..camera import Camera
 from ..configs import ColorMode
+from ..frame_buffer import FrameRingBuffer, TimestampedFrame
 from ..utils import get_cv2_rotation
 from .configuration_realsense import RealSenseCameraConfig
 
 logger = logging.getLogger(__name__)
 
+# Number of frames kept by the background read thread.
+FRAME_BUFFER_CAPACITY = 16
+
 
 class RealSenseCamera(Camera):
     """
@@ -132,9 +136,9 @@ class RealSenseCamera(Camera):
 
         self.thread: Thread | None = None
         self.stop_event: Event | None = None
-        self.frame_lock: Lock = Lock()
-        self.latest_frame: NDArray[Any] | None = None
-        self.new_frame_event: Event = Event()
+        self.frame_buffer = FrameRingBuffer(capacity=FRAME_BUFFER_CAPACITY, fps=self.fps)
+        self._last_async_seq = -1
+        self._last_capture_time: float | None = None
 
         self.rotation: int | None = get_cv2_rotation(config.rotation)
 
@@ -181,6 +185,7 @@ class RealSenseCamera(Camera):
             ) from e
 
         self._configure_capture_settings()
+        self.frame_buffer.fps = self.fps
 
         if warmup:
             time.sleep(
@@ -392,6 +397,7 @@ class RealSenseCamera(Camera):
             raise RuntimeError(f"{self} read failed (status={ret}).")
 
         color_frame = frame.get_color_frame()
+        self._last_capture_time = self._get_capture_time(color_frame)
         color_image_raw = np.asanyarray(color_frame.get_data())
 
         color_image_processed = self._postprocess_image(color_image_raw, color_mode)
@@ -401,6 +407,19 @@ class RealSenseCamera(Camera):
 
         return color_image_processed
 
+    def _get_capture_time(self, frame: Any) -> float:
+        """
+        Returns the capture time of a frame in the `time.perf_counter()` clock.
+
+        Frames timestamped in the global time domain (the camera clock synchronized with the host clock) are
+        dated from their hardware timestamp. For other domains, the time of reception is used.
+        """
+        now = time.perf_counter()
+        if frame.get_frame_timestamp_domain() == rs.timestamp_domain.global_time:
+            # The global time domain is in milliseconds since the epoch.
+            return min(now, now - (time.time() - frame.get_timestamp() / 1e3))
+        return now
+
     def _postprocess_image(
         self, image: NDArray[Any], color_mode: ColorMode | None = None, depth_frame: bool = False
     ) -> NDArray[Any]:
@@ -454,8 +473,7 @@ class RealSenseCamera(Camera):
 
         On each iteration:
         1. Reads a color frame with 500ms timeout
-        2. Stores result in latest_frame (thread-safe)
-        3. Sets new_frame_event to notify listeners
+        2. Pushes it to frame_buffer with its capture time, notifying waiting consumers
 
         Stops on DeviceNotConnectedError, logs other errors and continues.
         """
@@ -465,10 +483,7 @@ class RealSenseCamera(Camera):
         while not self.stop_event.is_set():
             try:
                 color_image = self.read(timeout_ms=500)
-
-                with self.frame_lock:
-                    self.latest_frame = color_image
-                self.new_frame_event.set()
+                self.frame_buffer.push(color_image, self._last_capture_time)
 
             except DeviceNotConnectedError:
                 break
@@ -505,7 +520,11 @@ class RealSenseCamera(Camera):
 
         This method retrieves the most recent color frame captured by the background
         read thread. It does not block waiting for the camera hardware directly,
-        but may wait up to timeout_ms for the background thread to provide a frame.
+        but may wait up to timeout_ms for the background thread to provide a frame
+        newer than the one returned by the previous call.
+
+        Consumers sharing the camera, or needing capture timestamps, should use
+        `read_latest` or `frame_buffer` instead.
 
         Args:
             timeout_ms (float): Maximum time in milliseconds to wait for a frame
@@ -526,21 +545,47 @@ class RealSenseCamera(Camera):
         if self.thread is None or not self.thread.is_alive():
             self._start_read_thread()
 
-        if not self.new_frame_event.wait(timeout=timeout_ms / 1000.0):
+        entry = self.frame_buffer.wait_for_newer(self._last_async_seq, timeout_s=timeout_ms / 1000.0)
+        if entry is None:
             thread_alive = self.thread is not None and self.thread.is_alive()
             raise TimeoutError(
                 f"Timed out waiting for frame from camera {self} after {timeout_ms} ms. "
                 f"Read thread alive: {thread_alive}."
             )
+        self._last_async_seq = entry.seq
+
+        return entry.frame
+
+    def read_latest(self, timeout_ms: float = 200) -> TimestampedFrame:
+        """
+        Returns the most recent frame captured by the background read thread, with its capture time.
+
+        Unlike `async_read`, this does not wait for a frame newer than the one previously returned, so any
+        number of consumers can share the camera. It only waits (up to timeout_ms) when no frame was captured
+        yet. Older frames remain available through `frame_buffer` (e.g., `frame_buffer.nearest(t)` to align a
+        frame with an action timestamp).
 
-        with self.frame_lock:
-            frame = self.latest_frame
-            self.new_frame_event.clear()
+        Args:
+            timeout_ms (float): Maximum time in milliseconds to wait for a first frame. Defaults to 200ms.
+
+        Returns:
+            TimestampedFrame: The frame, its capture time in the `time.perf_counter()` clock and its sequence
+                number.
 
-        if frame is None:
-            raise RuntimeError(f"Internal error: Event set but no frame available for {self}.")
+        Raises:
+            DeviceNotConnectedError: If the camera is not connected.
+            TimeoutError: If no frame becomes available within the specified timeout.
+        """
+        if not self.is_connected:
+            raise DeviceNotConnectedError(f"{self} is not connected.")
+
+        if self.thread is None or not self.thread.is_alive():
+            self._start_read_thread()
 
-        return frame
+        entry = self.frame_buffer.wait_for_newer(-1, timeout_s=timeout_ms / 1000.0)
+        if entry is None:
+            raise TimeoutError(f"Timed out waiting for frame from camera {self} after {timeout_ms} ms.")
+        return entry
 
     def disconnect(self) -> None:
         """
@@ -559,6 +604,8 @@ class RealSenseCamera(Camera):
 
         if self.thread is not None:
             self._stop_read_thread()
+        self.frame_buffer.clear()
+        self._last_async_seq = -1
 
         if self.rs_pipeline is not None:
             self.rs_pipeline.stop()
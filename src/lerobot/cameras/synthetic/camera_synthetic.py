@@ -0,0 +1,446 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Provides the SyntheticCamera and ReplayCamera classes, delivering generated or replayed frames with a
+realistic timing, to benchmark the recording pipeline without hardware.
+"""
+
+import logging
+import time
+from threading import Event, Thread
+from typing import Any
+
+import av
+import cv2  # type: ignore  # TODO: add type stubs for OpenCV
+import numpy as np
+from numpy.typing import NDArray  # type: ignore  # TODO: add type stubs for numpy.typing
+
+from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
+
+from ..camera import Camera
+from ..frame_buffer import FrameRingBuffer, TimestampedFrame
+from ..utils import get_cv2_rotation
+from .configuration_synthetic import ColorMode, ReplayCameraConfig, SyntheticCameraConfig
+
+# Number of frames kept by the background read thread.
+FRAME_BUFFER_CAPACITY = 16
+
+logger = logging.getLogger(__name__)
+
+
+class SyntheticCamera(Camera):
+    """
+    Camera generating random frames at a configured frame rate and resolution, without hardware.
+
+    Frames follow the timing model of the configuration: frame `k` is captured at `k / fps` seconds after
+    connection and becomes available `latency_ms` (plus a random jitter) later, a `read()` blocking until then.
+    Frames captured while nobody was reading are skipped, like with a camera driver keeping only the most recent
+    frame. Each frame is a fresh array which goes through the same color conversion and rotation as the frames
+    of an `OpenCVCamera`, and the background read thread, `async_read` and `read_latest` behave the same way,
+    so the camera-side cost of the recording pipeline can be measured on any machine.
+
+    Example:
+        ```python
+        from lerobot.cameras.synthetic import SyntheticCamera, SyntheticCameraConfig
+
+        camera = SyntheticCamera(SyntheticCameraConfig(fps=30, width=640, height=480, jitter_ms=2))
+        camera.connect()
+        frame = camera.async_read()
+        camera.disconnect()
+        ```
+    """
+
+    def __init__(self, config: SyntheticCameraConfig | ReplayCameraConfig):
+        """
+        Initializes the SyntheticCamera instance.
+
+        Args:
+            config: The configuration settings for the camera.
+        """
+        super().__init__(config)
+
+        self.config = config
+        self.color_mode = config.color_mode
+
+        self.thread: Thread | None = None
+        self.stop_event: Event | None = None
+        self.frame_buffer = FrameRingBuffer(capacity=FRAME_BUFFER_CAPACITY, fps=self.fps)
+        self._last_async_seq = -1
+        self._last_capture_time: float | None = None
+
+        self.rotation: int | None = get_cv2_rotation(config.rotation)
+        self._rng = np.random.default_rng(config.seed)
+        self._patterns: list[NDArray[Any]] = []
+        self._start_time: float | None = None
+        self._frame_index = -1
+
+        self._set_capture_size()
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}({self.width}x{self.height}@{self.fps})"
+
+    def _set_capture_size(self) -> None:
+        self.capture_width, self.capture_height = self.width, self.height
+        if self.rotation in [cv2.ROTATE_90_CLOCKWISE, cv2.ROTATE_90_COUNTERCLOCKWISE]:
+            self.capture_width, self.capture_height = self.height, self.width
+
+    @property
+    def is_connected(self) -> bool:
+        """Checks if the camera is currently connected."""
+        return self._start_time is not None
+
+    @staticmethod
+    def find_cameras() -> list[dict[str, Any]]:
+        """Synthetic cameras are not discoverable, they are created from their configuration."""
+        return []
+
+    def connect(self, warmup: bool = True) -> None:
+        """
+        Connects to the camera, generating the random frames cycled through.
+
+        Raises:
+            DeviceAlreadyConnectedError: If the camera is already connected.
+        """
+        if self.is_connected:
+            raise DeviceAlreadyConnectedError(f"{self} is already connected.")
+
+        shape = (self.capture_height, self.capture_width, 3)
+        self._patterns = [
+            self._rng.integers(0, 256, size=shape, dtype=np.uint8) for _ in range(self.config.num_patterns)
+        ]
+        self._start_clock()
+
+        if warmup:
+            self.read()
+
+        logger.info(f"{self} connected.")
+
+    def _start_clock(self) -> None:
+        self.frame_buffer.fps = self.fps
+        self._frame_index = -1
+        self._start_time = time.perf_counter()
+
+    def _next_raw_frame(self) -> NDArray[Any]:
+        """Returns the next raw BGR frame, at the capture resolution."""
+        return self._patterns[(self._frame_index + 1) % len(self._patterns)].copy()
+
+    def _wait_for_next_frame(self) -> float:
+        """Blocks until the next frame is available according to the timing model, returns its capture time."""
+        period_s = 1.0 / self.fps
+        latency_s = self.config.latency_ms / 1e3
+        now = time.perf_counter()
+
+        # The next frame is the most recent one captured, but never one already returned.
+        index = max(self._frame_index + 1, int((now - self._start_time - latency_s) / period_s))
+        while self.config.drop_rate > 0 and self._rng.random() < self.config.drop_rate:
+            index += 1
+        self._frame_index = index
+
+        capture_time = self._start_time + index * period_s
+        delay_s = latency_s
+        if self.config.jitter_ms > 0:
+            delay_s = max(0.0, delay_s + self._rng.normal(0.0, self.config.jitter_ms / 1e3))
+        remaining_s = capture_time + delay_s - time.perf_counter()
+        if remaining_s > 0:
+            time.sleep(remaining_s)
+        return capture_time
+
+    def read(self, color_mode: ColorMode | None = None) -> NDArray[Any]:
+        """
+        Reads a single frame synchronously, blocking until it is available according to the timing model.
+
+        Args:
+            color_mode (Optional[ColorMode]): If specified, overrides the default color mode
+                (`self.color_mode`) for this read operation.
+
+        Returns:
+            np.ndarray: The frame as a NumPy array in the format (height, width, channels), using the specified
+                or default color mode and applying any configured rotation.
+
+        Raises:
+            DeviceNotConnectedError: If the camera is not connected.
+            ValueError: If an invalid `color_mode` is requested.
+        """
+        if not self.is_connected:
+            raise DeviceNotConnectedError(f"{self} is not connected.")
+
+        start_time = time.perf_counter()
+
+        raw_frame = self._next_raw_frame()
+        self._last_capture_time = self._wait_for_next_frame()
+        processed_frame = self._postprocess_image(raw_frame, color_mode)
+
+        read_duration_ms = (time.perf_counter() - start_time) * 1e3
+        logger.debug(f"{self} read took: {read_duration_ms:.1f}ms")
+
+        return processed_frame
+
+    def _postprocess_image(self, image: NDArray[Any], color_mode: ColorMode | None = None) -> NDArray[Any]:
+        """
+        Applies color conversion and rotation to a raw BGR frame, as `OpenCVCamera` does.
+
+        Args:
+            image (np.ndarray): The raw BGR frame.
+            color_mode (Optional[ColorMode]): The target color mode (RGB or BGR). If None, uses the instance's
+                default `self.color_mode`.
+
+        Returns:
+            np.ndarray: The processed image frame.
+
+        Raises:
+            ValueError: If the requested `color_mode` is invalid.
+        """
+        requested_color_mode = self.color_mode if color_mode is None else color_mode
+
+        if requested_color_mode not in (ColorMode.RGB, ColorMode.BGR):
+            raise ValueError(
+                f"Invalid color mode '{requested_color_mode}'. Expected {ColorMode.RGB} or {ColorMode.BGR}."
+            )
+
+        processed_image = image
+        if requested_color_mode == ColorMode.RGB:
+            processed_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+        if self.rotation in [cv2.ROTATE_90_CLOCKWISE, cv2.ROTATE_90_COUNTERCLOCKWISE, cv2.ROTATE_180]:
+            processed_image = cv2.rotate(processed_image, self.rotation)
+
+        return processed_image
+
+    def _read_loop(self) -> None:
+        """
+        Internal loop run by the background thread for asynchronous reading.
+
+        Pushes every frame to frame_buffer with its capture time. Stops on DeviceNotConnectedError, logs other
+        errors and continues.
+        """
+        if self.stop_event is None:
+            raise RuntimeError(f"{self}: stop_event is not initialized before starting read loop.")
+
+        while not self.stop_event.is_set():
+            try:
+                color_image = self.read()
+                self.frame_buffer.push(color_image, self._last_capture_time)
+
+            except DeviceNotConnectedError:
+                break
+            except Exception as e:
+                logger.warning(f"Error reading frame in background thread for {self}: {e}")
+
+    def _start_read_thread(self) -> None:
+        """Starts or restarts the background read thread if it's not running."""
+        if self.thread is not None and self.thread.is_alive():
+            self.thread.join(timeout=0.1)
+        if self.stop_event is not None:
+            self.stop_event.set()
+
+        self.stop_event = Event()
+        self.thread = Thread(target=self._read_loop, args=(), name=f"{self}_read_loop")
+        self.thread.daemon = True
+        self.thread.start()
+
+    def _stop_read_thread(self) -> None:
+        """Signals the background read thread to stop and waits for it to join."""
+        if self.stop_event is not None:
+            self.stop_event.set()
+
+        if self.thread is not None and self.thread.is_alive():
+            self.thread.join(timeout=2.0)
+
+        self.thread = None
+        self.stop_event = None
+
+    def async_read(self, timeout_ms: float = 200) -> NDArray[Any]:
+        """
+        Reads the latest available frame asynchronously, waiting up to timeout_ms for a frame newer than the one
+        returned by the previous call.
+
+        Args:
+            timeout_ms (float): Maximum time in milliseconds to wait for a frame. Defaults to 200ms.
+
+        Returns:
+            np.ndarray: The latest captured frame.
+
+        Raises:
+            DeviceNotConnectedError: If the camera is not connected.
+            TimeoutError: If no frame becomes available within the specified timeout.
+        """
+        if not self.is_connected:
+            raise DeviceNotConnectedError(f"{self} is not connected.")
+
+        if self.thread is None or not self.thread.is_alive():
+            self._start_read_thread()
+
+        entry = self.frame_buffer.wait_for_newer(self._last_async_seq, timeout_s=timeout_ms / 1000.0)
+        if entry is None:
+            raise TimeoutError(f"Timed out waiting for frame from camera {self} after {timeout_ms} ms.")
+        self._last_async_seq = entry.seq
+
+        return entry.frame
+
+    def read_latest(self, timeout_ms: float = 200) -> TimestampedFrame:
+        """
+        Returns the most recent frame captured by the background read thread, with its capture time.
+
+        Args:
+            timeout_ms (float): Maximum time in milliseconds to wait for a first frame. Defaults to 200ms.
+
+        Raises:
+            DeviceNotConnectedError: If the camera is not connected.
+            TimeoutError: If no frame becomes available within the specified timeout.
+        """
+        if not self.is_connected:
+            raise DeviceNotConnectedError(f"{self} is not connected.")
+
+        if self.thread is None or not self.thread.is_alive():
+            self._start_read_thread()
+
+        entry = self.frame_buffer.wait_for_newer(-1, timeout_s=timeout_ms / 1000.0)
+        if entry is None:
+            raise TimeoutError(f"Timed out waiting for frame from camera {self} after {timeout_ms} ms.")
+        return entry
+
+    def disconnect(self) -> None:
+        """
+        Disconnects from the camera, stopping the background read thread (if running).
+
+        Raises:
+            DeviceNotConnectedError: If the camera is already disconnected.
+        """
+        if not self.is_connected and self.thread is None:
+            raise DeviceNotConnectedError(f"{self} not connected.")
+
+        if self.thread is not None:
+            self._stop_read_thread()
+        self._start_time = None
+        self.frame_buffer.clear()
+        self._last_async_seq = -1
+        self._release()
+
+        logger.info(f"{self} disconnected.")
+
+    def _release(self) -> None:
+        self._patterns = []
+
+
+class ReplayCamera(SyntheticCamera):
+    """
+    Camera replaying the frames of a video file, e.g. a dataset mp4, with the timing model of `SyntheticCamera`.
+
+    Frames are decoded on the fly in the read thread (or all at connection with `preload=True`), converted to
+    BGR and resized if needed, so that they reach `_postprocess_image` as the raw frames of an OpenCV camera.
+
+    Example:
+        ```python
+        from lerobot.cameras.synthetic import ReplayCamera, ReplayCameraConfig
+
+        camera = ReplayCamera(ReplayCameraConfig("front.mp4", jitter_ms=2))
+        camera.connect()
+        frame = camera.async_read()
+        camera.disconnect()
+        ```
+    """
+
+    def __init__(self, config: ReplayCameraConfig):
+        """
+        Initializes the ReplayCamera instance.
+
+        Args:
+            config: The configuration settings for the camera.
+        """
+        super().__init__(config)
+        self.path = config.path
+        self.container: av.container.InputContainer | None = None
+        self._frames = None
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}({self.path})"
+
+    @property
+    def is_connected(self) -> bool:
+        """Checks if the video is currently opened."""
+        return self._start_time is not None and (self.container is not None or bool(self._patterns))
+
+    def connect(self, warmup: bool = True) -> None:
+        """
+        Opens the video file, using its frame rate and resolution unless overridden in the configuration.
+
+        Raises:
+            DeviceAlreadyConnectedError: If the camera is already connected.
+            ConnectionError: If the video file cannot be opened.
+        """
+        if self.is_connected:
+            raise DeviceAlreadyConnectedError(f"{self} is already connected.")
+
+        try:
+            self.container = av.open(str(self.path))
+        except (OSError, av.error.FFmpegError) as e:
+            raise ConnectionError(f"Failed to open {self}: {e}") from e
+
+        stream = self.container.streams.video[0]
+        if self.fps is None:
+            self.fps = round(float(stream.average_rate))
+        if self.width is None or self.height is None:
+            self.width, self.height = stream.codec_context.width, stream.codec_context.height
+            if self.rotation in [cv2.ROTATE_90_CLOCKWISE, cv2.ROTATE_90_COUNTERCLOCKWISE]:
+                self.width, self.height = self.height, self.width
+        self._set_capture_size()
+        self._frames = self.container.decode(video=0)
+
+        if self.config.preload:
+            self._patterns = list(self._decoded_frames())
+            self._close_container()
+            if not self._patterns:
+                raise ConnectionError(f"Failed to open {self}: the video has no frames.")
+
+        self._start_clock()
+
+        if warmup:
+            self.read()
+
+        logger.info(f"{self} connected.")
+
+    def _decoded_frames(self):
+        for frame in self._frames:
+            image = frame.to_ndarray(format="bgr24")
+            if image.shape[:2] != (self.capture_height, self.capture_width):
+                image = cv2.resize(image, (self.capture_width, self.capture_height))
+            yield image
+
+    def _next_raw_frame(self) -> NDArray[Any]:
+        if self._patterns:
+            if not self.config.loop and self._frame_index + 1 >= len(self._patterns):
+                raise RuntimeError(f"{self} reached the end of the video.")
+            return super()._next_raw_frame()
+
+        image = next(self._decoded_frames(), None)
+        if image is None:
+            if not self.config.loop:
+                raise RuntimeError(f"{self} reached the end of the video.")
+            self.container.seek(0)
+            self._frames = self.container.decode(video=0)
+            image = next(self._decoded_frames(), None)
+            if image is None:
+                raise RuntimeError(f"{self} failed to decode a frame.")
+        return image
+
+    def _close_container(self) -> None:
+        if self.container is not None:
+            self.container.close()
+        self.container = None
+        self._frames = None
+
+    def _release(self) -> None:
+        self._close_container()
+        super()._release()
@@ -0,0 +1,124 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from ..configs import CameraConfig, ColorMode, Cv2Rotation
+
+__all__ = ["SyntheticCameraConfig", "ReplayCameraConfig", "ColorMode", "Cv2Rotation"]
+
+
+def _validate_timing(config: "SyntheticCameraConfig | ReplayCameraConfig") -> None:
+    if config.color_mode not in (ColorMode.RGB, ColorMode.BGR):
+        raise ValueError(
+            f"`color_mode` is expected to be {ColorMode.RGB.value} or {ColorMode.BGR.value}, but {config.color_mode} is provided."
+        )
+    if config.latency_ms < 0 or config.jitter_ms < 0:
+        raise ValueError(
+            f"`latency_ms` and `jitter_ms` must be non-negative, but {config.latency_ms} and {config.jitter_ms} are provided."
+        )
+    if not 0 <= config.drop_rate < 1:
+        raise ValueError(f"`drop_rate` must be in [0, 1), but {config.drop_rate} is provided.")
+
+
+@CameraConfig.register_subclass("synthetic")
+@dataclass
+class SyntheticCameraConfig(CameraConfig):
+    """Configuration class for cameras generating synthetic frames, without hardware.
+
+    Frames are delivered at the configured frame rate, following a timing model: each frame is captured on a
+    fixed schedule and becomes available after `latency_ms`, plus a random delay of standard deviation
+    `jitter_ms`. A fraction `drop_rate` of the frames is skipped, as a camera does under bus contention.
+    Frames go through the same color conversion and rotation as the OpenCV camera frames.
+
+    Example configurations:
+    ```python
+    SyntheticCameraConfig(fps=30, width=640, height=480)
+    SyntheticCameraConfig(fps=30, width=1280, height=720, latency_ms=20, jitter_ms=2, drop_rate=0.01)
+    ```
+
+    Attributes:
+        fps: Frames per second. Defaults to 30.
+        width: Frame width in pixels. Defaults to 640.
+        height: Frame height in pixels. Defaults to 480.
+        color_mode: Color mode for image output (RGB or BGR). Defaults to RGB.
+        rotation: Image rotation setting (0°, 90°, 180°, or 270°). Defaults to no rotation.
+        latency_ms: Mean delay between the capture of a frame and its availability.
+        jitter_ms: Standard deviation of the delay.
+        drop_rate: Probability for each frame to be skipped.
+        num_patterns: Number of distinct random frames cycled through.
+        seed: Seed of the frame contents and of the timing model.
+    """
+
+    color_mode: ColorMode = ColorMode.RGB
+    rotation: Cv2Rotation = Cv2Rotation.NO_ROTATION
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    drop_rate: float = 0.0
+    num_patterns: int = 8
+    seed: int | None = None
+
+    def __post_init__(self) -> None:
+        self.fps = 30 if self.fps is None else self.fps
+        self.width = 640 if self.width is None else self.width
+        self.height = 480 if self.height is None else self.height
+        if self.num_patterns < 1:
+            raise ValueError(f"`num_patterns` must be at least 1, but {self.num_patterns} is provided.")
+        _validate_timing(self)
+
+
+@CameraConfig.register_subclass("replay")
+@dataclass
+class ReplayCameraConfig(CameraConfig):
+    """Configuration class for cameras replaying the frames of a video file, e.g. a dataset mp4.
+
+    The frames are decoded with PyAV (any codec used by LeRobot datasets, including AV1) and delivered with the
+    same timing model as `SyntheticCameraConfig`. Frame rate and resolution default to those of the video;
+    frames are resized when a different resolution is requested.
+
+    Example configurations:
+    ```python
+    ReplayCameraConfig("videos/observation.images.front/chunk-000/file-000.mp4")
+    ReplayCameraConfig("front.mp4", fps=30, width=640, height=480, jitter_ms=2, preload=True)
+    ```
+
+    Attributes:
+        path: Path to the video file.
+        fps: Frames per second. Defaults to the frame rate of the video.
+        width: Frame width in pixels. Defaults to the width of the video.
+        height: Frame height in pixels. Defaults to the height of the video.
+        color_mode: Color mode for image output (RGB or BGR). Defaults to RGB.
+        rotation: Image rotation setting (0°, 90°, 180°, or 270°). Defaults to no rotation.
+        latency_ms: Mean delay between the capture of a frame and its availability.
+        jitter_ms: Standard deviation of the delay.
+        drop_rate: Probability for each frame to be skipped.
+        loop: Whether to restart from the first frame at the end of the video, instead of failing.
+        preload: Whether to decode all the frames at connection, to exclude decoding from the measured time.
+        seed: Seed of the timing model.
+    """
+
+    path: Path
+    color_mode: ColorMode = ColorMode.RGB
+    rotation: Cv2Rotation = Cv2Rotation.NO_ROTATION
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    drop_rate: float = 0.0
+    loop: bool = True
+    preload: bool = False
+    seed: int | None = None
+
+    def __post_init__(self) -> None:
+        self.path = Path(self.path)
+        _validate_timing(self)
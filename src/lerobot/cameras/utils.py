@@ -38,6 +38,16 @@ def make_cameras_from_configs(camera_configs: dict[str, CameraConfig]) -> dict[s
 
             cameras[key] = RealSenseCamera(cfg)
 
+        elif cfg.type == "synthetic":
+            from .synthetic import SyntheticCamera
+
+            cameras[key] = SyntheticCamera(cfg)
+
+        elif cfg.type == "replay":
+            from .synthetic import ReplayCamera
+
+            cameras[key] = ReplayCamera(cfg)
+
         elif cfg.type == "reachy2_camera":
             from .reachy2_camera.reachy2_camera import Reachy2Camera
 
@@ -56,6 +56,12 @@ class EvalConfig:
     batch_size: int = 50
     # `use_async_envs` specifies whether to use asynchronous environments (multiprocessing).
     use_async_envs: bool = False
+    # `refill_envs` starts the next episode in an environment as soon as it is done, instead of running the
+    # episodes batch by batch (for policies without observation history, see `scheduled_rollout`).
+    refill_envs: bool = True
+    # `batch_tasks` runs the environments of all the tasks of a suite (e.g. LIBERO) through a single policy batch,
+    # instead of one task after the other (or one per thread with `env.max_parallel_tasks`).
+    batch_tasks: bool = False
 
     def __post_init__(self) -> None:
         if self.batch_size > self.n_episodes:
@@ -62,6 +62,9 @@ class PreTrainedConfig(draccus.ChoiceRegistry, HubMixin, abc.ABC):  # type: igno
     # `use_amp` determines whether to use Automatic Mixed Precision (AMP) for training and evaluation. With AMP,
     # automatic gradient scaling is used.
     use_amp: bool = False
+    # `compile_pipelines` runs the pre- and post-processors in their compiled execution mode (fused normalization
+    # and tensor steps, see `DataProcessorPipeline.compile`) instead of step by step.
+    compile_pipelines: bool = False
 
     push_to_hub: bool = True  # type: ignore[assignment] # TODO: use a different name to avoid override
     repo_id: str | None = None
@@ -59,6 +59,14 @@ class TrainPipelineConfig(HubMixin):
     save_checkpoint: bool = True
     # Checkpoint is saved every `save_freq` training iterations and after the last training step.
     save_freq: int = 20_000
+    # Set to true to write checkpoints on a background thread. Training only stalls for the time it takes to
+    # copy the policy and optimizer state to CPU memory.
+    async_checkpoint: bool = False
+    # If set, only the `keep_last_n_checkpoints` most recent checkpoints are kept on disk.
+    keep_last_n_checkpoints: int | None = None
+    # Maximum size of a policy weights file (e.g. "5GB") for asynchronous checkpoints. Larger policies are
+    # split into several shards. By default, the weights are written to a single file.
+    checkpoint_max_shard_size: str | None = None
     use_policy_training_preset: bool = True
     optimizer: OptimizerConfig | None = None
     scheduler: LRSchedulerConfig | None = None
@@ -116,6 +124,11 @@ class TrainPipelineConfig(HubMixin):
             train_dir = f"{now:%Y-%m-%d}/{now:%H-%M-%S}_{self.job_name}"
             self.output_dir = Path("outputs/train") / train_dir
 
+        if self.keep_last_n_checkpoints is not None and self.keep_last_n_checkpoints < 1:
+            raise ValueError(
+                f"'keep_last_n_checkpoints' must be at least 1, got {self.keep_last_n_checkpoints}."
+            )
+
         if isinstance(self.dataset.repo_id, list):
             raise NotImplementedError("LeRobotMultiDataset is not currently implemented.")
 
@@ -19,7 +19,8 @@ from dataclasses import dataclass, field
 from typing import Any
 
 import torch
-from torchvision.transforms import v2
+import torch.nn.functional as nn_F  # noqa: N812
+from torchvision.transforms import InterpolationMode, v2
 from torchvision.transforms.v2 import (
     Transform,
     functional as F,  # noqa: N812
@@ -179,6 +180,9 @@ class ImageTransformsConfig:
     # By default, transforms are applied in Torchvision's suggested order (shown below).
     # Set this to True to apply them in a random order.
     random_order: bool = False
+    # Set this flag to `true` to apply the transforms to whole batches on the training device after collation
+    # (see `BatchedImageTransforms`), instead of to each sample in the dataloader workers.
+    batched_on_device: bool = False
     tfs: dict[str, ImageTransformConfig] = field(
         default_factory=lambda: {
             "brightness": ImageTransformConfig(
@@ -257,3 +261,228 @@ class ImageTransforms(Transform):
 
     def forward(self, *inputs: Any) -> Any:
         return self.tf(*inputs)
+
+
+def _expand_as(params: torch.Tensor, images: torch.Tensor) -> torch.Tensor:
+    """Reshapes per-sample parameters of shape (B,) to broadcast against images of shape (B, ...)."""
+    return params.view(-1, *([1] * (images.ndim - 1)))
+
+
+def _blend(image1: torch.Tensor, image2: torch.Tensor, ratio: torch.Tensor) -> torch.Tensor:
+    ratio = _expand_as(ratio, image1)
+    return (ratio * image1 + (1.0 - ratio) * image2).clamp(0.0, 1.0)
+
+
+def _adjust_brightness(images: torch.Tensor, factors: torch.Tensor) -> torch.Tensor:
+    return (_expand_as(factors, images) * images).clamp(0.0, 1.0)
+
+
+def _adjust_contrast(images: torch.Tensor, factors: torch.Tensor) -> torch.Tensor:
+    grayscale = F.rgb_to_grayscale(images) if images.shape[-3] == 3 else images
+    mean = grayscale.mean(dim=(-3, -2, -1), keepdim=True)
+    return _blend(images, mean, factors)
+
+
+def _adjust_saturation(images: torch.Tensor, factors: torch.Tensor) -> torch.Tensor:
+    if images.shape[-3] == 1:
+        return images
+    return _blend(images, F.rgb_to_grayscale(images), factors)
+
+
+def _adjust_hue(images: torch.Tensor, factors: torch.Tensor) -> torch.Tensor:
+    if images.shape[-3] == 1:
+        return images
+    # RGB -> HSV
+    value, _ = images.max(dim=-3)
+    min_value, _ = images.min(dim=-3)
+    chroma = value - min_value
+    is_gray = chroma == 0
+    saturation = chroma / torch.where(is_gray, torch.ones_like(value), value)
+    chroma = torch.where(is_gray, torch.ones_like(chroma), chroma)
+    red, green, blue = images.unbind(dim=-3)
+    red_c, green_c, blue_c = (value - red) / chroma, (value - green) / chroma, (value - blue) / chroma
+    hue = torch.where(
+        value == red,
+        blue_c - green_c,
+        torch.where(value == green, 2.0 + red_c - blue_c, 4.0 + green_c - red_c),
+    )
+    hue = torch.where(is_gray, torch.zeros_like(hue), hue)
+    hue = (hue / 6.0 + _expand_as(factors, hue)) % 1.0
+
+    # HSV -> RGB
+    n = torch.tensor([5.0, 3.0, 1.0], device=images.device, dtype=images.dtype).view(3, 1, 1)
+    k = (n + hue.unsqueeze(-3) * 6.0) % 6.0
+    weights = torch.clamp(torch.minimum(k, 4.0 - k), 0.0, 1.0)
+    return value.unsqueeze(-3) - (value * saturation).unsqueeze(-3) * weights
+
+
+def _adjust_sharpness(images: torch.Tensor, factors: torch.Tensor) -> torch.Tensor:
+    # A sharpness factor of 0 gives the degenerate (smoothed) image which is blended with the original one.
+    return _blend(images, F.adjust_sharpness(images, sharpness_factor=0.0), factors)
+
+
+def _uniform(low: float, high: float, batch_size: int, device: torch.device) -> torch.Tensor:
+    return torch.empty(batch_size, device=device).uniform_(low, high)
+
+
+class _BatchedColorJitter:
+    """Batched `v2.ColorJitter`: adjusts brightness, contrast, saturation and hue with per-sample factors."""
+
+    def __init__(self, **kwargs):
+        jitter = v2.ColorJitter(**kwargs)
+        self.adjustments = [
+            (adjust, bounds)
+            for adjust, bounds in (
+                (_adjust_brightness, jitter.brightness),
+                (_adjust_contrast, jitter.contrast),
+                (_adjust_saturation, jitter.saturation),
+                (_adjust_hue, jitter.hue),
+            )
+            if bounds is not None
+        ]
+
+    def __call__(self, images: torch.Tensor) -> torch.Tensor:
+        # As with `v2.ColorJitter`, the adjustments are applied in a random order (drawn once per batch).
+        for i in torch.randperm(len(self.adjustments)).tolist():
+            adjust, (low, high) = self.adjustments[i]
+            images = adjust(images, _uniform(low, high, images.shape[0], images.device))
+        return images
+
+
+class _BatchedSharpnessJitter:
+    """Batched `SharpnessJitter`, with a sharpness factor drawn per sample."""
+
+    def __init__(self, **kwargs):
+        self.sharpness = SharpnessJitter(**kwargs).sharpness
+
+    def __call__(self, images: torch.Tensor) -> torch.Tensor:
+        return _adjust_sharpness(images, _uniform(*self.sharpness, images.shape[0], images.device))
+
+
+class _BatchedRandomAffine:
+    """Batched `v2.RandomAffine`, with a rotation, translation and scale drawn per sample.
+
+    Only the `degrees`, `translate`, `scale` and `interpolation` (nearest or bilinear) arguments are supported.
+    Areas outside of the transformed images are filled with 0.
+    """
+
+    SUPPORTED_KWARGS = ("degrees", "translate", "scale", "interpolation")
+    INTERPOLATION_MODES = {InterpolationMode.NEAREST: "nearest", InterpolationMode.BILINEAR: "bilinear"}
+
+    def __init__(self, **kwargs):
+        unsupported = set(kwargs) - set(self.SUPPORTED_KWARGS)
+        if unsupported:
+            raise ValueError(
+                f"RandomAffine arguments {sorted(unsupported)} are not supported by batched transforms. "
+                f"Supported arguments: {list(self.SUPPORTED_KWARGS)}"
+            )
+        affine = v2.RandomAffine(**kwargs)
+        if affine.interpolation not in self.INTERPOLATION_MODES:
+            raise ValueError(
+                f"Interpolation '{affine.interpolation}' is not supported by batched transforms."
+            )
+        self.degrees = affine.degrees
+        self.translate = affine.translate
+        self.scale = affine.scale
+        self.mode = self.INTERPOLATION_MODES[affine.interpolation]
+
+    def __call__(self, images: torch.Tensor) -> torch.Tensor:
+        batch_size, device = images.shape[0], images.device
+        height, width = images.shape[-2:]
+
+        angle = torch.deg2rad(_uniform(*self.degrees, batch_size, device))
+        translation = torch.zeros(batch_size, 2, device=device)
+        if self.translate is not None:
+            max_dx, max_dy = self.translate[0] * width, self.translate[1] * height
+            translation[:, 0] = _uniform(-max_dx, max_dx, batch_size, device).round()
+            translation[:, 1] = _uniform(-max_dy, max_dy, batch_size, device).round()
+        scale = (
+            _uniform(*self.scale, batch_size, device)
+            if self.scale is not None
+            else torch.ones(batch_size, device=device)
+        )
+
+        # Inverse affine matrices, mapping the output coordinates to the input ones as in `F.affine`, expressed
+        # in the normalized coordinates of `affine_grid`.
+        cos, sin = torch.cos(angle) / scale, torch.sin(angle) / scale
+        tx, ty = translation.unbind(dim=-1)
+        theta = torch.stack(
+            [
+                torch.stack([cos, sin * height / width, -(cos * tx + sin * ty) * 2.0 / width], dim=-1),
+                torch.stack([-sin * width / height, cos, -(-sin * tx + cos * ty) * 2.0 / height], dim=-1),
+            ],
+            dim=-2,
+        ).to(images.dtype)
+
+        # The frames of a sample share its parameters.
+        frames = images.reshape(-1, *images.shape[-3:])
+        theta = theta.repeat_interleave(frames.shape[0] // batch_size, dim=0)
+        grid = nn_F.affine_grid(theta, list(frames.shape), align_corners=False)
+        output = nn_F.grid_sample(frames, grid, mode=self.mode, padding_mode="zeros", align_corners=False)
+        return output.view(images.shape)
+
+
+def make_batched_transform_from_config(cfg: ImageTransformConfig) -> Callable | None:
+    if cfg.type == "Identity":
+        return None
+    elif cfg.type == "ColorJitter":
+        return _BatchedColorJitter(**cfg.kwargs)
+    elif cfg.type == "SharpnessJitter":
+        return _BatchedSharpnessJitter(**cfg.kwargs)
+    elif cfg.type == "RandomAffine":
+        return _BatchedRandomAffine(**cfg.kwargs)
+    else:
+        raise ValueError(f"Transform '{cfg.type}' is not valid.")
+
+
+class BatchedImageTransforms(torch.nn.Module):
+    """Applies the transforms of an `ImageTransformsConfig` to whole batches of images.
+
+    This is the batched counterpart of `ImageTransforms`, meant to run on the training device after collation
+    instead of on each sample in the dataloader workers. As with `ImageTransforms`, each sample gets its own
+    random subset of transforms and its own random parameters, all drawn at once for the whole batch.
+
+    Images are float tensors in [0, 1] of shape (B, C, H, W), or (B, T, C, H, W) in which case the T frames of
+    a sample share the same transforms and parameters, as when `ImageTransforms` is applied to a sample. When
+    `random_order` is set, the order of the transforms is drawn once per batch.
+    """
+
+    def __init__(self, cfg: ImageTransformsConfig) -> None:
+        super().__init__()
+        self._cfg = cfg
+
+        weights = []
+        self.transforms = {}
+        for tf_name, tf_cfg in cfg.tfs.items():
+            if tf_cfg.weight <= 0.0:
+                continue
+
+            self.transforms[tf_name] = make_batched_transform_from_config(tf_cfg)
+            weights.append(tf_cfg.weight)
+
+        self.n_subset = min(len(self.transforms), cfg.max_num_transforms)
+        self.enabled = cfg.enable and self.n_subset > 0
+        self.weights = torch.tensor(weights, dtype=torch.float32)
+
+    def forward(self, images: torch.Tensor) -> torch.Tensor:
+        if not self.enabled:
+            return images
+
+        batch_size = images.shape[0]
+        # Draw the subset of transforms of each sample, without replacement.
+        selected = torch.multinomial(self.weights.expand(batch_size, -1), self.n_subset)
+        selected_mask = torch.zeros(batch_size, len(self.transforms), dtype=torch.bool)
+        selected_mask.scatter_(1, selected, True)
+
+        order = (
+            torch.randperm(len(self.transforms)) if self._cfg.random_order else range(len(self.transforms))
+        )
+        transforms = list(self.transforms.values())
+        for i in order:
+            if transforms[i] is None:
+                continue
+            indices = selected_mask[:, i].nonzero().squeeze(1).to(images.device)
+            if len(indices) == 0:
+                continue
+            images = images.index_copy(0, indices, transforms[i](images[indices]))
+        return images
@@ -0,0 +1,725 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""In-process simulation of a serial servo bus, to run and benchmark `MotorsBus` code without hardware.
+
+The simulated port handler replaces the port handler of the vendor SDK. The SDK packet handlers and group
+readers/writers are left untouched: they serialize instruction packets exactly as they would for a real
+adapter, and the simulated motors answer with byte-accurate status packets built from their control tables
+(`feetech/tables.py` and `dynamixel/tables.py`). Responses are only made available once they would have
+crossed the wire, following the baud rate, the return delay time of each motor and a model of the
+USB-serial adapter (latency, jitter, packet loss and corruption). The measured cost of `sync_read`,
+`sync_write` and of the control loops built on them is therefore representative of a real arm.
+
+Example:
+```python
+bus = FeetechMotorsBus("/dev/simulated", motors)
+simulator = simulate_bus(bus, LinkModel(usb_latency_ms=1.0, loss_rate=0.001))
+bus.connect()
+bus.sync_read("Present_Position")
+print(simulator.stats())
+```
+"""
+
+import random
+import time
+from collections import deque
+from dataclasses import dataclass
+
+from .encoding_utils import (
+    decode_sign_magnitude,
+    decode_twos_complement,
+    encode_sign_magnitude,
+    encode_twos_complement,
+)
+from .motors_bus import MotorsBus
+
+INST_PING = 0x01
+INST_READ = 0x02
+INST_WRITE = 0x03
+INST_REG_WRITE = 0x04
+INST_ACTION = 0x05
+INST_FACTORY_RESET = 0x06
+INST_REBOOT = 0x08
+INST_SYNC_READ = 0x82
+INST_SYNC_WRITE = 0x83
+INST_BULK_READ = 0x92
+INST_BULK_WRITE = 0x93
+
+BROADCAST_ID = 0xFE
+# Latency timer of the SDK port handlers (ms), used in their packet timeouts
+LATENCY_TIMER = 16
+
+# Unit of the Return_Delay_Time register, in seconds
+RETURN_DELAY_UNIT_S = 2e-6
+# Bits per byte on the wire: start bit, 8 data bits, stop bit
+BITS_PER_BYTE = 10
+
+
+def _crc16(data: bytes) -> int:
+    """CRC-16 (polynomial 0x8005) used by Dynamixel protocol 2.0."""
+    crc = 0
+    for byte in data:
+        crc = ((crc << 8) ^ _CRC_TABLE[((crc >> 8) ^ byte) & 0xFF]) & 0xFFFF
+    return crc
+
+
+def _make_crc_table() -> list[int]:
+    table = []
+    for i in range(256):
+        crc = i << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x8005) if crc & 0x8000 else crc << 1
+        table.append(crc & 0xFFFF)
+    return table
+
+
+_CRC_TABLE = _make_crc_table()
+
+
+@dataclass
+class LinkModel:
+    """Timing and reliability model of the link between the host and the motors.
+
+    Attributes:
+        usb_latency_ms: Mean one-way latency of the USB-serial adapter, paid by every instruction and every
+            status packet on top of their transmission time at the bus baud rate.
+        jitter_ms: Standard deviation of the USB latency.
+        loss_rate: Probability for each status packet to be lost.
+        corruption_rate: Probability for each status packet to have a flipped bit, failing its checksum.
+        processing_us: Time taken by a motor to process an instruction, before its return delay time.
+        seed: Seed of the random draws.
+    """
+
+    usb_latency_ms: float = 0.5
+    jitter_ms: float = 0.0
+    loss_rate: float = 0.0
+    corruption_rate: float = 0.0
+    processing_us: float = 50.0
+    seed: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.usb_latency_ms < 0 or self.jitter_ms < 0 or self.processing_us < 0:
+            raise ValueError("`usb_latency_ms`, `jitter_ms` and `processing_us` must be non-negative.")
+        if not 0 <= self.loss_rate <= 1 or not 0 <= self.corruption_rate <= 1:
+            raise ValueError(
+                f"`loss_rate` and `corruption_rate` must be in [0, 1], but {self.loss_rate} and "
+                f"{self.corruption_rate} are provided."
+            )
+
+
+@dataclass(frozen=True)
+class SimulatedBusStats:
+    instructions: int
+    status_packets: int
+    lost_packets: int
+    corrupted_packets: int
+    bytes_to_motors: int
+    bytes_from_motors: int
+
+
+class _FeetechProtocol:
+    """Feetech SCS/STS protocol 0: `FF FF ID LEN INST PARAMS CHECKSUM`, little endian."""
+
+    address_size = 1
+    memory_size = 256
+    header_size = 2
+    status_level_name = "Response_Status_Level"
+    # Feetech firmwares do not report instruction or range errors
+    instruction_error = None
+    access_error = None
+    # Present_Position = physical position - Homing_Offset
+    homing_sign = -1
+
+    @staticmethod
+    def _checksum(data: bytes) -> int:
+        return ~sum(data) & 0xFF
+
+    def parse(self, buffer: bytearray) -> list[tuple[int, int, bytes]]:
+        packets = []
+        while True:
+            idx = buffer.find(b"\xff\xff")
+            if idx < 0:
+                del buffer[: len(buffer) - 1]
+                break
+            del buffer[:idx]
+            if len(buffer) < 4:
+                break
+            total = buffer[3] + 4
+            if len(buffer) < total:
+                break
+            packet = bytes(buffer[:total])
+            if self._checksum(packet[2:-1]) != packet[-1]:
+                # Motors ignore corrupted packets
+                del buffer[:2]
+                continue
+            del buffer[:total]
+            packets.append((packet[2], packet[4], packet[5:-1]))
+        return packets
+
+    def status_packet(self, id_: int, error: int, data: bytes) -> bytes:
+        body = bytes([id_, len(data) + 2, error]) + data
+        return b"\xff\xff" + body + bytes([self._checksum(body)])
+
+    def ping_data(self, motor: "SimulatedMotor") -> bytes:
+        return b""
+
+    def responds(self, instruction: int, status_level: int) -> bool:
+        return status_level >= 1 or instruction in (INST_PING, INST_READ, INST_SYNC_READ)
+
+    def decode_sign(self, value: int, encoding: int) -> int:
+        return decode_sign_magnitude(value, encoding)
+
+    def encode_sign(self, value: int, encoding: int) -> int:
+        return encode_sign_magnitude(value, encoding)
+
+
+class _Dynamixel2Protocol:
+    """Dynamixel protocol 2.0: `FF FF FD 00 ID LEN_L LEN_H INST PARAMS CRC_L CRC_H`, with byte stuffing."""
+
+    address_size = 2
+    memory_size = 1024
+    header_size = 4
+    status_level_name = "Status_Return_Level"
+    instruction_error = 0x02
+    access_error = 0x07
+    # Present_Position = physical position + Homing_Offset
+    homing_sign = 1
+
+    HEADER = b"\xff\xff\xfd\x00"
+    INST_STATUS = 0x55
+
+    @staticmethod
+    def _stuff(length: bytes, body: bytes) -> bytes:
+        # Insert 0xFD after every FF FF FD, looking back into the (unstuffed) length bytes like the SDK does
+        seq = length + body
+        out = bytearray()
+        for i in range(2, len(seq)):
+            out.append(seq[i])
+            if seq[i] == 0xFD and seq[i - 1] == 0xFF and seq[i - 2] == 0xFF:
+                out.append(0xFD)
+        return bytes(out)
+
+    @staticmethod
+    def _unstuff(length: bytes, body: bytes) -> bytes:
+        seq = length + body
+        out = bytearray()
+        for i in range(2, len(seq)):
+            is_stuffing = (
+                seq[i] == 0xFD
+                and i + 1 < len(seq)
+                and seq[i + 1] == 0xFD
+                and seq[i - 1] == 0xFF
+                and seq[i - 2] == 0xFF
+            )
+            if not is_stuffing:
+                out.append(seq[i])
+        return bytes(out)
+
+    def parse(self, buffer: bytearray) -> list[tuple[int, int, bytes]]:
+        packets = []
+        while True:
+            idx = buffer.find(self.HEADER)
+            if idx < 0:
+                del buffer[: max(0, len(buffer) - 3)]
+                break
+            del buffer[:idx]
+            if len(buffer) < 7:
+                break
+            total = 7 + (buffer[5] | buffer[6] << 8)
+            if len(buffer) < total:
+                break
+            packet = bytes(buffer[:total])
+            if _crc16(packet[:-2]) != (packet[-2] | packet[-1] << 8):
+                del buffer[:4]
+                continue
+            del buffer[:total]
+            body = self._unstuff(packet[5:7], packet[7:-2])
+            packets.append((packet[4], body[0], body[1:]))
+        return packets
+
+    def status_packet(self, id_: int, error: int, data: bytes) -> bytes:
+        body = bytes([self.INST_STATUS, error]) + data
+        length = len(body) + 2
+        body = self._stuff(bytes([length & 0xFF, length >> 8]), body)
+        length = len(body) + 2
+        packet = self.HEADER + bytes([id_, length & 0xFF, length >> 8]) + body
+        crc = _crc16(packet)
+        return packet + bytes([crc & 0xFF, crc >> 8])
+
+    def ping_data(self, motor: "SimulatedMotor") -> bytes:
+        return motor.get("Model_Number").to_bytes(2, "little") + bytes([motor.get("Firmware_Version")])
+
+    def responds(self, instruction: int, status_level: int) -> bool:
+        if instruction == INST_PING:
+            return True
+        if instruction in (INST_READ, INST_SYNC_READ, INST_BULK_READ):
+            return status_level >= 1
+        return status_level >= 2
+
+    def decode_sign(self, value: int, encoding: int) -> int:
+        return decode_twos_complement(value, encoding)
+
+    def encode_sign(self, value: int, encoding: int) -> int:
+        return encode_twos_complement(value, encoding)
+
+
+class SimulatedMotor:
+    """Control table memory and position dynamics of a simulated servo.
+
+    When torque is enabled, the position moves towards the goal position at `max_velocity` (steps/s).
+    Positions are exposed through Present_Position, offset by Homing_Offset as on the real motors.
+    """
+
+    def __init__(
+        self,
+        id_: int,
+        model: str,
+        ctrl_table: dict[str, tuple[int, int]],
+        encodings: dict[str, int],
+        model_number: int,
+        resolution: int,
+        baudrate_table: dict[int, int],
+        baudrate: int,
+        protocol: _FeetechProtocol | _Dynamixel2Protocol,
+        max_velocity: float | None = None,
+    ):
+        self.model = model
+        self.ctrl_table = ctrl_table
+        self.encodings = encodings
+        self.baudrate_table = baudrate_table
+        self.protocol = protocol
+        self.max_velocity = max_velocity if max_velocity is not None else float(resolution)
+        self.memory = bytearray(protocol.memory_size)
+        self.registered: tuple[int, bytes] | None = None
+
+        defaults = {
+            "Model_Number": model_number,
+            "Firmware_Major_Version": 3,
+            "Firmware_Minor_Version": 10,
+            "Firmware_Version": 52,
+            "ID": id_,
+            "Baud_Rate": baudrate_table[baudrate],
+            "Return_Delay_Time": 250,
+            "Response_Status_Level": 1,
+            "Status_Return_Level": 2,
+            "Max_Position_Limit": resolution - 1,
+            "Present_Voltage": 120,
+            "Present_Input_Voltage": 120,
+            "Present_Temperature": 30,
+        }
+        for name, value in defaults.items():
+            if name in ctrl_table:
+                self.set(name, value)
+
+        self._position = float(resolution // 2)
+        self._last_update = time.perf_counter()
+        self.set_signed("Goal_Position", resolution // 2)
+        self._write_present_position()
+
+    @property
+    def id(self) -> int:
+        return self.get("ID")
+
+    @property
+    def baudrate(self) -> int | None:
+        index = self.get("Baud_Rate")
+        return next((baud for baud, idx in self.baudrate_table.items() if idx == index), None)
+
+    @property
+    def return_delay_s(self) -> float:
+        return self.get("Return_Delay_Time") * RETURN_DELAY_UNIT_S
+
+    @property
+    def status_level(self) -> int:
+        return self.get(self.protocol.status_level_name)
+
+    @property
+    def position(self) -> float:
+        """Physical position, in steps."""
+        return self._position
+
+    @position.setter
+    def position(self, value: float) -> None:
+        self._position = float(value)
+        self._write_present_position()
+
+    def get(self, data_name: str) -> int:
+        addr, length = self.ctrl_table[data_name]
+        return int.from_bytes(self.memory[addr : addr + length], "little")
+
+    def set(self, data_name: str, value: int) -> None:
+        addr, length = self.ctrl_table[data_name]
+        self.memory[addr : addr + length] = (value & ((1 << (8 * length)) - 1)).to_bytes(length, "little")
+
+    def get_signed(self, data_name: str) -> int:
+        value = self.get(data_name)
+        if data_name in self.encodings:
+            value = self.protocol.decode_sign(value, self.encodings[data_name])
+        return value
+
+    def set_signed(self, data_name: str, value: int) -> None:
+        if data_name in self.encodings:
+            value = self.protocol.encode_sign(value, self.encodings[data_name])
+        self.set(data_name, value)
+
+    def _homing_offset(self) -> int:
+        return self.get_signed("Homing_Offset") if "Homing_Offset" in self.ctrl_table else 0
+
+    def _write_present_position(self) -> None:
+        present = round(self._position) + self.protocol.homing_sign * self._homing_offset()
+        self.set_signed("Present_Position", present)
+
+    def update(self, now: float) -> None:
+        """Advances the position dynamics to `now`."""
+        dt, self._last_update = max(0.0, now - self._last_update), now
+        if self.get("Torque_Enable"):
+            target = self.get_signed("Goal_Position") - self.protocol.homing_sign * self._homing_offset()
+            step = self.max_velocity * dt
+            self._position += max(-step, min(step, target - self._position))
+            if "Moving" in self.ctrl_table:
+                self.set("Moving", int(round(self._position) != target))
+        self._write_present_position()
+
+    def read(self, addr: int, length: int, now: float) -> tuple[int, bytes]:
+        if addr + length > len(self.memory):
+            return self.protocol.access_error or 0, bytes(length)
+        self.update(now)
+        return 0, bytes(self.memory[addr : addr + length])
+
+    def write(self, addr: int, data: bytes, now: float) -> int:
+        if addr + len(data) > len(self.memory):
+            return self.protocol.access_error or 0
+        self.update(now)
+        self.memory[addr : addr + len(data)] = data
+        # Writing the homing offset shifts Present_Position right away
+        self._write_present_position()
+        return 0
+
+
+class ServoBusSimulator:
+    """Motors attached to a simulated bus, answering the instruction packets sent by the host.
+
+    `transmit` consumes the bytes written by the host and returns the status packets of the motors, each
+    paired with the time at which it is fully received by the host. Instructions are serialized on the
+    half-duplex bus: an instruction only starts once the responses to the previous one are over.
+    """
+
+    def __init__(
+        self,
+        motors: list[SimulatedMotor],
+        protocol: _FeetechProtocol | _Dynamixel2Protocol,
+        link: LinkModel | None = None,
+    ):
+        self.motors = motors
+        self.protocol = protocol
+        self.link = link if link is not None else LinkModel()
+        self._rng = random.Random(self.link.seed)
+        self._rx_buffer = bytearray()
+        self._bus_free_at = 0.0
+        self._instructions = 0
+        self._status_packets = 0
+        self._lost_packets = 0
+        self._corrupted_packets = 0
+        self._bytes_to_motors = 0
+        self._bytes_from_motors = 0
+
+    def motor(self, id_: int) -> SimulatedMotor | None:
+        return next((m for m in self.motors if m.id == id_), None)
+
+    def _usb_latency_s(self) -> float:
+        latency_ms = self.link.usb_latency_ms
+        if self.link.jitter_ms > 0:
+            latency_ms = max(0.0, self._rng.gauss(latency_ms, self.link.jitter_ms))
+        return latency_ms / 1e3
+
+    def transmit(self, data: bytes, now: float, baudrate: int) -> list[tuple[float, bytes]]:
+        byte_time_s = BITS_PER_BYTE / baudrate
+        self._bytes_to_motors += len(data)
+        self._rx_buffer += data
+        t = max(now + self._usb_latency_s(), self._bus_free_at) + len(data) * byte_time_s
+
+        listeners = [m for m in self.motors if m.baudrate == baudrate]
+        responses = []
+        for id_, instruction, params in self.protocol.parse(self._rx_buffer):
+            self._instructions += 1
+            for motor_id, return_delay_s, error, reply in self._execute(
+                id_, instruction, params, t, listeners
+            ):
+                t += return_delay_s + self.link.processing_us / 1e6
+                packet = self.protocol.status_packet(motor_id, error, reply)
+                t += len(packet) * byte_time_s
+                self._status_packets += 1
+                if self._rng.random() < self.link.loss_rate:
+                    self._lost_packets += 1
+                    continue
+                if self._rng.random() < self.link.corruption_rate:
+                    self._corrupted_packets += 1
+                    packet = bytearray(packet)
+                    packet[self._rng.randrange(self.protocol.header_size, len(packet))] ^= (
+                        1 << self._rng.randrange(8)
+                    )
+                    packet = bytes(packet)
+                self._bytes_from_motors += len(packet)
+                responses.append((t + self._usb_latency_s(), packet))
+        self._bus_free_at = t
+        return responses
+
+    def _execute(
+        self, id_: int, instruction: int, params: bytes, now: float, listeners: list[SimulatedMotor]
+    ) -> list[tuple[int, float, int, bytes]]:
+        """Applies an instruction and returns the (id, return delay, error, data) of each response, in order."""
+        a = self.protocol.address_size
+        by_id = {m.id: m for m in listeners}
+        targets = listeners if id_ == BROADCAST_ID else [by_id[id_]] if id_ in by_id else []
+        unicast = id_ != BROADCAST_ID
+        replies = []
+
+        def reply(motor: SimulatedMotor, error: int = 0, data: bytes = b"", always: bool = False) -> None:
+            if always or self.protocol.responds(instruction, motor.status_level):
+                replies.append((motor.id, motor.return_delay_s, error, data))
+
+        def address(offset: int) -> int:
+            return int.from_bytes(params[offset : offset + a], "little")
+
+        if instruction == INST_PING:
+            for motor in sorted(targets, key=lambda m: m.id):
+                reply(motor, data=self.protocol.ping_data(motor), always=True)
+        elif instruction == INST_READ and unicast:
+            for motor in targets:
+                error, data = motor.read(address(0), address(a), now)
+                reply(motor, error, data)
+        elif instruction in (INST_WRITE, INST_REG_WRITE):
+            for motor in targets:
+                # Respond with the ID the instruction was addressed to, even when writing the ID itself
+                motor_id, return_delay_s = motor.id, motor.return_delay_s
+                if instruction == INST_WRITE:
+                    error = motor.write(address(0), params[a:], now)
+                else:
+                    error, motor.registered = 0, (address(0), params[a:])
+                if unicast and self.protocol.responds(instruction, motor.status_level):
+                    replies.append((motor_id, return_delay_s, error, b""))
+        elif instruction == INST_ACTION:
+            for motor in targets:
+                if motor.registered is not None:
+                    motor.write(*motor.registered, now)
+                    motor.registered = None
+                if unicast:
+                    reply(motor)
+        elif instruction == INST_SYNC_READ and not unicast:
+            addr, length = address(0), address(a)
+            for motor_id in params[2 * a :]:
+                if motor_id in by_id:
+                    error, data = by_id[motor_id].read(addr, length, now)
+                    reply(by_id[motor_id], error, data)
+        elif instruction == INST_SYNC_WRITE and not unicast:
+            addr, length = address(0), address(a)
+            for i in range(2 * a, len(params) - length, length + 1):
+                if params[i] in by_id:
+                    by_id[params[i]].write(addr, params[i + 1 : i + 1 + length], now)
+        elif instruction == INST_BULK_READ and isinstance(self.protocol, _Dynamixel2Protocol):
+            for i in range(0, len(params), 5):
+                motor_id, addr, length = params[i], address(i + 1), address(i + 3)
+                if motor_id in by_id:
+                    error, data = by_id[motor_id].read(addr, length, now)
+                    reply(by_id[motor_id], error, data)
+        elif instruction == INST_BULK_WRITE and isinstance(self.protocol, _Dynamixel2Protocol):
+            i = 0
+            while i + 5 <= len(params):
+                motor_id, addr, length = params[i], address(i + 1), address(i + 3)
+                if motor_id in by_id:
+                    by_id[motor_id].write(addr, params[i + 5 : i + 5 + length], now)
+                i += 5 + length
+        elif instruction in (INST_REBOOT, INST_FACTORY_RESET) and isinstance(
+            self.protocol, _Dynamixel2Protocol
+        ):
+            for motor in targets:
+                motor.set("Torque_Enable", 0)
+                if unicast:
+                    reply(motor)
+        elif unicast and self.protocol.instruction_error is not None:
+            for motor in targets:
+                reply(motor, self.protocol.instruction_error, always=True)
+        return replies
+
+    def stats(self) -> SimulatedBusStats:
+        return SimulatedBusStats(
+            instructions=self._instructions,
+            status_packets=self._status_packets,
+            lost_packets=self._lost_packets,
+            corrupted_packets=self._corrupted_packets,
+            bytes_to_motors=self._bytes_to_motors,
+            bytes_from_motors=self._bytes_from_motors,
+        )
+
+
+class SimulatedPortHandler:
+    """Drop-in replacement for the `PortHandler` of the vendor SDKs, connected to a `ServoBusSimulator`.
+
+    Like a serial port opened with `timeout=0`, `readPort` never blocks: it returns the bytes of the status
+    packets whose arrival time has passed, so the SDK busy-waits on the port for as long as a real transfer
+    would take. Late responses, e.g. received after a timeout, are left in the input buffer until
+    `clearPort` is called, as on real hardware.
+    """
+
+    def __init__(self, port_name: str, simulator: ServoBusSimulator, baudrate: int = 1_000_000):
+        self.is_open = False
+        self.baudrate = baudrate
+        self.packet_start_time = 0.0
+        self.packet_timeout = 0.0
+        self.tx_time_per_byte = 0.0
+        self.is_using = False
+        self.port_name = port_name
+        self.simulator = simulator
+        self._pending: deque[tuple[float, bytes]] = deque()
+
+    def openPort(self):  # noqa: N802
+        return self.setBaudRate(self.baudrate)
+
+    def closePort(self):  # noqa: N802
+        self._pending.clear()
+        self.is_open = False
+
+    def clearPort(self):  # noqa: N802
+        self._pending.clear()
+
+    def setPortName(self, port_name):  # noqa: N802
+        self.port_name = port_name
+
+    def getPortName(self):  # noqa: N802
+        return self.port_name
+
+    def setBaudRate(self, baudrate):  # noqa: N802
+        baud = self.getCFlagBaud(baudrate)
+        if baud <= 0:
+            return False
+        self.baudrate = baudrate
+        return self.setupPort(baud)
+
+    def getBaudRate(self):  # noqa: N802
+        return self.baudrate
+
+    def _ready(self, now: float) -> int:
+        return sum(len(packet) for ready_time, packet in self._pending if ready_time <= now)
+
+    def getBytesAvailable(self):  # noqa: N802
+        return self._ready(time.perf_counter())
+
+    def readPort(self, length):  # noqa: N802
+        now = time.perf_counter()
+        data = bytearray()
+        while self._pending and self._pending[0][0] <= now and len(data) < length:
+            ready_time, packet = self._pending.popleft()
+            missing = length - len(data)
+            data += packet[:missing]
+            if len(packet) > missing:
+                self._pending.appendleft((ready_time, packet[missing:]))
+        return bytes(data)
+
+    def writePort(self, packet):  # noqa: N802
+        packet = bytes(packet)
+        responses = self.simulator.transmit(packet, time.perf_counter(), self.baudrate)
+        # Responses come back in order: a response is only complete once the previous ones are
+        last_ready = self._pending[-1][0] if self._pending else 0.0
+        for ready_time, response in responses:
+            last_ready = max(last_ready, ready_time)
+            self._pending.append((last_ready, response))
+        return len(packet)
+
+    def setPacketTimeout(self, packet_length):  # noqa: N802
+        self.packet_start_time = self.getCurrentTime()
+        self.packet_timeout = (self.tx_time_per_byte * packet_length) + (LATENCY_TIMER * 2.0) + 2.0
+
+    def setPacketTimeoutMillis(self, msec):  # noqa: N802
+        self.packet_start_time = self.getCurrentTime()
+        self.packet_timeout = msec
+
+    def isPacketTimeout(self):  # noqa: N802
+        if self.getTimeSinceStart() > self.packet_timeout:
+            self.packet_timeout = 0
+            return True
+        return False
+
+    def getCurrentTime(self):  # noqa: N802
+        return time.perf_counter() * 1e3
+
+    def getTimeSinceStart(self):  # noqa: N802
+        return self.getCurrentTime() - self.packet_start_time
+
+    def setupPort(self, cflag_baud):  # noqa: N802
+        self._pending.clear()
+        self.is_open = True
+        self.tx_time_per_byte = (1000.0 / self.baudrate) * BITS_PER_BYTE
+        return True
+
+    def getCFlagBaud(self, baudrate):  # noqa: N802
+        return baudrate if baudrate > 0 else -1
+
+
+def simulate_bus(
+    bus: MotorsBus, link: LinkModel | None = None, max_velocity: float | None = None
+) -> ServoBusSimulator:
+    """Attaches simulated motors to `bus`, replacing the port handler of its SDK.
+
+    One motor is simulated per motor of the bus, with the model, ID and baud rate it expects. Must be called
+    before `bus.connect()`.
+
+    Args:
+        bus: A `FeetechMotorsBus` (protocol 0) or `DynamixelMotorsBus`.
+        link: Timing and reliability model of the link. Defaults to `LinkModel()`.
+        max_velocity: Speed of the simulated motors, in steps/s. Defaults to one turn per second.
+
+    Returns:
+        ServoBusSimulator: The simulated motors, to inspect their state and the transfer statistics.
+    """
+    if bus.is_connected:
+        raise RuntimeError("The bus must be simulated before it is connected.")
+
+    bus_type = type(bus).__name__
+    if bus_type == "FeetechMotorsBus":
+        if bus.protocol_version != 0:
+            raise ValueError("Only Feetech protocol 0 can be simulated.")
+        protocol = _FeetechProtocol()
+    elif bus_type == "DynamixelMotorsBus":
+        protocol = _Dynamixel2Protocol()
+    else:
+        raise ValueError(f"Simulation is not supported for {bus_type}.")
+
+    motors = [
+        SimulatedMotor(
+            id_=m.id,
+            model=m.model,
+            ctrl_table=bus.model_ctrl_table[m.model],
+            encodings=bus.model_encoding_table.get(m.model, {}),
+            model_number=bus.model_number_table[m.model],
+            resolution=bus.model_resolution_table[m.model],
+            baudrate_table=bus.model_baudrate_table[m.model],
+            baudrate=bus.default_baudrate,
+            protocol=protocol,
+            max_velocity=max_velocity,
+        )
+        for m in bus.motors.values()
+    ]
+    simulator = ServoBusSimulator(motors, protocol, link)
+    port_handler = SimulatedPortHandler(bus.port, simulator, bus.default_baudrate)
+    if bus_type == "FeetechMotorsBus":
+        from .feetech.feetech import patch_setPacketTimeout
+
+        port_handler.setPacketTimeout = patch_setPacketTimeout.__get__(port_handler, SimulatedPortHandler)
+
+    bus.port_handler = port_handler
+    # The group readers/writers hold a reference to the port they transmit on
+    for group in (bus.sync_reader, bus.sync_writer):
+        group.port = port_handler
+    return simulator
@@ -174,7 +174,15 @@ def save_optimizer_state(
 
 def _save_single_optimizer_state(optimizer: torch.optim.Optimizer, save_dir: Path) -> None:
     """Save a single optimizer's state to disk."""
-    state = optimizer.state_dict()
+    save_optimizer_state_dict(optimizer.state_dict(), save_dir)
+
+
+def save_optimizer_state_dict(state_dict: dict[str, Any], save_dir: Path) -> None:
+    """Save an optimizer `state_dict` (as returned by `Optimizer.state_dict()`) to disk.
+
+    This is useful when the state has been snapshotted beforehand, e.g. to write it from another thread.
+    """
+    state = dict(state_dict)
     param_groups = state.pop("param_groups")
     flat_state = flatten_dict(state)
     save_file(flat_state, save_dir / OPTIMIZER_STATE)
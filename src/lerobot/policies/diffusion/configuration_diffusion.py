@@ -98,6 +98,10 @@ class DiffusionConfig(PreTrainedConfig):
         clip_sample_range: The magnitude of the clipping range as described above.
         num_inference_steps: Number of reverse diffusion steps to use at inference time (steps are evenly
             spaced). If not provided, this defaults to be the same as `num_train_timesteps`.
+        cache_image_features: Whether `select_action` keeps the features of the images in the observation
+            history instead of the images themselves, so that only the newest frame goes through the vision
+            backbone at each step, instead of all `n_obs_steps` frames at each action chunk. This gives the same
+            actions in eval mode (where the crop is deterministic) and does not affect training.
         do_mask_loss_for_padding: Whether to mask the loss when there are copy-padded actions. See
             `LeRobotDataset` and `load_previous_and_future_frames` for more information. Note, this defaults
             to False as the original Diffusion Policy implementation does the same.
@@ -147,6 +151,7 @@ class DiffusionConfig(PreTrainedConfig):
 
     # Inference
     num_inference_steps: int | None = None
+    cache_image_features: bool = True
 
     # Loss computation
     do_mask_loss_for_padding: bool = False
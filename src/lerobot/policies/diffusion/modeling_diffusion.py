@@ -43,6 +43,10 @@ from lerobot.policies.utils import (
 )
 from lerobot.utils.constants import ACTION, OBS_ENV_STATE, OBS_IMAGES, OBS_STATE
 
+# Key of the image features of all the cameras, (B, n_obs_steps, num_cameras * feature_dim), which replace the
+# images in the observation queues when `config.cache_image_features` is set.
+OBS_IMAGE_FEATURES = "observation.image_features"
+
 
 class DiffusionPolicy(PreTrainedPolicy):
     """
@@ -85,7 +89,8 @@ class DiffusionPolicy(PreTrainedPolicy):
             ACTION: deque(maxlen=self.config.n_action_steps),
         }
         if self.config.image_features:
-            self._queues[OBS_IMAGES] = deque(maxlen=self.config.n_obs_steps)
+            image_key = OBS_IMAGE_FEATURES if self.config.cache_image_features else OBS_IMAGES
+            self._queues[image_key] = deque(maxlen=self.config.n_obs_steps)
         if self.config.env_state_feature:
             self._queues[OBS_ENV_STATE] = deque(maxlen=self.config.n_obs_steps)
 
@@ -127,6 +132,9 @@ class DiffusionPolicy(PreTrainedPolicy):
         if self.config.image_features:
             batch = dict(batch)  # shallow copy so that adding a key doesn't modify the original
             batch[OBS_IMAGES] = torch.stack([batch[key] for key in self.config.image_features], dim=-4)
+            if self.config.cache_image_features:
+                # Only encode the newest frame: the features of the previous ones are already in the queue.
+                batch[OBS_IMAGE_FEATURES] = self.diffusion.encode_images(batch.pop(OBS_IMAGES)[:, None])[:, 0]
         # NOTE: It's important that this happens after stacking the images into a single key.
         self._queues = populate_queues(self._queues, batch)
 
@@ -234,37 +242,40 @@ class DiffusionModel(nn.Module):
 
         return sample
 
+    def encode_images(self, images: Tensor) -> Tensor:
+        """Encode images of shape (B, S, num_cameras, C, H, W) to features of shape
+        (B, S, num_cameras * feature_dim)."""
+        batch_size, n_obs_steps = images.shape[:2]
+        if self.config.use_separate_rgb_encoder_per_camera:
+            # Combine batch and sequence dims while rearranging to make the camera index dimension first.
+            images_per_camera = einops.rearrange(images, "b s n ... -> n (b s) ...")
+            img_features_list = torch.cat(
+                [encoder(images) for encoder, images in zip(self.rgb_encoder, images_per_camera, strict=True)]
+            )
+            # Separate batch and sequence dims back out. The camera index dim gets absorbed into the
+            # feature dim (effectively concatenating the camera features).
+            return einops.rearrange(
+                img_features_list, "(n b s) ... -> b s (n ...)", b=batch_size, s=n_obs_steps
+            )
+        # Combine batch, sequence, and "which camera" dims before passing to shared encoder.
+        img_features = self.rgb_encoder(einops.rearrange(images, "b s n ... -> (b s n) ..."))
+        # Separate batch dim and sequence dim back out. The camera index dim gets absorbed into the
+        # feature dim (effectively concatenating the camera features).
+        return einops.rearrange(img_features, "(b s n) ... -> b s (n ...)", b=batch_size, s=n_obs_steps)
+
     def _prepare_global_conditioning(self, batch: dict[str, Tensor]) -> Tensor:
-        """Encode image features and concatenate them all together along with the state vector."""
-        batch_size, n_obs_steps = batch[OBS_STATE].shape[:2]
+        """Encode image features and concatenate them all together along with the state vector.
+
+        Images already encoded by `encode_images` can be passed as "observation.image_features" instead of
+        "observation.images".
+        """
         global_cond_feats = [batch[OBS_STATE]]
         # Extract image features.
         if self.config.image_features:
-            if self.config.use_separate_rgb_encoder_per_camera:
-                # Combine batch and sequence dims while rearranging to make the camera index dimension first.
-                images_per_camera = einops.rearrange(batch[OBS_IMAGES], "b s n ... -> n (b s) ...")
-                img_features_list = torch.cat(
-                    [
-                        encoder(images)
-                        for encoder, images in zip(self.rgb_encoder, images_per_camera, strict=True)
-                    ]
-                )
-                # Separate batch and sequence dims back out. The camera index dim gets absorbed into the
-                # feature dim (effectively concatenating the camera features).
-                img_features = einops.rearrange(
-                    img_features_list, "(n b s) ... -> b s (n ...)", b=batch_size, s=n_obs_steps
-                )
+            if OBS_IMAGE_FEATURES in batch:
+                global_cond_feats.append(batch[OBS_IMAGE_FEATURES])
             else:
-                # Combine batch, sequence, and "which camera" dims before passing to shared encoder.
-                img_features = self.rgb_encoder(
-                    einops.rearrange(batch[OBS_IMAGES], "b s n ... -> (b s n) ...")
-                )
-                # Separate batch dim and sequence dim back out. The camera index dim gets absorbed into the
-                # feature dim (effectively concatenating the camera features).
-                img_features = einops.rearrange(
-                    img_features, "(b s n) ... -> b s (n ...)", b=batch_size, s=n_obs_steps
-                )
-            global_cond_feats.append(img_features)
+                global_cond_feats.append(self.encode_images(batch[OBS_IMAGES]))
 
         if self.config.env_state_feature:
             global_cond_feats.append(batch[OBS_ENV_STATE])
@@ -279,6 +290,8 @@ class DiffusionModel(nn.Module):
             "observation.state": (B, n_obs_steps, state_dim)
 
             "observation.images": (B, n_obs_steps, num_cameras, C, H, W)
+                OR
+            "observation.image_features": (B, n_obs_steps, num_cameras * feature_dim)
                 AND/OR
             "observation.environment_state": (B, n_obs_steps, environment_dim)
         }
@@ -166,6 +166,8 @@ class ProcessorConfigKwargs(TypedDict, total=False):
         preprocessor_overrides: A dictionary of overrides for the preprocessor configuration.
         postprocessor_overrides: A dictionary of overrides for the postprocessor configuration.
         dataset_stats: Dataset statistics for normalization.
+        compile_pipelines: Enables the compiled execution mode of both pipelines (see
+            `DataProcessorPipeline.compile`).
     """
 
     preprocessor_config_filename: str | None
@@ -173,6 +175,7 @@ class ProcessorConfigKwargs(TypedDict, total=False):
     preprocessor_overrides: dict[str, Any] | None
     postprocessor_overrides: dict[str, Any] | None
     dataset_stats: dict[str, dict[str, torch.Tensor]] | None
+    compile_pipelines: bool
 
 
 def make_pre_post_processors(
@@ -227,7 +230,7 @@ def make_pre_post_processors(
             kwargs["preprocessor_overrides"] = preprocessor_overrides
             kwargs["postprocessor_overrides"] = postprocessor_overrides
 
-        return (
+        processors = (
             PolicyProcessorPipeline.from_pretrained(
                 pretrained_model_name_or_path=pretrained_path,
                 config_filename=kwargs.get(
@@ -249,7 +252,7 @@ def make_pre_post_processors(
         )
 
     # Create a new processor based on policy type
-    if isinstance(policy_cfg, TDMPCConfig):
+    elif isinstance(policy_cfg, TDMPCConfig):
         from lerobot.policies.tdmpc.processor_tdmpc import make_tdmpc_pre_post_processors
 
         processors = make_tdmpc_pre_post_processors(
@@ -332,6 +335,9 @@ def make_pre_post_processors(
     else:
         raise NotImplementedError(f"Processor for policy type '{policy_cfg.type}' is not implemented.")
 
+    if kwargs.get("compile_pipelines", False):
+        for processor in processors:
+            processor.compile()
     return processors
 
 
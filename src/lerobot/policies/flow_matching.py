@@ -0,0 +1,33 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers shared by the flow matching policies (pi0, pi05 and SmolVLA)."""
+
+import torch
+from torch import Tensor
+
+
+def make_denoising_times(num_steps: int, bsize: int, device: torch.device | str) -> Tensor:
+    """Times of the Euler steps of the flow matching, from 1 towards 0, with shape (num_steps, bsize).
+
+    They are accumulated in float32 on CPU, as in the original `while time >= -dt / 2` loop, so that the actions
+    do not depend on whether the loop is compiled.
+    """
+    dt = torch.tensor(-1.0 / num_steps, dtype=torch.float32)
+    time = torch.tensor(1.0, dtype=torch.float32)
+    times = []
+    while time >= -dt / 2:
+        times.append(time.clone())
+        time += dt
+    return torch.stack(times)[:, None].expand(len(times), bsize).to(device)
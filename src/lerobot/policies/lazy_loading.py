@@ -0,0 +1,173 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Lazy loading of the pretrained weights of the policies.
+
+By default, `PreTrainedPolicy.from_pretrained` builds the policy with randomly initialized weights, then copies
+the weights of the checkpoint into it: the model is allocated twice (the policy and the state dict), and the random
+initialization of large models (pi0, pi05, GROOT) takes a long time. With `lazy_load=True`, the parameters are
+created on the meta device (`init_empty_weights`), which allocates no memory and skips their initialization, and
+are then replaced one by one by the tensors of the memory-mapped safetensors files, read directly on the target
+device and cast to the dtype of the parameters (`load_state_dict_lazily`). The shards are read one after the other,
+so that only the weights of the policy and one tensor of the checkpoint are in memory at a time.
+
+The buffers are created as usual, since the non-persistent ones are not saved in the checkpoints.
+"""
+
+import threading
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import accelerate
+import torch
+from safetensors import safe_open
+from torch import Tensor, nn
+
+# `accelerate.init_empty_weights` patches `nn.Module.register_parameter` for the whole process, and restores the
+# method it found when entering: concurrent contexts could leave the patch in place
+_init_empty_weights_lock = threading.Lock()
+
+
+@contextmanager
+def init_empty_weights() -> Iterator[None]:
+    """Create the parameters of the modules built in the context on the meta device.
+
+    This is `accelerate.init_empty_weights` without the buffers, entered by one thread at a time, which keeps the
+    parameters already on the meta device: `accelerate` wraps them in new parameters, which unties the weights tied
+    by assignment (e.g. `tie_weights` of transformers). The dtype conversions of the modules (e.g.
+    `module.to(torch.bfloat16)`) apply to the empty parameters, but they cannot be moved to another device in the
+    context. Since the patch applies to the whole process, the other threads should not build modules meanwhile.
+    """
+    with _init_empty_weights_lock:
+        register_parameter = nn.Module.register_parameter
+        with accelerate.init_empty_weights(include_buffers=False):
+            register_empty_parameter = nn.Module.register_parameter
+
+            def register_parameter_once(module: nn.Module, name: str, param: nn.Parameter | None):
+                if param is not None and param.device.type == "meta":
+                    register_parameter(module, name, param)
+                else:
+                    register_empty_parameter(module, name, param)
+
+            nn.Module.register_parameter = register_parameter_once
+            try:
+                yield
+            finally:
+                nn.Module.register_parameter = register_empty_parameter
+
+
+def empty_parameters(model: nn.Module) -> list[str]:
+    """Names of the parameters of `model` that are still on the meta device."""
+    return [name for name, param in model.named_parameters() if param.device.type == "meta"]
+
+
+def _state_dict_tensors(model: nn.Module) -> tuple[dict[int, list[tuple[nn.Module, str]]], dict[str, Tensor]]:
+    """The modules holding each tensor, and the tensors by name in the state dict (tied tensors have several names)."""
+    slots: dict[int, list[tuple[nn.Module, str]]] = defaultdict(list)
+    tensors: dict[str, Tensor] = {}
+    for prefix, module in model.named_modules(remove_duplicate=False):
+        prefix = f"{prefix}." if prefix else ""
+        named_tensors = list(module._parameters.items()) + [
+            (name, buffer)
+            for name, buffer in module._buffers.items()
+            if name not in module._non_persistent_buffers_set
+        ]
+        for name, tensor in named_tensors:
+            if tensor is not None:
+                tensors[f"{prefix}{name}"] = tensor
+                slots[id(tensor)].append((module, name))
+    return slots, tensors
+
+
+def check_checkpoint_keys(
+    model: nn.Module, model_files: list[str], key_map: dict[str, str] | None = None
+) -> tuple[list[str], list[str]]:
+    """The missing and unexpected keys that `load_state_dict_lazily` would report, without reading any tensor.
+
+    Only the headers of the safetensors files are read, so that the policy can still be loaded another way (e.g.
+    with its regular initialization if some parameters are missing) before the weights take any memory.
+    """
+    _, tensors = _state_dict_tensors(model)
+    found = set()
+    unexpected_keys = []
+    for model_file in model_files:
+        with safe_open(model_file, framework="pt") as f:
+            for checkpoint_key in f.keys():  # noqa: SIM118
+                key = checkpoint_key if key_map is None else key_map.get(checkpoint_key)
+                if key is None:
+                    continue
+                if key in tensors:
+                    found.add(id(tensors[key]))
+                else:
+                    unexpected_keys.append(checkpoint_key)
+    missing_keys = [key for key, tensor in tensors.items() if id(tensor) not in found]
+    return missing_keys, unexpected_keys
+
+
+def load_state_dict_lazily(
+    model: nn.Module,
+    model_files: list[str],
+    device: str | torch.device,
+    key_map: dict[str, str] | None = None,
+) -> tuple[list[str], list[str]]:
+    """Replace the parameters and persistent buffers of `model` by the tensors of safetensors files.
+
+    Each tensor is read from the memory-mapped file on `device`, cast to the dtype of the tensor it replaces, and
+    assigned to all the modules that share this tensor (e.g. tied weights, which are only stored once).
+
+    Args:
+        model: The model, usually built with `init_empty_weights`.
+        model_files: The safetensors files (the shards of the checkpoint), read in this order.
+        device: The device of the loaded tensors.
+        key_map: Names of the tensors of the model, by name in the checkpoint. The tensors of the checkpoint
+            missing from `key_map` are skipped. By default, the names are the same.
+
+    Returns:
+        The missing keys (the tensors of the model that were not found in the checkpoint) and the unexpected keys
+        (the tensors of the checkpoint that are not in the model), as `nn.Module.load_state_dict`.
+    """
+    slots, tensors = _state_dict_tensors(model)
+    loaded = set()
+    unexpected_keys = []
+    for model_file in model_files:
+        with safe_open(model_file, framework="pt", device=str(device)) as f:
+            for checkpoint_key in f.keys():  # noqa: SIM118
+                key = checkpoint_key if key_map is None else key_map.get(checkpoint_key)
+                if key is None:
+                    continue
+                if key not in tensors:
+                    unexpected_keys.append(checkpoint_key)
+                    continue
+                target = tensors[key]
+                value = f.get_tensor(checkpoint_key)
+                if value.shape != target.shape:
+                    raise RuntimeError(
+                        f"Error(s) in loading state_dict for {model.__class__.__name__}: size mismatch for {key}: "
+                        f"copying a param with shape {value.shape} from checkpoint, the shape in current model is "
+                        f"{target.shape}."
+                    )
+                value = value.to(dtype=target.dtype)
+                if isinstance(target, nn.Parameter):
+                    value = nn.Parameter(value, requires_grad=target.requires_grad)
+                for module, name in slots[id(target)]:
+                    if isinstance(value, nn.Parameter):
+                        module._parameters[name] = value
+                    else:
+                        module._buffers[name] = value
+                loaded.add(id(target))
+
+    # Tensors sharing memory (e.g. tied weights) are only stored once
+    missing_keys = [key for key, tensor in tensors.items() if id(tensor) not in loaded]
+    return missing_keys, unexpected_keys
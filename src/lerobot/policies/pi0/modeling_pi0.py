@@ -17,12 +17,13 @@
 import builtins
 import logging
 import math
-from collections import deque
+from collections import OrderedDict, deque
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
 import torch
 import torch.nn.functional as F  # noqa: N812
+from safetensors import safe_open
 from torch import Tensor, nn
 
 from lerobot.utils.import_utils import _transformers_available
@@ -40,8 +41,11 @@ else:
     PaliGemmaForConditionalGeneration = None
 
 from lerobot.configs.policies import PreTrainedConfig
+from lerobot.policies.flow_matching import make_denoising_times
+from lerobot.policies.lazy_loading import empty_parameters
 from lerobot.policies.pi0.configuration_pi0 import PI0Config
 from lerobot.policies.pretrained import PreTrainedPolicy, T
+from lerobot.policies.rtc import guide_velocity, make_inpainting
 from lerobot.utils.constants import (
     ACTION,
     OBS_LANGUAGE_ATTENTION_MASK,
@@ -50,6 +54,9 @@ from lerobot.utils.constants import (
     OPENPI_ATTENTION_MASK_VALUE,
 )
 
+# Number of batches of tasks whose language embeddings are kept at inference
+LANGUAGE_CACHE_SIZE = 8
+
 
 def get_safe_dtype(target_dtype, device_type):
     """Get a safe dtype for the given device type."""
@@ -527,12 +534,20 @@ class PI0Pytorch(nn.Module):  # see openpi `PI0Pytorch`
         # Initialize gradient checkpointing flag
         self.gradient_checkpointing_enabled = False
 
+        # Language embeddings of the last tasks seen at inference, see `embed_prefix`. Loading new weights in
+        # place (e.g. `load_state_dict` in eval mode) invalidates them.
+        self._language_cache: OrderedDict[tuple, Tensor] = OrderedDict()
+        self.register_load_state_dict_post_hook(lambda module, _: module.clear_language_cache())
+
         # Compile model if requested
         if config.compile_model:
             torch.set_float32_matmul_precision("high")
             self.sample_actions = torch.compile(self.sample_actions, mode=config.compile_mode)
             # Also compile the main forward pass used during training
             self.forward = torch.compile(self.forward, mode=config.compile_mode)
+        elif config.compile_denoising:
+            # Static shapes, and CUDA graphs on GPU: the loop only takes step-invariant tensors
+            self.denoise_loop = torch.compile(self.denoise_loop, mode="reduce-overhead", dynamic=False)
 
         msg = """An incorrect transformer version is used, please create an issue on https://github.com/huggingface/lerobot/issues"""
 
@@ -560,6 +575,35 @@ class PI0Pytorch(nn.Module):  # see openpi `PI0Pytorch`
         self.paligemma_with_expert.gemma_expert.model.gradient_checkpointing = False
         logging.info("Disabled gradient checkpointing for PI0Pytorch model")
 
+    def train(self, mode: bool = True):
+        # The weights change during training, which invalidates the cached language embeddings
+        if mode:
+            self.clear_language_cache()
+        return super().train(mode)
+
+    def clear_language_cache(self):
+        """Forget the cached language embeddings, e.g. after changing the weights in eval mode."""
+        self._language_cache.clear()
+
+    def _cached_language_embedding(self, lang_embed_func, lang_tokens: Tensor, tasks: list[str]) -> Tensor:
+        """Embed the language tokens, reusing the embeddings of the last tasks seen at inference.
+
+        The task is usually the same for a whole episode. The embeddings are keyed by the task strings (the tokens
+        are a function of them), which avoids copying the tokens to the CPU to look them up. Only the embeddings can
+        be reused: the prefix attention is bidirectional, so the keys and values of the language tokens depend on
+        the images.
+        """
+        key = (tuple(tasks), tuple(lang_tokens.shape), lang_tokens.device)
+        lang_emb = self._language_cache.get(key)
+        if lang_emb is None:
+            lang_emb = lang_embed_func(lang_tokens)
+            self._language_cache[key] = lang_emb
+            if len(self._language_cache) > LANGUAGE_CACHE_SIZE:
+                self._language_cache.popitem(last=False)
+        else:
+            self._language_cache.move_to_end(key)
+        return lang_emb
+
     def _apply_checkpoint(self, func, *args, **kwargs):
         """Helper method to apply gradient checkpointing if enabled."""
         if self.gradient_checkpointing_enabled and self.training:
@@ -568,10 +612,40 @@ class PI0Pytorch(nn.Module):  # see openpi `PI0Pytorch`
             )
         return func(*args, **kwargs)
 
-    def _prepare_attention_masks_4d(self, att_2d_masks):
+    def _prepare_attention_masks_4d(self, att_2d_masks, dtype=torch.float32):
         """Helper method to prepare 4D attention masks for transformer."""
         att_2d_masks_4d = att_2d_masks[:, None, :, :]
-        return torch.where(att_2d_masks_4d, 0.0, OPENPI_ATTENTION_MASK_VALUE)
+        return torch.where(att_2d_masks_4d, 0.0, OPENPI_ATTENTION_MASK_VALUE).to(dtype)
+
+    def _prepare_suffix_attention(self, prefix_pad_masks, suffix_pad_masks, suffix_att_masks):
+        """4D attention mask and position ids of the suffix tokens, which attend to the cached prefix."""
+        suffix_len = suffix_pad_masks.shape[1]
+        batch_size = prefix_pad_masks.shape[0]
+        prefix_len = prefix_pad_masks.shape[1]
+
+        prefix_pad_2d_masks = prefix_pad_masks[:, None, :].expand(batch_size, suffix_len, prefix_len)
+        suffix_att_2d_masks = make_att_2d_masks(suffix_pad_masks, suffix_att_masks)
+        full_att_2d_masks = torch.cat([prefix_pad_2d_masks, suffix_att_2d_masks], dim=2)
+
+        prefix_offsets = torch.sum(prefix_pad_masks, dim=-1)[:, None]
+        position_ids = prefix_offsets + torch.cumsum(suffix_pad_masks, dim=1) - 1
+
+        mask_dtype = self._attention_mask_dtype(self.paligemma_with_expert.gemma_expert.model)
+        return self._prepare_attention_masks_4d(full_att_2d_masks, dtype=mask_dtype), position_ids
+
+    def _attention_mask_dtype(self, model) -> torch.dtype:
+        """dtype of the additive attention masks of `model`, which SDPA requires to be that of the queries."""
+        if self.config.attention_implementation == "sdpa":
+            return model.layers[0].self_attn.q_proj.weight.dtype
+        return torch.float32
+
+    def _suffix_masks(self, bsize, device, dtype=torch.bool):
+        """Padding and attention masks of the suffix: the state token, then the action tokens."""
+        pad_masks = torch.ones(bsize, 1 + self.config.chunk_size, dtype=torch.bool, device=device)
+        # The state token does not attend to the action tokens, and image and language inputs attend to neither
+        att_masks = [1] + [1] + ([0] * (self.config.chunk_size - 1))
+        att_masks = torch.tensor(att_masks, dtype=dtype, device=device)
+        return pad_masks, att_masks[None, :].expand(bsize, len(att_masks))
 
     def sample_noise(self, shape, device):
         return torch.normal(
@@ -590,9 +664,13 @@ class PI0Pytorch(nn.Module):  # see openpi `PI0Pytorch`
         return time.to(dtype=torch.float32, device=device)
 
     def embed_prefix(
-        self, images, img_masks, lang_tokens, lang_masks
+        self, images, img_masks, lang_tokens, lang_masks, tasks=None
     ) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
-        """Embed images with SigLIP and language tokens with embedding layer."""
+        """Embed images with SigLIP and language tokens with embedding layer.
+
+        With `tasks`, the task strings the language tokens were made from, the language embeddings are cached at
+        inference (see `_cached_language_embedding`).
+        """
         embs = []
         pad_masks = []
         att_masks = []
@@ -616,7 +694,10 @@ class PI0Pytorch(nn.Module):  # see openpi `PI0Pytorch`
             lang_emb_dim = lang_emb.shape[-1]
             return lang_emb * math.sqrt(lang_emb_dim)
 
-        lang_emb = self._apply_checkpoint(lang_embed_func, lang_tokens)
+        if tasks is None or len(tasks) != lang_tokens.shape[0] or self.training or torch.is_grad_enabled():
+            lang_emb = self._apply_checkpoint(lang_embed_func, lang_tokens)
+        else:
+            lang_emb = self._cached_language_embedding(lang_embed_func, lang_tokens, tasks)
         embs.append(lang_emb)
         pad_masks.append(lang_masks)
 
@@ -635,8 +716,6 @@ class PI0Pytorch(nn.Module):  # see openpi `PI0Pytorch`
     def embed_suffix(self, state, noisy_actions, timestep):
         """Embed state, noisy_actions, timestep to prepare for Expert Gemma processing."""
         embs = []
-        pad_masks = []
-        att_masks = []
 
         if self.state_proj.weight.dtype == torch.float32:
             state = state.to(torch.float32)
@@ -646,12 +725,6 @@ class PI0Pytorch(nn.Module):  # see openpi `PI0Pytorch`
 
         state_emb = self._apply_checkpoint(state_proj_func, state)
         embs.append(state_emb[:, None, :])
-        bsize = state_emb.shape[0]
-        device = state_emb.device
-
-        state_mask = torch.ones(bsize, 1, dtype=torch.bool, device=device)
-        pad_masks.append(state_mask)
-        att_masks += [1]
 
         # Embed timestep using sine-cosine positional encoding
         time_emb = create_sinusoidal_pos_embedding(
@@ -681,17 +754,9 @@ class PI0Pytorch(nn.Module):  # see openpi `PI0Pytorch`
         adarms_cond = None
 
         embs.append(action_time_emb)
-        bsize, action_time_dim = action_time_emb.shape[:2]
-        action_time_mask = torch.ones(bsize, action_time_dim, dtype=torch.bool, device=timestep.device)
-        pad_masks.append(action_time_mask)
-
-        # Set attention masks so that image, language and state inputs do not attend to action tokens
-        att_masks += [1] + ([0] * (self.config.chunk_size - 1))
 
         embs = torch.cat(embs, dim=1)
-        pad_masks = torch.cat(pad_masks, dim=1)
-        att_masks = torch.tensor(att_masks, dtype=embs.dtype, device=embs.device)
-        att_masks = att_masks[None, :].expand(bsize, len(att_masks))
+        pad_masks, att_masks = self._suffix_masks(embs.shape[0], embs.device, dtype=embs.dtype)
 
         return embs, pad_masks, att_masks, adarms_cond
 
@@ -756,7 +821,16 @@ class PI0Pytorch(nn.Module):  # see openpi `PI0Pytorch`
 
     @torch.no_grad()  # see openpi `sample_actions` (slightly adapted)
     def sample_actions(
-        self, images, img_masks, lang_tokens, lang_masks, state, noise=None, num_steps=None
+        self,
+        images,
+        img_masks,
+        lang_tokens,
+        lang_masks,
+        state,
+        noise=None,
+        num_steps=None,
+        inpainting=None,
+        tasks=None,
     ) -> Tensor:
         """Do a full inference forward and compute the action."""
         if num_steps is None:
@@ -775,13 +849,16 @@ class PI0Pytorch(nn.Module):  # see openpi `PI0Pytorch`
             noise = self.sample_noise(actions_shape, device)
 
         prefix_embs, prefix_pad_masks, prefix_att_masks = self.embed_prefix(
-            images, img_masks, lang_tokens, lang_masks
+            images, img_masks, lang_tokens, lang_masks, tasks
         )
         prefix_att_2d_masks = make_att_2d_masks(prefix_pad_masks, prefix_att_masks)
         prefix_position_ids = torch.cumsum(prefix_pad_masks, dim=1) - 1
 
-        prefix_att_2d_masks_4d = self._prepare_attention_masks_4d(prefix_att_2d_masks)
-        self.paligemma_with_expert.paligemma.language_model.config._attn_implementation = "eager"  # noqa: SLF001
+        language_model = self.paligemma_with_expert.paligemma.language_model
+        prefix_att_2d_masks_4d = self._prepare_attention_masks_4d(
+            prefix_att_2d_masks, dtype=self._attention_mask_dtype(language_model)
+        )
+        language_model.config._attn_implementation = self.config.attention_implementation  # noqa: SLF001
 
         _, past_key_values = self.paligemma_with_expert.forward(
             attention_mask=prefix_att_2d_masks_4d,
@@ -791,23 +868,45 @@ class PI0Pytorch(nn.Module):  # see openpi `PI0Pytorch`
             use_cache=True,
         )
 
-        dt = -1.0 / num_steps
-        dt = torch.tensor(dt, dtype=torch.float32, device=device)
+        # The times, suffix attention mask and position ids do not depend on the denoising step, so they are
+        # only built once
+        times = make_denoising_times(num_steps, bsize, device)
+        suffix_attention = self._prepare_suffix_attention(
+            prefix_pad_masks, *self._suffix_masks(bsize, device)
+        )
+
+        if self.config.compile_denoising:
+            torch.compiler.cudagraph_mark_step_begin()
+            # The outputs of CUDA graphs are overwritten by the next replay
+            return self.denoise_loop(
+                state, prefix_pad_masks, past_key_values, noise, times, suffix_attention, inpainting
+            ).clone()
+        return self.denoise_loop(
+            state, prefix_pad_masks, past_key_values, noise, times, suffix_attention, inpainting
+        )
 
+    def denoise_loop(
+        self, state, prefix_pad_masks, past_key_values, noise, times, suffix_attention, inpainting=None
+    ):
+        """Integrate the velocity field with Euler steps at `times`, from `noise` to the actions.
+
+        `inpainting` holds the target actions and weights of `lerobot.policies.rtc.guide_velocity`, to guide the
+        actions towards those of the previous chunk (real-time chunking).
+        """
+        dt = torch.tensor(-1.0 / len(times), dtype=torch.float32, device=noise.device)
         x_t = noise
-        time = torch.tensor(1.0, dtype=torch.float32, device=device)
-        while time >= -dt / 2:
-            expanded_time = time.expand(bsize)
+        for time in times:
             v_t = self.denoise_step(
                 state,
                 prefix_pad_masks,
                 past_key_values,
                 x_t,
-                expanded_time,
+                time,
+                suffix_attention=suffix_attention,
             )
+            if inpainting is not None:
+                v_t = guide_velocity(x_t, v_t, time, *inpainting)
             x_t = x_t + dt * v_t
-            time += dt
-
         return x_t
 
     def denoise_step(
@@ -817,23 +916,22 @@ class PI0Pytorch(nn.Module):  # see openpi `PI0Pytorch`
         past_key_values,
         x_t,
         timestep,
+        suffix_attention=None,
     ):
-        """Apply one denoising step of the noise `x_t` at a given timestep."""
-        suffix_embs, suffix_pad_masks, suffix_att_masks, adarms_cond = self.embed_suffix(state, x_t, timestep)
-
-        suffix_len = suffix_pad_masks.shape[1]
-        batch_size = prefix_pad_masks.shape[0]
-        prefix_len = prefix_pad_masks.shape[1]
+        """Apply one denoising step of the noise `x_t` at a given timestep.
 
-        prefix_pad_2d_masks = prefix_pad_masks[:, None, :].expand(batch_size, suffix_len, prefix_len)
-        suffix_att_2d_masks = make_att_2d_masks(suffix_pad_masks, suffix_att_masks)
-        full_att_2d_masks = torch.cat([prefix_pad_2d_masks, suffix_att_2d_masks], dim=2)
-
-        prefix_offsets = torch.sum(prefix_pad_masks, dim=-1)[:, None]
-        position_ids = prefix_offsets + torch.cumsum(suffix_pad_masks, dim=1) - 1
+        `suffix_attention` is the output of `_prepare_suffix_attention`, computed here if not provided.
+        """
+        suffix_embs, suffix_pad_masks, suffix_att_masks, adarms_cond = self.embed_suffix(state, x_t, timestep)
 
-        full_att_2d_masks_4d = self._prepare_attention_masks_4d(full_att_2d_masks)
-        self.paligemma_with_expert.gemma_expert.model.config._attn_implementation = "eager"  # noqa: SLF001
+        if suffix_attention is None:
+            suffix_attention = self._prepare_suffix_attention(
+                prefix_pad_masks, suffix_pad_masks, suffix_att_masks
+            )
+        full_att_2d_masks_4d, position_ids = suffix_attention
+        self.paligemma_with_expert.gemma_expert.model.config._attn_implementation = (  # noqa: SLF001
+            self.config.attention_implementation
+        )
 
         outputs_embeds, _ = self.paligemma_with_expert.forward(
             attention_mask=full_att_2d_masks_4d,
@@ -875,7 +973,9 @@ class PI0Policy(PreTrainedPolicy):
         if config.gradient_checkpointing:
             self.model.gradient_checkpointing_enable()
 
-        self.model.to(config.device)
+        # The empty parameters of `init_empty_weights` (`lazy_load`) are moved once loaded
+        if not empty_parameters(self.model):
+            self.model.to(config.device)
 
         self.reset()
 
@@ -893,6 +993,7 @@ class PI0Policy(PreTrainedPolicy):
         local_files_only: bool = False,
         revision: str | None = None,
         strict: bool = True,
+        lazy_load: bool = False,
         **kwargs,
     ) -> T:
         """Override the from_pretrained method to handle key remapping and display important disclaimer."""
@@ -918,6 +1019,32 @@ class PI0Policy(PreTrainedPolicy):
                 **kwargs,
             )
 
+        if lazy_load:
+            # Falls back to the regular loading if the policy cannot be built on the meta device or some parameters
+            # are not in the checkpoint. This is done outside of the `try` below, so that the errors of `strict`
+            # are raised.
+            try:
+                from transformers.utils import cached_file
+
+                resolved_file = cached_file(
+                    pretrained_name_or_path,
+                    "model.safetensors",
+                    cache_dir=kwargs.get("cache_dir"),
+                    force_download=kwargs.get("force_download", False),
+                    resume_download=kwargs.get("resume_download"),
+                    proxies=kwargs.get("proxies"),
+                    use_auth_token=kwargs.get("use_auth_token"),
+                    revision=kwargs.get("revision"),
+                    local_files_only=kwargs.get("local_files_only", False),
+                )
+            except Exception as e:
+                print(f"Could not load model.safetensors lazily: {e}")
+            else:
+                policy = cls._load_lazily(config, [resolved_file], config.device, strict, **kwargs)
+                if policy is not None:
+                    print("✓ Loaded model.safetensors lazily")
+                    return policy
+
         # Initialize model without loading weights
         # Check if dataset_stats were provided in kwargs
         model = cls(config, **kwargs)
@@ -1049,6 +1176,18 @@ class PI0Policy(PreTrainedPolicy):
 
         return fixed_state_dict
 
+    def _checkpoint_key_map(self, model_files: list[str]) -> dict[str, str]:
+        checkpoint_keys = []
+        for model_file in model_files:
+            with safe_open(model_file, framework="pt") as f:
+                checkpoint_keys.extend(f.keys())
+        # Only the keys are remapped, so that the checkpoint keys can stand for the tensors
+        fixed_keys = self._fix_pytorch_state_dict_keys({key: key for key in checkpoint_keys}, self.config)
+        return {
+            key: new_key if new_key.startswith("model.") else f"model.{new_key}"
+            for new_key, key in fixed_keys.items()
+        }
+
     def get_optim_params(self) -> dict:
         return self.parameters()
 
@@ -1058,6 +1197,8 @@ class PI0Policy(PreTrainedPolicy):
         self._queues = {
             ACTION: deque(maxlen=self.config.n_action_steps),
         }
+        # Actions of the last chunk that were not executed, to guide the next one with `real_time_chunking`
+        self._prev_chunk = None
 
     def _preprocess_images(self, batch: dict[str, Tensor]) -> tuple[list[Tensor], list[Tensor]]:
         """Preprocess images for the model.
@@ -1141,15 +1282,27 @@ class PI0Policy(PreTrainedPolicy):
 
         # Action queue logic for n_action_steps > 1
         if len(self._action_queue) == 0:
-            actions = self.predict_action_chunk(batch)[:, : self.config.n_action_steps]
+            if self.config.real_time_chunking:
+                chunk = self.predict_action_chunk(batch, prev_chunk=self._prev_chunk)
+                self._prev_chunk = chunk[:, self.config.n_action_steps :]
+                actions = chunk[:, : self.config.n_action_steps]
+            else:
+                actions = self.predict_action_chunk(batch)[:, : self.config.n_action_steps]
             # Transpose to get shape (n_action_steps, batch_size, action_dim)
             self._action_queue.extend(actions.transpose(0, 1))
 
         return self._action_queue.popleft()
 
     @torch.no_grad()
-    def predict_action_chunk(self, batch: dict[str, Tensor]) -> Tensor:
-        """Predict a chunk of actions given environment observations."""
+    def predict_action_chunk(
+        self, batch: dict[str, Tensor], prev_chunk: Tensor | None = None, inference_delay: int = 0
+    ) -> Tensor:
+        """Predict a chunk of actions given environment observations.
+
+        With `prev_chunk`, the remaining actions of the previous chunk (as returned by this method), the new chunk
+        is guided towards them and its `inference_delay` first actions are frozen to them (see
+        `lerobot.policies.rtc`).
+        """
         self.eval()
 
         # Prepare inputs
@@ -1157,8 +1310,22 @@ class PI0Policy(PreTrainedPolicy):
         lang_tokens, lang_masks = batch[f"{OBS_LANGUAGE_TOKENS}"], batch[f"{OBS_LANGUAGE_ATTENTION_MASK}"]
         state = self.prepare_state(batch)
 
+        inpainting = None
+        if prev_chunk is not None and prev_chunk.shape[1] > 0:
+            inpainting = make_inpainting(
+                prev_chunk, inference_delay, self.config.chunk_size, self.config.max_action_dim
+            )
+
+        # The language embeddings are cached by task, except in the compiled `sample_actions` (the strings would be
+        # guarded on)
+        tasks = None if self.config.compile_model else batch.get("task")
+        if isinstance(tasks, str):
+            tasks = [tasks]
+
         # Sample actions using the model
-        actions = self.model.sample_actions(images, img_masks, lang_tokens, lang_masks, state)
+        actions = self.model.sample_actions(
+            images, img_masks, lang_tokens, lang_masks, state, inpainting=inpainting, tasks=tasks
+        )
 
         # Unpad actions to actual action dimension
         original_action_dim = self.config.output_features[ACTION].shape[0]
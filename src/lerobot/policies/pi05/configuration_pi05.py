@@ -45,6 +45,8 @@ class PI05Config(PreTrainedConfig):
     time_sampling_offset: float = 0.001
     min_period: float = 4e-3
     max_period: float = 4.0
+    # Attention backend at inference: "eager" or "sdpa" (`torch.nn.functional.scaled_dot_product_attention`)
+    attention_implementation: str = "eager"
 
     image_resolution: tuple[int, int] = (224, 224)  # see openpi `preprocessing_pytorch.py`
 
@@ -65,6 +67,10 @@ class PI05Config(PreTrainedConfig):
     gradient_checkpointing: bool = False  # Enable gradient checkpointing for memory optimization
     compile_model: bool = False  # Whether to use torch.compile for model optimization
     compile_mode: str = "max-autotune"  # Torch compile mode
+    # Compile only the denoising loop at inference, with static shapes and CUDA graphs on GPU
+    compile_denoising: bool = False
+    # Guide each chunk of `select_action` towards the actions left in the previous one (see policies/rtc.py)
+    real_time_chunking: bool = False
     device: str | None = None  # Device to use for the model (None = auto-detect)
 
     # Optimizer settings: see openpi `AdamW`
@@ -101,6 +107,9 @@ class PI05Config(PreTrainedConfig):
         if self.dtype not in ["bfloat16", "float32"]:
             raise ValueError(f"Invalid dtype: {self.dtype}")
 
+        if self.attention_implementation not in ["eager", "sdpa"]:
+            raise ValueError(f"Invalid attention_implementation: {self.attention_implementation}")
+
     def validate_features(self) -> None:
         """Validate and set up input/output features."""
         for i in range(self.empty_cameras):
@@ -23,6 +23,7 @@ from typing import TYPE_CHECKING, Literal
 
 import torch
 import torch.nn.functional as F  # noqa: N812
+from safetensors import safe_open
 from torch import Tensor, nn
 
 from lerobot.utils.import_utils import _transformers_available
@@ -40,8 +41,11 @@ else:
     PaliGemmaForConditionalGeneration = None
 
 from lerobot.configs.policies import PreTrainedConfig
+from lerobot.policies.flow_matching import make_denoising_times
+from lerobot.policies.lazy_loading import empty_parameters
 from lerobot.policies.pi05.configuration_pi05 import PI05Config
 from lerobot.policies.pretrained import PreTrainedPolicy, T
+from lerobot.policies.rtc import guide_velocity, make_inpainting
 from lerobot.utils.constants import (
     ACTION,
     OBS_LANGUAGE_ATTENTION_MASK,
@@ -529,6 +533,9 @@ class PI05Pytorch(nn.Module):  # see openpi `PI0Pytorch`
         if config.compile_model:
             torch.set_float32_matmul_precision("high")
             self.sample_actions = torch.compile(self.sample_actions, mode=config.compile_mode)
+        elif config.compile_denoising:
+            # Static shapes, and CUDA graphs on GPU: the loop only takes step-invariant tensors
+            self.denoise_loop = torch.compile(self.denoise_loop, mode="reduce-overhead", dynamic=False)
 
         msg = """An incorrect transformer version is used, please create an issue on https://github.com/huggingface/lerobot/issues"""
 
@@ -564,10 +571,40 @@ class PI05Pytorch(nn.Module):  # see openpi `PI0Pytorch`
             )
         return func(*args, **kwargs)
 
-    def _prepare_attention_masks_4d(self, att_2d_masks):
+    def _prepare_attention_masks_4d(self, att_2d_masks, dtype=torch.float32):
         """Helper method to prepare 4D attention masks for transformer."""
         att_2d_masks_4d = att_2d_masks[:, None, :, :]
-        return torch.where(att_2d_masks_4d, 0.0, OPENPI_ATTENTION_MASK_VALUE)
+        return torch.where(att_2d_masks_4d, 0.0, OPENPI_ATTENTION_MASK_VALUE).to(dtype)
+
+    def _prepare_suffix_attention(self, prefix_pad_masks, suffix_pad_masks, suffix_att_masks):
+        """4D attention mask and position ids of the suffix tokens, which attend to the cached prefix."""
+        suffix_len = suffix_pad_masks.shape[1]
+        batch_size = prefix_pad_masks.shape[0]
+        prefix_len = prefix_pad_masks.shape[1]
+
+        prefix_pad_2d_masks = prefix_pad_masks[:, None, :].expand(batch_size, suffix_len, prefix_len)
+        suffix_att_2d_masks = make_att_2d_masks(suffix_pad_masks, suffix_att_masks)
+        full_att_2d_masks = torch.cat([prefix_pad_2d_masks, suffix_att_2d_masks], dim=2)
+
+        prefix_offsets = torch.sum(prefix_pad_masks, dim=-1)[:, None]
+        position_ids = prefix_offsets + torch.cumsum(suffix_pad_masks, dim=1) - 1
+
+        mask_dtype = self._attention_mask_dtype(self.paligemma_with_expert.gemma_expert.model)
+        return self._prepare_attention_masks_4d(full_att_2d_masks, dtype=mask_dtype), position_ids
+
+    def _attention_mask_dtype(self, model) -> torch.dtype:
+        """dtype of the additive attention masks of `model`, which SDPA requires to be that of the queries."""
+        if self.config.attention_implementation == "sdpa":
+            return model.layers[0].self_attn.q_proj.weight.dtype
+        return torch.float32
+
+    def _suffix_masks(self, bsize, device, dtype=torch.bool):
+        """Padding and attention masks of the suffix, made of the action tokens."""
+        pad_masks = torch.ones(bsize, self.config.chunk_size, dtype=torch.bool, device=device)
+        # Set attention masks so that image, language and state inputs do not attend to action tokens
+        att_masks = [1] + ([0] * (self.config.chunk_size - 1))
+        att_masks = torch.tensor(att_masks, dtype=dtype, device=device)
+        return pad_masks, att_masks[None, :].expand(bsize, len(att_masks))
 
     def sample_noise(self, shape, device):
         return torch.normal(
@@ -631,8 +668,6 @@ class PI05Pytorch(nn.Module):  # see openpi `PI0Pytorch`
     def embed_suffix(self, noisy_actions, timestep):
         """Embed noisy_actions, timestep to prepare for Expert Gemma processing."""
         embs = []
-        pad_masks = []
-        att_masks = []
 
         # Embed timestep using sine-cosine positional encoding
         time_emb = create_sinusoidal_pos_embedding(
@@ -661,17 +696,9 @@ class PI05Pytorch(nn.Module):  # see openpi `PI0Pytorch`
         adarms_cond = time_emb
 
         embs.append(action_time_emb)
-        bsize, action_time_dim = action_time_emb.shape[:2]
-        action_time_mask = torch.ones(bsize, action_time_dim, dtype=torch.bool, device=timestep.device)
-        pad_masks.append(action_time_mask)
-
-        # Set attention masks so that image, language and state inputs do not attend to action tokens
-        att_masks += [1] + ([0] * (self.config.chunk_size - 1))
 
         embs = torch.cat(embs, dim=1)
-        pad_masks = torch.cat(pad_masks, dim=1)
-        att_masks = torch.tensor(att_masks, dtype=embs.dtype, device=embs.device)
-        att_masks = att_masks[None, :].expand(bsize, len(att_masks))
+        pad_masks, att_masks = self._suffix_masks(embs.shape[0], embs.device, dtype=embs.dtype)
 
         return embs, pad_masks, att_masks, adarms_cond
 
@@ -731,7 +758,9 @@ class PI05Pytorch(nn.Module):  # see openpi `PI0Pytorch`
         return F.mse_loss(u_t, v_t, reduction="none")
 
     @torch.no_grad()  # see openpi `sample_actions` (slightly adapted)
-    def sample_actions(self, images, img_masks, tokens, masks, noise=None, num_steps=None) -> Tensor:
+    def sample_actions(
+        self, images, img_masks, tokens, masks, noise=None, num_steps=None, inpainting=None
+    ) -> Tensor:
         """Do a full inference forward and compute the action."""
         if num_steps is None:
             num_steps = self.config.num_inference_steps
@@ -752,8 +781,11 @@ class PI05Pytorch(nn.Module):  # see openpi `PI0Pytorch`
         prefix_att_2d_masks = make_att_2d_masks(prefix_pad_masks, prefix_att_masks)
         prefix_position_ids = torch.cumsum(prefix_pad_masks, dim=1) - 1
 
-        prefix_att_2d_masks_4d = self._prepare_attention_masks_4d(prefix_att_2d_masks)
-        self.paligemma_with_expert.paligemma.language_model.config._attn_implementation = "eager"  # noqa: SLF001
+        language_model = self.paligemma_with_expert.paligemma.language_model
+        prefix_att_2d_masks_4d = self._prepare_attention_masks_4d(
+            prefix_att_2d_masks, dtype=self._attention_mask_dtype(language_model)
+        )
+        language_model.config._attn_implementation = self.config.attention_implementation  # noqa: SLF001
 
         _, past_key_values = self.paligemma_with_expert.forward(
             attention_mask=prefix_att_2d_masks_4d,
@@ -763,22 +795,44 @@ class PI05Pytorch(nn.Module):  # see openpi `PI0Pytorch`
             use_cache=True,
         )
 
-        dt = -1.0 / num_steps
-        dt = torch.tensor(dt, dtype=torch.float32, device=device)
+        # The times, suffix attention mask and position ids do not depend on the denoising step, so they are
+        # only built once
+        times = make_denoising_times(num_steps, bsize, device)
+        suffix_attention = self._prepare_suffix_attention(
+            prefix_pad_masks, *self._suffix_masks(bsize, device)
+        )
+
+        if self.config.compile_denoising:
+            torch.compiler.cudagraph_mark_step_begin()
+            # The outputs of CUDA graphs are overwritten by the next replay
+            return self.denoise_loop(
+                prefix_pad_masks, past_key_values, noise, times, suffix_attention, inpainting
+            ).clone()
+        return self.denoise_loop(
+            prefix_pad_masks, past_key_values, noise, times, suffix_attention, inpainting
+        )
 
+    def denoise_loop(
+        self, prefix_pad_masks, past_key_values, noise, times, suffix_attention, inpainting=None
+    ):
+        """Integrate the velocity field with Euler steps at `times`, from `noise` to the actions.
+
+        `inpainting` holds the target actions and weights of `lerobot.policies.rtc.guide_velocity`, to guide the
+        actions towards those of the previous chunk (real-time chunking).
+        """
+        dt = torch.tensor(-1.0 / len(times), dtype=torch.float32, device=noise.device)
         x_t = noise
-        time = torch.tensor(1.0, dtype=torch.float32, device=device)
-        while time >= -dt / 2:
-            expanded_time = time.expand(bsize)
+        for time in times:
             v_t = self.denoise_step(
                 prefix_pad_masks,
                 past_key_values,
                 x_t,
-                expanded_time,
+                time,
+                suffix_attention=suffix_attention,
             )
+            if inpainting is not None:
+                v_t = guide_velocity(x_t, v_t, time, *inpainting)
             x_t = x_t + dt * v_t
-            time += dt
-
         return x_t
 
     def denoise_step(
@@ -787,23 +841,22 @@ class PI05Pytorch(nn.Module):  # see openpi `PI0Pytorch`
         past_key_values,
         x_t,
         timestep,
+        suffix_attention=None,
     ):
-        """Apply one denoising step of the noise `x_t` at a given timestep."""
-        suffix_embs, suffix_pad_masks, suffix_att_masks, adarms_cond = self.embed_suffix(x_t, timestep)
-
-        suffix_len = suffix_pad_masks.shape[1]
-        batch_size = prefix_pad_masks.shape[0]
-        prefix_len = prefix_pad_masks.shape[1]
-
-        prefix_pad_2d_masks = prefix_pad_masks[:, None, :].expand(batch_size, suffix_len, prefix_len)
-        suffix_att_2d_masks = make_att_2d_masks(suffix_pad_masks, suffix_att_masks)
-        full_att_2d_masks = torch.cat([prefix_pad_2d_masks, suffix_att_2d_masks], dim=2)
+        """Apply one denoising step of the noise `x_t` at a given timestep.
 
-        prefix_offsets = torch.sum(prefix_pad_masks, dim=-1)[:, None]
-        position_ids = prefix_offsets + torch.cumsum(suffix_pad_masks, dim=1) - 1
+        `suffix_attention` is the output of `_prepare_suffix_attention`, computed here if not provided.
+        """
+        suffix_embs, suffix_pad_masks, suffix_att_masks, adarms_cond = self.embed_suffix(x_t, timestep)
 
-        full_att_2d_masks_4d = self._prepare_attention_masks_4d(full_att_2d_masks)
-        self.paligemma_with_expert.gemma_expert.model.config._attn_implementation = "eager"  # noqa: SLF001
+        if suffix_attention is None:
+            suffix_attention = self._prepare_suffix_attention(
+                prefix_pad_masks, suffix_pad_masks, suffix_att_masks
+            )
+        full_att_2d_masks_4d, position_ids = suffix_attention
+        self.paligemma_with_expert.gemma_expert.model.config._attn_implementation = (  # noqa: SLF001
+            self.config.attention_implementation
+        )
 
         outputs_embeds, _ = self.paligemma_with_expert.forward(
             attention_mask=full_att_2d_masks_4d,
@@ -845,7 +898,9 @@ class PI05Policy(PreTrainedPolicy):
         if config.gradient_checkpointing:
             self.model.gradient_checkpointing_enable()
 
-        self.model.to(config.device)
+        # The empty parameters of `init_empty_weights` (`lazy_load`) are moved once loaded
+        if not empty_parameters(self.model):
+            self.model.to(config.device)
 
         self.reset()
 
@@ -863,6 +918,7 @@ class PI05Policy(PreTrainedPolicy):
         local_files_only: bool = False,
         revision: str | None = None,
         strict: bool = True,
+        lazy_load: bool = False,
         **kwargs,
     ) -> T:
         """Override the from_pretrained method to handle key remapping and display important disclaimer."""
@@ -888,6 +944,32 @@ class PI05Policy(PreTrainedPolicy):
                 **kwargs,
             )
 
+        if lazy_load:
+            # Falls back to the regular loading if the policy cannot be built on the meta device or some parameters
+            # are not in the checkpoint. This is done outside of the `try` below, so that the errors of `strict`
+            # are raised.
+            try:
+                from transformers.utils import cached_file
+
+                resolved_file = cached_file(
+                    pretrained_name_or_path,
+                    "model.safetensors",
+                    cache_dir=kwargs.get("cache_dir"),
+                    force_download=kwargs.get("force_download", False),
+                    resume_download=kwargs.get("resume_download"),
+                    proxies=kwargs.get("proxies"),
+                    use_auth_token=kwargs.get("use_auth_token"),
+                    revision=kwargs.get("revision"),
+                    local_files_only=kwargs.get("local_files_only", False),
+                )
+            except Exception as e:
+                print(f"Could not load model.safetensors lazily: {e}")
+            else:
+                policy = cls._load_lazily(config, [resolved_file], config.device, strict, **kwargs)
+                if policy is not None:
+                    print("✓ Loaded model.safetensors lazily")
+                    return policy
+
         # Initialize model without loading weights
         # Check if dataset_stats were provided in kwargs
         model = cls(config, **kwargs)
@@ -1025,6 +1107,18 @@ class PI05Policy(PreTrainedPolicy):
 
         return fixed_state_dict
 
+    def _checkpoint_key_map(self, model_files: list[str]) -> dict[str, str]:
+        checkpoint_keys = []
+        for model_file in model_files:
+            with safe_open(model_file, framework="pt") as f:
+                checkpoint_keys.extend(f.keys())
+        # Only the keys are remapped, so that the checkpoint keys can stand for the tensors
+        fixed_keys = self._fix_pytorch_state_dict_keys({key: key for key in checkpoint_keys}, self.config)
+        return {
+            key: new_key if new_key.startswith("model.") else f"model.{new_key}"
+            for new_key, key in fixed_keys.items()
+        }
+
     def get_optim_params(self) -> dict:
         return self.parameters()
 
@@ -1034,6 +1128,8 @@ class PI05Policy(PreTrainedPolicy):
         self._queues = {
             ACTION: deque(maxlen=self.config.n_action_steps),
         }
+        # Actions of the last chunk that were not executed, to guide the next one with `real_time_chunking`
+        self._prev_chunk = None
 
     def _preprocess_images(self, batch: dict[str, Tensor]) -> tuple[list[Tensor], list[Tensor]]:
         """Preprocess images for the model.
@@ -1113,23 +1209,41 @@ class PI05Policy(PreTrainedPolicy):
 
         # Action queue logic for n_action_steps > 1
         if len(self._action_queue) == 0:
-            actions = self.predict_action_chunk(batch)[:, : self.config.n_action_steps]
+            if self.config.real_time_chunking:
+                chunk = self.predict_action_chunk(batch, prev_chunk=self._prev_chunk)
+                self._prev_chunk = chunk[:, self.config.n_action_steps :]
+                actions = chunk[:, : self.config.n_action_steps]
+            else:
+                actions = self.predict_action_chunk(batch)[:, : self.config.n_action_steps]
             # Transpose to get shape (n_action_steps, batch_size, action_dim)
             self._action_queue.extend(actions.transpose(0, 1))
 
         return self._action_queue.popleft()
 
     @torch.no_grad()
-    def predict_action_chunk(self, batch: dict[str, Tensor]) -> Tensor:
-        """Predict a chunk of actions given environment observations."""
+    def predict_action_chunk(
+        self, batch: dict[str, Tensor], prev_chunk: Tensor | None = None, inference_delay: int = 0
+    ) -> Tensor:
+        """Predict a chunk of actions given environment observations.
+
+        With `prev_chunk`, the remaining actions of the previous chunk (as returned by this method), the new chunk
+        is guided towards them and its `inference_delay` first actions are frozen to them (see
+        `lerobot.policies.rtc`).
+        """
         self.eval()
 
         # Prepare inputs
         images, img_masks = self._preprocess_images(batch)
         tokens, masks = batch[f"{OBS_LANGUAGE_TOKENS}"], batch[f"{OBS_LANGUAGE_ATTENTION_MASK}"]
 
+        inpainting = None
+        if prev_chunk is not None and prev_chunk.shape[1] > 0:
+            inpainting = make_inpainting(
+                prev_chunk, inference_delay, self.config.chunk_size, self.config.max_action_dim
+            )
+
         # Sample actions using the model (no separate state needed for PI05)
-        actions = self.model.sample_actions(images, img_masks, tokens, masks)
+        actions = self.model.sample_actions(images, img_masks, tokens, masks, inpainting=inpainting)
 
         # Unpad actions to actual action dimension
         original_action_dim = self.config.output_features[ACTION].shape[0]
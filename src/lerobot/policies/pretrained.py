@@ -13,6 +13,7 @@
 # limitations under the License.
 import abc
 import builtins
+import json
 import logging
 import os
 from importlib.resources import files
@@ -23,14 +24,33 @@ from typing import TypedDict, TypeVar
 import packaging
 import safetensors
 from huggingface_hub import HfApi, ModelCard, ModelCardData, hf_hub_download
-from huggingface_hub.constants import SAFETENSORS_SINGLE_FILE
+from huggingface_hub.constants import SAFETENSORS_INDEX_FILE, SAFETENSORS_SINGLE_FILE
 from huggingface_hub.errors import HfHubHTTPError
-from safetensors.torch import load_model as load_model_as_safetensor, save_model as save_model_as_safetensor
+from safetensors.torch import (
+    load_file as load_file_as_safetensor,
+    load_model as load_model_as_safetensor,
+    save_file as save_file_as_safetensor,
+    save_model as save_model_as_safetensor,
+)
 from torch import Tensor, nn
 from typing_extensions import Unpack
 
 from lerobot.configs.policies import PreTrainedConfig
 from lerobot.configs.train import TrainPipelineConfig
+from lerobot.policies.lazy_loading import (
+    check_checkpoint_keys,
+    empty_parameters,
+    init_empty_weights,
+    load_state_dict_lazily,
+)
+from lerobot.policies.quantization import (
+    QUANTIZATION_METADATA_KEY,
+    get_checkpoint_quantization,
+    get_quantization,
+    load_quantized_state_dict,
+    quantize_policy,
+    quantized_state_dict,
+)
 from lerobot.policies.utils import log_model_loading_keys
 from lerobot.utils.hub import HubMixin
 
@@ -69,6 +89,14 @@ class PreTrainedPolicy(nn.Module, HubMixin, abc.ABC):
     def _save_pretrained(self, save_directory: Path) -> None:
         self.config._save_pretrained(save_directory)
         model_to_save = self.module if hasattr(self, "module") else self
+        quantization = get_quantization(model_to_save)
+        if quantization is not None:
+            save_file_as_safetensor(
+                quantized_state_dict(model_to_save),
+                str(save_directory / SAFETENSORS_SINGLE_FILE),
+                metadata={"format": "pt", QUANTIZATION_METADATA_KEY: quantization},
+            )
+            return
         save_model_as_safetensor(model_to_save, str(save_directory / SAFETENSORS_SINGLE_FILE))
 
     @classmethod
@@ -85,11 +113,20 @@ class PreTrainedPolicy(nn.Module, HubMixin, abc.ABC):
         local_files_only: bool = False,
         revision: str | None = None,
         strict: bool = False,
+        quantize: str | None = None,
+        channels_last: bool = False,
+        lazy_load: bool = False,
         **kwargs,
     ) -> T:
         """
         The policy is set in evaluation mode by default using `policy.eval()` (dropout modules are
         deactivated). To train it, you should first set it back in training mode with `policy.train()`.
+
+        With `quantize` (e.g. "dynamic_int8") or `channels_last`, the policy is prepared for CPU inference
+        (see `lerobot.policies.quantization`). Policies saved after quantization are loaded quantized.
+
+        With `lazy_load`, the policy is built without initializing its weights, which are then read directly from
+        the memory-mapped checkpoint on `config.device` (see `lerobot.policies.lazy_loading`).
         """
         if config is None:
             config = PreTrainedConfig.from_pretrained(
@@ -104,11 +141,10 @@ class PreTrainedPolicy(nn.Module, HubMixin, abc.ABC):
                 **kwargs,
             )
         model_id = str(pretrained_name_or_path)
-        instance = cls(config, **kwargs)
         if os.path.isdir(model_id):
             print("Loading weights from local directory")
             model_file = os.path.join(model_id, SAFETENSORS_SINGLE_FILE)
-            policy = cls._load_as_safetensor(instance, model_file, config.device, strict)
+            index_file = os.path.join(model_id, SAFETENSORS_INDEX_FILE)
         else:
             try:
                 model_file = hf_hub_download(
@@ -122,18 +158,41 @@ class PreTrainedPolicy(nn.Module, HubMixin, abc.ABC):
                     token=token,
                     local_files_only=local_files_only,
                 )
-                policy = cls._load_as_safetensor(instance, model_file, config.device, strict)
             except HfHubHTTPError as e:
                 raise FileNotFoundError(
                     f"{SAFETENSORS_SINGLE_FILE} not found on the HuggingFace Hub in {model_id}"
                 ) from e
+            index_file = None
+
+        # Checkpoints written with a `max_shard_size` are split into several files
+        sharded = index_file is not None and not os.path.isfile(model_file) and os.path.isfile(index_file)
+        policy = None
+        if lazy_load and (sharded or get_checkpoint_quantization(model_file) is None):
+            model_files = cls._get_shard_files(index_file) if sharded else [model_file]
+            policy = cls._load_lazily(config, model_files, config.device, strict, **kwargs)
+        if policy is None:
+            instance = cls(config, **kwargs)
+            if sharded:
+                policy = cls._load_as_sharded_safetensor(instance, index_file, config.device, strict)
+            else:
+                policy = cls._load_as_safetensor(instance, model_file, config.device, strict)
 
         policy.to(config.device)
         policy.eval()
+        if quantize is not None or channels_last:
+            if config.device != "cpu":
+                raise ValueError(
+                    f"Quantized inference is only supported on CPU, got device '{config.device}'."
+                )
+            quantize_policy(policy, quantize, channels_last=channels_last)
         return policy
 
     @classmethod
     def _load_as_safetensor(cls, model: T, model_file: str, map_location: str, strict: bool) -> T:
+        quantization = get_checkpoint_quantization(model_file)
+        if quantization is not None:
+            return cls._load_as_quantized_safetensor(model, model_file, quantization, map_location, strict)
+
         # Create base kwargs
         kwargs = {"strict": strict}
 
@@ -156,6 +215,101 @@ class PreTrainedPolicy(nn.Module, HubMixin, abc.ABC):
             model.to(map_location)
         return model
 
+    @classmethod
+    def _load_as_quantized_safetensor(
+        cls, model: T, model_file: str, quantization: str, map_location: str, strict: bool
+    ) -> T:
+        if map_location != "cpu":
+            raise ValueError(
+                f"{model_file} holds weights quantized with '{quantization}', which are only supported on CPU "
+                f"(got device '{map_location}')."
+            )
+        quantize_policy(model, quantization)
+        missing_keys, unexpected_keys = load_quantized_state_dict(model, load_file_as_safetensor(model_file))
+        if strict and (missing_keys or unexpected_keys):
+            raise RuntimeError(
+                f"Error(s) in loading state_dict for {model.__class__.__name__}: "
+                f"missing keys {missing_keys}, unexpected keys {unexpected_keys}"
+            )
+        log_model_loading_keys(missing_keys, unexpected_keys)
+        return model
+
+    @classmethod
+    def _load_as_sharded_safetensor(cls, model: T, index_file: str, map_location: str, strict: bool) -> T:
+        loaded_keys = set()
+        unexpected_keys = []
+        for shard_file in cls._get_shard_files(index_file):
+            state_dict = load_file_as_safetensor(shard_file, device=map_location)
+            unexpected_keys.extend(model.load_state_dict(state_dict, strict=False).unexpected_keys)
+            loaded_keys.update(state_dict)
+
+        # Tensors sharing memory (e.g. tied weights) are only stored once
+        aliases = {name for name, _ in model.named_parameters(remove_duplicate=False)} - {
+            name for name, _ in model.named_parameters()
+        }
+        missing_keys = [k for k in model.state_dict() if k not in loaded_keys and k not in aliases]
+        if strict and (missing_keys or unexpected_keys):
+            raise RuntimeError(
+                f"Error(s) in loading state_dict for {model.__class__.__name__}: "
+                f"missing keys {missing_keys}, unexpected keys {unexpected_keys}"
+            )
+        log_model_loading_keys(missing_keys, unexpected_keys)
+        return model
+
+    @staticmethod
+    def _get_shard_files(index_file: str) -> list[str]:
+        with open(index_file) as f:
+            weight_map = json.load(f)["weight_map"]
+        shards_dir = os.path.dirname(index_file)
+        return [os.path.join(shards_dir, shard_file) for shard_file in sorted(set(weight_map.values()))]
+
+    @classmethod
+    def _load_lazily(
+        cls,
+        config: PreTrainedConfig,
+        model_files: list[str],
+        map_location: str,
+        strict: bool,
+        **kwargs,
+    ) -> T | None:
+        """Build the policy on the meta device and load its weights from `model_files`.
+
+        Returns None if the policy cannot be built on the meta device (e.g. it runs a forward pass in `__init__`), or
+        if some parameters are missing from the checkpoint: they cannot be initialized once the policy is built, so
+        that the policy has to be loaded with its regular initialization. Both are checked before reading any weight.
+        """
+        try:
+            with init_empty_weights():
+                model = cls(config, **kwargs)
+        except Exception as e:
+            logging.warning(
+                f"{cls.__name__} cannot be built without initializing its weights ({e}), loading the policy "
+                "without `lazy_load`."
+            )
+            return None
+        key_map = model._checkpoint_key_map(model_files)
+        missing_keys, unexpected_keys = check_checkpoint_keys(model, model_files, key_map)
+        if strict and (missing_keys or unexpected_keys):
+            raise RuntimeError(
+                f"Error(s) in loading state_dict for {model.__class__.__name__}: "
+                f"missing keys {missing_keys}, unexpected keys {unexpected_keys}"
+            )
+        empty = set(empty_parameters(model)) & set(missing_keys)
+        if empty:
+            logging.warning(
+                f"{len(empty)} parameters of {model.__class__.__name__} are missing from the "
+                "checkpoint, loading the policy without `lazy_load`."
+            )
+            return None
+        load_state_dict_lazily(model, model_files, map_location, key_map)
+        log_model_loading_keys(missing_keys, unexpected_keys)
+        # The buffers were not moved to the device by `__init__` in `init_empty_weights`
+        return model.to(map_location)
+
+    def _checkpoint_key_map(self, model_files: list[str]) -> dict[str, str] | None:
+        """Names of the tensors of the policy by name in the checkpoint with `lazy_load`, None if they are the same."""
+        return None
+
     @abc.abstractmethod
     def get_optim_params(self) -> dict:
         """
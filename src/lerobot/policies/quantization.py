@@ -0,0 +1,138 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Quantized CPU inference of the policies (ACT, Diffusion and VQ-BeT).
+
+With `dynamic_int8`, the weights of the `nn.Linear` layers are stored in int8, and their inputs are quantized on
+the fly at each call (`torch.ao.quantization.quantize_dynamic`): the matrix products run with int8 kernels (fbgemm
+or oneDNN on x86, qnnpack on ARM), and the rest of the model stays in float32. The convolutions (the vision
+backbones and the 1D U-Net of Diffusion) are not quantized, but their weights can be converted to the channels-last
+memory format, which lets oneDNN use its NHWC kernels.
+
+A quantized policy is saved with its int8 weights, scales and zero points as regular tensors, and the
+quantization mode in the metadata of the safetensors file, so that `PreTrainedPolicy.from_pretrained` quantizes
+the policy before loading its weights.
+"""
+
+import logging
+from collections import OrderedDict
+
+import torch
+from safetensors import safe_open
+from torch import Tensor, nn
+from torch.ao.nn.quantized.dynamic import Linear as DynamicQuantizedLinear
+
+DYNAMIC_INT8 = "dynamic_int8"
+QUANTIZATION_MODES = (DYNAMIC_INT8,)
+# Key of the quantization mode in the metadata of the safetensors files
+QUANTIZATION_METADATA_KEY = "lerobot_quantization"
+
+
+def get_quantization(model: nn.Module) -> str | None:
+    """Quantization mode of `model`, or None if it is not quantized."""
+    if any(isinstance(module, DynamicQuantizedLinear) for module in model.modules()):
+        return DYNAMIC_INT8
+    return None
+
+
+def quantize_policy(model: nn.Module, quantize: str | None = DYNAMIC_INT8, channels_last: bool = False):
+    """Quantize `model` in place for CPU inference, and return it.
+
+    Args:
+        model: The model, on CPU. Already quantized layers are left as is.
+        quantize: The quantization mode (see `QUANTIZATION_MODES`), or None to only apply `channels_last`.
+        channels_last: Convert the weights of the 2D convolutions to the channels-last memory format.
+    """
+    if quantize is not None and quantize not in QUANTIZATION_MODES:
+        raise ValueError(f"Unknown quantization mode '{quantize}', expected one of {QUANTIZATION_MODES}.")
+    if any(p.device.type != "cpu" for p in model.parameters()):
+        raise ValueError("Quantized inference is only supported on CPU.")
+
+    if quantize == DYNAMIC_INT8:
+        model.eval()
+        torch.ao.quantization.quantize_dynamic(model, {nn.Linear}, dtype=torch.qint8, inplace=True)
+    if channels_last:
+        if not torch.backends.mkldnn.is_available():
+            logging.warning("oneDNN is not available, the channels-last convolutions may be slower.")
+        model.to(memory_format=torch.channels_last)
+    return model
+
+
+def _quantized_linears(model: nn.Module) -> dict[str, DynamicQuantizedLinear]:
+    return {
+        name: module for name, module in model.named_modules() if isinstance(module, DynamicQuantizedLinear)
+    }
+
+
+def quantized_state_dict(model: nn.Module) -> dict[str, Tensor]:
+    """State dict of a quantized model, with the quantized weights split into plain tensors.
+
+    The weight of each quantized linear layer is stored as `weight` (int8), `weight_scale` and
+    `weight_zero_point` (scalars, or one per output channel), next to its float `bias`.
+    """
+    linears = _quantized_linears(model)
+    state_dict = {
+        key: value
+        for key, value in model.state_dict().items()
+        if not any(key.startswith(f"{name}.") for name in linears)
+    }
+    for name, module in linears.items():
+        weight = module.weight()
+        state_dict[f"{name}.weight"] = weight.int_repr()
+        if weight.qscheme() in (torch.per_channel_affine, torch.per_channel_symmetric):
+            state_dict[f"{name}.weight_scale"] = weight.q_per_channel_scales().float()
+            state_dict[f"{name}.weight_zero_point"] = weight.q_per_channel_zero_points()
+        else:
+            state_dict[f"{name}.weight_scale"] = torch.tensor(weight.q_scale(), dtype=torch.float32)
+            state_dict[f"{name}.weight_zero_point"] = torch.tensor(weight.q_zero_point())
+        if module.bias() is not None:
+            state_dict[f"{name}.bias"] = module.bias()
+    # safetensors does not store tensors sharing memory (e.g. tied weights)
+    return {key: value.detach().clone().contiguous() for key, value in state_dict.items()}
+
+
+def load_quantized_state_dict(model: nn.Module, state_dict: dict[str, Tensor]) -> tuple[list[str], list[str]]:
+    """Load a state dict written by `quantized_state_dict` into a model quantized in the same mode.
+
+    Returns:
+        The missing and unexpected keys, as `nn.Module.load_state_dict`.
+    """
+    # The versions of the modules tell the quantized layers the format of their state dict
+    metadata = model.state_dict()._metadata
+    state_dict = OrderedDict(state_dict)
+    state_dict._metadata = metadata
+    missing_keys = []
+    for name, module in _quantized_linears(model).items():
+        keys = [f"{name}.weight", f"{name}.weight_scale", f"{name}.weight_zero_point"]
+        if all(key in state_dict for key in keys):
+            int_weight, scale, zero_point = (state_dict.pop(key) for key in keys)
+            if scale.ndim == 0:
+                weight = torch._make_per_tensor_quantized_tensor(int_weight, scale.item(), zero_point.item())
+            else:
+                weight = torch._make_per_channel_quantized_tensor(int_weight, scale.double(), zero_point, 0)
+            module.set_weight_bias(weight, state_dict.pop(f"{name}.bias", None))
+        else:
+            missing_keys.extend(key for key in keys if key not in state_dict)
+        # The quantized layers expect their packed parameters in the state dict
+        state_dict.update(module.state_dict(prefix=f"{name}."))
+
+    result = model.load_state_dict(state_dict, strict=False)
+    return missing_keys + list(result.missing_keys), list(result.unexpected_keys)
+
+
+def get_checkpoint_quantization(model_file: str) -> str | None:
+    """Quantization mode of the weights saved in the safetensors file `model_file`, if any."""
+    with safe_open(model_file, framework="pt") as f:
+        metadata = f.metadata() or {}
+    return metadata.get(QUANTIZATION_METADATA_KEY)
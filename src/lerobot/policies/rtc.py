@@ -0,0 +1,84 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Real-time chunking of flow matching policies (pi0, pi05 and SmolVLA), as in "Real-Time Execution of Action
+Chunking Flow Policies" (https://huggingface.co/papers/2506.07339).
+
+The next chunk is predicted while the current one is executed. The actions executed during the inference are
+those of the current chunk, so the new chunk is denoised with its first `inference_delay` actions frozen to them,
+and the following ones guided towards the rest of the current chunk with decreasing weights ("inpainting"). The
+transition between chunks is then smooth, even though they are predicted from different observations.
+
+The paper computes the guidance with a vector-Jacobian product through the model at each denoising step. Here,
+the Jacobian of the denoised actions with respect to the noisy ones is approximated by the identity, which only
+needs the velocity predicted by the model: the denoised actions are moved towards the target by the guidance
+weights, and the frozen actions are exactly those of the previous chunk at the end of the denoising.
+"""
+
+import math
+
+import torch
+from torch import Tensor
+
+
+def make_inpainting_weights(
+    prefix_len: int, inference_delay: int, chunk_size: int, device: torch.device | str | None = None
+) -> Tensor:
+    """Guidance weights of the actions of a chunk, of shape (chunk_size,).
+
+    The `inference_delay` first actions are frozen (weight 1). The weights then decrease exponentially to 0 at
+    `prefix_len`, the number of actions of the previous chunk that overlap with the new one, and are 0 after.
+    """
+    prefix_len = min(prefix_len, chunk_size)
+    inference_delay = min(inference_delay, prefix_len)
+    i = torch.arange(chunk_size, dtype=torch.float32, device=device)
+    c = (prefix_len - i) / (prefix_len - inference_delay + 1)
+    weights = c * torch.expm1(c) / (math.e - 1)
+    weights = torch.where(i < inference_delay, torch.ones_like(weights), weights)
+    return torch.where(i < prefix_len, weights, torch.zeros_like(weights))
+
+
+def make_inpainting(
+    prev_chunk: Tensor, inference_delay: int, chunk_size: int, action_dim: int
+) -> tuple[Tensor, Tensor]:
+    """Target actions and guidance weights of `guide_velocity`.
+
+    Args:
+        prev_chunk: Remaining actions of the previous chunk, of shape (batch_size, n, d) with d <= action_dim.
+            The first one is to be executed at the same time as the first action of the new chunk.
+        inference_delay: Number of actions executed before the new chunk is available.
+        chunk_size: Number of actions in a chunk.
+        action_dim: Dimension of the actions denoised by the model (padded).
+
+    Returns:
+        The targets, of shape (batch_size, chunk_size, action_dim), padded with zeros, and the weights, of shape
+        (chunk_size,).
+    """
+    bsize, prefix_len, dim = prev_chunk.shape
+    prefix_len = min(prefix_len, chunk_size)
+    target = prev_chunk.new_zeros(bsize, chunk_size, action_dim, dtype=torch.float32)
+    target[:, :prefix_len, :dim] = prev_chunk[:, :prefix_len]
+    weights = make_inpainting_weights(prefix_len, inference_delay, chunk_size, device=prev_chunk.device)
+    return target, weights
+
+
+def guide_velocity(x_t: Tensor, v_t: Tensor, time: Tensor, target: Tensor, weights: Tensor) -> Tensor:
+    """Velocity moving the actions denoised from `x_t` towards `target`, by `weights` along the chunk.
+
+    With the convention of the flow matching policies, `x_t = time * noise + (1 - time) * actions`, so the
+    actions denoised in one step are `x_t - time * v_t`.
+    """
+    time = time.reshape(-1, 1, 1)
+    denoised = x_t - time * v_t
+    return v_t - weights[:, None] * (target - denoised) / time
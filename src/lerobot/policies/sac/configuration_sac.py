@@ -145,6 +145,12 @@ class SACConfig(PreTrainedConfig):
     offline_buffer_capacity: int = 100000
     # Whether to use asynchronous prefetching for the buffers
     async_prefetch: bool = False
+    # Whether the replay buffers store the features of the frozen pretrained vision encoder instead of the images.
+    # Features are computed once per transition, and the learner skips the vision encoder. DrQ image augmentation
+    # does not apply, and the buffers are not saved as datasets in the checkpoints.
+    cache_image_features: bool = False
+    # Storage dtype of the cached image features, e.g. "float16" to halve their memory
+    image_features_dtype: str = "float32"
     # Number of steps before learning starts
     online_step_before_learning: int = 100
     # Frequency of policy updates
@@ -200,6 +206,16 @@ class SACConfig(PreTrainedConfig):
     def __post_init__(self):
         super().__post_init__()
         # Any validation specific to SAC configuration
+        if self.cache_image_features and (self.vision_encoder_name is None or not self.freeze_vision_encoder):
+            raise ValueError(
+                "`cache_image_features` requires a frozen pretrained vision encoder (`vision_encoder_name` set "
+                "and `freeze_vision_encoder=True`)."
+            )
+        if self.image_features_dtype not in ("float32", "float16", "bfloat16"):
+            raise ValueError(
+                f"`image_features_dtype` must be 'float32', 'float16' or 'bfloat16', but "
+                f"'{self.image_features_dtype}' is provided."
+            )
 
     def get_optimizer_preset(self) -> MultiAdamConfig:
         return MultiAdamConfig(
@@ -66,6 +66,10 @@ class SmolVLAConfig(PreTrainedConfig):
 
     # Attention utils
     use_cache: bool = True
+    # Compile the denoising loop at inference, with static shapes and CUDA graphs on GPU
+    compile_denoising: bool = False
+    # Guide each chunk of `select_action` towards the actions left in the previous one (see policies/rtc.py)
+    real_time_chunking: bool = False
 
     # Finetuning settings
     freeze_vision_encoder: bool = True
@@ -89,6 +93,7 @@ class SmolVLAConfig(PreTrainedConfig):
     add_image_special_tokens: bool = False  # Whether to use special image tokens around image features.
 
     attention_mode: str = "cross_attn"
+    attention_implementation: str = "eager"  # "eager" or "sdpa" (torch's scaled_dot_product_attention)
 
     prefix_length: int = -1
 
@@ -111,6 +116,10 @@ class SmolVLAConfig(PreTrainedConfig):
                 f"The chunk size is the upper bound for the number of action steps per model invocation. Got "
                 f"{self.n_action_steps} for `n_action_steps` and {self.chunk_size} for `chunk_size`."
             )
+        if self.attention_implementation not in ["eager", "sdpa"]:
+            raise ValueError(
+                f"`attention_implementation` must be 'eager' or 'sdpa'. Got {self.attention_implementation}."
+            )
         if self.use_delta_joint_actions_aloha:
             raise NotImplementedError(
                 "`use_delta_joint_actions_aloha` is used by smolvla for aloha real models. It is not ported yet in LeRobot."
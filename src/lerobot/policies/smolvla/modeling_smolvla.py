@@ -59,7 +59,9 @@ import torch
 import torch.nn.functional as F  # noqa: N812
 from torch import Tensor, nn
 
+from lerobot.policies.flow_matching import make_denoising_times
 from lerobot.policies.pretrained import PreTrainedPolicy
+from lerobot.policies.rtc import guide_velocity, make_inpainting
 from lerobot.policies.smolvla.configuration_smolvla import SmolVLAConfig
 from lerobot.policies.smolvla.smolvlm_with_expert import SmolVLMWithExpertModel
 from lerobot.policies.utils import (
@@ -241,11 +243,19 @@ class SmolVLAPolicy(PreTrainedPolicy):
         self._queues = {
             ACTION: deque(maxlen=self.config.n_action_steps),
         }
+        # Actions of the last chunk that were not executed, to guide the next one with `real_time_chunking`
+        self._prev_chunk = None
 
     def get_optim_params(self) -> dict:
         return self.parameters()
 
-    def _get_action_chunk(self, batch: dict[str, Tensor], noise: Tensor | None = None) -> Tensor:
+    def _get_action_chunk(
+        self,
+        batch: dict[str, Tensor],
+        noise: Tensor | None = None,
+        prev_chunk: Tensor | None = None,
+        inference_delay: int = 0,
+    ) -> Tensor:
         # TODO: Check if this for loop is needed.
         # Context: In fact, self.queues contains only ACTION field, and in inference, we don't have action in the batch
         # In the case of offline inference, we have the action in the batch
@@ -260,7 +270,17 @@ class SmolVLAPolicy(PreTrainedPolicy):
         lang_tokens = batch[f"{OBS_LANGUAGE_TOKENS}"]
         lang_masks = batch[f"{OBS_LANGUAGE_ATTENTION_MASK}"]
 
-        actions = self.model.sample_actions(images, img_masks, lang_tokens, lang_masks, state, noise=noise)
+        inpainting = None
+        if prev_chunk is not None and prev_chunk.shape[1] > 0:
+            if self.config.adapt_to_pi_aloha:
+                prev_chunk = self._pi_aloha_encode_actions_inv(prev_chunk.clone())
+            inpainting = make_inpainting(
+                prev_chunk, inference_delay, self.config.chunk_size, self.config.max_action_dim
+            )
+
+        actions = self.model.sample_actions(
+            images, img_masks, lang_tokens, lang_masks, state, noise=noise, inpainting=inpainting
+        )
 
         # Unpad actions
         original_action_dim = self.config.action_feature.shape[0]
@@ -278,13 +298,25 @@ class SmolVLAPolicy(PreTrainedPolicy):
         return batch
 
     @torch.no_grad()
-    def predict_action_chunk(self, batch: dict[str, Tensor], noise: Tensor | None = None) -> Tensor:
+    def predict_action_chunk(
+        self,
+        batch: dict[str, Tensor],
+        noise: Tensor | None = None,
+        prev_chunk: Tensor | None = None,
+        inference_delay: int = 0,
+    ) -> Tensor:
+        """Predict a chunk of actions given environment observations.
+
+        With `prev_chunk`, the remaining actions of the previous chunk (as returned by this method), the new chunk
+        is guided towards them and its `inference_delay` first actions are frozen to them (see
+        `lerobot.policies.rtc`).
+        """
         self.eval()
 
         batch = self._prepare_batch(batch)
         self._queues = populate_queues(self._queues, batch, exclude_keys=[ACTION])
 
-        actions = self._get_action_chunk(batch, noise)
+        actions = self._get_action_chunk(batch, noise, prev_chunk, inference_delay)
         return actions
 
     @torch.no_grad()
@@ -302,7 +334,11 @@ class SmolVLAPolicy(PreTrainedPolicy):
         # Action queue logic for n_action_steps > 1. When the action_queue is depleted, populate it by
         # querying the policy.
         if len(self._queues[ACTION]) == 0:
-            actions = self._get_action_chunk(batch, noise)
+            if self.config.real_time_chunking:
+                actions = self._get_action_chunk(batch, noise, prev_chunk=self._prev_chunk)
+                self._prev_chunk = actions[:, self.config.n_action_steps :]
+            else:
+                actions = self._get_action_chunk(batch, noise)
 
             # `self.predict_action_chunk` returns a (batch_size, n_action_steps, action_dim) tensor, but the queue
             # effectively has shape (n_action_steps, batch_size, *), hence the transpose.
@@ -486,7 +522,11 @@ class VLAFlowMatching(nn.Module):
             self_attn_every_n_layers=self.config.self_attn_every_n_layers,
             expert_width_multiplier=self.config.expert_width_multiplier,
             device=self.config.device,
+            attention_implementation=self.config.attention_implementation,
         )
+        if self.config.compile_denoising:
+            # Static shapes, and CUDA graphs on GPU: the loop only takes step-invariant tensors
+            self.denoise_loop = torch.compile(self.denoise_loop, mode="reduce-overhead", dynamic=False)
         self.state_proj = nn.Linear(
             self.config.max_state_dim, self.vlm_with_expert.config.text_config.hidden_size
         )
@@ -628,8 +668,6 @@ class VLAFlowMatching(nn.Module):
     def embed_suffix(self, noisy_actions, timestep):
         """Embed state, noisy_actions, timestep to prepare for Expert Gemma processing."""
         embs = []
-        pad_masks = []
-        att_masks = []
 
         # Fuse timestep + action information using an MLP
         action_emb = self.action_in_proj(noisy_actions)
@@ -656,18 +694,31 @@ class VLAFlowMatching(nn.Module):
         # Add to input tokens
         embs.append(action_time_emb)
 
-        bsize, action_time_dim = action_time_emb.shape[:2]
-        action_time_mask = torch.ones(bsize, action_time_dim, dtype=torch.bool, device=device)
-        pad_masks.append(action_time_mask)
-
-        # Set attention masks so that image, language and state inputs do not attend to action tokens
-        att_masks += [1] * self.config.chunk_size
         embs = torch.cat(embs, dim=1)
-        pad_masks = torch.cat(pad_masks, dim=1)
-        att_masks = torch.tensor(att_masks, dtype=embs.dtype, device=embs.device)
-        att_masks = att_masks[None, :].expand(bsize, len(att_masks))
+        pad_masks, att_masks = self._suffix_masks(bsize, device, dtype=embs.dtype)
         return embs, pad_masks, att_masks
 
+    def _suffix_masks(self, bsize, device, dtype=torch.bool):
+        """Padding and attention masks of the suffix, made of the action tokens."""
+        pad_masks = torch.ones(bsize, self.config.chunk_size, dtype=torch.bool, device=device)
+        # Set attention masks so that image, language and state inputs do not attend to action tokens
+        att_masks = torch.ones(self.config.chunk_size, dtype=dtype, device=device)
+        return pad_masks, att_masks[None, :].expand(bsize, self.config.chunk_size)
+
+    def _prepare_suffix_attention(self, prefix_pad_masks, suffix_pad_masks, suffix_att_masks):
+        """2D attention mask and position ids of the suffix tokens, which attend to the cached prefix."""
+        suffix_len = suffix_pad_masks.shape[1]
+        batch_size = prefix_pad_masks.shape[0]
+        prefix_len = prefix_pad_masks.shape[1]
+        prefix_pad_2d_masks = prefix_pad_masks[:, None, :].expand(batch_size, suffix_len, prefix_len)
+
+        suffix_att_2d_masks = make_att_2d_masks(suffix_pad_masks, suffix_att_masks)
+
+        full_att_2d_masks = torch.cat([prefix_pad_2d_masks, suffix_att_2d_masks], dim=2)
+        prefix_offsets = torch.sum(prefix_pad_masks, dim=-1)[:, None]
+        position_ids = prefix_offsets + torch.cumsum(suffix_pad_masks, dim=1) - 1
+        return full_att_2d_masks, position_ids
+
     def forward(
         self, images, img_masks, lang_tokens, lang_masks, state, actions, noise=None, time=None
     ) -> Tensor:
@@ -706,7 +757,9 @@ class VLAFlowMatching(nn.Module):
         losses = F.mse_loss(u_t, v_t, reduction="none")
         return losses
 
-    def sample_actions(self, images, img_masks, lang_tokens, lang_masks, state, noise=None) -> Tensor:
+    def sample_actions(
+        self, images, img_masks, lang_tokens, lang_masks, state, noise=None, inpainting=None
+    ) -> Tensor:
         """Do a full inference forward and compute the action (batch_size x num_steps x num_motors)"""
         bsize = state.shape[0]
         device = state.device
@@ -729,22 +782,45 @@ class VLAFlowMatching(nn.Module):
             use_cache=self.config.use_cache,
             fill_kv_cache=True,
         )
-        dt = -1.0 / self.config.num_steps
-        dt = torch.tensor(dt, dtype=torch.float32, device=device)
+        # The times, suffix attention mask and position ids do not depend on the denoising step, so they are
+        # only built once
+        times = make_denoising_times(self.config.num_steps, bsize, device)
+        suffix_attention = self._prepare_suffix_attention(
+            prefix_pad_masks, *self._suffix_masks(bsize, device)
+        )
 
+        if self.config.compile_denoising:
+            torch.compiler.cudagraph_mark_step_begin()
+            # The outputs of CUDA graphs are overwritten by the next replay
+            return self.denoise_loop(
+                prefix_pad_masks, past_key_values, noise, times, suffix_attention, inpainting
+            ).clone()
+        return self.denoise_loop(
+            prefix_pad_masks, past_key_values, noise, times, suffix_attention, inpainting
+        )
+
+    def denoise_loop(
+        self, prefix_pad_masks, past_key_values, noise, times, suffix_attention, inpainting=None
+    ):
+        """Integrate the velocity field with Euler steps at `times`, from `noise` to the actions.
+
+        `inpainting` holds the target actions and weights of `lerobot.policies.rtc.guide_velocity`, to guide the
+        actions towards those of the previous chunk (real-time chunking).
+        """
+        dt = torch.tensor(-1.0 / len(times), dtype=torch.float32, device=noise.device)
         x_t = noise
-        time = torch.tensor(1.0, dtype=torch.float32, device=device)
-        while time >= -dt / 2:
-            expanded_time = time.expand(bsize)
+        for time in times:
             v_t = self.denoise_step(
                 prefix_pad_masks,
                 past_key_values,
                 x_t,
-                expanded_time,
+                time,
+                suffix_attention=suffix_attention,
             )
+            if inpainting is not None:
+                v_t = guide_velocity(x_t, v_t, time, *inpainting)
             # Euler step
-            x_t += dt * v_t
-            time += dt
+            x_t = x_t + dt * v_t
         return x_t
 
     def denoise_step(
@@ -753,20 +829,19 @@ class VLAFlowMatching(nn.Module):
         past_key_values,
         x_t,
         timestep,
+        suffix_attention=None,
     ):
-        """Apply one denoising step of the noise `x_t` at a given timestep."""
-        suffix_embs, suffix_pad_masks, suffix_att_masks = self.embed_suffix(x_t, timestep)
+        """Apply one denoising step of the noise `x_t` at a given timestep.
 
-        suffix_len = suffix_pad_masks.shape[1]
-        batch_size = prefix_pad_masks.shape[0]
-        prefix_len = prefix_pad_masks.shape[1]
-        prefix_pad_2d_masks = prefix_pad_masks[:, None, :].expand(batch_size, suffix_len, prefix_len)
-
-        suffix_att_2d_masks = make_att_2d_masks(suffix_pad_masks, suffix_att_masks)
+        `suffix_attention` is the output of `_prepare_suffix_attention`, computed here if not provided.
+        """
+        suffix_embs, suffix_pad_masks, suffix_att_masks = self.embed_suffix(x_t, timestep)
 
-        full_att_2d_masks = torch.cat([prefix_pad_2d_masks, suffix_att_2d_masks], dim=2)
-        prefix_offsets = torch.sum(prefix_pad_masks, dim=-1)[:, None]
-        position_ids = prefix_offsets + torch.cumsum(suffix_pad_masks, dim=1) - 1
+        if suffix_attention is None:
+            suffix_attention = self._prepare_suffix_attention(
+                prefix_pad_masks, suffix_pad_masks, suffix_att_masks
+            )
+        full_att_2d_masks, position_ids = suffix_attention
 
         outputs_embeds, _ = self.vlm_with_expert.forward(
             attention_mask=full_att_2d_masks,
@@ -28,7 +28,7 @@ import torchvision
 from torch import Tensor, nn
 
 from lerobot.policies.pretrained import PreTrainedPolicy
-from lerobot.policies.utils import get_device_from_parameters, get_output_shape, populate_queues
+from lerobot.policies.utils import get_output_shape, populate_queues
 from lerobot.policies.vqbet.configuration_vqbet import VQBeTConfig
 from lerobot.policies.vqbet.vqbet_utils import GPT, ResidualVQ
 from lerobot.utils.constants import ACTION, OBS_IMAGES, OBS_STATE
@@ -534,7 +534,8 @@ class VQBeTHead(nn.Module):
                 NT=NT,
             )
 
-        device = get_device_from_parameters(self)
+        # The device of the inputs: once quantized, the layers of the head have no float parameters left
+        device = x.device
         indices = (
             torch.arange(NT, device=device).unsqueeze(1),
             torch.arange(self.vqvae_model.vqvae_num_layers, device=device).unsqueeze(0),
@@ -19,6 +19,7 @@ This script defines a processor step for moving environment transition data to a
 its floating-point precision.
 """
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
@@ -44,10 +45,19 @@ class DeviceProcessorStep(ProcessorStep):
         device: The target device for tensors (e.g., "cpu", "cuda", "cuda:0").
         float_dtype: The target floating-point dtype as a string (e.g., "float32", "float16", "bfloat16").
                      If None, the dtype is not changed.
+        pin_memory: If True and the target device is CUDA, the CPU tensors of a transition are staged into
+                    reusable pinned buffers and copied in one pass with `non_blocking=True` on a dedicated
+                    stream. The current stream waits on an event recorded after the copies, so the host never
+                    blocks on the transfer. Ignored for other devices.
+        flatten_transfers: If True (with `pin_memory`), the CPU tensors sharing a dtype are packed into a
+                    single contiguous pinned buffer and copied with one transfer, then split on the device.
+                    This is beneficial when a transition holds many small tensors (e.g., states and scalars).
     """
 
     device: str = "cpu"
     float_dtype: str | None = None
+    pin_memory: bool = False
+    flatten_transfers: bool = False
 
     DTYPE_MAPPING = {
         "float16": torch.float16,
@@ -81,6 +91,25 @@ class DeviceProcessorStep(ProcessorStep):
         else:
             self._target_float_dtype = None
 
+        self._batched_transfer = self.pin_memory and self.tensor_device.type == "cuda"
+        # Created lazily on the first batched transfer.
+        self._transfer_stream: torch.cuda.Stream | None = None
+        self._transfer_event: torch.cuda.Event | None = None
+        self._staging_buffers: dict[Any, torch.Tensor] = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        # CUDA streams and events cannot be copied or pickled; they are recreated on the next transfer.
+        state = self.__dict__.copy()
+        state["_transfer_stream"] = None
+        state["_transfer_event"] = None
+        state["_staging_buffers"] = {}
+        return state
+
+    @property
+    def supports_tensor_transform(self) -> bool:
+        """Batched transfers need the whole transition at once, so they are not folded by compiled pipelines."""
+        return not self._batched_transfer
+
     def _process_tensor(self, tensor: torch.Tensor) -> torch.Tensor:
         """
         Moves a single tensor to the target device and casts its dtype.
@@ -132,12 +161,16 @@ class DeviceProcessorStep(ProcessorStep):
         Returns:
             A new `EnvTransition` object with all tensors moved to the target device and dtype.
         """
-        new_transition = transition.copy()
-        action = new_transition.get(TransitionKey.ACTION)
+        action = transition.get(TransitionKey.ACTION)
 
         if action is not None and not isinstance(action, PolicyAction):
             raise ValueError(f"If action is not None should be a PolicyAction type got {type(action)}")
 
+        if self._batched_transfer:
+            # Move all CPU tensors at once; the dtype casts below then run on the device.
+            transition = self._transfer_to_device(transition)
+        new_transition = transition.copy()
+
         simple_tensor_keys = [
             TransitionKey.ACTION,
             TransitionKey.REWARD,
@@ -168,14 +201,149 @@ class DeviceProcessorStep(ProcessorStep):
 
         return new_transition
 
+    def _transfer_to_device(self, transition: EnvTransition) -> EnvTransition:
+        """
+        Copies all CPU tensors of a transition to the target CUDA device in one pass, on a dedicated stream.
+
+        Args:
+            transition: The input `EnvTransition` object.
+
+        Returns:
+            A new `EnvTransition` object where the CPU tensors are replaced by their device copies. The current
+            stream is made to wait on the copies, so the returned tensors can be used right away.
+        """
+        locations: list[tuple[TransitionKey, str | None]] = []
+        tensors: list[torch.Tensor] = []
+        for key in (TransitionKey.ACTION, TransitionKey.REWARD, TransitionKey.DONE, TransitionKey.TRUNCATED):
+            value = transition.get(key)
+            if isinstance(value, torch.Tensor) and value.device.type == "cpu":
+                locations.append((key, None))
+                tensors.append(value)
+        for key in (TransitionKey.OBSERVATION, TransitionKey.COMPLEMENTARY_DATA):
+            for k, v in (transition.get(key) or {}).items():
+                if isinstance(v, torch.Tensor) and v.device.type == "cpu":
+                    locations.append((key, k))
+                    tensors.append(v)
+        if not tensors:
+            return transition
+
+        if self._transfer_stream is None:
+            self._transfer_stream = torch.cuda.Stream(device=self.tensor_device)
+            self._transfer_event = torch.cuda.Event()
+
+        # The staging buffers are reused: wait for the copies of the previous call to be done reading them.
+        self._transfer_event.synchronize()
+        with torch.cuda.stream(self._transfer_stream):
+            if self.flatten_transfers:
+                moved = self._copy_flattened(tensors)
+            else:
+                moved = [
+                    self._stage(location, tensor).to(self.tensor_device, non_blocking=True)
+                    for location, tensor in zip(locations, tensors, strict=True)
+                ]
+            self._transfer_event.record(self._transfer_stream)
+
+        current_stream = torch.cuda.current_stream(self.tensor_device)
+        current_stream.wait_event(self._transfer_event)
+
+        new_transition = transition.copy()
+        for key in (TransitionKey.OBSERVATION, TransitionKey.COMPLEMENTARY_DATA):
+            if new_transition.get(key) is not None:
+                new_transition[key] = dict(new_transition[key])
+        for (key, k), tensor in zip(locations, moved, strict=True):
+            # The memory was allocated on the transfer stream but is used on the current one.
+            tensor.record_stream(current_stream)
+            if k is None:
+                new_transition[key] = tensor
+            else:
+                new_transition[key][k] = tensor
+        return new_transition
+
+    def _stage(self, location: Any, tensor: torch.Tensor) -> torch.Tensor:
+        """Returns `tensor` in pinned memory, copied into a staging buffer reused across calls if needed."""
+        if tensor.is_pinned():
+            return tensor
+        buffer = self._staging_buffers.get(location)
+        if buffer is None or buffer.shape != tensor.shape or buffer.dtype != tensor.dtype:
+            buffer = torch.empty(tensor.shape, dtype=tensor.dtype, pin_memory=True)
+            self._staging_buffers[location] = buffer
+        return buffer.copy_(tensor)
+
+    def _copy_flattened(self, tensors: list[torch.Tensor]) -> list[torch.Tensor]:
+        """Copies `tensors` with one transfer per dtype, through contiguous pinned staging buffers."""
+        groups: dict[torch.dtype, list[int]] = {}
+        for i, tensor in enumerate(tensors):
+            groups.setdefault(tensor.dtype, []).append(i)
+
+        moved: list[torch.Tensor | None] = [None] * len(tensors)
+        for dtype, indices in groups.items():
+            total = sum(tensors[i].numel() for i in indices)
+            buffer = self._staging_buffers.get(dtype)
+            if buffer is None or buffer.numel() < total:
+                buffer = torch.empty(total, dtype=dtype, pin_memory=True)
+                self._staging_buffers[dtype] = buffer
+
+            offset = 0
+            for i in indices:
+                numel = tensors[i].numel()
+                buffer[offset : offset + numel].view(tensors[i].shape).copy_(tensors[i])
+                offset += numel
+
+            flat = buffer[:total].to(self.tensor_device, non_blocking=True)
+            offset = 0
+            for i in indices:
+                numel = tensors[i].numel()
+                moved[i] = flat[offset : offset + numel].view(tensors[i].shape)
+                offset += numel
+        return moved
+
+    def get_tensor_transform(
+        self, transition_key: TransitionKey, key: str | None
+    ) -> Callable[[Any], Any] | None:
+        """
+        Returns the function applied to a single value of a transition, used by compiled pipelines.
+
+        Args:
+            transition_key: The part of the transition the value belongs to.
+            key: The key of the value within the observation or complementary data, None otherwise.
+
+        Returns:
+            A function moving tensors to the target device and dtype, or None for the parts of the transition
+            which are not processed by this step.
+        """
+        if transition_key == TransitionKey.ACTION:
+            return self._process_action
+        if transition_key in (
+            TransitionKey.REWARD,
+            TransitionKey.DONE,
+            TransitionKey.TRUNCATED,
+            TransitionKey.OBSERVATION,
+            TransitionKey.COMPLEMENTARY_DATA,
+        ):
+            return self._process_value
+        return None
+
+    def _process_value(self, value: Any) -> Any:
+        return self._process_tensor(value) if isinstance(value, torch.Tensor) else value
+
+    def _process_action(self, action: Any) -> Any:
+        if not isinstance(action, PolicyAction):
+            raise ValueError(f"If action is not None should be a PolicyAction type got {type(action)}")
+        return self._process_tensor(action)
+
     def get_config(self) -> dict[str, Any]:
         """
         Returns the serializable configuration of the processor.
 
         Returns:
-            A dictionary containing the device and float_dtype settings.
+            A dictionary containing the device and float_dtype settings, and the transfer options when enabled.
         """
-        return {"device": self.device, "float_dtype": self.float_dtype}
+        config = {"device": self.device, "float_dtype": self.float_dtype}
+        if self.pin_memory:
+            config["pin_memory"] = True
+        if self.flatten_transfers:
+            config["flatten_transfers"] = True
+        return config
 
     def transform_features(
         self, features: dict[PipelineFeatureType, dict[str, PolicyFeature]]
@@ -17,6 +17,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from copy import deepcopy
 from dataclasses import dataclass, field
 from typing import Any
@@ -32,6 +33,14 @@ from .converters import from_tensor_to_numpy, to_tensor
 from .core import EnvTransition, PolicyAction, TransitionKey
 from .pipeline import PolicyProcessorPipeline, ProcessorStep, ProcessorStepRegistry
 
+# Statistics defining the (low, high) or (mean, std) reference values of each normalization mode.
+_NORM_MODE_STATS = {
+    NormalizationMode.MEAN_STD: ("mean", "std"),
+    NormalizationMode.MIN_MAX: ("min", "max"),
+    NormalizationMode.QUANTILES: ("q01", "q99"),
+    NormalizationMode.QUANTILE10: ("q10", "q90"),
+}
+
 
 @dataclass
 class _NormalizationMixin:
@@ -82,6 +91,8 @@ class _NormalizationMixin:
             normalization to specific observation features.
         _tensor_stats: An internal dictionary holding the normalization statistics as
             PyTorch tensors.
+        _affine_cache: An internal cache of the affine (shift, scale, offset) coefficients equivalent to
+            each feature's normalization, per device and dtype.
         _stats_explicitly_provided: Internal flag tracking whether stats were explicitly
             provided during construction (used for override preservation).
     """
@@ -96,6 +107,9 @@ class _NormalizationMixin:
 
     _tensor_stats: dict[str, dict[str, Tensor]] = field(default_factory=dict, init=False, repr=False)
     _stats_explicitly_provided: bool = field(default=False, init=False, repr=False)
+    _affine_cache: dict[tuple, tuple[Tensor | None, Tensor, Tensor]] = field(
+        default_factory=dict, init=False, repr=False
+    )
 
     def __post_init__(self):
         """
@@ -149,6 +163,7 @@ class _NormalizationMixin:
         if dtype is not None:
             self.dtype = dtype
         self._tensor_stats = to_tensor(self.stats, device=self.device, dtype=self.dtype)
+        self._affine_cache.clear()
         return self
 
     def state_dict(self) -> dict[str, Tensor]:
@@ -193,6 +208,8 @@ class _NormalizationMixin:
             representation is updated to ensure consistency with the current device
             and dtype settings.
         """
+        self._affine_cache.clear()
+
         # If stats were explicitly provided during construction, preserve them
         if self._stats_explicitly_provided and self.stats is not None:
             # Don't load from state_dict, keep the explicitly provided stats
@@ -275,14 +292,135 @@ class _NormalizationMixin:
         processed_action = self._apply_transform(action, ACTION, FeatureType.ACTION, inverse=inverse)
         return processed_action
 
+    def _get_tensor_transform(
+        self, transition_key: TransitionKey, key: str | None, *, inverse: bool
+    ) -> Callable[[Any], Tensor] | None:
+        """
+        Returns the function (un)normalizing a single value of a transition, used by compiled pipelines.
+
+        Args:
+            transition_key: The part of the transition the value belongs to.
+            key: The key of the value within the observation, None otherwise.
+            inverse: If `True`, the function applies unnormalization; otherwise, normalization.
+
+        Returns:
+            The transformation function, or None if the value is left untouched.
+        """
+        if transition_key == TransitionKey.ACTION:
+
+            def transform_action(action: Any) -> Tensor:
+                if not isinstance(action, PolicyAction):
+                    raise ValueError(f"Action should be a PolicyAction type got {type(action)}")
+                return self._apply_transform(action, ACTION, FeatureType.ACTION, inverse=inverse)
+
+            return transform_action
+
+        if transition_key != TransitionKey.OBSERVATION or key not in self.features:
+            return None
+        if self.normalize_observation_keys is not None and key not in self.normalize_observation_keys:
+            return None
+        feature_type = self.features[key].type
+        if feature_type == FeatureType.ACTION:
+            return None
+        if self.norm_map.get(feature_type, NormalizationMode.IDENTITY) == NormalizationMode.IDENTITY:
+            return None
+
+        def transform_observation(value: Any) -> Tensor:
+            return self._apply_transform(torch.as_tensor(value), key, feature_type, inverse=inverse)
+
+        return transform_observation
+
+    def _get_affine_coefficients(
+        self,
+        key: str,
+        feature_type: FeatureType,
+        device: torch.device,
+        dtype: torch.dtype,
+        *,
+        inverse: bool = False,
+    ) -> tuple[Tensor | None, Tensor, Tensor] | None:
+        """
+        Returns the (shift, scale, offset) coefficients such that the transformation is
+        `(tensor - shift) * scale + offset`.
+
+        Every normalization mode is an affine function of the input, so the coefficients are computed once from
+        the statistics and cached per device and dtype. When normalizing, the shift is kept apart from the
+        offset: folding it in would cancel catastrophically for constant features, whose scale is `1 / eps`.
+        It is None when unnormalizing, where the transformation reduces to a single multiply-add.
+
+        Args:
+            key: The feature key.
+            feature_type: The `FeatureType` of the feature.
+            device: The device of the tensors to transform.
+            dtype: The dtype of the tensors to transform.
+            inverse: If `True`, returns the coefficients of the unnormalization.
+
+        Returns:
+            The (shift, scale, offset) tensors, or None if the feature is not transformed.
+
+        Raises:
+            ValueError: If an unsupported normalization mode is encountered or if the statistics it requires are
+                missing.
+        """
+        cache_key = (key, inverse, device, dtype)
+        coefficients = self._affine_cache.get(cache_key)
+        if coefficients is not None:
+            return coefficients
+
+        norm_mode = self.norm_map.get(feature_type, NormalizationMode.IDENTITY)
+        if norm_mode == NormalizationMode.IDENTITY or key not in self._tensor_stats:
+            return None
+        if norm_mode not in _NORM_MODE_STATS:
+            raise ValueError(f"Unsupported normalization mode: {norm_mode}")
+
+        stats = self._tensor_stats[key]
+        low_name, high_name = _NORM_MODE_STATS[norm_mode]
+        if stats.get(low_name) is None or stats.get(high_name) is None:
+            message = (
+                f"{norm_mode.name} normalization mode requires {low_name} and {high_name} stats, "
+                "please update the dataset with the correct stats"
+            )
+            if norm_mode in (NormalizationMode.QUANTILES, NormalizationMode.QUANTILE10):
+                message += " using the `augment_dataset_quantile_stats.py` script"
+            raise ValueError(message)
+
+        # Computed in double precision, then cast to the target dtype.
+        low, high = stats[low_name].double(), stats[high_name].double()
+        shift = None
+        if norm_mode == NormalizationMode.MEAN_STD:
+            mean, std = low, high
+            if inverse:
+                scale, offset = std, mean
+            else:
+                # Avoid division by zero by adding a small epsilon.
+                shift, scale, offset = mean, 1.0 / (std + self.eps), torch.zeros_like(mean)
+        else:
+            # When low == high, substitute the range with a small epsilon to prevent division by zero.
+            denom = high - low
+            denom = torch.where(denom == 0, torch.full_like(denom, self.eps), denom)
+            if inverse:
+                # Map from [-1, 1] back to [low, high]
+                scale = denom / 2.0
+                offset = scale + low
+            else:
+                # Map from [low, high] to [-1, 1]
+                shift, scale, offset = low, 2.0 / denom, torch.full_like(low, -1.0)
+
+        coefficients = tuple(
+            None if coefficient is None else coefficient.to(device=device, dtype=dtype).contiguous()
+            for coefficient in (shift, scale, offset)
+        )
+        self._affine_cache[cache_key] = coefficients
+        return coefficients
+
     def _apply_transform(
         self, tensor: Tensor, key: str, feature_type: FeatureType, *, inverse: bool = False
     ) -> Tensor:
         """
         Core logic to apply a normalization or unnormalization transformation to a tensor.
 
-        This method selects the appropriate normalization mode based on the feature type
-        and applies the corresponding mathematical operation.
+        Every supported mode is an affine function of the input, so the transformation is a fused
+        `offset + (tensor - shift) * scale`, with coefficients looked up from a per-device, per-dtype cache.
 
         Normalization Modes:
           - MEAN_STD: Centers data around zero with unit variance.
@@ -290,6 +428,10 @@ class _NormalizationMixin:
           - QUANTILES: Scales data to [-1, 1] range using 1st and 99th percentiles (q01/q99).
           - QUANTILE10: Scales data to [-1, 1] range using 10th and 90th percentiles (q10/q90).
 
+        For Accelerate compatibility, the output follows the device and dtype of the input tensor. The
+        stored statistics are left untouched; a copy of the coefficients is cached for each device and
+        dtype seen, so inputs alternating between devices do not trigger repeated transfers.
+
         Args:
             tensor: The input tensor to transform.
             key: The feature key corresponding to the tensor.
@@ -302,99 +444,16 @@ class _NormalizationMixin:
         Raises:
             ValueError: If an unsupported normalization mode is encountered.
         """
-        norm_mode = self.norm_map.get(feature_type, NormalizationMode.IDENTITY)
-        if norm_mode == NormalizationMode.IDENTITY or key not in self._tensor_stats:
+        dtype = tensor.dtype if tensor.is_floating_point() else self.dtype
+        coefficients = self._get_affine_coefficients(key, feature_type, tensor.device, dtype, inverse=inverse)
+        if coefficients is None:
             return tensor
-
-        if norm_mode not in (
-            NormalizationMode.MEAN_STD,
-            NormalizationMode.MIN_MAX,
-            NormalizationMode.QUANTILES,
-            NormalizationMode.QUANTILE10,
-        ):
-            raise ValueError(f"Unsupported normalization mode: {norm_mode}")
-
-        # For Accelerate compatibility: Ensure stats are on the same device and dtype as the input tensor
-        if self._tensor_stats and key in self._tensor_stats:
-            first_stat = next(iter(self._tensor_stats[key].values()))
-            if first_stat.device != tensor.device or first_stat.dtype != tensor.dtype:
-                self.to(device=tensor.device, dtype=tensor.dtype)
-
-        stats = self._tensor_stats[key]
-
-        if norm_mode == NormalizationMode.MEAN_STD:
-            mean = stats.get("mean", None)
-            std = stats.get("std", None)
-            if mean is None or std is None:
-                raise ValueError(
-                    "MEAN_STD normalization mode requires mean and std stats, please update the dataset with the correct stats"
-                )
-
-            mean, std = stats["mean"], stats["std"]
-            # Avoid division by zero by adding a small epsilon.
-            denom = std + self.eps
-            if inverse:
-                return tensor * std + mean
-            return (tensor - mean) / denom
-
-        if norm_mode == NormalizationMode.MIN_MAX:
-            min_val = stats.get("min", None)
-            max_val = stats.get("max", None)
-            if min_val is None or max_val is None:
-                raise ValueError(
-                    "MIN_MAX normalization mode requires min and max stats, please update the dataset with the correct stats"
-                )
-
-            min_val, max_val = stats["min"], stats["max"]
-            denom = max_val - min_val
-            # When min_val == max_val, substitute the denominator with a small epsilon
-            # to prevent division by zero. This consistently maps an input equal to
-            # min_val to -1, ensuring a stable transformation.
-            denom = torch.where(
-                denom == 0, torch.tensor(self.eps, device=tensor.device, dtype=tensor.dtype), denom
-            )
-            if inverse:
-                # Map from [-1, 1] back to [min, max]
-                return (tensor + 1) / 2 * denom + min_val
-            # Map from [min, max] to [-1, 1]
-            return 2 * (tensor - min_val) / denom - 1
-
-        if norm_mode == NormalizationMode.QUANTILES:
-            q01 = stats.get("q01", None)
-            q99 = stats.get("q99", None)
-            if q01 is None or q99 is None:
-                raise ValueError(
-                    "QUANTILES normalization mode requires q01 and q99 stats, please update the dataset with the correct stats using the `augment_dataset_quantile_stats.py` script"
-                )
-
-            denom = q99 - q01
-            # Avoid division by zero by adding epsilon when quantiles are identical
-            denom = torch.where(
-                denom == 0, torch.tensor(self.eps, device=tensor.device, dtype=tensor.dtype), denom
-            )
-            if inverse:
-                return (tensor + 1.0) * denom / 2.0 + q01
-            return 2.0 * (tensor - q01) / denom - 1.0
-
-        if norm_mode == NormalizationMode.QUANTILE10:
-            q10 = stats.get("q10", None)
-            q90 = stats.get("q90", None)
-            if q10 is None or q90 is None:
-                raise ValueError(
-                    "QUANTILE10 normalization mode requires q10 and q90 stats, please update the dataset with the correct stats using the `augment_dataset_quantile_stats.py` script"
-                )
-
-            denom = q90 - q10
-            # Avoid division by zero by adding epsilon when quantiles are identical
-            denom = torch.where(
-                denom == 0, torch.tensor(self.eps, device=tensor.device, dtype=tensor.dtype), denom
-            )
-            if inverse:
-                return (tensor + 1.0) * denom / 2.0 + q10
-            return 2.0 * (tensor - q10) / denom - 1.0
-
-        # If necessary stats are missing, return input unchanged.
-        return tensor
+        # Only the transformed tensors are cast, e.g. integer index or label features are passed through as is
+        tensor = tensor.to(dtype=dtype)
+        shift, scale, offset = coefficients
+        if shift is not None:
+            tensor = tensor - shift
+        return torch.addcmul(offset, tensor, scale)
 
 
 @dataclass
@@ -465,6 +524,11 @@ class NormalizerProcessorStep(_NormalizationMixin, ProcessorStep):
 
         return new_transition
 
+    def get_tensor_transform(
+        self, transition_key: TransitionKey, key: str | None
+    ) -> Callable[[Any], Tensor] | None:
+        return self._get_tensor_transform(transition_key, key, inverse=False)
+
     def transform_features(
         self, features: dict[PipelineFeatureType, dict[str, PolicyFeature]]
     ) -> dict[PipelineFeatureType, dict[str, PolicyFeature]]:
@@ -526,6 +590,11 @@ class UnnormalizerProcessorStep(_NormalizationMixin, ProcessorStep):
 
         return new_transition
 
+    def get_tensor_transform(
+        self, transition_key: TransitionKey, key: str | None
+    ) -> Callable[[Any], Tensor] | None:
+        return self._get_tensor_transform(transition_key, key, inverse=True)
+
     def transform_features(
         self, features: dict[PipelineFeatureType, dict[str, PolicyFeature]]
     ) -> dict[PipelineFeatureType, dict[str, PolicyFeature]]:
@@ -557,4 +626,5 @@ def hotswap_stats(
             step.stats = stats
             # Re-initialize tensor_stats on the correct device.
             step._tensor_stats = to_tensor(stats, device=step.device, dtype=step.dtype)  # type: ignore[assignment]
+            step._affine_cache.clear()
     return rp
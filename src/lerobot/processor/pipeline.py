@@ -250,6 +250,73 @@ class ProcessorMigrationError(Exception):
         )
 
 
+class _FusedTensorStep:
+    """Applies a run of consecutive tensor-only processor steps in a single pass over a transition.
+
+    Each step must implement `get_tensor_transform(transition_key, key)`, returning the function it applies to
+    the value stored under `transition[transition_key]` (`key` is None) or `transition[transition_key][key]`
+    (for the observation and complementary data dictionaries), or None if it leaves that value untouched.
+    The functions of all steps are resolved and chained once per key, then cached.
+    """
+
+    SIMPLE_KEYS = (TransitionKey.ACTION, TransitionKey.REWARD, TransitionKey.DONE, TransitionKey.TRUNCATED)
+    DICT_KEYS = (TransitionKey.OBSERVATION, TransitionKey.COMPLEMENTARY_DATA)
+
+    def __init__(self, steps: Sequence[ProcessorStep], use_torch_compile: bool = False):
+        self.steps = list(steps)
+        self.use_torch_compile = use_torch_compile
+        self._transforms: dict[tuple[TransitionKey, str | None], Callable[[Any], Any] | None] = {}
+
+    def __deepcopy__(self, memo: dict) -> _FusedTensorStep:
+        # The cached transforms are bound to the original steps and are rebuilt lazily for the copies.
+        return _FusedTensorStep(deepcopy(self.steps, memo), self.use_torch_compile)
+
+    def _get_transform(self, transition_key: TransitionKey, key: str | None) -> Callable[[Any], Any] | None:
+        if (transition_key, key) not in self._transforms:
+            fns = []
+            for step in self.steps:
+                fn = step.get_tensor_transform(transition_key, key)  # type: ignore[attr-defined]
+                if fn is not None:
+                    fns.append(fn)
+
+            transform: Callable[[Any], Any] | None = None
+            if len(fns) == 1:
+                transform = fns[0]
+            elif len(fns) > 1:
+
+                def transform(value: Any, fns: list[Callable[[Any], Any]] = fns) -> Any:
+                    for fn in fns:
+                        value = fn(value)
+                    return value
+
+            if transform is not None and self.use_torch_compile:
+                transform = torch.compile(transform, dynamic=False)
+            self._transforms[(transition_key, key)] = transform
+        return self._transforms[(transition_key, key)]
+
+    def __call__(self, transition: EnvTransition) -> EnvTransition:
+        new_transition = transition.copy()
+        for transition_key in self.SIMPLE_KEYS:
+            value = transition.get(transition_key)
+            if value is None:
+                continue
+            transform = self._get_transform(transition_key, None)
+            if transform is not None:
+                new_transition[transition_key] = transform(value)
+
+        for transition_key in self.DICT_KEYS:
+            data_dict = transition.get(transition_key)
+            if data_dict is None:
+                continue
+            new_data_dict = dict(data_dict)
+            for key, value in data_dict.items():
+                transform = self._get_transform(transition_key, key)
+                if transform is not None:
+                    new_data_dict[key] = transform(value)
+            new_transition[transition_key] = new_data_dict
+        return new_transition
+
+
 @dataclass
 class DataProcessorPipeline(HubMixin, Generic[TInput, TOutput]):
     """A sequential pipeline for processing data, integrated with the Hugging Face Hub.
@@ -281,6 +348,11 @@ class DataProcessorPipeline(HubMixin, Generic[TInput, TOutput]):
     before_step_hooks: list[Callable[[int, EnvTransition], None]] = field(default_factory=list, repr=False)
     after_step_hooks: list[Callable[[int, EnvTransition], None]] = field(default_factory=list, repr=False)
 
+    # Steps used in compiled mode (see `compile`), None when the pipeline runs step by step.
+    _compiled_steps: list[Callable[[EnvTransition], EnvTransition]] | None = field(
+        default=None, init=False, repr=False
+    )
+
     def __call__(self, data: TInput) -> TOutput:
         """Processes input data through the full pipeline.
 
@@ -303,6 +375,11 @@ class DataProcessorPipeline(HubMixin, Generic[TInput, TOutput]):
         Returns:
             The final `EnvTransition` after all steps have been applied.
         """
+        if self._compiled_steps is not None and not self.before_step_hooks and not self.after_step_hooks:
+            for compiled_step in self._compiled_steps:
+                transition = compiled_step(transition)
+            return transition
+
         for idx, processor_step in enumerate(self.steps):
             # Execute pre-hooks
             for hook in self.before_step_hooks:
@@ -315,6 +392,46 @@ class DataProcessorPipeline(HubMixin, Generic[TInput, TOutput]):
                 hook(idx, transition)
         return transition
 
+    def compile(self, use_torch_compile: bool = False) -> DataProcessorPipeline[TInput, TOutput]:
+        """Enables the compiled execution mode of the pipeline.
+
+        Steps that implement `get_tensor_transform` (e.g., `DeviceProcessorStep`, `NormalizerProcessorStep`
+        and `UnnormalizerProcessorStep`) only apply per-key tensor functions. In compiled mode, each run of
+        consecutive such steps is folded into a single step which resolves the functions to apply to each
+        key once, then applies them in one pass over the transition. This avoids rebuilding the transition
+        and re-dispatching on every key for each step, which matters in high-frequency control loops.
+
+        A step can opt out of folding by exposing a falsy `supports_tensor_transform` attribute, e.g.
+        `DeviceProcessorStep` when it batches the transfers of a whole transition.
+
+        The pipeline falls back to the step-by-step execution whenever hooks are registered, and `step_through`
+        always runs step by step. `compile` must be called again if `steps` is modified afterwards.
+
+        Args:
+            use_torch_compile: If True, the per-key functions of folded steps are wrapped with
+                `torch.compile`.
+
+        Returns:
+            The pipeline itself, to allow chaining.
+        """
+        compiled_steps: list[Callable[[EnvTransition], EnvTransition]] = []
+        tensor_steps: list[ProcessorStep] = []
+        for processor_step in self.steps:
+            if hasattr(processor_step, "get_tensor_transform") and getattr(
+                processor_step, "supports_tensor_transform", True
+            ):
+                tensor_steps.append(processor_step)
+                continue
+            if tensor_steps:
+                compiled_steps.append(_FusedTensorStep(tensor_steps, use_torch_compile))
+                tensor_steps = []
+            compiled_steps.append(processor_step)
+        if tensor_steps:
+            compiled_steps.append(_FusedTensorStep(tensor_steps, use_torch_compile))
+
+        self._compiled_steps = compiled_steps
+        return self
+
     def step_through(self, data: TInput) -> Iterable[EnvTransition]:
         """Processes data step-by-step, yielding the transition at each stage.
 
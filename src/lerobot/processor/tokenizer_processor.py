@@ -23,6 +23,8 @@ token IDs and attention masks, which are then added to the observation dictionar
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -62,6 +64,11 @@ class TokenizerProcessorStep(ObservationProcessorStep):
         padding_side: The side to pad on ('left' or 'right').
         padding: The padding strategy ('max_length', 'longest', etc.).
         truncation: Whether to truncate sequences longer than `max_length`.
+        cache_size: The maximum number of tokenized tasks kept in the LRU cache. Datasets and control loops
+            usually only see a handful of distinct tasks, so tokenized prompts are cached (already on the
+            target device) instead of calling the tokenizer on every transition. Set to 0 to disable caching.
+            The returned tensors are copies of the cached ones, and the cache can be used from several threads
+            (e.g. a processor shared by the eval or record threads).
         input_tokenizer: The internal tokenizer instance, loaded during initialization.
     """
 
@@ -72,9 +79,16 @@ class TokenizerProcessorStep(ObservationProcessorStep):
     padding_side: str = "right"
     padding: str = "max_length"
     truncation: bool = True
+    cache_size: int = 64
 
     # Internal tokenizer instance (not part of the config)
     input_tokenizer: Any = field(default=None, init=False, repr=False)
+    _cache: OrderedDict[tuple, tuple[torch.Tensor, torch.Tensor]] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _cache_hits: int = field(default=0, init=False, repr=False)
+    _cache_misses: int = field(default=0, init=False, repr=False)
+    _cache_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """
@@ -106,6 +120,16 @@ class TokenizerProcessorStep(ObservationProcessorStep):
                 "Pass a tokenizer object directly or a tokenizer name to auto-load."
             )
 
+    def __getstate__(self) -> dict[str, Any]:
+        # Locks cannot be copied or pickled; a new one is created by `__setstate__`.
+        state = self.__dict__.copy()
+        del state["_cache_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._cache_lock = threading.Lock()
+
     def get_task(self, transition: EnvTransition) -> list[str] | None:
         """
         Extracts the task description(s) from the transition's complementary data.
@@ -149,28 +173,122 @@ class TokenizerProcessorStep(ObservationProcessorStep):
         if task is None:
             raise ValueError("Task cannot be None")
 
-        # Tokenize the task (this will create CPU tensors)
-        tokenized_prompt = self._tokenize_text(task)
-
         # Detect the device from existing tensors in the transition to ensure consistency
         target_device = self._detect_device(self.transition)
 
-        # Move new tokenized tensors to the detected device
-        if target_device is not None:
-            tokenized_prompt = {
-                k: v.to(target_device) if isinstance(v, torch.Tensor) else v
-                for k, v in tokenized_prompt.items()
-            }
+        if self.cache_size > 0:
+            input_ids, attention_mask = self._tokenize_cached(task, target_device)
+        else:
+            input_ids, attention_mask = self._tokenize_to_device(task, target_device)
 
         # Create a new observation dict to avoid modifying the original in place
         new_observation = dict(observation)
 
         # Add tokenized data to the observation
-        new_observation[OBS_LANGUAGE_TOKENS] = tokenized_prompt["input_ids"]
-        new_observation[OBS_LANGUAGE_ATTENTION_MASK] = tokenized_prompt["attention_mask"].to(dtype=torch.bool)
+        new_observation[OBS_LANGUAGE_TOKENS] = input_ids
+        new_observation[OBS_LANGUAGE_ATTENTION_MASK] = attention_mask
 
         return new_observation
 
+    def cache_info(self) -> dict[str, float]:
+        """
+        Returns the statistics of the tokenization cache.
+
+        This can be polled from a pipeline hook to monitor the cache, e.g.
+        `pipeline.register_after_step_hook(lambda idx, _: log(pipeline.steps[idx].cache_info()))`.
+
+        Returns:
+            A dictionary with the number of cache `hits` and `misses`, the current `size` and `max_size`
+            of the cache and the resulting `hit_rate`.
+        """
+        with self._cache_lock:
+            lookups = self._cache_hits + self._cache_misses
+            return {
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "size": len(self._cache),
+                "max_size": self.cache_size,
+                "hit_rate": self._cache_hits / lookups if lookups > 0 else 0.0,
+            }
+
+    def clear_cache(self) -> None:
+        """Empties the tokenization cache and resets its statistics."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_hits = 0
+            self._cache_misses = 0
+
+    def _tokenize_to_device(
+        self, text: list[str], device: torch.device | None
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """
+        Tokenizes `text` and moves the token IDs and boolean attention mask to `device`.
+
+        Args:
+            text: A list of strings to tokenize.
+            device: The target device, or None to keep the tensors on the CPU.
+
+        Returns:
+            A tuple with the token IDs and the attention mask.
+        """
+        # Tokenize the task (this will create CPU tensors)
+        tokenized_prompt = self._tokenize_text(text)
+        input_ids = tokenized_prompt["input_ids"]
+        attention_mask = tokenized_prompt["attention_mask"].to(dtype=torch.bool)
+
+        # Move new tokenized tensors to the detected device
+        if device is not None:
+            input_ids = input_ids.to(device)
+            attention_mask = attention_mask.to(device)
+        return input_ids, attention_mask
+
+    def _tokenize_cached(
+        self, tasks: list[str], device: torch.device | None
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """
+        Tokenizes a batch of tasks, reusing the cached tensors of previously seen tasks.
+
+        With `max_length` padding, each task is tokenized independently of the rest of the batch, so tasks are
+        cached one by one and batches are assembled from the cached rows. With other padding strategies the
+        result depends on the whole batch, which is then cached as a single entry. The cache is locked during the
+        lookup (the tokenizer is also called under the lock, the fast tokenizers are not thread-safe either).
+
+        Args:
+            tasks: The list of task strings.
+            device: The target device, or None to keep the tensors on the CPU.
+
+        Returns:
+            A tuple with the token IDs and the attention mask, matching the output of `_tokenize_to_device`.
+        """
+        device = device if device is not None else torch.device("cpu")
+        settings = (self.max_length, self.padding, self.padding_side, self.truncation, device)
+        with self._cache_lock:
+            if len(tasks) == 1 or self.padding != "max_length":
+                input_ids, attention_mask = self._lookup((tuple(tasks), *settings), tasks, device)
+                # The cached tensors must not be modified by the next steps or the policy
+                return input_ids.clone(), attention_mask.clone()
+
+            entries = [self._lookup(((task,), *settings), [task], device) for task in tasks]
+        input_ids = torch.cat([ids.reshape(1, -1) for ids, _ in entries])
+        attention_mask = torch.cat([mask.reshape(1, -1) for _, mask in entries])
+        return input_ids, attention_mask
+
+    def _lookup(
+        self, key: tuple, text: list[str], device: torch.device | None
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._cache.move_to_end(key)
+            self._cache_hits += 1
+            return entry
+
+        self._cache_misses += 1
+        entry = self._tokenize_to_device(text, device)
+        self._cache[key] = entry
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return entry
+
     def _detect_device(self, transition: EnvTransition) -> torch.device | None:
         """
         Detects the torch.device from existing tensors in the transition.
@@ -232,6 +350,7 @@ class TokenizerProcessorStep(ObservationProcessorStep):
             "padding_side": self.padding_side,
             "padding": self.padding,
             "truncation": self.truncation,
+            "cache_size": self.cache_size,
         }
 
         # Only save tokenizer_name if it was used to create the tokenizer
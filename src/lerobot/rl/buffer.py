@@ -36,6 +36,9 @@ class BatchTransition(TypedDict):
     done: torch.Tensor
     truncated: torch.Tensor
     complementary_info: dict[str, torch.Tensor | float | int] | None = None
+    # Image features stored in place of the images, see `ReplayBuffer.feature_encoder`
+    observation_feature: dict[str, torch.Tensor] | None = None
+    next_observation_feature: dict[str, torch.Tensor] | None = None
 
 
 def random_crop_vectorized(images: torch.Tensor, output_size: tuple) -> torch.Tensor:
@@ -87,6 +90,8 @@ class ReplayBuffer:
         use_drq: bool = True,
         storage_device: str = "cpu",
         optimize_memory: bool = False,
+        feature_encoder: Callable[[dict[str, torch.Tensor]], dict[str, torch.Tensor]] | None = None,
+        feature_dtype: torch.dtype = torch.float32,
     ):
         """
         Replay buffer for storing transitions.
@@ -104,6 +109,13 @@ class ReplayBuffer:
                 Using "cpu" can help save GPU memory.
             optimize_memory (bool): If True, optimizes memory by not storing duplicate next_states when
                 they can be derived from states. This is useful for large datasets where next_state[i] = state[i+1].
+            feature_encoder (Optional[Callable]): A frozen image encoder, mapping a dict of batched images to a
+                dict of features with the same keys (e.g. `SACObservationEncoder.get_cached_image_features`).
+                If provided, the images of each transition are encoded once when added, and only their features
+                are stored. Sampled batches then carry them in `observation_feature` and
+                `next_observation_feature` instead of images, and DrQ augmentation does not apply.
+            feature_dtype (torch.dtype): Storage dtype of the features, e.g. `torch.float16` to halve their
+                memory. Sampled features are cast back to float32.
         """
         if capacity <= 0:
             raise ValueError("Capacity must be greater than 0.")
@@ -129,13 +141,46 @@ class ReplayBuffer:
             self.image_augmentation_function = torch.compile(base_function)
         self.use_drq = use_drq
 
+        self.feature_encoder = feature_encoder
+        self.feature_dtype = feature_dtype
+
+    def _encode_images(
+        self, state: dict[str, torch.Tensor]
+    ) -> tuple[dict[str, torch.Tensor], dict[str, torch.Tensor]]:
+        """Split a state into its non-image entries and the features of its images."""
+        images = {k: v.to(self.device) for k, v in state.items() if k.startswith(OBS_IMAGE)}
+        with torch.no_grad():
+            features = self.feature_encoder(images)
+        return {k: v for k, v in state.items() if k not in images}, features
+
     def _initialize_storage(
         self,
         state: dict[str, torch.Tensor],
         action: torch.Tensor,
         complementary_info: dict[str, torch.Tensor] | None = None,
+        features: dict[str, torch.Tensor] | None = None,
     ):
         """Initialize the storage tensors based on the first transition."""
+        self.features = None
+        if self.feature_encoder is not None:
+            if features is None:
+                state, features = self._encode_images(state)
+            self.features = {
+                key: torch.empty(
+                    (self.capacity, *val.squeeze(0).shape),
+                    dtype=self.feature_dtype,
+                    device=self.storage_device,
+                )
+                for key, val in features.items()
+            }
+            if not self.optimize_memory:
+                self.next_features = {
+                    key: torch.empty_like(val, device=self.storage_device)
+                    for key, val in self.features.items()
+                }
+            else:
+                self.next_features = self.features
+
         # Determine shapes from the first transition
         state_shapes = {key: val.squeeze(0).shape for key, val in state.items()}
         action_shape = action.squeeze(0).shape
@@ -198,9 +243,18 @@ class ReplayBuffer:
         complementary_info: dict[str, torch.Tensor] | None = None,
     ):
         """Saves a transition, ensuring tensors are stored on the designated storage device."""
+        features = None
+        if self.feature_encoder is not None:
+            # Store the features of the images instead of the images
+            state, features = self._encode_images(state)
+            if not self.optimize_memory:
+                next_state, next_features = self._encode_images(next_state)
+
         # Initialize storage if this is the first transition
         if not self.initialized:
-            self._initialize_storage(state=state, action=action, complementary_info=complementary_info)
+            self._initialize_storage(
+                state=state, action=action, complementary_info=complementary_info, features=features
+            )
 
         # Store the transition in pre-allocated tensors
         for key in self.states:
@@ -210,6 +264,12 @@ class ReplayBuffer:
                 # Only store next_states if not optimizing memory
                 self.next_states[key][self.position].copy_(next_state[key].squeeze(dim=0))
 
+        if features is not None:
+            for key in self.features:
+                self.features[key][self.position].copy_(features[key].squeeze(dim=0))
+                if not self.optimize_memory:
+                    self.next_features[key][self.position].copy_(next_features[key].squeeze(dim=0))
+
         self.actions[self.position].copy_(action.squeeze(dim=0))
         self.rewards[self.position] = reward
         self.dones[self.position] = done
@@ -293,7 +353,7 @@ class ReplayBuffer:
             for key in self.complementary_info_keys:
                 batch_complementary_info[key] = self.complementary_info[key][idx].to(self.device)
 
-        return BatchTransition(
+        batch = BatchTransition(
             state=batch_state,
             action=batch_actions,
             reward=batch_rewards,
@@ -303,6 +363,19 @@ class ReplayBuffer:
             complementary_info=batch_complementary_info,
         )
 
+        # Sample the image features if they are stored instead of the images
+        if self.features is not None:
+            next_idx = (idx + 1) % self.capacity if self.optimize_memory else idx
+            batch["observation_feature"] = {
+                key: self.features[key][idx].to(self.device, dtype=torch.float32) for key in self.features
+            }
+            batch["next_observation_feature"] = {
+                key: self.next_features[key][next_idx].to(self.device, dtype=torch.float32)
+                for key in self.next_features
+            }
+
+        return batch
+
     def get_iterator(
         self,
         batch_size: int,
@@ -422,6 +495,8 @@ class ReplayBuffer:
         use_drq: bool = True,
         storage_device: str = "cpu",
         optimize_memory: bool = False,
+        feature_encoder: Callable[[dict[str, torch.Tensor]], dict[str, torch.Tensor]] | None = None,
+        feature_dtype: torch.dtype = torch.float32,
     ) -> "ReplayBuffer":
         """
         Convert a LeRobotDataset into a ReplayBuffer.
@@ -437,6 +512,9 @@ class ReplayBuffer:
             use_drq (bool): Whether to use DrQ image augmentation when sampling.
             storage_device (str): Device for storing tensor data. Using "cpu" saves GPU memory.
             optimize_memory (bool): If True, reduces memory usage by not duplicating state data.
+            feature_encoder (Callable | None): Frozen image encoder whose features are stored instead of the
+                images, see `ReplayBuffer`.
+            feature_dtype (torch.dtype): Storage dtype of the image features.
 
         Returns:
             ReplayBuffer: The replay buffer with dataset transitions.
@@ -458,6 +536,8 @@ class ReplayBuffer:
             use_drq=use_drq,
             storage_device=storage_device,
             optimize_memory=optimize_memory,
+            feature_encoder=feature_encoder,
+            feature_dtype=feature_dtype,
         )
 
         # Convert dataset to transitions
@@ -518,6 +598,10 @@ class ReplayBuffer:
         """
         if self.size == 0:
             raise ValueError("The replay buffer is empty. Cannot convert to a dataset.")
+        if self.features is not None:
+            raise ValueError(
+                "The replay buffer stores image features instead of images. Cannot convert to a dataset."
+            )
 
         # Create features dictionary for the dataset
         features = {
@@ -814,6 +898,15 @@ def concatenate_batch_transitions(
         dim=0,
     )
 
+    # Concatenate image features if both batches carry them
+    for key in ("observation_feature", "next_observation_feature"):
+        left_features = left_batch_transitions.get(key)
+        right_features = right_batch_transition.get(key)
+        if left_features is not None and right_features is not None:
+            left_batch_transitions[key] = {
+                k: torch.cat([left_features[k], right_features[k]], dim=0) for k in left_features
+            }
+
     # Handle complementary_info
     left_info = left_batch_transitions.get("complementary_info")
     right_info = right_batch_transition.get("complementary_info")
@@ -74,7 +74,7 @@ from lerobot.teleoperators import (
 from lerobot.teleoperators.teleoperator import Teleoperator
 from lerobot.teleoperators.utils import TeleopEvents
 from lerobot.utils.constants import ACTION, DONE, OBS_IMAGES, OBS_STATE, REWARD
-from lerobot.utils.robot_utils import busy_wait
+from lerobot.utils.robot_utils import OverrunPolicy, RateScheduler, busy_wait
 from lerobot.utils.utils import log_say
 
 logging.basicConfig(level=logging.INFO)
@@ -574,8 +574,6 @@ def control_loop(
      teleop_device: Teleoperator device
      cfg: gym_manipulator configuration
     """
-    dt = 1.0 / cfg.env.fps
-
     print(f"Starting control loop at {cfg.env.fps} FPS")
     print("Controls:")
     print("- Use gamepad/teleop device for intervention")
@@ -641,9 +639,8 @@ def control_loop(
     episode_step = 0
     episode_start_time = time.perf_counter()
 
+    scheduler = RateScheduler(cfg.env.fps)
     while episode_idx < cfg.dataset.num_episodes_to_record:
-        step_start_time = time.perf_counter()
-
         # Create a neutral action (no movement)
         neutral_action = torch.tensor([0.0, 0.0, 0.0], dtype=torch.float32)
         if use_gripper:
@@ -692,6 +689,7 @@ def control_loop(
             logging.info(
                 f"Episode ended after {episode_step} steps in {episode_time:.1f}s with reward {transition[TransitionKey.REWARD]}"
             )
+            logging.info(f"Control loop timing: {scheduler.stats().format()}")
             episode_step = 0
             episode_idx += 1
 
@@ -711,9 +709,12 @@ def control_loop(
 
             transition = create_transition(observation=obs, info=info)
             transition = env_processor(transition)
+            # The reset is not part of the schedule of the next episode
+            scheduler.reset()
+            continue
 
         # Maintain fps timing
-        busy_wait(dt - (time.perf_counter() - step_start_time))
+        scheduler.wait()
 
     if dataset is not None and cfg.dataset.push_to_hub:
         logging.info("Pushing dataset to hub")
@@ -737,15 +738,15 @@ def replay_trajectory(
 
     _, info = env.reset()
 
+    scheduler = RateScheduler(cfg.env.fps, overrun_policy=OverrunPolicy.CATCH_UP)
     for action_data in actions:
-        start_time = time.perf_counter()
         transition = create_transition(
             observation=env.get_raw_joint_positions() if hasattr(env, "get_raw_joint_positions") else {},
             action=action_data[ACTION],
         )
         transition = action_processor(transition)
         env.step(transition[TransitionKey.ACTION])
-        busy_wait(1 / cfg.env.fps - (time.perf_counter() - start_time))
+        scheduler.wait()
 
 
 @parser.wrap()
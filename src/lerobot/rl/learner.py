@@ -48,6 +48,7 @@ import logging
 import os
 import shutil
 import time
+from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from pprint import pformat
@@ -66,7 +67,7 @@ from lerobot.datasets.factory import make_dataset
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
 from lerobot.policies.factory import make_policy
 from lerobot.policies.sac.modeling_sac import SACPolicy
-from lerobot.rl.buffer import ReplayBuffer, concatenate_batch_transitions
+from lerobot.rl.buffer import BatchTransition, ReplayBuffer, concatenate_batch_transitions
 from lerobot.rl.process import ProcessSignalHandler
 from lerobot.rl.wandb_utils import WandBLogger
 from lerobot.robots import so100_follower  # noqa: F401
@@ -326,7 +327,12 @@ def add_actor_information_and_train(
 
     log_training_info(cfg=cfg, policy=policy)
 
-    replay_buffer = initialize_replay_buffer(cfg, device, storage_device)
+    feature_encoder = None
+    if cfg.policy.cache_image_features:
+        # The frozen encoder runs once per transition, when it is added to the buffers
+        feature_encoder = policy.actor.encoder.get_cached_image_features
+
+    replay_buffer = initialize_replay_buffer(cfg, device, storage_device, feature_encoder)
     batch_size = cfg.batch_size
     offline_replay_buffer = None
 
@@ -335,6 +341,7 @@ def add_actor_information_and_train(
             cfg=cfg,
             device=device,
             storage_device=storage_device,
+            feature_encoder=feature_encoder,
         )
         batch_size: int = batch_size // 2  # We will sample from both replay buffer
 
@@ -409,7 +416,7 @@ def add_actor_information_and_train(
             check_nan_in_transition(observations=observations, actions=actions, next_state=next_observations)
 
             observation_features, next_observation_features = get_observation_features(
-                policy=policy, observations=observations, next_observations=next_observations
+                policy=policy, observations=observations, next_observations=next_observations, batch=batch
             )
 
             # Create a batch dictionary with all required elements for the forward method
@@ -468,7 +475,7 @@ def add_actor_information_and_train(
         check_nan_in_transition(observations=observations, actions=actions, next_state=next_observations)
 
         observation_features, next_observation_features = get_observation_features(
-            policy=policy, observations=observations, next_observations=next_observations
+            policy=policy, observations=observations, next_observations=next_observations, batch=batch
         )
 
         # Create a batch dictionary with all required elements for the forward method
@@ -735,6 +742,11 @@ def save_training_checkpoint(
     # Update the "last" symlink
     update_last_checkpoint(checkpoint_dir)
 
+    if cfg.policy.cache_image_features:
+        logging.warning("The replay buffers store image features instead of images, they are not saved")
+        logging.info("Resume training")
+        return
+
     # TODO : temporary save replay buffer here, remove later when on the robot
     # We want to control this with the keyboard inputs
     dataset_dir = os.path.join(cfg.output_dir, "dataset")
@@ -933,7 +945,10 @@ def log_training_info(cfg: TrainRLServerPipelineConfig, policy: nn.Module) -> No
 
 
 def initialize_replay_buffer(
-    cfg: TrainRLServerPipelineConfig, device: str, storage_device: str
+    cfg: TrainRLServerPipelineConfig,
+    device: str,
+    storage_device: str,
+    feature_encoder: Callable | None = None,
 ) -> ReplayBuffer:
     """
     Initialize a replay buffer, either empty or from a dataset if resuming.
@@ -942,17 +957,23 @@ def initialize_replay_buffer(
         cfg (TrainRLServerPipelineConfig): Training configuration
         device (str): Device to store tensors on
         storage_device (str): Device for storage optimization
+        feature_encoder (Callable | None): Frozen image encoder whose features are stored instead of the images
 
     Returns:
         ReplayBuffer: Initialized replay buffer
     """
-    if not cfg.resume:
+    feature_dtype = getattr(torch, cfg.policy.image_features_dtype)
+    if cfg.resume and feature_encoder is not None:
+        logging.warning("The online replay buffer was not saved with cached image features, starting empty")
+    if not cfg.resume or feature_encoder is not None:
         return ReplayBuffer(
             capacity=cfg.policy.online_buffer_capacity,
             device=device,
             state_keys=cfg.policy.input_features.keys(),
             storage_device=storage_device,
             optimize_memory=True,
+            feature_encoder=feature_encoder,
+            feature_dtype=feature_dtype,
         )
 
     logging.info("Resume training load the online dataset")
@@ -972,6 +993,7 @@ def initialize_replay_buffer(
         device=device,
         state_keys=cfg.policy.input_features.keys(),
         optimize_memory=True,
+        feature_dtype=feature_dtype,
     )
 
 
@@ -979,6 +1001,7 @@ def initialize_offline_replay_buffer(
     cfg: TrainRLServerPipelineConfig,
     device: str,
     storage_device: str,
+    feature_encoder: Callable | None = None,
 ) -> ReplayBuffer:
     """
     Initialize an offline replay buffer from a dataset.
@@ -987,11 +1010,13 @@ def initialize_offline_replay_buffer(
         cfg (TrainRLServerPipelineConfig): Training configuration
         device (str): Device to store tensors on
         storage_device (str): Device for storage optimization
+        feature_encoder (Callable | None): Frozen image encoder whose features are stored instead of the images
 
     Returns:
         ReplayBuffer: Initialized offline replay buffer
     """
-    if not cfg.resume:
+    # With cached image features, the offline buffer is not saved in the checkpoints
+    if not cfg.resume or feature_encoder is not None:
         logging.info("make_dataset offline buffer")
         offline_dataset = make_dataset(cfg)
     else:
@@ -1010,6 +1035,8 @@ def initialize_offline_replay_buffer(
         storage_device=storage_device,
         optimize_memory=True,
         capacity=cfg.policy.offline_buffer_capacity,
+        feature_encoder=feature_encoder,
+        feature_dtype=getattr(torch, cfg.policy.image_features_dtype),
     )
     return offline_replay_buffer
 
@@ -1018,7 +1045,10 @@ def initialize_offline_replay_buffer(
 
 
 def get_observation_features(
-    policy: SACPolicy, observations: torch.Tensor, next_observations: torch.Tensor
+    policy: SACPolicy,
+    observations: torch.Tensor,
+    next_observations: torch.Tensor,
+    batch: BatchTransition | None = None,
 ) -> tuple[torch.Tensor | None, torch.Tensor | None]:
     """
     Get observation features from the policy encoder. It act as cache for the observation features.
@@ -1029,11 +1059,15 @@ def get_observation_features(
         policy: The policy model
         observations: The current observations
         next_observations: The next observations
+        batch: The sampled batch, whose features are used as is when the replay buffer stores them
 
     Returns:
         tuple: observation_features, next_observation_features
     """
 
+    if batch is not None and batch.get("observation_feature") is not None:
+        return batch["observation_feature"], batch["next_observation_feature"]
+
     if policy.config.vision_encoder_name is None or not policy.config.freeze_vision_encoder:
         return None, None
 
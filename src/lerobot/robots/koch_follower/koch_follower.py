@@ -19,6 +19,7 @@ import time
 from functools import cached_property
 from typing import Any
 
+from lerobot.cameras.camera_group import CameraGroup
 from lerobot.cameras.utils import make_cameras_from_configs
 from lerobot.motors import Motor, MotorCalibration, MotorNormMode
 from lerobot.motors.dynamixel import (
@@ -61,6 +62,7 @@ class KochFollower(Robot):
             calibration=self.calibration,
         )
         self.cameras = make_cameras_from_configs(config.cameras)
+        self.camera_group = CameraGroup(self.cameras, max_skew_ms=config.camera_max_skew_ms)
 
     @property
     def _motors_ft(self) -> dict[str, type]:
@@ -193,12 +195,13 @@ class KochFollower(Robot):
         dt_ms = (time.perf_counter() - start) * 1e3
         logger.debug(f"{self} read state: {dt_ms:.1f}ms")
 
-        # Capture images from cameras
-        for cam_key, cam in self.cameras.items():
+        # Capture a time-aligned set of images from cameras
+        if self.cameras:
             start = time.perf_counter()
-            obs_dict[cam_key] = cam.async_read()
+            synced = self.camera_group.read()
+            obs_dict.update(synced.frames)
             dt_ms = (time.perf_counter() - start) * 1e3
-            logger.debug(f"{self} read {cam_key}: {dt_ms:.1f}ms")
+            logger.debug(f"{self} read cameras: {dt_ms:.1f}ms (skew {synced.skew_ms:.1f}ms)")
 
         return obs_dict
 
@@ -238,5 +241,6 @@ class KochFollower(Robot):
         self.bus.disconnect(self.config.disable_torque_on_disconnect)
         for cam in self.cameras.values():
             cam.disconnect()
+        self.camera_group.close()
 
         logger.info(f"{self} disconnected.")
@@ -64,6 +64,17 @@ class LeKiwiHostConfig:
     # If robot jitters decrease the frequency and monitor cpu load with `top` in cmd
     max_loop_freq_hz: int = 30
 
+    # Observation wire format: "binary" (multipart message with raw JPEG images, see `protocol.py`) or "json"
+    # (base64-encoded images, for clients of previous versions). Must match that of the client.
+    protocol: str = "binary"
+    jpeg_quality: int = 90
+    # Number of threads compressing the camera images, 0 to compress them in the control loop
+    encoder_workers: int = 0
+
+    def __post_init__(self):
+        if self.protocol not in ("binary", "json"):
+            raise ValueError(f"`protocol` must be 'binary' or 'json', but '{self.protocol}' is provided.")
+
 
 @RobotConfig.register_subclass("lekiwi_client")
 @dataclass
@@ -94,3 +105,13 @@ class LeKiwiClientConfig(RobotConfig):
 
     polling_timeout_ms: int = 15
     connect_timeout_s: int = 5
+
+    # Observation wire format, must match that of the host (see `LeKiwiHostConfig.protocol`)
+    protocol: str = "binary"
+    # Number of threads decompressing the camera images, 0 to decompress them in `get_observation`
+    decoder_workers: int = 0
+
+    def __post_init__(self):
+        super().__post_init__()
+        if self.protocol not in ("binary", "json"):
+            raise ValueError(f"`protocol` must be 'binary' or 'json', but '{self.protocol}' is provided.")
@@ -28,6 +28,7 @@ from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnected
 
 from ..robot import Robot
 from .config_lekiwi import LeKiwiClientConfig
+from .protocol import ObservationDecoder
 
 
 class LeKiwiClient(Robot):
@@ -51,6 +52,8 @@ class LeKiwiClient(Robot):
 
         self.polling_timeout_ms = config.polling_timeout_ms
         self.connect_timeout_s = config.connect_timeout_s
+        self.protocol = config.protocol
+        self.decoder = None
 
         self.zmq_context = None
         self.zmq_cmd_socket = None
@@ -59,6 +62,8 @@ class LeKiwiClient(Robot):
         self.last_frames = {}
 
         self.last_remote_state = {}
+        # Host time at which the last observation was sent, with the binary protocol
+        self.last_remote_timestamp = None
 
         # Define three speed levels and a current index
         self.speed_levels = [
@@ -128,9 +133,14 @@ class LeKiwiClient(Robot):
         self.zmq_cmd_socket.setsockopt(zmq.CONFLATE, 1)
 
         self.zmq_observation_socket = self.zmq_context.socket(zmq.PULL)
+        if self.protocol == "binary":
+            # CONFLATE does not support multipart messages, the latest observation is kept when polling
+            self.zmq_observation_socket.setsockopt(zmq.RCVHWM, 1)
+            self.decoder = ObservationDecoder(self.config.decoder_workers)
+        else:
+            self.zmq_observation_socket.setsockopt(zmq.CONFLATE, 1)
         zmq_observations_locator = f"tcp://{self.remote_ip}:{self.port_zmq_observations}"
         self.zmq_observation_socket.connect(zmq_observations_locator)
-        self.zmq_observation_socket.setsockopt(zmq.CONFLATE, 1)
 
         poller = zmq.Poller()
         poller.register(self.zmq_observation_socket, zmq.POLLIN)
@@ -143,8 +153,11 @@ class LeKiwiClient(Robot):
     def calibrate(self) -> None:
         pass
 
-    def _poll_and_get_latest_message(self) -> str | None:
-        """Polls the ZMQ socket for a limited time and returns the latest message string."""
+    def _poll_and_get_latest_message(self) -> str | list[bytes] | None:
+        """Polls the ZMQ socket for a limited time and returns the latest message.
+
+        The message is a string with the JSON protocol, and the list of its frames with the binary protocol.
+        """
         zmq = self._zmq
         poller = zmq.Poller()
         poller.register(self.zmq_observation_socket, zmq.POLLIN)
@@ -162,7 +175,10 @@ class LeKiwiClient(Robot):
         last_msg = None
         while True:
             try:
-                msg = self.zmq_observation_socket.recv_string(zmq.NOBLOCK)
+                if self.protocol == "binary":
+                    msg = self.zmq_observation_socket.recv_multipart(zmq.NOBLOCK)
+                else:
+                    msg = self.zmq_observation_socket.recv_string(zmq.NOBLOCK)
                 last_msg = msg
             except zmq.Again:
                 break
@@ -233,7 +249,9 @@ class LeKiwiClient(Robot):
         if latest_message_str is None:
             return self.last_frames, self.last_remote_state
 
-        # 3. Parse the JSON message
+        # 3. Parse the message
+        if self.protocol == "binary":
+            return self._get_binary_data(latest_message_str)
         observation = self._parse_observation_json(latest_message_str)
 
         # 4. If JSON parsing failed, return cached data
@@ -252,6 +270,33 @@ class LeKiwiClient(Robot):
 
         return new_frames, new_state
 
+    def _get_binary_data(self, frames: list[bytes]) -> tuple[dict[str, np.ndarray], dict[str, Any]]:
+        """Decodes a binary observation, returning the last known values if it is invalid."""
+        try:
+            observation = self.decoder.decode(frames)
+        except ValueError as e:
+            logging.error(f"Error decoding binary observation, serving last observation: {e}")
+            return self.last_frames, self.last_remote_state
+
+        if len(observation.state) != len(self._state_order):
+            logging.error(
+                f"Expected {len(self._state_order)} state values but received {len(observation.state)}, "
+                "serving last observation."
+            )
+            return self.last_frames, self.last_remote_state
+
+        flat_state = {
+            key: float(value) for key, value in zip(self._state_order, observation.state, strict=True)
+        }
+        new_state = {**flat_state, OBS_STATE: observation.state}
+        new_frames = {name: frame for name, frame in observation.frames.items() if name in self._cameras_ft}
+
+        self.last_frames = new_frames
+        self.last_remote_state = new_state
+        self.last_remote_timestamp = observation.timestamp
+
+        return new_frames, new_state
+
     def get_observation(self) -> dict[str, Any]:
         """
         Capture observations from the remote robot: current follower arm positions,
@@ -343,4 +388,7 @@ class LeKiwiClient(Robot):
         self.zmq_observation_socket.close()
         self.zmq_cmd_socket.close()
         self.zmq_context.term()
+        if self.decoder is not None:
+            self.decoder.close()
+            self.decoder = None
         self._is_connected = False
@@ -19,6 +19,7 @@ import json
 import logging
 import time
 from dataclasses import dataclass, field
+from functools import partial
 
 import cv2
 import draccus
@@ -26,6 +27,7 @@ import zmq
 
 from .config_lekiwi import LeKiwiConfig, LeKiwiHostConfig
 from .lekiwi import LeKiwi
+from .protocol import ObservationEncoder
 
 
 @dataclass
@@ -44,14 +46,51 @@ class LeKiwiHost:
         self.zmq_cmd_socket.bind(f"tcp://*:{config.port_zmq_cmd}")
 
         self.zmq_observation_socket = self.zmq_context.socket(zmq.PUSH)
-        self.zmq_observation_socket.setsockopt(zmq.CONFLATE, 1)
+        if config.protocol == "binary":
+            # CONFLATE does not support multipart messages: keep at most one pending observation instead
+            self.zmq_observation_socket.setsockopt(zmq.SNDHWM, 1)
+        else:
+            self.zmq_observation_socket.setsockopt(zmq.CONFLATE, 1)
         self.zmq_observation_socket.bind(f"tcp://*:{config.port_zmq_observations}")
 
         self.connection_time_s = config.connection_time_s
         self.watchdog_timeout_ms = config.watchdog_timeout_ms
         self.max_loop_freq_hz = config.max_loop_freq_hz
+        self.protocol = config.protocol
+        self.jpeg_quality = config.jpeg_quality
+        self.encoder = ObservationEncoder(config.jpeg_quality, config.encoder_workers)
+
+    def send_observation(self, observation: dict, camera_keys: list[str]) -> None:
+        """Sends an observation to the client without blocking, dropping it when no client is connected.
+
+        The state values are the entries of `observation` which are not in `camera_keys`, in insertion order.
+        """
+        if self.protocol == "binary":
+            state = [value for key, value in observation.items() if key not in camera_keys]
+            images = {key: observation[key] for key in camera_keys}
+            frames = self.encoder.encode(state, images)
+            send = partial(self.zmq_observation_socket.send_multipart, frames, copy=False)
+        else:
+            # Encode ndarrays to base64 strings
+            observation = dict(observation)
+            for cam_key in camera_keys:
+                ret, buffer = cv2.imencode(
+                    ".jpg", observation[cam_key], [int(cv2.IMWRITE_JPEG_QUALITY), self.jpeg_quality]
+                )
+                if ret:
+                    observation[cam_key] = base64.b64encode(buffer).decode("utf-8")
+                else:
+                    observation[cam_key] = ""
+            send = partial(self.zmq_observation_socket.send_string, json.dumps(observation))
+
+        # Send the observation to the remote agent
+        try:
+            send(flags=zmq.NOBLOCK)
+        except zmq.Again:
+            logging.info("Dropping observation, no client connected")
 
     def disconnect(self):
+        self.encoder.close()
         self.zmq_observation_socket.close()
         self.zmq_cmd_socket.close()
         self.zmq_context.term()
@@ -98,22 +137,7 @@ def main(cfg: LeKiwiServerConfig):
                 robot.stop_base()
 
             last_observation = robot.get_observation()
-
-            # Encode ndarrays to base64 strings
-            for cam_key, _ in robot.cameras.items():
-                ret, buffer = cv2.imencode(
-                    ".jpg", last_observation[cam_key], [int(cv2.IMWRITE_JPEG_QUALITY), 90]
-                )
-                if ret:
-                    last_observation[cam_key] = base64.b64encode(buffer).decode("utf-8")
-                else:
-                    last_observation[cam_key] = ""
-
-            # Send the observation to the remote agent
-            try:
-                host.zmq_observation_socket.send_string(json.dumps(last_observation), flags=zmq.NOBLOCK)
-            except zmq.Again:
-                logging.info("Dropping observation, no client connected")
+            host.send_observation(last_observation, list(robot.cameras))
 
             # Ensure a short sleep to avoid overloading the CPU.
             elapsed = time.time() - loop_start_time
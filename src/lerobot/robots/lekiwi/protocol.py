@@ -0,0 +1,114 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Binary wire format of the observations sent by the LeKiwi host to the client.
+
+An observation is a multipart ZMQ message:
+
+- frame 0: a fixed-layout header (`HEADER`: protocol version, number of cameras, number of state values,
+  sequence number and host timestamp) followed by the state values as little-endian float32, in the order
+  agreed upon by both sides (`LeKiwi.observation_features`);
+- then, for each camera, one frame with its name in UTF-8 and one frame with its JPEG bytes. An empty JPEG frame
+  means that the image could not be encoded.
+
+Compared to JSON with base64-encoded images, there is no text (de)serialization of the state and the images
+are a quarter smaller without base64. JPEG (de)compression releases the GIL, so `ObservationEncoder` and
+`ObservationDecoder` can spread the cameras over a thread pool.
+"""
+
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+PROTOCOL_VERSION = 1
+# version, number of cameras, number of state values, sequence number, host timestamp
+HEADER = struct.Struct("<BBHId")
+
+
+@dataclass
+class DecodedObservation:
+    state: np.ndarray
+    frames: dict[str, np.ndarray]
+    seq: int
+    timestamp: float
+
+
+class _CodecPool:
+    def __init__(self, num_workers: int = 0):
+        self._executor = ThreadPoolExecutor(num_workers, "lekiwi_codec") if num_workers > 0 else None
+
+    def map(self, fn, items: list) -> list:
+        if self._executor is None or len(items) < 2:
+            return [fn(item) for item in items]
+        return list(self._executor.map(fn, items))
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+class ObservationEncoder(_CodecPool):
+    """Encodes observations to multipart messages, compressing the camera images in `num_workers` threads.
+
+    With `num_workers=0`, the images are compressed one after another in the calling thread.
+    """
+
+    def __init__(self, jpeg_quality: int = 90, num_workers: int = 0):
+        super().__init__(num_workers)
+        self.jpeg_params = [int(cv2.IMWRITE_JPEG_QUALITY), jpeg_quality]
+        self._seq = 0
+
+    def _encode_image(self, image: np.ndarray) -> bytes:
+        ret, buffer = cv2.imencode(".jpg", image, self.jpeg_params)
+        return buffer.tobytes() if ret else b""
+
+    def encode(self, state: list[float], images: dict[str, np.ndarray]) -> list[bytes]:
+        header = HEADER.pack(PROTOCOL_VERSION, len(images), len(state), self._seq, time.time())
+        self._seq = (self._seq + 1) % 2**32
+        frames = [header + np.asarray(state, dtype="<f4").tobytes()]
+        jpegs = self.map(self._encode_image, list(images.values()))
+        for name, jpeg in zip(images, jpegs, strict=True):
+            frames += [name.encode("utf-8"), jpeg]
+        return frames
+
+
+class ObservationDecoder(_CodecPool):
+    """Decodes the multipart messages of `ObservationEncoder`, decompressing the images in `num_workers` threads."""
+
+    @staticmethod
+    def _decode_image(jpeg: bytes) -> np.ndarray | None:
+        if len(jpeg) == 0:
+            return None
+        return cv2.imdecode(np.frombuffer(jpeg, dtype=np.uint8), cv2.IMREAD_COLOR)
+
+    def decode(self, frames: list[bytes]) -> DecodedObservation:
+        """Raises `ValueError` when the message is not a valid observation."""
+        if len(frames) == 0 or len(frames[0]) < HEADER.size:
+            raise ValueError("Missing observation header.")
+        version, num_cameras, num_state, seq, timestamp = HEADER.unpack_from(frames[0])
+        if version != PROTOCOL_VERSION:
+            raise ValueError(f"Unsupported protocol version {version} (expected {PROTOCOL_VERSION}).")
+        if len(frames[0]) != HEADER.size + 4 * num_state or len(frames) != 1 + 2 * num_cameras:
+            raise ValueError("Observation size does not match its header.")
+
+        state = np.frombuffer(frames[0], dtype="<f4", count=num_state, offset=HEADER.size).astype(np.float32)
+        names = [bytes(name).decode("utf-8") for name in frames[1::2]]
+        images = self.map(self._decode_image, [bytes(jpeg) for jpeg in frames[2::2]])
+        decoded = {name: image for name, image in zip(names, images, strict=True) if image is not None}
+        return DecodedObservation(state=state, frames=decoded, seq=seq, timestamp=timestamp)
@@ -37,5 +37,9 @@ class SO101FollowerConfig(RobotConfig):
     # cameras
     cameras: dict[str, CameraConfig] = field(default_factory=dict)
 
+    # Maximum time between the capture of the frames of an observation, in milliseconds. When set, the
+    # observation waits (up to the camera read timeout) for a better aligned set of frames.
+    camera_max_skew_ms: float | None = None
+
     # Set to `True` for backward compatibility with previous policies/dataset
     use_degrees: bool = False
@@ -49,7 +49,6 @@ You can learn about the CLI options for this script in the `EvalPipelineConfig`
 import concurrent.futures as cf
 import json
 import logging
-import threading
 import time
 from collections import defaultdict
 from collections.abc import Callable
@@ -82,13 +81,13 @@ from lerobot.policies.factory import make_policy, make_pre_post_processors
 from lerobot.policies.pretrained import PreTrainedPolicy
 from lerobot.processor import PolicyAction, PolicyProcessorPipeline
 from lerobot.utils.constants import ACTION, DONE, OBS_STR, REWARD
-from lerobot.utils.io_utils import write_video
 from lerobot.utils.random_utils import set_seed
 from lerobot.utils.utils import (
     get_safe_torch_device,
     init_logging,
     inside_slurm,
 )
+from lerobot.utils.video_recorder import StreamingVideoRecorder
 
 
 def rollout(
@@ -98,7 +97,7 @@ def rollout(
     postprocessor: PolicyProcessorPipeline[PolicyAction, PolicyAction],
     seeds: list[int] | None = None,
     return_observations: bool = False,
-    render_callback: Callable[[gym.vector.VectorEnv], None] | None = None,
+    render_callback: Callable[[gym.vector.VectorEnv, np.ndarray], None] | None = None,
 ) -> dict:
     """Run a batched policy rollout once through a batch of environments.
 
@@ -127,7 +126,8 @@ def rollout(
         return_observations: Whether to include all observations in the returned rollout data. Observations
             are returned optionally because they typically take more memory to cache. Defaults to False.
         render_callback: Optional rendering callback to be used after the environments are reset, and after
-            every step.
+            every step. It is passed the environments and the (cumulative) done conditions after the step, so
+            that the frames after the end of an episode can be discarded.
     Returns:
         The dictionary described above.
     """
@@ -137,7 +137,7 @@ def rollout(
     policy.reset()
     observation, info = env.reset(seed=seeds)
     if render_callback is not None:
-        render_callback(env)
+        render_callback(env, np.zeros(env.num_envs, dtype=bool))
 
     all_observations = []
     all_actions = []
@@ -176,8 +176,6 @@ def rollout(
 
         # Apply the next action.
         observation, reward, terminated, truncated, info = env.step(action_numpy)
-        if render_callback is not None:
-            render_callback(env)
 
         # VectorEnv stores is_success in `info["final_info"][env_index]["is_success"]`. "final_info" isn't
         # available if none of the envs finished.
@@ -199,6 +197,8 @@ def rollout(
         done = terminated | truncated | done
         if step + 1 == max_steps:
             done = np.ones_like(done, dtype=bool)
+        if render_callback is not None:
+            render_callback(env, done)
 
         all_actions.append(torch.from_numpy(action_numpy))
         all_rewards.append(torch.from_numpy(reward))
@@ -236,6 +236,287 @@ def rollout(
     return ret
 
 
+def supports_scheduled_rollout(policy: PreTrainedPolicy) -> bool:
+    """Whether `scheduled_rollout` can start new episodes in the batch of `policy` while others are running.
+
+    This is the case when, between two action chunks, the policy has no per-episode state that `policy.reset`
+    would clear: no history of observations and no temporal ensembling of the actions.
+    """
+    return (
+        getattr(policy.config, "n_obs_steps", 1) == 1
+        and getattr(policy.config, "temporal_ensemble_coeff", None) is None
+    )
+
+
+class _EpisodeSlots:
+    """Episodes run by the sub-environments of one vector env in `scheduled_rollouts`, and their statistics."""
+
+    def __init__(
+        self,
+        env: gym.vector.VectorEnv,
+        n_episodes: int,
+        seeds: list[int] | None,
+        max_episodes_rendered: int,
+        videos_dir: Path | None,
+        recorder: StreamingVideoRecorder | None,
+    ):
+        if seeds is not None and len(seeds) != n_episodes:
+            raise ValueError(f"Expected {n_episodes} seeds, got {len(seeds)}.")
+        self.env = env
+        self.num_envs = env.num_envs
+        self.n_episodes = n_episodes
+        self.seeds = seeds
+        self.max_episodes_rendered = max_episodes_rendered if recorder is not None else 0
+        self.videos_dir = videos_dir
+        self.recorder = recorder
+        self.max_steps = env.call("_max_episode_steps")[0]
+
+        # Episode run by each sub-environment (-1 when idle) and its statistics so far
+        self.episode = np.full(self.num_envs, -1)
+        self.steps = np.zeros(self.num_envs, dtype=int)
+        self.sum_reward = np.zeros(self.num_envs)
+        self.max_reward = np.full(self.num_envs, -np.inf)
+        self.success = np.zeros(self.num_envs, dtype=bool)
+        # Video of each sub-environment whose episode is rendered
+        self.videos: dict[int, int] = {}
+
+        self.results = {
+            "sum_reward": [None] * n_episodes,
+            "max_reward": [None] * n_episodes,
+            "success": [None] * n_episodes,
+            "video_paths": [
+                str(videos_dir / f"eval_episode_{i}.mp4")
+                for i in range(min(self.max_episodes_rendered, n_episodes))
+            ],
+        }
+        self.next_episode = 0
+        self.n_finished = 0
+        self.observation = None
+
+    @property
+    def done(self) -> bool:
+        return self.n_finished == self.n_episodes
+
+    def can_start_episodes(self) -> bool:
+        return self.next_episode < self.n_episodes and bool((self.episode < 0).any())
+
+    def render(self, slots: np.ndarray):
+        slots = [i for i in slots if i in self.videos]
+        if not slots:
+            return
+        if isinstance(self.env, gym.vector.SyncVectorEnv):
+            frames = {i: self.env.envs[i].render() for i in slots}
+        else:
+            # Here we must render all frames and discard any we don't need.
+            frames = dict(enumerate(self.env.call("render")))
+        for i in slots:
+            self.recorder.add_frame(self.videos[i], frames[i])
+
+    def start_episodes(self):
+        """Start the next episodes in the idle sub-environments (all of them at the first call)."""
+        slots = np.flatnonzero(self.episode < 0)[: self.n_episodes - self.next_episode]
+        episodes = np.arange(self.next_episode, self.next_episode + len(slots))
+        self.next_episode += len(slots)
+        self.episode[slots] = episodes
+        self.steps[slots] = 0
+        self.sum_reward[slots] = 0.0
+        self.max_reward[slots] = -np.inf
+        self.success[slots] = False
+        for i, episode in zip(slots, episodes, strict=True):
+            if episode < self.max_episodes_rendered:
+                self.videos[i] = self.recorder.open(
+                    self.results["video_paths"][episode], self.env.unwrapped.metadata["render_fps"]
+                )
+
+        reset_seeds: list[int | None] = [None] * self.num_envs
+        if self.seeds is not None:
+            for i, episode in zip(slots, episodes, strict=True):
+                reset_seeds[i] = self.seeds[episode]
+        if self.observation is None:
+            self.observation, _ = self.env.reset(seed=reset_seeds)
+        else:
+            reset_mask = np.zeros(self.num_envs, dtype=bool)
+            reset_mask[slots] = True
+            self.observation, _ = self.env.reset(seed=reset_seeds, options={"reset_mask": reset_mask})
+        self.render(slots)
+
+    def step(self, action: np.ndarray) -> list[bool]:
+        """Step the environments, and return the successes of the episodes done at this step."""
+        self.observation, reward, terminated, truncated, info = self.env.step(action)
+        if "final_info" in info:
+            successes = np.asarray(info["final_info"]["is_success"], dtype=bool)
+        else:
+            successes = np.zeros(self.num_envs, dtype=bool)
+
+        running = self.episode >= 0
+        self.steps[running] += 1
+        self.sum_reward[running] += reward[running]
+        self.max_reward[running] = np.maximum(self.max_reward[running], reward[running])
+        self.success[running] |= successes[running]
+        done = running & (terminated | truncated | (self.steps >= self.max_steps))
+        self.render(np.flatnonzero(running & ~done))
+
+        for i in np.flatnonzero(done):
+            episode = self.episode[i]
+            self.results["sum_reward"][episode] = float(self.sum_reward[i])
+            self.results["max_reward"][episode] = float(self.max_reward[i])
+            self.results["success"][episode] = bool(self.success[i])
+            if i in self.videos:
+                self.recorder.close_video(self.videos.pop(i))
+            self.episode[i] = -1
+            self.n_finished += 1
+        return self.success[done].tolist()
+
+
+def _concatenate_observations(observations: list[dict[str, Any]]) -> dict[str, Any]:
+    """Concatenate the batches of observations of several vector envs into a single batch."""
+    if len(observations) == 1:
+        return observations[0]
+    return {
+        key: torch.cat([obs[key] for obs in observations])
+        if isinstance(observations[0][key], Tensor)
+        else [x for obs in observations for x in obs[key]]
+        for key in observations[0]
+    }
+
+
+def scheduled_rollouts(
+    envs: list[gym.vector.VectorEnv],
+    policy: PreTrainedPolicy,
+    preprocessor: PolicyProcessorPipeline[dict[str, Any], dict[str, Any]],
+    postprocessor: PolicyProcessorPipeline[PolicyAction, PolicyAction],
+    n_episodes: int,
+    seeds: list[int] | None = None,
+    max_episodes_rendered: int = 0,
+    videos_dirs: list[Path] | None = None,
+    recorder: StreamingVideoRecorder | None = None,
+) -> list[dict]:
+    """Run `n_episodes` episodes in each of `envs`, starting the next episode in a sub-environment as soon as
+    its episode is done.
+
+    Unlike `rollout`, the batch of the policy stays full until the last episodes, instead of waiting for the
+    longest episode of each batch. The observations of all the `envs` (e.g. the tasks of a suite) are gathered in
+    a single batch, so that the policy runs one forward pass for all of them, and the rows of its action queues
+    are the state of each sub-environment.
+
+    Sub-environments are only refilled between two action chunks (every `policy.config.n_action_steps` steps),
+    and the policy is then reset, so that the new episodes do not start with the actions planned for the previous
+    ones. This requires `supports_scheduled_rollout(policy)`. The envs whose episodes are all done are removed from
+    the batch at the same time.
+
+    Each returned dictionary (one per env) contains lists indexed by episode:
+        "sum_reward": The sum of the rewards of the episode.
+        "max_reward": The maximum reward of the episode.
+        "success": Whether the episode was successful.
+        "video_paths": The videos of the first `max_episodes_rendered` episodes (indexed by episode too).
+
+    Args:
+        envs: The batches of environments.
+        policy: The policy. Must be a PyTorch nn module.
+        n_episodes: The number of episodes to run in each env.
+        seeds: If provided, the seed of each episode, used when its sub-environment is reset.
+        max_episodes_rendered: Number of episodes (the first ones) of each env to render into videos.
+        videos_dirs: Where to save the videos of each env.
+        recorder: Encodes the rendered frames as they are produced. Required to render episodes.
+    Returns:
+        The dictionaries described above.
+    """
+    assert isinstance(policy, nn.Module), "Policy must be a PyTorch nn module."
+
+    if max_episodes_rendered > 0 and (videos_dirs is None or recorder is None):
+        raise ValueError("If max_episodes_rendered > 0, videos_dirs and recorder must be provided.")
+    all_slots = [
+        _EpisodeSlots(
+            env,
+            n_episodes,
+            seeds,
+            max_episodes_rendered,
+            videos_dirs[i] if videos_dirs is not None else None,
+            recorder,
+        )
+        for i, env in enumerate(envs)
+    ]
+    n_action_steps = getattr(policy.config, "n_action_steps", 1)
+    for slots in all_slots:
+        check_env_attributes_and_types(slots.env)
+
+    total_episodes = n_episodes * len(envs)
+    progbar = trange(
+        total_episodes,
+        desc=f"Running {total_episodes} episodes in {sum(env.num_envs for env in envs)} environments",
+        disable=inside_slurm(),  # we dont want progress bar when we use slurm, since it clutters the logs
+        leave=False,
+    )
+    n_finished = 0
+    n_successes = 0
+    active = []
+    steps_since_reset = 0
+    while n_finished < total_episodes:
+        # Refill the idle sub-environments once the policy has executed its current action chunk
+        if steps_since_reset % n_action_steps == 0:
+            refill = [slots for slots in all_slots if slots.can_start_episodes()]
+            still_active = [slots for slots in all_slots if not slots.done]
+            if refill or len(still_active) != len(active):
+                for slots in refill:
+                    slots.start_episodes()
+                active = still_active
+                # Plan the first actions of the new episodes from their first observation
+                policy.reset()
+                steps_since_reset = 0
+
+        # Numpy array to tensor and changing dictionary keys to LeRobot policy format.
+        observation = _concatenate_observations(
+            [add_envs_task(slots.env, preprocess_observation(slots.observation)) for slots in active]
+        )
+        observation = preprocessor(observation)
+        with torch.inference_mode():
+            action = policy.select_action(observation)
+        action = postprocessor(action)
+        action_numpy: np.ndarray = action.to("cpu").numpy()
+        assert action_numpy.ndim == 2, "Action dimensions should be (batch, action_dim)"
+
+        sections = np.cumsum([slots.num_envs for slots in active])[:-1]
+        for slots, env_action in zip(active, np.split(action_numpy, sections), strict=True):
+            successes = slots.step(env_action)
+            n_finished += len(successes)
+            n_successes += sum(successes)
+            progbar.update(len(successes))
+            if successes:
+                progbar.set_postfix({"running_success_rate": f"{n_successes / n_finished * 100:.1f}%"})
+        steps_since_reset += 1
+
+    progbar.close()
+    if hasattr(policy, "use_original_modules"):
+        policy.use_original_modules()
+
+    return [slots.results for slots in all_slots]
+
+
+def scheduled_rollout(
+    env: gym.vector.VectorEnv,
+    policy: PreTrainedPolicy,
+    preprocessor: PolicyProcessorPipeline[dict[str, Any], dict[str, Any]],
+    postprocessor: PolicyProcessorPipeline[PolicyAction, PolicyAction],
+    n_episodes: int,
+    seeds: list[int] | None = None,
+    max_episodes_rendered: int = 0,
+    videos_dir: Path | None = None,
+    recorder: StreamingVideoRecorder | None = None,
+) -> dict:
+    """`scheduled_rollouts` for a single batch of environments."""
+    return scheduled_rollouts(
+        [env],
+        policy,
+        preprocessor,
+        postprocessor,
+        n_episodes,
+        seeds,
+        max_episodes_rendered,
+        videos_dirs=[videos_dir] if videos_dir is not None else None,
+        recorder=recorder,
+    )[0]
+
+
 def eval_policy(
     env: gym.vector.VectorEnv,
     policy: PreTrainedPolicy,
@@ -246,6 +527,7 @@ def eval_policy(
     videos_dir: Path | None = None,
     return_episode_data: bool = False,
     start_seed: int | None = None,
+    refill_envs: bool = True,
 ) -> dict:
     """
     Args:
@@ -258,6 +540,9 @@ def eval_policy(
             the "episodes" key of the returned dictionary.
         start_seed: The first seed to use for the first individual rollout. For all subsequent rollouts the
             seed is incremented by 1. If not provided, the environments are not manually seeded.
+        refill_envs: Whether to start the next episode in an environment of the batch as soon as it is done
+            (see `scheduled_rollout`), rather than running the episodes batch by batch. Only used when
+            `supports_scheduled_rollout(policy)` and without `return_episode_data`.
     Returns:
         Dictionary with metrics and data regarding the rollouts.
     """
@@ -281,20 +566,24 @@ def eval_policy(
     max_rewards = []
     all_successes = []
     all_seeds = []
-    threads = []  # for video saving threads
     n_episodes_rendered = 0  # for saving the correct number of videos
+    # Videos of the first environments of the current batch, encoded while the episodes run
+    recorder = StreamingVideoRecorder() if max_episodes_rendered > 0 else None
+    batch_videos: list[int] = []
 
     # Callback for visualization.
-    def render_frame(env: gym.vector.VectorEnv):
-        # noqa: B023
-        if n_episodes_rendered >= max_episodes_rendered:
+    def render_frame(env: gym.vector.VectorEnv, done: np.ndarray):
+        if not batch_videos:
             return
-        n_to_render_now = min(max_episodes_rendered - n_episodes_rendered, env.num_envs)
         if isinstance(env, gym.vector.SyncVectorEnv):
-            ep_frames.append(np.stack([env.envs[i].render() for i in range(n_to_render_now)]))  # noqa: B023
-        elif isinstance(env, gym.vector.AsyncVectorEnv):
+            frames = [env.envs[i].render() for i in range(len(batch_videos))]
+        else:
             # Here we must render all frames and discard any we don't need.
-            ep_frames.append(np.stack(env.call("render")[:n_to_render_now]))
+            frames = env.call("render")[: len(batch_videos)]
+        # The frames after the end of an episode belong to the next one (the environments are auto-reset)
+        for video, frame, episode_done in zip(batch_videos, frames, done, strict=False):
+            if not episode_done:
+                recorder.add_frame(video, frame)
 
     if max_episodes_rendered > 0:
         video_paths: list[str] = []
@@ -302,13 +591,37 @@ def eval_policy(
     if return_episode_data:
         episode_data: dict | None = None
 
+    if refill_envs and not return_episode_data and supports_scheduled_rollout(policy):
+        seeds = None if start_seed is None else list(range(start_seed, start_seed + n_episodes))
+        rollout_data = scheduled_rollout(
+            env=env,
+            policy=policy,
+            preprocessor=preprocessor,
+            postprocessor=postprocessor,
+            n_episodes=n_episodes,
+            seeds=seeds,
+            max_episodes_rendered=max_episodes_rendered,
+            videos_dir=videos_dir,
+            recorder=recorder,
+        )
+        sum_rewards = rollout_data["sum_reward"]
+        max_rewards = rollout_data["max_reward"]
+        all_successes = rollout_data["success"]
+        all_seeds = seeds if seeds is not None else [None] * n_episodes
+        # No batches left to run: all the episodes are done
+        n_batches = 0
+        if max_episodes_rendered > 0:
+            video_paths += rollout_data["video_paths"]
+
     # we dont want progress bar when we use slurm, since it clutters the logs
     progbar = trange(n_batches, desc="Stepping through eval batches", disable=inside_slurm())
     for batch_ix in progbar:
-        # Cache frames for rendering videos. Each item will be (b, h, w, c), and the list indexes the rollout
-        # step.
-        if max_episodes_rendered > 0:
-            ep_frames: list[np.ndarray] = []
+        # Start the videos of the episodes to render in this batch.
+        n_to_render_now = min(max_episodes_rendered - n_episodes_rendered, env.num_envs)
+        for i in range(max(n_to_render_now, 0)):
+            video_path = videos_dir / f"eval_episode_{n_episodes_rendered + i}.mp4"
+            video_paths.append(str(video_path))
+            batch_videos.append(recorder.open(video_path, env.unwrapped.metadata["render_fps"]))
 
         if start_seed is None:
             seeds = None
@@ -365,37 +678,24 @@ def eval_policy(
                 # Concatenate the episode data.
                 episode_data = {k: torch.cat([episode_data[k], this_episode_data[k]]) for k in episode_data}
 
-        # Maybe render video for visualization.
-        if max_episodes_rendered > 0 and len(ep_frames) > 0:
-            batch_stacked_frames = np.stack(ep_frames, axis=1)  # (b, t, *)
-            for stacked_frames, done_index in zip(
-                batch_stacked_frames, done_indices.flatten().tolist(), strict=False
-            ):
-                if n_episodes_rendered >= max_episodes_rendered:
-                    break
-
-                videos_dir.mkdir(parents=True, exist_ok=True)
-                video_path = videos_dir / f"eval_episode_{n_episodes_rendered}.mp4"
-                video_paths.append(str(video_path))
-                thread = threading.Thread(
-                    target=write_video,
-                    args=(
-                        str(video_path),
-                        stacked_frames[: done_index + 1],  # + 1 to capture the last observation
-                        env.unwrapped.metadata["render_fps"],
-                    ),
-                )
-                thread.start()
-                threads.append(thread)
-                n_episodes_rendered += 1
+        # Finish the videos of this batch (the encoding goes on in the background).
+        for video in batch_videos:
+            recorder.close_video(video)
+        n_episodes_rendered += len(batch_videos)
+        batch_videos.clear()
 
         progbar.set_postfix(
             {"running_success_rate": f"{np.mean(all_successes[:n_episodes]).item() * 100:.1f}%"}
         )
 
-    # Wait till all video rendering threads are done.
-    for thread in threads:
-        thread.join()
+    # Wait till all the videos are encoded.
+    if recorder is not None:
+        recorder.close()
+        video_stats = recorder.stats()
+        logging.info(
+            f"Encoded {video_stats.videos} videos ({video_stats.frames} frames) in "
+            f"{video_stats.encode_ms_per_frame:.2f}ms per frame, rollouts blocked for {video_stats.blocked_s:.2f}s"
+        )
 
     # Compile eval info.
     info = {
@@ -431,6 +731,7 @@ def eval_policy(
 
     if max_episodes_rendered > 0:
         info["video_paths"] = video_paths
+        info["video_stats"] = asdict(video_stats)
 
     return info
 
@@ -516,6 +817,7 @@ def eval_main(cfg: EvalPipelineConfig):
         policy_cfg=cfg.policy,
         pretrained_path=cfg.policy.pretrained_path,
         preprocessor_overrides=preprocessor_overrides,
+        compile_pipelines=cfg.policy.compile_pipelines,
     )
     with torch.no_grad(), torch.autocast(device_type=device.type) if cfg.policy.use_amp else nullcontext():
         info = eval_policy_all(
@@ -528,6 +830,8 @@ def eval_main(cfg: EvalPipelineConfig):
             videos_dir=Path(cfg.output_dir) / "videos",
             start_seed=cfg.seed,
             max_parallel_tasks=cfg.env.max_parallel_tasks,
+            refill_envs=cfg.eval.refill_envs,
+            batch_tasks=cfg.eval.batch_tasks,
         )
         print("Overall Aggregated Metrics:")
         print(info["overall"])
@@ -568,6 +872,7 @@ def eval_one(
     videos_dir: Path | None,
     return_episode_data: bool,
     start_seed: int | None,
+    refill_envs: bool = True,
 ) -> TaskMetrics:
     """Evaluates one task_id of one suite using the provided vec env."""
 
@@ -583,6 +888,7 @@ def eval_one(
         videos_dir=task_videos_dir,
         return_episode_data=return_episode_data,
         start_seed=start_seed,
+        refill_envs=refill_envs,
     )
 
     per_episode = task_result["per_episode"]
@@ -607,6 +913,7 @@ def run_one(
     videos_dir: Path | None,
     return_episode_data: bool,
     start_seed: int | None,
+    refill_envs: bool = True,
 ):
     """
     Run eval_one for a single (task_group, task_id, env).
@@ -629,6 +936,7 @@ def run_one(
         videos_dir=task_videos_dir,
         return_episode_data=return_episode_data,
         start_seed=start_seed,
+        refill_envs=refill_envs,
     )
     # ensure we always provide video_paths key to simplify accumulation
     if max_episodes_rendered > 0:
@@ -648,6 +956,8 @@ def eval_policy_all(
     return_episode_data: bool = False,
     start_seed: int | None = None,
     max_parallel_tasks: int = 1,
+    refill_envs: bool = True,
+    batch_tasks: bool = False,
 ) -> dict:
     """
     Evaluate a nested `envs` dict: {task_group: {task_id: vec_env}}.
@@ -655,6 +965,8 @@ def eval_policy_all(
     accumulates per-group and overall statistics, and returns the same aggregate metrics
     schema as the single-env evaluator (avg_sum_reward / avg_max_reward / pc_success / timings)
     plus per-task infos.
+    With `batch_tasks`, the observations of all the tasks are gathered in a single batch for the policy
+    instead (see `scheduled_rollouts`), when the policy supports it and without `return_episode_data`.
     """
     start_t = time.time()
 
@@ -701,9 +1013,37 @@ def eval_policy_all(
         videos_dir=videos_dir,
         return_episode_data=return_episode_data,
         start_seed=start_seed,
+        refill_envs=refill_envs,
     )
 
-    if max_parallel_tasks <= 1:
+    if batch_tasks and not return_episode_data and supports_scheduled_rollout(policy):
+        # batched path: a single inference loop on the main thread steps the envs of all the tasks
+        seeds = None if start_seed is None else list(range(start_seed, start_seed + n_episodes))
+        render = max_episodes_rendered > 0 and videos_dir is not None
+        recorder = StreamingVideoRecorder() if render else None
+        results = scheduled_rollouts(
+            [env for _, _, env in tasks],
+            policy,
+            preprocessor,
+            postprocessor,
+            n_episodes,
+            seeds=seeds,
+            max_episodes_rendered=max_episodes_rendered if render else 0,
+            videos_dirs=[videos_dir / f"{tg}_{tid}" for tg, tid, _ in tasks] if render else None,
+            recorder=recorder,
+        )
+        if recorder is not None:
+            recorder.close()
+        for (task_group, task_id, _), result in zip(tasks, results, strict=True):
+            metrics = TaskMetrics(
+                sum_rewards=result["sum_reward"],
+                max_rewards=result["max_reward"],
+                successes=result["success"],
+                video_paths=result["video_paths"],
+            )
+            _accumulate_to(task_group, metrics)
+            per_task_infos.append({"task_group": task_group, "task_id": task_id, "metrics": metrics})
+    elif max_parallel_tasks <= 1:
         # sequential path (single accumulator path on the main thread)
         # NOTE: keeping a single-threaded accumulator avoids concurrent list appends or locks
         for task_group, task_id, env in tasks:
@@ -59,6 +59,8 @@ lerobot-record \
 """
 
 import logging
+import queue
+import threading
 import time
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
@@ -70,6 +72,10 @@ from lerobot.cameras import (  # noqa: F401
 )
 from lerobot.cameras.opencv.configuration_opencv import OpenCVCameraConfig  # noqa: F401
 from lerobot.cameras.realsense.configuration_realsense import RealSenseCameraConfig  # noqa: F401
+from lerobot.cameras.synthetic.configuration_synthetic import (  # noqa: F401
+    ReplayCameraConfig,
+    SyntheticCameraConfig,
+)
 from lerobot.configs import parser
 from lerobot.configs.policies import PreTrainedConfig
 from lerobot.datasets.image_writer import safe_stop_image_writer
@@ -119,7 +125,8 @@ from lerobot.utils.control_utils import (
     sanity_check_dataset_robot_compatibility,
 )
 from lerobot.utils.import_utils import register_third_party_devices
-from lerobot.utils.robot_utils import busy_wait
+from lerobot.utils.pipeline_utils import STOP, PipelineStats, StageTimer, StageWorker, put_latest
+from lerobot.utils.robot_utils import RateScheduler
 from lerobot.utils.utils import (
     get_safe_torch_device,
     init_logging,
@@ -186,6 +193,9 @@ class RecordConfig:
     play_sounds: bool = True
     # Resume recording on an existing dataset.
     resume: bool = False
+    # Run the observation, inference and actuation in their own threads, with dataset writes and display
+    # moved off the control path. Per-stage timing is logged at the end of each episode.
+    pipelined: bool = False
 
     def __post_init__(self):
         # HACK: We parse again the cli args here to get the pretrained path if there was one.
@@ -234,6 +244,82 @@ class RecordConfig:
 """
 
 
+def _split_teleops(
+    teleop: Teleoperator | list[Teleoperator] | None, robot: Robot
+) -> tuple[Teleoperator | None, KeyboardTeleop | None]:
+    """Returns the arm and keyboard teleoperators of a multi-teleop setup, or `(None, None)`."""
+    teleop_arm = teleop_keyboard = None
+    if isinstance(teleop, list):
+        teleop_keyboard = next((t for t in teleop if isinstance(t, KeyboardTeleop)), None)
+        teleop_arm = next(
+            (
+                t
+                for t in teleop
+                if isinstance(
+                    t,
+                    (so100_leader.SO100Leader | so101_leader.SO101Leader | koch_leader.KochLeader),
+                )
+            ),
+            None,
+        )
+
+        if not (teleop_arm and teleop_keyboard and len(teleop) == 2 and robot.name == "lekiwi_client"):
+            raise ValueError(
+                "For multi-teleop, the list must contain exactly one KeyboardTeleop and one arm teleoperator. Currently only supported for LeKiwi robot."
+            )
+    return teleop_arm, teleop_keyboard
+
+
+def _compute_action(
+    obs: RobotObservation,
+    observation_frame: dict[str, Any] | None,
+    robot: Robot,
+    teleop_action_processor: RobotProcessorPipeline[tuple[RobotAction, RobotObservation], RobotAction],
+    dataset: LeRobotDataset | None,
+    teleop: Teleoperator | list[Teleoperator] | None,
+    teleop_arm: Teleoperator | None,
+    teleop_keyboard: KeyboardTeleop | None,
+    policy: PreTrainedPolicy | None,
+    preprocessor: PolicyProcessorPipeline[dict[str, Any], dict[str, Any]] | None,
+    postprocessor: PolicyProcessorPipeline[PolicyAction, PolicyAction] | None,
+    single_task: str | None,
+) -> RobotAction | None:
+    """Gets the next action from the policy or the teleoperator, or `None` if there is neither."""
+    if policy is not None and preprocessor is not None and postprocessor is not None:
+        action_values = predict_action(
+            observation=observation_frame,
+            policy=policy,
+            device=get_safe_torch_device(policy.config.device),
+            preprocessor=preprocessor,
+            postprocessor=postprocessor,
+            use_amp=policy.config.use_amp,
+            task=single_task,
+            robot_type=robot.robot_type,
+        )
+        return make_robot_action(action_values, dataset.features)
+
+    elif policy is None and isinstance(teleop, Teleoperator):
+        act = teleop.get_action()
+
+        # Applies a pipeline to the raw teleop action, default is IdentityProcessor
+        return teleop_action_processor((act, obs))
+
+    elif policy is None and isinstance(teleop, list):
+        arm_action = teleop_arm.get_action()
+        arm_action = {f"arm_{k}": v for k, v in arm_action.items()}
+        keyboard_action = teleop_keyboard.get_action()
+        base_action = robot._from_keyboard_to_base_action(keyboard_action)
+        act = {**arm_action, **base_action} if len(base_action) > 0 else arm_action
+        return teleop_action_processor((act, obs))
+
+    logging.info(
+        "No policy or teleoperator provided, skipping action generation."
+        "This is likely to happen when resetting the environment without a teleop device."
+        "The robot won't be at its rest position at the start of the next episode."
+    )
+    return None
+
+
 @safe_stop_image_writer
 def record_loop(
     robot: Robot,
@@ -256,29 +342,12 @@ def record_loop(
     control_time_s: int | None = None,
     single_task: str | None = None,
     display_data: bool = False,
-):
+    pipelined: bool = False,
+) -> PipelineStats | None:
     if dataset is not None and dataset.fps != fps:
         raise ValueError(f"The dataset fps should be equal to requested fps ({dataset.fps} != {fps}).")
 
-    teleop_arm = teleop_keyboard = None
-    if isinstance(teleop, list):
-        teleop_keyboard = next((t for t in teleop if isinstance(t, KeyboardTeleop)), None)
-        teleop_arm = next(
-            (
-                t
-                for t in teleop
-                if isinstance(
-                    t,
-                    (so100_leader.SO100Leader | so101_leader.SO101Leader | koch_leader.KochLeader),
-                )
-            ),
-            None,
-        )
-
-        if not (teleop_arm and teleop_keyboard and len(teleop) == 2 and robot.name == "lekiwi_client"):
-            raise ValueError(
-                "For multi-teleop, the list must contain exactly one KeyboardTeleop and one arm teleoperator. Currently only supported for LeKiwi robot."
-            )
+    teleop_arm, teleop_keyboard = _split_teleops(teleop, robot)
 
     # Reset policy and processor if they are provided
     if policy is not None and preprocessor is not None and postprocessor is not None:
@@ -286,11 +355,30 @@ def record_loop(
         preprocessor.reset()
         postprocessor.reset()
 
+    if pipelined:
+        return _pipelined_record_loop(
+            robot=robot,
+            events=events,
+            fps=fps,
+            teleop_action_processor=teleop_action_processor,
+            robot_action_processor=robot_action_processor,
+            robot_observation_processor=robot_observation_processor,
+            dataset=dataset,
+            teleop=teleop,
+            teleop_arm=teleop_arm,
+            teleop_keyboard=teleop_keyboard,
+            policy=policy,
+            preprocessor=preprocessor,
+            postprocessor=postprocessor,
+            control_time_s=control_time_s,
+            single_task=single_task,
+            display_data=display_data,
+        )
+
     timestamp = 0
+    scheduler = RateScheduler(fps)
     start_episode_t = time.perf_counter()
     while timestamp < control_time_s:
-        start_loop_t = time.perf_counter()
-
         if events["exit_early"]:
             events["exit_early"] = False
             break
@@ -301,52 +389,30 @@ def record_loop(
         # Applies a pipeline to the raw robot observation, default is IdentityProcessor
         obs_processed = robot_observation_processor(obs)
 
+        observation_frame = None
         if policy is not None or dataset is not None:
             observation_frame = build_dataset_frame(dataset.features, obs_processed, prefix=OBS_STR)
 
         # Get action from either policy or teleop
-        if policy is not None and preprocessor is not None and postprocessor is not None:
-            action_values = predict_action(
-                observation=observation_frame,
-                policy=policy,
-                device=get_safe_torch_device(policy.config.device),
-                preprocessor=preprocessor,
-                postprocessor=postprocessor,
-                use_amp=policy.config.use_amp,
-                task=single_task,
-                robot_type=robot.robot_type,
-            )
-
-            act_processed_policy: RobotAction = make_robot_action(action_values, dataset.features)
-
-        elif policy is None and isinstance(teleop, Teleoperator):
-            act = teleop.get_action()
-
-            # Applies a pipeline to the raw teleop action, default is IdentityProcessor
-            act_processed_teleop = teleop_action_processor((act, obs))
-
-        elif policy is None and isinstance(teleop, list):
-            arm_action = teleop_arm.get_action()
-            arm_action = {f"arm_{k}": v for k, v in arm_action.items()}
-            keyboard_action = teleop_keyboard.get_action()
-            base_action = robot._from_keyboard_to_base_action(keyboard_action)
-            act = {**arm_action, **base_action} if len(base_action) > 0 else arm_action
-            act_processed_teleop = teleop_action_processor((act, obs))
-        else:
-            logging.info(
-                "No policy or teleoperator provided, skipping action generation."
-                "This is likely to happen when resetting the environment without a teleop device."
-                "The robot won't be at its rest position at the start of the next episode."
-            )
+        action_values = _compute_action(
+            obs,
+            observation_frame,
+            robot,
+            teleop_action_processor,
+            dataset,
+            teleop,
+            teleop_arm,
+            teleop_keyboard,
+            policy,
+            preprocessor,
+            postprocessor,
+            single_task,
+        )
+        if action_values is None:
             continue
 
         # Applies a pipeline to the action, default is IdentityProcessor
-        if policy is not None and act_processed_policy is not None:
-            action_values = act_processed_policy
-            robot_action_to_send = robot_action_processor((act_processed_policy, obs))
-        else:
-            action_values = act_processed_teleop
-            robot_action_to_send = robot_action_processor((act_processed_teleop, obs))
+        robot_action_to_send = robot_action_processor((action_values, obs))
 
         # Send action to robot
         # Action can eventually be clipped using `max_relative_target`,
@@ -363,11 +429,211 @@ def record_loop(
         if display_data:
             log_rerun_data(observation=obs_processed, action=action_values)
 
-        dt_s = time.perf_counter() - start_loop_t
-        busy_wait(1 / fps - dt_s)
+        scheduler.wait()
 
         timestamp = time.perf_counter() - start_episode_t
 
+    logging.info(f"Record loop timing: {scheduler.stats().format()}")
+
+
+@dataclass
+class _Tick:
+    """Data of one control tick, handed over from stage to stage."""
+
+    start_t: float
+    obs: RobotObservation
+    obs_processed: RobotObservation
+    observation_frame: dict[str, Any] | None
+    action_values: RobotAction | None = None
+    robot_action: RobotAction | None = None
+
+
+def _pipelined_record_loop(
+    robot: Robot,
+    events: dict,
+    fps: int,
+    teleop_action_processor: RobotProcessorPipeline[tuple[RobotAction, RobotObservation], RobotAction],
+    robot_action_processor: RobotProcessorPipeline[tuple[RobotAction, RobotObservation], RobotAction],
+    robot_observation_processor: RobotProcessorPipeline[RobotObservation, RobotObservation],
+    dataset: LeRobotDataset | None,
+    teleop: Teleoperator | list[Teleoperator] | None,
+    teleop_arm: Teleoperator | None,
+    teleop_keyboard: KeyboardTeleop | None,
+    policy: PreTrainedPolicy | None,
+    preprocessor: PolicyProcessorPipeline[dict[str, Any], dict[str, Any]] | None,
+    postprocessor: PolicyProcessorPipeline[PolicyAction, PolicyAction] | None,
+    control_time_s: int | float,
+    single_task: str | None,
+    display_data: bool,
+) -> PipelineStats:
+    """Same data flow as `record_loop`, split into stages running in their own threads.
+
+    - observation: ticks at `fps`, reads and processes the robot observation.
+    - inference: computes the action from the latest observation, with the policy or the teleoperator.
+    - actuation: sends the action to the robot and hands the frame over to the dataset and display stages.
+    - dataset / display: `dataset.add_frame` and `log_rerun_data`, off the critical path.
+
+    The observation of tick k+1 is thus taken while the action of tick k is being computed. Observations and
+    actions go through single-slot queues which keep the latest item: when inference falls behind, the stale
+    observations are dropped rather than delaying the control. Dataset frames are never dropped; the dataset
+    queue holds up to two seconds of frames before stalling the actuation stage. The robot is accessed by one
+    stage at a time, as motor buses do not support concurrent transfers.
+
+    Returns:
+        PipelineStats: Per-stage timing and deadline misses, also logged at the end of the loop.
+    """
+    period_s = 1 / fps
+    abort = threading.Event()
+    stop = threading.Event()
+    robot_lock = threading.Lock()
+
+    timers = {
+        name: StageTimer(name, deadline_s=period_s)
+        for name in ["observation", "inference", "actuation", "dataset", "display"]
+    }
+    end_to_end = StageTimer("end_to_end", deadline_s=period_s)
+    counters = dict.fromkeys(
+        ["dropped_observations", "dropped_actions", "dataset_stalls", "dropped_displays"], 0
+    )
+    inference_queue = queue.Queue(maxsize=1)
+    actuation_queue = queue.Queue(maxsize=1)
+    dataset_queue = queue.Queue(maxsize=max(1, 2 * fps))
+    display_queue = queue.Queue(maxsize=1)
+    observation_errors: list[BaseException] = []
+    scheduler = RateScheduler(fps)
+    ticks = 0
+
+    def observe():
+        nonlocal ticks
+        scheduler.reset()
+        try:
+            while not stop.is_set() and not abort.is_set():
+                start_t = time.perf_counter()
+                with timers["observation"].time():
+                    with robot_lock:
+                        obs = robot.get_observation()
+                    obs_processed = robot_observation_processor(obs)
+                    observation_frame = None
+                    if policy is not None or dataset is not None:
+                        observation_frame = build_dataset_frame(
+                            dataset.features, obs_processed, prefix=OBS_STR
+                        )
+                tick = _Tick(start_t, obs, obs_processed, observation_frame)
+                if put_latest(inference_queue, tick):
+                    counters["dropped_observations"] += 1
+                ticks += 1
+                # Missed ticks are skipped rather than taken in a burst to catch up with the schedule
+                scheduler.wait()
+        except BaseException as e:
+            logging.exception("Error in pipeline stage 'observation'")
+            observation_errors.append(e)
+            abort.set()
+        finally:
+            put_latest(inference_queue, STOP)
+
+    def infer(tick: _Tick):
+        tick.action_values = _compute_action(
+            tick.obs,
+            tick.observation_frame,
+            robot,
+            teleop_action_processor,
+            dataset,
+            teleop,
+            teleop_arm,
+            teleop_keyboard,
+            policy,
+            preprocessor,
+            postprocessor,
+            single_task,
+        )
+        if tick.action_values is None:
+            return
+        tick.robot_action = robot_action_processor((tick.action_values, tick.obs))
+        if put_latest(actuation_queue, tick):
+            counters["dropped_actions"] += 1
+
+    def put_frame(item: Any):
+        try:
+            dataset_queue.put_nowait(item)
+            return
+        except queue.Full:
+            counters["dataset_stalls"] += 1
+        while not abort.is_set():
+            try:
+                dataset_queue.put(item, timeout=0.05)
+                return
+            except queue.Full:
+                continue
+
+    def actuate(tick: _Tick):
+        with robot_lock:
+            robot.send_action(tick.robot_action)
+        end_to_end.record(time.perf_counter() - tick.start_t)
+
+        if dataset is not None:
+            action_frame = build_dataset_frame(dataset.features, tick.action_values, prefix=ACTION)
+            put_frame({**tick.observation_frame, **action_frame, "task": single_task})
+
+        if display_data and put_latest(display_queue, tick):
+            counters["dropped_displays"] += 1
+
+    def finish_actuation():
+        if dataset is not None:
+            put_frame(STOP)
+        if display_data:
+            put_latest(display_queue, STOP)
+
+    def show(tick: _Tick):
+        log_rerun_data(observation=tick.obs_processed, action=tick.action_values)
+
+    workers = [
+        StageWorker(
+            "inference",
+            infer,
+            inference_queue,
+            abort,
+            timers["inference"],
+            on_stop=lambda: put_latest(actuation_queue, STOP),
+        ),
+        StageWorker("actuation", actuate, actuation_queue, abort, timers["actuation"], finish_actuation),
+    ]
+    if dataset is not None:
+        workers.append(StageWorker("dataset", dataset.add_frame, dataset_queue, abort, timers["dataset"]))
+    if display_data:
+        workers.append(StageWorker("display", show, display_queue, abort, timers["display"]))
+
+    observer = threading.Thread(target=observe, name="observation", daemon=True)
+    for worker in workers:
+        worker.start()
+    observer.start()
+
+    start_episode_t = time.perf_counter()
+    while not abort.is_set() and time.perf_counter() - start_episode_t < control_time_s:
+        if events["exit_early"]:
+            events["exit_early"] = False
+            break
+        time.sleep(min(period_s, 0.01))
+
+    # Stop taking observations and let the stages drain their queues, so that every frame is in the dataset
+    stop.set()
+    observer.join()
+    for worker in workers:
+        worker.join()
+
+    errors = observation_errors + [worker.error for worker in workers if worker.error is not None]
+    if errors:
+        raise errors[0]
+
+    stats = PipelineStats(
+        stages={name: timer.stats() for name, timer in timers.items() if timer.stats().count > 0},
+        end_to_end=end_to_end.stats(),
+        ticks=ticks,
+        overruns=scheduler.stats().overruns,
+        counters=counters,
+    )
+    logging.info(f"Pipelined record loop at {fps} fps:\n{stats.format()}\n{scheduler.stats().format()}")
+    return stats
+
 
 @parser.wrap()
 def record(cfg: RecordConfig) -> LeRobotDataset:
@@ -434,9 +700,10 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
             pretrained_path=cfg.policy.pretrained_path,
             dataset_stats=rename_stats(dataset.meta.stats, cfg.dataset.rename_map),
             preprocessor_overrides={
-                "device_processor": {"device": cfg.policy.device},
+                "device_processor": {"device": cfg.policy.device, "pin_memory": True},
                 "rename_observations_processor": {"rename_map": cfg.dataset.rename_map},
             },
+            compile_pipelines=cfg.policy.compile_pipelines,
         )
 
     robot.connect()
@@ -464,6 +731,7 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
                 control_time_s=cfg.dataset.episode_time_s,
                 single_task=cfg.dataset.single_task,
                 display_data=cfg.display_data,
+                pipelined=cfg.pipelined,
             )
 
             # Execute a few seconds without recording to give time to manually reset the environment
@@ -483,6 +751,7 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
                     control_time_s=cfg.dataset.reset_time_s,
                     single_task=cfg.dataset.single_task,
                     display_data=cfg.display_data,
+                    pipelined=cfg.pipelined,
                 )
 
             if events["rerecord_episode"]:
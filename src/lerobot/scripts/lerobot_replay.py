@@ -40,7 +40,6 @@ lerobot-replay \
 """
 
 import logging
-import time
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from pprint import pformat
@@ -62,7 +61,7 @@ from lerobot.robots import (  # noqa: F401
 )
 from lerobot.utils.constants import ACTION
 from lerobot.utils.import_utils import register_third_party_devices
-from lerobot.utils.robot_utils import busy_wait
+from lerobot.utils.robot_utils import OverrunPolicy, RateScheduler
 from lerobot.utils.utils import (
     init_logging,
     log_say,
@@ -106,9 +105,9 @@ def replay(cfg: ReplayConfig):
     robot.connect()
 
     log_say("Replaying episode", cfg.play_sounds, blocking=True)
+    # Late frames are sent back to back rather than dropped, so that the whole trajectory is replayed
+    scheduler = RateScheduler(dataset.fps, overrun_policy=OverrunPolicy.CATCH_UP)
     for idx in range(len(episode_frames)):
-        start_episode_t = time.perf_counter()
-
         action_array = actions[idx][ACTION]
         action = {}
         for i, name in enumerate(dataset.features[ACTION]["names"]):
@@ -120,9 +119,9 @@ def replay(cfg: ReplayConfig):
 
         _ = robot.send_action(processed_action)
 
-        dt_s = time.perf_counter() - start_episode_t
-        busy_wait(1 / dataset.fps - dt_s)
+        scheduler.wait()
 
+    logging.info(f"Replay loop timing: {scheduler.stats().format()}")
     robot.disconnect()
 
 
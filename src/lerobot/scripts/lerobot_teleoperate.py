@@ -60,6 +60,10 @@ import rerun as rr
 
 from lerobot.cameras.opencv.configuration_opencv import OpenCVCameraConfig  # noqa: F401
 from lerobot.cameras.realsense.configuration_realsense import RealSenseCameraConfig  # noqa: F401
+from lerobot.cameras.synthetic.configuration_synthetic import (  # noqa: F401
+    ReplayCameraConfig,
+    SyntheticCameraConfig,
+)
 from lerobot.configs import parser
 from lerobot.processor import (
     RobotAction,
@@ -89,7 +93,7 @@ from lerobot.teleoperators import (  # noqa: F401
     so101_leader,
 )
 from lerobot.utils.import_utils import register_third_party_devices
-from lerobot.utils.robot_utils import busy_wait
+from lerobot.utils.robot_utils import RateScheduler
 from lerobot.utils.utils import init_logging, move_cursor_up
 from lerobot.utils.visualization_utils import init_rerun, log_rerun_data
 
@@ -133,6 +137,7 @@ def teleop_loop(
     """
 
     display_len = max(len(key) for key in robot.action_features)
+    scheduler = RateScheduler(fps)
     start = time.perf_counter()
 
     while True:
@@ -172,12 +177,12 @@ def teleop_loop(
                 print(f"{motor:<{display_len}} | {value:>7.2f}")
             move_cursor_up(len(robot_action_to_send) + 5)
 
-        dt_s = time.perf_counter() - loop_start
-        busy_wait(1 / fps - dt_s)
+        scheduler.wait()
         loop_s = time.perf_counter() - loop_start
         print(f"\ntime: {loop_s * 1e3:.2f}ms ({1 / loop_s:.0f} Hz)")
 
         if duration is not None and time.perf_counter() - start >= duration:
+            logging.info(f"Teleoperation loop timing: {scheduler.stats().format()}")
             return
 
 
@@ -0,0 +1,192 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Building blocks of staged control loops, where each stage runs in its own thread.
+
+Stages are connected by bounded queues. Control data goes through `put_latest`, which drops the oldest item
+when the queue is full since a stale observation or action is worth less than a fresh one, while data that
+must not be lost (e.g. dataset frames) goes through blocking puts. Each stage is timed by a `StageTimer`, which
+counts the calls exceeding the loop period.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+# Marks the end of the stream in a stage queue
+STOP = object()
+
+
+@dataclass(frozen=True)
+class StageStats:
+    name: str
+    count: int
+    mean_ms: float
+    p50_ms: float
+    p99_ms: float
+    max_ms: float
+    deadline_misses: int
+
+
+class StageTimer:
+    """Collects the durations of a pipeline stage and counts those exceeding `deadline_s`.
+
+    Percentiles are computed over the last `window` durations.
+    """
+
+    def __init__(self, name: str, deadline_s: float | None = None, window: int = 10_000):
+        self.name = name
+        self.deadline_s = deadline_s
+        self._durations: deque[float] = deque(maxlen=window)
+        self._count = 0
+        self._deadline_misses = 0
+        self._lock = threading.Lock()
+
+    def record(self, duration_s: float) -> None:
+        with self._lock:
+            self._durations.append(duration_s)
+            self._count += 1
+            if self.deadline_s is not None and duration_s > self.deadline_s:
+                self._deadline_misses += 1
+
+    @contextmanager
+    def time(self):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(time.perf_counter() - start)
+
+    def stats(self) -> StageStats:
+        with self._lock:
+            durations_ms = np.array(self._durations) * 1e3
+            count, deadline_misses = self._count, self._deadline_misses
+        if len(durations_ms) == 0:
+            return StageStats(self.name, 0, 0.0, 0.0, 0.0, 0.0, 0)
+        return StageStats(
+            name=self.name,
+            count=count,
+            mean_ms=float(durations_ms.mean()),
+            p50_ms=float(np.percentile(durations_ms, 50)),
+            p99_ms=float(np.percentile(durations_ms, 99)),
+            max_ms=float(durations_ms.max()),
+            deadline_misses=deadline_misses,
+        )
+
+
+@dataclass(frozen=True)
+class PipelineStats:
+    """Timing of a staged control loop.
+
+    Attributes:
+        stages: Duration of each call of each stage. A deadline miss is a call longer than the loop period.
+        end_to_end: Delay between the start of an observation and the action computed from it being sent.
+            A deadline miss is an action sent more than one period after its observation started.
+        ticks: Number of observations taken.
+        overruns: Number of ticks skipped because the observation stage could not keep up with the period.
+        counters: Items dropped or waited for at the queues, e.g. `dropped_observations`.
+    """
+
+    stages: dict[str, StageStats]
+    end_to_end: StageStats
+    ticks: int
+    overruns: int
+    counters: dict[str, int] = field(default_factory=dict)
+
+    def format(self) -> str:
+        header = f"{'stage':<14}{'count':>7}{'mean':>9}{'p50':>9}{'p99':>9}{'max':>9}{'missed':>8}"
+        lines = [header]
+        for s in [*self.stages.values(), self.end_to_end]:
+            lines.append(
+                f"{s.name:<14}{s.count:>7}{s.mean_ms:>9.2f}{s.p50_ms:>9.2f}{s.p99_ms:>9.2f}{s.max_ms:>9.2f}"
+                f"{s.deadline_misses:>8}"
+            )
+        counters = ", ".join(f"{key}={value}" for key, value in self.counters.items())
+        lines.append(f"ticks={self.ticks}, overruns={self.overruns}" + (f", {counters}" if counters else ""))
+        return "\n".join(lines)
+
+
+def put_latest(q: queue.Queue, item: Any) -> bool:
+    """Puts `item` in `q` without blocking, dropping the oldest item if the queue is full.
+
+    Returns:
+        bool: Whether an item was dropped.
+    """
+    dropped = False
+    while True:
+        try:
+            q.put_nowait(item)
+            return dropped
+        except queue.Full:
+            try:
+                q.get_nowait()
+                dropped = True
+            except queue.Empty:
+                pass
+
+
+class StageWorker(threading.Thread):
+    """Thread calling `fn` on each item of `inbox` until it receives `STOP`.
+
+    `on_stop` is called once the stream is over, typically to forward `STOP` to the next stages. When `fn`
+    raises, the error is kept in `error`, `abort` is set so that the other stages stop too, and the worker
+    exits.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fn: Callable[[Any], None],
+        inbox: queue.Queue,
+        abort: threading.Event,
+        timer: StageTimer | None = None,
+        on_stop: Callable[[], None] | None = None,
+    ):
+        super().__init__(name=name, daemon=True)
+        self.fn = fn
+        self.inbox = inbox
+        self.abort = abort
+        self.timer = timer
+        self.on_stop = on_stop
+        self.error: BaseException | None = None
+
+    def run(self) -> None:
+        try:
+            while not self.abort.is_set():
+                try:
+                    item = self.inbox.get(timeout=0.05)
+                except queue.Empty:
+                    continue
+                if item is STOP:
+                    break
+                if self.timer is not None:
+                    with self.timer.time():
+                        self.fn(item)
+                else:
+                    self.fn(item)
+        except BaseException as e:
+            logging.exception(f"Error in pipeline stage '{self.name}'")
+            self.error = e
+            self.abort.set()
+        finally:
+            if self.on_stop is not None:
+                self.on_stop()
@@ -11,19 +11,190 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-
+import math
 import platform
 import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+
+import numpy as np
+
+
+def _default_spin_s() -> float:
+    # `time.sleep` overshoots by ~0.1ms on Linux, but by up to a few ms on Mac and Windows
+    if platform.system() == "Darwin":
+        return 0.003
+    if platform.system() == "Windows":
+        return 0.016
+    return 0.001
+
+
+DEFAULT_SPIN_S = _default_spin_s()
+
+
+def sleep_until(deadline: float, spin_s: float = DEFAULT_SPIN_S) -> None:
+    """Waits until `time.perf_counter()` reaches `deadline`.
+
+    Sleeps until `spin_s` before the deadline, then spins for the remaining time. The spin loop releases the
+    GIL at each iteration so that other threads, e.g. camera readers, are not starved.
+    """
+    remaining = deadline - time.perf_counter()
+    if remaining > spin_s:
+        time.sleep(remaining - spin_s)
+    while time.perf_counter() < deadline:
+        time.sleep(0)
 
 
 def busy_wait(seconds):
-    if platform.system() == "Darwin" or platform.system() == "Windows":
-        # On Mac and Windows, `time.sleep` is not accurate and we need to use this while loop trick,
-        # but it consumes CPU cycles.
-        end_time = time.perf_counter() + seconds
-        while time.perf_counter() < end_time:
-            pass
-    else:
-        # On Linux time.sleep is accurate
-        if seconds > 0:
-            time.sleep(seconds)
+    if seconds > 0:
+        sleep_until(time.perf_counter() + seconds)
+
+
+class OverrunPolicy(str, Enum):
+    # Drop the missed deadlines and resume on the next deadline of the schedule
+    SKIP = "skip"
+    # Run the late iterations back to back until the schedule is caught up
+    CATCH_UP = "catch_up"
+
+
+# Upper edges of the lateness histogram buckets, in ms
+LATENESS_HISTOGRAM_EDGES_MS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0)
+
+
+@dataclass(frozen=True)
+class RateStats:
+    """Timing of a loop paced by a `RateScheduler`.
+
+    Attributes:
+        fps: Target rate.
+        ticks: Number of iterations.
+        overruns: Number of iterations which ended after their deadline.
+        skipped_ticks: Number of deadlines dropped with `OverrunPolicy.SKIP`.
+        mean_period_ms: Mean duration between the starts of consecutive iterations.
+        lateness_p50_ms: Median delay between a deadline and the start of the next iteration.
+        lateness_p99_ms: 99th percentile of that delay.
+        lateness_max_ms: Maximum of that delay.
+        histogram: Number of iterations per lateness bucket, keyed by the upper edge of the bucket.
+    """
+
+    fps: float
+    ticks: int
+    overruns: int
+    skipped_ticks: int
+    mean_period_ms: float
+    lateness_p50_ms: float
+    lateness_p99_ms: float
+    lateness_max_ms: float
+    histogram: dict[str, int]
+
+    def format(self) -> str:
+        histogram = " ".join(f"{edge}:{count}" for edge, count in self.histogram.items() if count > 0)
+        return (
+            f"{self.ticks} ticks at {self.fps:g} fps (mean period {self.mean_period_ms:.2f}ms), "
+            f"{self.overruns} overruns, {self.skipped_ticks} skipped, lateness p50 {self.lateness_p50_ms:.3f}ms "
+            f"p99 {self.lateness_p99_ms:.3f}ms max {self.lateness_max_ms:.3f}ms | {histogram}"
+        )
+
+
+class RateScheduler:
+    """Paces a control loop on an absolute schedule: the k-th iteration starts at `start + k / fps`.
+
+    Unlike sleeping for `1 / fps` minus the duration of the iteration, the schedule does not drift with the
+    overshoot of each sleep. Waits use `sleep_until`, sleeping then spinning for the last `spin_s`. When an
+    iteration runs past its deadline, `overrun_policy` decides between dropping the missed deadlines (`skip`,
+    the loop stays on the schedule grid) or running the late iterations back to back (`catch_up`, no
+    iteration is lost, e.g. when replaying a trajectory).
+
+    Example:
+    ```python
+    scheduler = RateScheduler(fps=30)
+    while not done:
+        step()
+        scheduler.wait()
+    logging.info(scheduler.stats().format())
+    ```
+    """
+
+    def __init__(
+        self,
+        fps: float,
+        overrun_policy: OverrunPolicy | str = OverrunPolicy.SKIP,
+        spin_s: float = DEFAULT_SPIN_S,
+        window: int = 10_000,
+    ):
+        if fps <= 0:
+            raise ValueError(f"`fps` must be positive, but {fps} is provided.")
+        self.fps = fps
+        self.period_s = 1 / fps
+        self.overrun_policy = OverrunPolicy(overrun_policy)
+        self.spin_s = spin_s
+        self._window = window
+        self.reset()
+
+    def reset(self) -> None:
+        """Restarts the schedule from now and clears the statistics, e.g. after a pause between episodes."""
+        self._start = time.perf_counter()
+        self._last_tick_t = self._start
+        self._tick = 0
+        self._ticks = 0
+        self._overruns = 0
+        self._skipped_ticks = 0
+        self._periods: deque[float] = deque(maxlen=self._window)
+        self._lateness: deque[float] = deque(maxlen=self._window)
+        self._histogram = [0] * (len(LATENESS_HISTOGRAM_EDGES_MS) + 1)
+
+    @property
+    def next_deadline(self) -> float:
+        return self._start + (self._tick + 1) * self.period_s
+
+    def time_left(self) -> float:
+        """Time until the next deadline, negative when the current iteration is late."""
+        return self.next_deadline - time.perf_counter()
+
+    def wait(self) -> float:
+        """Waits for the start of the next iteration.
+
+        Returns:
+            float: Lateness of the next iteration with respect to its deadline, in seconds.
+        """
+        deadline = self.next_deadline
+        now = time.perf_counter()
+        if now <= deadline:
+            sleep_until(deadline, self.spin_s)
+            self._tick += 1
+        else:
+            self._overruns += 1
+            if self.overrun_policy is OverrunPolicy.SKIP:
+                missed = math.floor((now - self._start) / self.period_s) - self._tick
+                self._skipped_ticks += missed
+                self._tick += missed
+                deadline = self.next_deadline
+                sleep_until(deadline, self.spin_s)
+            self._tick += 1
+
+        tick_t = time.perf_counter()
+        lateness = max(0.0, tick_t - deadline)
+        self._ticks += 1
+        self._periods.append(tick_t - self._last_tick_t)
+        self._last_tick_t = tick_t
+        self._lateness.append(lateness)
+        bucket = np.searchsorted(LATENESS_HISTOGRAM_EDGES_MS, lateness * 1e3, side="right")
+        self._histogram[bucket] += 1
+        return lateness
+
+    def stats(self) -> RateStats:
+        lateness_ms = np.array(self._lateness) * 1e3 if self._lateness else np.zeros(1)
+        labels = [f"<{edge:g}ms" for edge in LATENESS_HISTOGRAM_EDGES_MS]
+        labels.append(f">={LATENESS_HISTOGRAM_EDGES_MS[-1]:g}ms")
+        return RateStats(
+            fps=self.fps,
+            ticks=self._ticks,
+            overruns=self._overruns,
+            skipped_ticks=self._skipped_ticks,
+            mean_period_ms=float(np.mean(self._periods) * 1e3) if self._periods else 0.0,
+            lateness_p50_ms=float(np.percentile(lateness_ms, 50)),
+            lateness_p99_ms=float(np.percentile(lateness_ms, 99)),
+            lateness_max_ms=float(lateness_ms.max()),
+            histogram=dict(zip(labels, self._histogram, strict=True)),
+        )
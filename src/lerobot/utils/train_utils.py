@@ -13,14 +13,23 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import logging
+import os
+import shutil
+import sys
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
+import torch
+from huggingface_hub import save_torch_state_dict
 from torch.optim import Optimizer
 from torch.optim.lr_scheduler import LRScheduler
 
 from lerobot.configs.train import TrainPipelineConfig
 from lerobot.datasets.utils import load_json, write_json
-from lerobot.optim.optimizers import load_optimizer_state, save_optimizer_state
+from lerobot.optim.optimizers import load_optimizer_state, save_optimizer_state, save_optimizer_state_dict
 from lerobot.optim.schedulers import load_scheduler_state, save_scheduler_state
 from lerobot.policies.pretrained import PreTrainedPolicy
 from lerobot.processor import PolicyProcessorPipeline
@@ -62,6 +71,28 @@ def update_last_checkpoint(checkpoint_dir: Path) -> Path:
     last_checkpoint_dir.symlink_to(relative_target)
 
 
+def prune_checkpoints(checkpoints_dir: Path, keep_last_n: int) -> list[Path]:
+    """Deletes all but the `keep_last_n` most recent step checkpoints in `checkpoints_dir`.
+
+    Only the step sub-directories (e.g. '005000/') are considered, the 'last' symlink and in-progress
+    temporary directories are left untouched.
+
+    Returns:
+        list[Path]: The checkpoint directories that were removed.
+    """
+    if keep_last_n < 1:
+        raise ValueError(f"`keep_last_n` must be at least 1, got {keep_last_n}.")
+
+    step_dirs = sorted(
+        (d for d in checkpoints_dir.iterdir() if d.name.isdigit() and d.is_dir() and not d.is_symlink()),
+        key=lambda d: int(d.name),
+    )
+    removed = step_dirs[:-keep_last_n]
+    for checkpoint_dir in removed:
+        shutil.rmtree(checkpoint_dir)
+    return removed
+
+
 def save_checkpoint(
     checkpoint_dir: Path,
     step: int,
@@ -163,3 +194,183 @@ def load_training_state(
         scheduler = load_scheduler_state(scheduler, training_state_dir)
 
     return step, optimizer, scheduler
+
+
+class AsyncCheckpointWriter:
+    """Writes training checkpoints on a background thread.
+
+    `save` produces the same directory structure as `save_checkpoint`, but only blocks the training loop for
+    the time it takes to snapshot the policy and optimizer tensors to CPU memory (pinned when the tensors live
+    on a CUDA device, so that the device-to-host copies are asynchronous). Serialization is then done by a
+    worker thread in a temporary directory which is atomically renamed once complete, so that an interrupted
+    run never leaves a partially written checkpoint behind.
+
+    At most one checkpoint is in flight: calling `save` while the previous checkpoint is still being written
+    first waits for it. This bounds the host memory used by the snapshot and lets the staging buffers be
+    reused from one checkpoint to the next. `wait` (or `close`) must be called before exiting.
+
+    Args:
+        keep_last_n (int | None, optional): If set, only the `keep_last_n` most recent checkpoints are kept
+            on disk. Defaults to None (all checkpoints are kept).
+        max_shard_size (int | str | None, optional): Maximum size of each policy weights file (e.g. "5GB").
+            When the weights do not fit in a single shard, they are written as
+            'model-0000x-of-0000y.safetensors' files along with a 'model.safetensors.index.json' index.
+            Defaults to None (a single 'model.safetensors' file is written).
+    """
+
+    def __init__(self, keep_last_n: int | None = None, max_shard_size: int | str | None = None):
+        if keep_last_n is not None and keep_last_n < 1:
+            raise ValueError(f"`keep_last_n` must be at least 1, got {keep_last_n}.")
+        self.keep_last_n = keep_last_n
+        self.max_shard_size = max_shard_size if max_shard_size is not None else sys.maxsize
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint_writer")
+        self._pending: Future | None = None
+        self._staging_buffers: dict[str, torch.Tensor] = {}
+
+    def save(
+        self,
+        checkpoint_dir: Path,
+        step: int,
+        cfg: TrainPipelineConfig,
+        policy: PreTrainedPolicy,
+        optimizer: Optimizer | dict[str, Optimizer],
+        scheduler: LRScheduler | None = None,
+        preprocessor: PolicyProcessorPipeline | None = None,
+        postprocessor: PolicyProcessorPipeline | None = None,
+        on_complete: Callable[[Path], None] | None = None,
+    ) -> Future:
+        """Snapshots the training state and schedules the checkpoint to be written to `checkpoint_dir`.
+
+        The 'last' checkpoint symlink is updated (and old checkpoints pruned) by the worker thread once the
+        checkpoint has been fully written, after which `on_complete(checkpoint_dir)` is called.
+
+        Returns:
+            Future: A future resolving to `checkpoint_dir` once the checkpoint is on disk.
+        """
+        self.wait()
+
+        tmp_dir = checkpoint_dir.parent / f".{checkpoint_dir.name}.tmp"
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir)
+        pretrained_dir = tmp_dir / PRETRAINED_MODEL_DIR
+        training_state_dir = tmp_dir / TRAINING_STATE_DIR
+        pretrained_dir.mkdir(parents=True)
+        training_state_dir.mkdir(parents=True)
+
+        # Configs, processor states, rng and scheduler states are small: write them right away so that they
+        # reflect the state at `step`.
+        policy.config._save_pretrained(pretrained_dir)
+        cfg.save_pretrained(pretrained_dir)
+        if preprocessor is not None:
+            preprocessor.save_pretrained(pretrained_dir)
+        if postprocessor is not None:
+            postprocessor.save_pretrained(pretrained_dir)
+        save_training_step(step, training_state_dir)
+        save_rng_state(training_state_dir)
+        if scheduler is not None:
+            save_scheduler_state(scheduler, training_state_dir)
+
+        model = policy.module if hasattr(policy, "module") else policy
+        model_state = self._snapshot_state_dict(model.state_dict(), prefix="model")
+        if isinstance(optimizer, dict):
+            optimizer_state = {
+                name: self._snapshot(opt.state_dict(), f"optimizer/{name}") for name, opt in optimizer.items()
+            }
+        else:
+            optimizer_state = self._snapshot(optimizer.state_dict(), "optimizer")
+        if torch.cuda.is_available():
+            # Wait for the non-blocking device-to-host copies before handing the buffers to the worker.
+            torch.cuda.synchronize()
+
+        self._pending = self._executor.submit(
+            self._write,
+            tmp_dir,
+            checkpoint_dir,
+            model_state,
+            optimizer_state,
+            isinstance(optimizer, dict),
+            on_complete,
+        )
+        return self._pending
+
+    def wait(self) -> None:
+        """Blocks until the in-flight checkpoint (if any) is written, re-raising its error if it failed."""
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            pending.result()
+
+    def close(self) -> None:
+        """Waits for the in-flight checkpoint and stops the worker thread."""
+        try:
+            self.wait()
+        finally:
+            self._executor.shutdown(wait=True)
+            self._staging_buffers.clear()
+
+    def _stage(self, key: str, tensor: torch.Tensor) -> torch.Tensor:
+        buffer = self._staging_buffers.get(key)
+        if buffer is None or buffer.shape != tensor.shape or buffer.dtype != tensor.dtype:
+            buffer = torch.empty(tensor.shape, dtype=tensor.dtype, pin_memory=tensor.is_cuda)
+            self._staging_buffers[key] = buffer
+        buffer.copy_(tensor.detach(), non_blocking=tensor.is_cuda)
+        return buffer
+
+    def _snapshot_state_dict(
+        self, state_dict: dict[str, torch.Tensor], prefix: str
+    ) -> dict[str, torch.Tensor]:
+        # Tensors sharing the same memory (e.g. tied weights) are staged once so that the aliasing is
+        # preserved and the duplicates can be discarded at serialization time, like `save_model` does.
+        staged: dict[tuple, torch.Tensor] = {}
+        snapshot = {}
+        for name, tensor in state_dict.items():
+            storage_key = (
+                tensor.device,
+                tensor.untyped_storage().data_ptr(),
+                tensor.storage_offset(),
+                tuple(tensor.shape),
+                tuple(tensor.stride()),
+            )
+            if storage_key not in staged:
+                staged[storage_key] = self._stage(f"{prefix}/{name}", tensor)
+            snapshot[name] = staged[storage_key]
+        return snapshot
+
+    def _snapshot(self, obj: Any, key: str) -> Any:
+        if isinstance(obj, torch.Tensor):
+            return self._stage(key, obj)
+        if isinstance(obj, dict):
+            return {k: self._snapshot(v, f"{key}/{k}") for k, v in obj.items()}
+        if isinstance(obj, (list, tuple)):
+            return type(obj)(self._snapshot(v, f"{key}/{i}") for i, v in enumerate(obj))
+        return obj
+
+    def _write(
+        self,
+        tmp_dir: Path,
+        checkpoint_dir: Path,
+        model_state: dict[str, torch.Tensor],
+        optimizer_state: dict[str, Any],
+        multiple_optimizers: bool,
+        on_complete: Callable[[Path], None] | None,
+    ) -> Path:
+        save_torch_state_dict(model_state, tmp_dir / PRETRAINED_MODEL_DIR, max_shard_size=self.max_shard_size)
+
+        training_state_dir = tmp_dir / TRAINING_STATE_DIR
+        if multiple_optimizers:
+            for name, state in optimizer_state.items():
+                optimizer_dir = training_state_dir / name
+                optimizer_dir.mkdir(exist_ok=True, parents=True)
+                save_optimizer_state_dict(state, optimizer_dir)
+        else:
+            save_optimizer_state_dict(optimizer_state, training_state_dir)
+
+        if checkpoint_dir.exists():
+            shutil.rmtree(checkpoint_dir)
+        os.replace(tmp_dir, checkpoint_dir)
+        update_last_checkpoint(checkpoint_dir)
+        if self.keep_last_n is not None:
+            for removed_dir in prune_checkpoints(checkpoint_dir.parent, self.keep_last_n):
+                logging.info(f"Removed old checkpoint {removed_dir}")
+        if on_complete is not None:
+            on_complete(checkpoint_dir)
+        return checkpoint_dir
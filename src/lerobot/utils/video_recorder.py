@@ -0,0 +1,221 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Streaming encoding of rendered episodes to videos.
+
+`write_video` encodes an episode once all its frames are stacked in memory, so recording a batch of episodes keeps
+`n_steps x n_envs` frames alive. `StreamingVideoRecorder` instead sends each frame to an incremental PyAV encoder as
+soon as it is rendered. The videos are spread over a pool of worker threads (the frames of a video are always
+encoded by the same worker, in order), and the number of frames waiting to be encoded is bounded: when the workers
+fall behind, `add_frame` blocks until a frame is encoded.
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import av
+import numpy as np
+
+# Sentinel closing the queue of a worker
+_STOP = object()
+
+
+@dataclass
+class VideoRecorderStats:
+    videos: int = 0
+    frames: int = 0
+    # Time spent by the workers encoding and writing frames, in seconds
+    encode_s: float = 0.0
+    # Time spent by `add_frame` waiting for the workers, in seconds
+    blocked_s: float = 0.0
+
+    @property
+    def encode_ms_per_frame(self) -> float:
+        return 1e3 * self.encode_s / max(self.frames, 1)
+
+
+class _VideoWriter:
+    """Incremental encoder of one video, opened at its first frame (which gives the size of the video)."""
+
+    def __init__(self, video_path: Path, fps: float, vcodec: str, pix_fmt: str, options: dict[str, str]):
+        self.video_path = video_path
+        self.fps = fps
+        self.vcodec = vcodec
+        self.pix_fmt = pix_fmt
+        self.options = options
+        self.container = None
+        self.stream = None
+
+    def write(self, frame: np.ndarray):
+        if self.container is None:
+            self.video_path.parent.mkdir(parents=True, exist_ok=True)
+            self.container = av.open(str(self.video_path), "w")
+            try:
+                self.stream = self.container.add_stream(
+                    self.vcodec, rate=round(self.fps), options=self.options
+                )
+                self.stream.pix_fmt = self.pix_fmt
+                # yuv420p needs even dimensions
+                self.stream.height = frame.shape[0] - frame.shape[0] % 2
+                self.stream.width = frame.shape[1] - frame.shape[1] % 2
+            except Exception:
+                # e.g. an unknown codec: the video is not written, and the writer stays closed
+                self.container.close()
+                self.container = None
+                self.stream = None
+                raise
+        frame = np.ascontiguousarray(frame[: self.stream.height, : self.stream.width])
+        video_frame = av.VideoFrame.from_ndarray(frame, format="rgb24")
+        self.container.mux(self.stream.encode(video_frame))
+
+    def close(self):
+        if self.stream is None:
+            return
+        try:
+            # Flush the encoder
+            self.container.mux(self.stream.encode())
+        finally:
+            self.container.close()
+
+
+class StreamingVideoRecorder:
+    """Encodes the frames of several videos while they are produced, in `num_workers` threads.
+
+    Example:
+        with StreamingVideoRecorder() as recorder:
+            video = recorder.open("episode_0.mp4", fps=30)
+            for frame in frames:
+                recorder.add_frame(video, frame)
+            recorder.close_video(video)
+
+    Args:
+        num_workers: Number of encoding threads.
+        max_queued_frames: Maximum number of frames waiting to be encoded, per worker.
+        vcodec: Video codec (see `av.codecs_available`).
+        pix_fmt: Pixel format of the videos.
+        options: Options of the encoder, e.g. {"crf": "23"}.
+    """
+
+    def __init__(
+        self,
+        num_workers: int = 2,
+        max_queued_frames: int = 32,
+        vcodec: str = "libx264",
+        pix_fmt: str = "yuv420p",
+        options: dict[str, str] | None = None,
+    ):
+        if num_workers < 1:
+            raise ValueError(f"num_workers must be at least 1, got {num_workers}.")
+        self.vcodec = vcodec
+        self.pix_fmt = pix_fmt
+        self.options = options or {}
+        self._stats = VideoRecorderStats()
+        self._stats_lock = threading.Lock()
+        self._error: BaseException | None = None
+        self._next_video = 0
+        self._closed = False
+        self._queues = [queue.Queue(maxsize=max_queued_frames) for _ in range(num_workers)]
+        self._workers = [
+            threading.Thread(target=self._work, args=(q,), name=f"video_recorder_{i}", daemon=True)
+            for i, q in enumerate(self._queues)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def __enter__(self) -> "StreamingVideoRecorder":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _work(self, q: queue.Queue):
+        writers: dict[int, _VideoWriter] = {}
+        while True:
+            item = q.get()
+            if item is _STOP:
+                break
+            video, frame, writer = item
+            if self._error is not None:
+                continue
+            start = time.perf_counter()
+            try:
+                if writer is not None:
+                    writers[video] = writer
+                elif frame is not None:
+                    writers[video].write(frame)
+                else:
+                    writers.pop(video).close()
+            except Exception as e:
+                self._set_error(video, e)
+            with self._stats_lock:
+                self._stats.encode_s += time.perf_counter() - start
+                if frame is not None:
+                    self._stats.frames += 1
+                elif writer is None:
+                    self._stats.videos += 1
+        # The videos that were not closed, e.g. after an error
+        for video, writer in writers.items():
+            try:
+                writer.close()
+            except Exception as e:
+                self._set_error(video, e)
+
+    def _set_error(self, video: int, error: Exception):
+        logging.error(f"Failed to encode video {video}: {error}")
+        if self._error is None:
+            self._error = error
+
+    def _put(self, video: int, item: tuple):
+        if self._error is not None:
+            raise RuntimeError("Video encoding failed.") from self._error
+        start = time.perf_counter()
+        self._queues[video % len(self._queues)].put(item)
+        with self._stats_lock:
+            self._stats.blocked_s += time.perf_counter() - start
+
+    def open(self, video_path: str | Path, fps: float) -> int:
+        """Start a new video, and return its handle for `add_frame` and `close_video`."""
+        video = self._next_video
+        self._next_video += 1
+        writer = _VideoWriter(Path(video_path), fps, self.vcodec, self.pix_fmt, self.options)
+        self._put(video, (video, None, writer))
+        return video
+
+    def add_frame(self, video: int, frame: np.ndarray):
+        """Queue a (h, w, 3) uint8 RGB frame of `video`. The frame must not be modified afterwards."""
+        self._put(video, (video, frame, None))
+
+    def close_video(self, video: int):
+        """Finish `video` once its queued frames are encoded."""
+        self._put(video, (video, None, None))
+
+    def close(self):
+        """Wait for all the queued frames to be encoded and close the videos."""
+        if self._closed:
+            return
+        self._closed = True
+        for q in self._queues:
+            q.put(_STOP)
+        for worker in self._workers:
+            worker.join()
+        if self._error is not None:
+            raise RuntimeError("Video encoding failed.") from self._error
+
+    def stats(self) -> VideoRecorderStats:
+        with self._stats_lock:
+            return VideoRecorderStats(**vars(self._stats))
@@ -217,3 +217,27 @@ def test_predict_action_chunk(monkeypatch, policy_server):
     for i, ta in enumerate(timed_actions):
         expected_ts = obs.get_timestamp() + i * policy_server.config.environment_dt
         assert abs(ta.get_timestamp() - expected_ts) < 1e-6
+
+
+def test_real_time_chunking_inputs(policy_server):
+    """With real-time chunking, the remaining actions of the last chunk are passed to the policy."""
+    calls = []
+
+    def predict_action_chunk(observation, **kwargs):
+        calls.append(kwargs)
+        return torch.arange(20.0)[None, :, None].expand(1, 20, 6)
+
+    policy_server.policy.predict_action_chunk = predict_action_chunk
+    policy_server.real_time_chunking = True
+    policy_server.actions_per_chunk = 10
+    observation = {OBS_STATE: torch.zeros(1, 6)}
+
+    policy_server.last_processed_obs = _make_obs(torch.zeros(6), timestep=5)
+    policy_server._get_action_chunk(observation)
+    policy_server.last_processed_obs = _make_obs(torch.zeros(6), timestep=8)
+    policy_server._get_action_chunk(observation)
+
+    assert calls[0] == {}
+    # The chunk of timestep 5 is kept from timestep 8 on
+    torch.testing.assert_close(calls[1]["prev_chunk"], torch.arange(3.0, 10.0)[None, :, None].expand(1, 7, 6))
+    assert calls[1]["inference_delay"] >= 1
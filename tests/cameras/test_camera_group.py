@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from lerobot.cameras.camera_group import CameraGroup
+from lerobot.cameras.frame_buffer import FrameRingBuffer
+
+
+def make_frame(value: int) -> np.ndarray:
+    return np.full((4, 4, 3), value, dtype=np.uint8)
+
+
+class BufferedCamera:
+    """Minimal stand-in for a camera with a background frame buffer."""
+
+    def __init__(self):
+        self.frame_buffer = FrameRingBuffer(capacity=8)
+
+    def read_latest(self, timeout_ms: float = 200):
+        entry = self.frame_buffer.wait_for_newer(-1, timeout_ms / 1e3)
+        if entry is None:
+            raise TimeoutError("No frame")
+        return entry
+
+
+class PollingCamera:
+    """Minimal stand-in for a camera only providing `async_read`."""
+
+    def __init__(self, value: int, delay_s: float = 0.0):
+        self.value = value
+        self.delay_s = delay_s
+
+    def async_read(self, timeout_ms: float = 200):
+        time.sleep(self.delay_s)
+        return make_frame(self.value)
+
+
+def test_aligns_buffered_frames():
+    front, wrist = BufferedCamera(), BufferedCamera()
+    for i in range(5):
+        front.frame_buffer.push(make_frame(i), timestamp=1.0 + i * 0.033)
+    for i in range(4):
+        wrist.frame_buffer.push(make_frame(10 + i), timestamp=1.01 + i * 0.033)
+
+    group = CameraGroup({"front": front, "wrist": wrist})
+    synced = group.read()
+
+    # The least recent latest frame is wrist's at 1.109, closest to front's frame 3 at 1.099
+    assert synced.frames["wrist"][0, 0, 0] == 13
+    assert synced.frames["front"][0, 0, 0] == 3
+    assert synced.skew_ms == pytest.approx(10.0)
+    assert list(synced.frames) == ["front", "wrist"]
+
+
+def test_aligns_to_given_timestamp():
+    front, wrist = BufferedCamera(), BufferedCamera()
+    for i in range(5):
+        front.frame_buffer.push(make_frame(i), timestamp=1.0 + i * 0.1)
+        wrist.frame_buffer.push(make_frame(10 + i), timestamp=1.0 + i * 0.1)
+
+    synced = CameraGroup({"front": front, "wrist": wrist}).read(timestamp=1.18)
+
+    assert synced.frames["front"][0, 0, 0] == 2
+    assert synced.frames["wrist"][0, 0, 0] == 12
+    assert synced.skew_ms == 0.0
+
+
+def test_waits_for_lagging_camera():
+    front, wrist = BufferedCamera(), BufferedCamera()
+    now = time.perf_counter()
+    front.frame_buffer.push(make_frame(0), timestamp=now)
+    wrist.frame_buffer.push(make_frame(10), timestamp=now - 0.05)
+
+    def capture_aligned_frame():
+        time.sleep(0.02)
+        wrist.frame_buffer.push(make_frame(11), timestamp=now)
+
+    thread = threading.Thread(target=capture_aligned_frame)
+    thread.start()
+    group = CameraGroup({"front": front, "wrist": wrist}, max_skew_ms=5)
+    synced = group.read(timeout_ms=1000)
+    thread.join()
+
+    assert synced.frames["wrist"][0, 0, 0] == 11
+    assert synced.skew_ms == 0.0
+    assert group.stats().skew_violations == 0
+
+
+def test_skew_violation_after_timeout():
+    front, wrist = BufferedCamera(), BufferedCamera()
+    front.frame_buffer.push(make_frame(0), timestamp=1.0)
+    wrist.frame_buffer.push(make_frame(10), timestamp=1.05)
+
+    group = CameraGroup({"front": front, "wrist": wrist}, max_skew_ms=5)
+    synced = group.read(timeout_ms=10)
+
+    assert synced.skew_ms == pytest.approx(50.0)
+    stats = group.stats()
+    assert stats.num_sets == 1
+    assert stats.skew_violations == 1
+    assert stats.max_skew_ms == pytest.approx(50.0)
+
+
+def test_reads_unbuffered_cameras_in_parallel():
+    group = CameraGroup({"a": PollingCamera(1, delay_s=0.1), "b": PollingCamera(2, delay_s=0.1)})
+    try:
+        start = time.perf_counter()
+        synced = group.read()
+        elapsed_s = time.perf_counter() - start
+    finally:
+        group.close()
+
+    assert synced.frames["a"][0, 0, 0] == 1
+    assert synced.frames["b"][0, 0, 0] == 2
+    assert elapsed_s < 0.19
+
+
+def test_missing_frame_raises():
+    group = CameraGroup({"front": BufferedCamera()})
+    with pytest.raises(TimeoutError):
+        group.read(timeout_ms=10)
+
+
+def test_empty_group():
+    synced = CameraGroup({}).read()
+    assert synced.frames == {}
+    assert synced.skew_ms == 0.0
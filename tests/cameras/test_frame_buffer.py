@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from lerobot.cameras.frame_buffer import FrameRingBuffer
+
+
+def make_frame(value: int) -> np.ndarray:
+    return np.full((4, 4, 3), value, dtype=np.uint8)
+
+
+def test_empty_buffer():
+    buffer = FrameRingBuffer(capacity=4)
+
+    assert len(buffer) == 0
+    assert buffer.latest() is None
+    assert buffer.nearest(0.0) is None
+    assert buffer.since(-1) == []
+    assert buffer.wait_for_newer(-1, timeout_s=0) is None
+
+
+def test_invalid_capacity():
+    with pytest.raises(ValueError):
+        FrameRingBuffer(capacity=0)
+
+
+def test_latest_and_since():
+    buffer = FrameRingBuffer(capacity=4)
+    frames = [make_frame(i) for i in range(6)]
+    for i, frame in enumerate(frames):
+        assert buffer.push(frame, timestamp=float(i)) == i
+
+    latest = buffer.latest()
+    assert latest.seq == 5
+    assert latest.timestamp == 5.0
+    # Frames are returned without copies
+    assert latest.frame is frames[5]
+
+    assert len(buffer) == 4
+    assert [entry.seq for entry in buffer.since(-1)] == [2, 3, 4, 5]
+    assert [entry.seq for entry in buffer.since(3)] == [4, 5]
+    assert buffer.since(5) == []
+
+
+def test_nearest():
+    buffer = FrameRingBuffer(capacity=8)
+    for i in range(5):
+        buffer.push(make_frame(i), timestamp=1.0 + i * 0.1)
+
+    assert buffer.nearest(1.22).seq == 2
+    assert buffer.nearest(0.0).seq == 0
+    assert buffer.nearest(10.0).seq == 4
+
+
+def test_consumers_do_not_consume_for_each_other():
+    buffer = FrameRingBuffer(capacity=4)
+    buffer.push(make_frame(0))
+
+    # Two consumers seeing nothing yet both get the same frame
+    assert buffer.wait_for_newer(-1, timeout_s=0).seq == 0
+    assert buffer.wait_for_newer(-1, timeout_s=0).seq == 0
+    assert buffer.wait_for_newer(0, timeout_s=0) is None
+
+
+def test_wait_for_newer_wakes_up_on_push():
+    buffer = FrameRingBuffer(capacity=4)
+    buffer.push(make_frame(0))
+
+    def push_later():
+        time.sleep(0.05)
+        buffer.push(make_frame(1))
+
+    thread = threading.Thread(target=push_later)
+    thread.start()
+    entry = buffer.wait_for_newer(0, timeout_s=2.0)
+    thread.join()
+
+    assert entry is not None
+    assert entry.seq == 1
+
+
+def test_stats():
+    buffer = FrameRingBuffer(capacity=2, fps=10)
+    # The frame at t=0.4 follows a gap of 2 missed frames
+    for i, timestamp in enumerate([0.0, 0.1, 0.4]):
+        buffer.push(make_frame(i), timestamp=time.perf_counter() - 1.0 + timestamp)
+    buffer.latest()
+
+    stats = buffer.stats()
+    assert stats.frames_captured == 3
+    # Frame 0 was overwritten without being read
+    assert stats.frames_dropped == 1
+    assert stats.frames_missed == 2
+    assert stats.max_latency_ms >= stats.mean_latency_ms > 0
+
+    buffer.clear()
+    assert len(buffer) == 0
+    assert buffer.stats().frames_captured == 0
@@ -134,6 +134,27 @@ def test_async_read(index_or_path):
             camera.disconnect()  # To stop/join the thread. Otherwise get warnings when the test ends
 
 
+def test_read_latest():
+    config = OpenCVCameraConfig(index_or_path=DEFAULT_PNG_FILE_PATH)
+    camera = OpenCVCamera(config)
+    camera.connect(warmup=False)
+
+    try:
+        first = camera.read_latest()
+        camera.async_read()
+        latest = camera.read_latest()
+
+        assert isinstance(first.frame, np.ndarray)
+        assert latest.seq >= first.seq
+        assert latest.timestamp >= first.timestamp
+        assert camera.frame_buffer.stats().frames_captured > latest.seq
+    finally:
+        if camera.is_connected:
+            camera.disconnect()
+
+    assert len(camera.frame_buffer) == 0
+
+
 def test_async_read_timeout():
     config = OpenCVCameraConfig(index_or_path=DEFAULT_PNG_FILE_PATH)
     camera = OpenCVCamera(config)
@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Example of running a specific test:
+# ```bash
+# pytest tests/cameras/test_synthetic.py::test_connect
+# ```
+
+import time
+
+import av
+import numpy as np
+import pytest
+
+from lerobot.cameras.configs import ColorMode, Cv2Rotation
+from lerobot.cameras.synthetic import (
+    ReplayCamera,
+    ReplayCameraConfig,
+    SyntheticCamera,
+    SyntheticCameraConfig,
+)
+from lerobot.cameras.utils import make_cameras_from_configs
+from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
+
+
+@pytest.fixture
+def video_path(tmp_path):
+    path = tmp_path / "replay.mp4"
+    with av.open(str(path), mode="w") as container:
+        stream = container.add_stream("mpeg4", rate=30)
+        stream.width, stream.height, stream.pix_fmt = 64, 48, "yuv420p"
+        for i in range(5):
+            image = np.full((48, 64, 3), i * 50, dtype=np.uint8)
+            for packet in stream.encode(av.VideoFrame.from_ndarray(image, format="rgb24")):
+                container.mux(packet)
+        for packet in stream.encode():
+            container.mux(packet)
+    return path
+
+
+def test_connect():
+    camera = SyntheticCamera(SyntheticCameraConfig(fps=30, width=64, height=48))
+    camera.connect(warmup=False)
+
+    assert camera.is_connected
+    with pytest.raises(DeviceAlreadyConnectedError):
+        camera.connect()
+
+    camera.disconnect()
+    assert not camera.is_connected
+    with pytest.raises(DeviceNotConnectedError):
+        camera.disconnect()
+
+
+def test_read_not_connected():
+    camera = SyntheticCamera(SyntheticCameraConfig())
+    with pytest.raises(DeviceNotConnectedError):
+        camera.read()
+    with pytest.raises(DeviceNotConnectedError):
+        camera.async_read()
+
+
+@pytest.mark.parametrize(
+    "rotation",
+    [Cv2Rotation.NO_ROTATION, Cv2Rotation.ROTATE_90, Cv2Rotation.ROTATE_180, Cv2Rotation.ROTATE_270],
+    ids=["no_rot", "rot90", "rot180", "rot270"],
+)
+def test_rotation(rotation):
+    camera = SyntheticCamera(SyntheticCameraConfig(fps=60, width=64, height=48, rotation=rotation))
+    camera.connect(warmup=False)
+    frame = camera.read()
+    camera.disconnect()
+
+    assert frame.shape == (48, 64, 3)
+
+
+def test_color_mode():
+    config = SyntheticCameraConfig(fps=60, width=8, height=4, num_patterns=1, seed=0)
+    camera = SyntheticCamera(config)
+    camera.connect(warmup=False)
+    rgb = camera.read()
+    bgr = camera.read(color_mode=ColorMode.BGR)
+    camera.disconnect()
+
+    np.testing.assert_array_equal(rgb, bgr[..., ::-1])
+
+
+def test_read_follows_frame_rate():
+    camera = SyntheticCamera(SyntheticCameraConfig(fps=50, width=8, height=8, latency_ms=5))
+    camera.connect(warmup=False)
+    start = time.perf_counter()
+    for _ in range(5):
+        camera.async_read()
+    elapsed_s = time.perf_counter() - start
+    latest = camera.read_latest()
+    camera.disconnect()
+
+    assert 0.07 < elapsed_s < 0.5
+    # Frames are timestamped at capture, `latency_ms` before they become available
+    assert time.perf_counter() - latest.timestamp >= 0.005
+
+
+def test_drop_rate():
+    camera = SyntheticCamera(SyntheticCameraConfig(fps=200, width=8, height=8, drop_rate=0.5, seed=0))
+    camera.connect(warmup=False)
+    for _ in range(20):
+        camera.async_read()
+    stats = camera.frame_buffer.stats()
+    camera.disconnect()
+
+    assert stats.frames_missed > 0
+
+
+def test_invalid_config():
+    with pytest.raises(ValueError):
+        SyntheticCameraConfig(drop_rate=1.0)
+    with pytest.raises(ValueError):
+        SyntheticCameraConfig(jitter_ms=-1)
+
+
+@pytest.mark.parametrize("preload", [False, True], ids=["decode", "preload"])
+def test_replay(video_path, preload):
+    camera = ReplayCamera(ReplayCameraConfig(video_path, fps=100, color_mode=ColorMode.RGB, preload=preload))
+    camera.connect(warmup=False)
+
+    assert (camera.width, camera.height) == (64, 48)
+    frames = [camera.read() for _ in range(7)]
+    camera.disconnect()
+
+    assert all(frame.shape == (48, 64, 3) for frame in frames)
+    # The video is looped
+    assert abs(int(frames[5].mean()) - int(frames[0].mean())) < 5
+    assert int(frames[1].mean()) > int(frames[0].mean())
+
+
+def test_replay_resize(video_path):
+    camera = ReplayCamera(ReplayCameraConfig(video_path, width=32, height=24))
+    camera.connect()
+    frame = camera.async_read()
+    camera.disconnect()
+
+    assert frame.shape == (24, 32, 3)
+    assert camera.fps == 30
+
+
+def test_replay_end_of_video(video_path):
+    camera = ReplayCamera(ReplayCameraConfig(video_path, fps=200, loop=False))
+    camera.connect(warmup=False)
+    for _ in range(5):
+        camera.read()
+    with pytest.raises(RuntimeError):
+        camera.read()
+    camera.disconnect()
+
+
+def test_replay_missing_file(tmp_path):
+    camera = ReplayCamera(ReplayCameraConfig(tmp_path / "missing.mp4"))
+    with pytest.raises(ConnectionError):
+        camera.connect()
+
+
+def test_make_cameras_from_configs(video_path):
+    cameras = make_cameras_from_configs(
+        {"synthetic": SyntheticCameraConfig(), "replay": ReplayCameraConfig(video_path)}
+    )
+
+    assert isinstance(cameras["synthetic"], SyntheticCamera)
+    assert isinstance(cameras["replay"], ReplayCamera)
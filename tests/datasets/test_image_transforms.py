@@ -22,11 +22,15 @@ from torchvision.transforms import v2
 from torchvision.transforms.v2 import functional as F  # noqa: N812
 
 from lerobot.datasets.transforms import (
+    BatchedImageTransforms,
     ImageTransformConfig,
     ImageTransforms,
     ImageTransformsConfig,
     RandomSubsetApply,
     SharpnessJitter,
+    _adjust_hue,
+    _adjust_sharpness,
+    make_batched_transform_from_config,
     make_transform_from_config,
 )
 from lerobot.scripts.lerobot_imgtransform_viz import (
@@ -429,3 +433,101 @@ def test_save_each_transform(img_tensor_factory, tmp_path):
             assert (transform_dir / file_name).exists(), (
                 f"{file_name} was not found in {transform} directory."
             )
+
+
+def test_batched_image_transforms_disabled(img_tensor_factory):
+    images = torch.stack([img_tensor_factory() for _ in range(4)])
+    tf = BatchedImageTransforms(ImageTransformsConfig(enable=False))
+    assert tf(images) is images
+
+
+@pytest.mark.parametrize("shape", [(6, 3, 32, 48), (6, 2, 3, 32, 48)])
+def test_batched_image_transforms_default_config(shape):
+    images = torch.rand(shape)
+    tf = BatchedImageTransforms(ImageTransformsConfig(enable=True))
+
+    output = tf(images)
+
+    assert output.shape == images.shape
+    assert output.dtype == images.dtype
+    assert output.min() >= 0.0 and output.max() <= 1.0
+
+
+def test_batched_image_transforms_per_sample_parameters(img_tensor_factory):
+    img_tensor = img_tensor_factory()
+    # The same image for every sample, with two frames per sample
+    images = img_tensor.expand(8, 2, *img_tensor.shape)
+    tf_cfg = ImageTransformsConfig(
+        enable=True,
+        tfs={"brightness": ImageTransformConfig(type="ColorJitter", kwargs={"brightness": (0.5, 1.5)})},
+    )
+
+    output = BatchedImageTransforms(tf_cfg)(images)
+
+    # Parameters are drawn per sample, and shared by the frames of a sample
+    assert not torch.allclose(output[0], output[1])
+    torch.testing.assert_close(output[:, 0], output[:, 1])
+
+
+def test_batched_image_transforms_subset(img_tensor_factory):
+    images = torch.stack([img_tensor_factory() for _ in range(16)])
+    tf_cfg = ImageTransformsConfig(
+        enable=True,
+        max_num_transforms=1,
+        tfs={
+            "brightness": ImageTransformConfig(type="ColorJitter", kwargs={"brightness": (0.5, 1.5)}),
+            "identity": ImageTransformConfig(type="Identity"),
+        },
+    )
+
+    with seeded_context(1337):
+        output = BatchedImageTransforms(tf_cfg)(images)
+
+    unchanged = (output == images).flatten(start_dim=1).all(dim=1)
+    # Each sample is transformed by one of the two transforms
+    assert 0 < unchanged.sum() < len(images)
+
+
+def test_batched_hue_and_sharpness_match_functional(img_tensor_factory):
+    images = torch.stack([img_tensor_factory() for _ in range(3)])
+    hue_factors = torch.tensor([-0.1, 0.02, 0.3])
+    sharpness_factors = torch.tensor([0.5, 1.0, 1.5])
+
+    expected_hue = torch.stack(
+        [F.adjust_hue(img, h.item()) for img, h in zip(images, hue_factors, strict=True)]
+    )
+    expected_sharpness = torch.stack(
+        [F.adjust_sharpness(img, f.item()) for img, f in zip(images, sharpness_factors, strict=True)]
+    )
+
+    torch.testing.assert_close(_adjust_hue(images, hue_factors), expected_hue)
+    torch.testing.assert_close(_adjust_sharpness(images, sharpness_factors), expected_sharpness)
+
+
+def test_batched_affine_matches_functional(img_tensor_factory):
+    images = torch.stack([img_tensor_factory(height=40, width=60) for _ in range(4)])
+    tf = make_batched_transform_from_config(
+        ImageTransformConfig(type="RandomAffine", kwargs={"degrees": (20.0, 20.0), "translate": (0.1, 0.1)})
+    )
+
+    with seeded_context(1337):
+        output = tf(images)
+    with seeded_context(1337):
+        torch.empty(4).uniform_(20.0, 20.0)
+        tx = torch.empty(4).uniform_(-6.0, 6.0).round()
+        ty = torch.empty(4).uniform_(-4.0, 4.0).round()
+
+    expected = torch.stack(
+        [
+            F.affine(img, angle=20.0, translate=[x.item(), y.item()], scale=1.0, shear=[0.0, 0.0])
+            for img, x, y in zip(images, tx, ty, strict=True)
+        ]
+    )
+    torch.testing.assert_close(output, expected)
+
+
+def test_batched_affine_unsupported_arguments():
+    with pytest.raises(ValueError, match="not supported by batched transforms"):
+        make_batched_transform_from_config(
+            ImageTransformConfig(type="RandomAffine", kwargs={"degrees": 5.0, "shear": 10.0})
+        )
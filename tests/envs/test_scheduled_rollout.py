@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from types import SimpleNamespace
+
+import av
+import gymnasium as gym
+import numpy as np
+import pytest
+import torch
+from torch import nn
+
+from lerobot.scripts.lerobot_eval import (
+    eval_policy_all,
+    scheduled_rollout,
+    scheduled_rollouts,
+    supports_scheduled_rollout,
+)
+from lerobot.utils.constants import OBS_STATE
+from lerobot.utils.video_recorder import StreamingVideoRecorder
+
+MAX_STEPS = 12
+
+
+class CountdownEnv(gym.Env):
+    """An episode lasts `seed % 7 + 2` steps, with a reward of 1 per step, and succeeds for even seeds."""
+
+    metadata = {"render_modes": ["rgb_array"], "render_fps": 10}
+
+    def __init__(self):
+        self.observation_space = gym.spaces.Dict(
+            {"agent_pos": gym.spaces.Box(-np.inf, np.inf, shape=(2,), dtype=np.float64)}
+        )
+        self.action_space = gym.spaces.Box(-1, 1, shape=(1,), dtype=np.float32)
+        self.render_mode = "rgb_array"
+        self._seed = 0
+        self._t = 0
+
+    def _obs(self):
+        return {"agent_pos": np.array([self._seed, self._t], dtype=np.float64)}
+
+    def reset(self, seed=None, options=None):
+        super().reset(seed=seed)
+        self._seed = -1 if seed is None else seed
+        self._t = 0
+        return self._obs(), {}
+
+    def step(self, action):
+        self._t += 1
+        terminated = self._t == self._seed % 7 + 2
+        info = {"is_success": terminated and self._seed % 2 == 0}
+        return self._obs(), 1.0, terminated, False, info
+
+    def render(self):
+        return np.full((4, 4, 3), self._t, dtype=np.uint8)
+
+
+class RecordingPolicy(nn.Module):
+    """Records the (seed, step) observations, and the steps at which it is reset."""
+
+    def __init__(self, n_action_steps: int):
+        super().__init__()
+        self.config = SimpleNamespace(n_action_steps=n_action_steps)
+        self.observations = []
+        self.reset_steps = []
+
+    def reset(self):
+        self.reset_steps.append(len(self.observations))
+
+    def select_action(self, batch):
+        self.observations.append(batch[OBS_STATE].clone())
+        return torch.zeros(batch[OBS_STATE].shape[0], 1)
+
+
+def _make_env(num_envs: int) -> gym.vector.VectorEnv:
+    return gym.vector.SyncVectorEnv(
+        [lambda: gym.wrappers.TimeLimit(CountdownEnv(), MAX_STEPS) for _ in range(num_envs)],
+        autoreset_mode=gym.vector.AutoresetMode.SAME_STEP,
+    )
+
+
+@pytest.mark.parametrize("n_action_steps", [1, 3])
+def test_scheduled_rollout(n_action_steps, tmp_path):
+    n_episodes = 11
+    seeds = list(range(100, 100 + n_episodes))
+    env = _make_env(4)
+    policy = RecordingPolicy(n_action_steps)
+
+    with StreamingVideoRecorder() as recorder:
+        ret = scheduled_rollout(
+            env,
+            policy,
+            lambda x: x,
+            lambda x: x,
+            n_episodes,
+            seeds=seeds,
+            max_episodes_rendered=2,
+            videos_dir=tmp_path,
+            recorder=recorder,
+        )
+
+    lengths = [seed % 7 + 2 for seed in seeds]
+    assert ret["sum_reward"] == [float(length) for length in lengths]
+    assert ret["max_reward"] == [1.0] * n_episodes
+    assert ret["success"] == [seed % 2 == 0 for seed in seeds]
+    # The initial frame and one frame per step before the episode is done
+    assert ret["video_paths"] == [str(tmp_path / f"eval_episode_{i}.mp4") for i in range(2)]
+    for video_path, length in zip(ret["video_paths"], lengths, strict=False):
+        with av.open(video_path) as container:
+            assert sum(1 for _ in container.decode(video=0)) == length
+    # Episodes only start between two action chunks
+    assert all(step % n_action_steps == 0 for step in policy.reset_steps)
+    # Running the episodes batch by batch takes as many steps as the longest episode of each batch
+    batched_steps = sum(max(lengths[i : i + 4]) for i in range(0, n_episodes, 4))
+    assert len(policy.observations) <= batched_steps
+    if n_action_steps == 1:
+        assert len(policy.observations) < batched_steps
+    # Each episode starts from its own first observation
+    first_observations = {
+        (int(obs[i, 0]), int(obs[i, 1])) for obs in policy.observations for i in range(4) if obs[i, 1] == 0
+    }
+    assert {(seed, 0) for seed in seeds} <= first_observations
+    env.close()
+
+
+def test_scheduled_rollout_fewer_episodes_than_envs():
+    env = _make_env(4)
+    ret = scheduled_rollout(env, RecordingPolicy(1), lambda x: x, lambda x: x, 2, seeds=[0, 1])
+
+    assert ret["sum_reward"] == [2.0, 3.0]
+    assert ret["success"] == [True, False]
+    env.close()
+
+
+def test_supports_scheduled_rollout():
+    assert supports_scheduled_rollout(SimpleNamespace(config=SimpleNamespace(n_action_steps=10)))
+    assert not supports_scheduled_rollout(SimpleNamespace(config=SimpleNamespace(n_obs_steps=2)))
+    assert not supports_scheduled_rollout(
+        SimpleNamespace(config=SimpleNamespace(n_obs_steps=1, temporal_ensemble_coeff=0.01))
+    )
+
+
+def test_scheduled_rollouts_batch_envs():
+    envs = [_make_env(2), _make_env(3)]
+    policy = RecordingPolicy(2)
+
+    results = scheduled_rollouts(
+        envs, policy, lambda x: x, lambda x: x, 4, seeds=[0, 1, 2, 3], max_episodes_rendered=0
+    )
+
+    for result in results:
+        assert result["sum_reward"] == [2.0, 3.0, 4.0, 5.0]
+        assert result["success"] == [True, False, True, False]
+    # A single batch for both envs, until the episodes of one of them are all done
+    batch_sizes = [len(obs) for obs in policy.observations]
+    assert batch_sizes[0] == 5
+    assert batch_sizes[-1] in (2, 3)
+    for env in envs:
+        env.close()
+
+
+def test_eval_policy_all_batch_tasks():
+    envs = {"suite": {0: _make_env(2), 1: _make_env(2)}}
+    policy = RecordingPolicy(1)
+
+    info = eval_policy_all(envs, policy, lambda x: x, lambda x: x, 3, start_seed=0, batch_tasks=True)
+
+    assert [task["task_id"] for task in info["per_task"]] == [0, 1]
+    assert info["per_task"][0]["metrics"]["sum_rewards"] == [2.0, 3.0, 4.0]
+    assert info["overall"]["n_episodes"] == 6
+    assert info["overall"]["pc_success"] == pytest.approx(200 / 3)
+    assert len(policy.observations[0]) == 4
+    for group in envs.values():
+        for env in group.values():
+            env.close()
@@ -0,0 +1,75 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Small policies (a few MB) with the same features, to test the loading and conversions of the weights."""
+
+import torch
+
+from lerobot.configs.types import FeatureType, PolicyFeature
+from lerobot.policies.act.configuration_act import ACTConfig
+from lerobot.policies.act.modeling_act import ACTPolicy
+from lerobot.policies.diffusion.configuration_diffusion import DiffusionConfig
+from lerobot.policies.diffusion.modeling_diffusion import DiffusionPolicy
+from lerobot.policies.pretrained import PreTrainedPolicy
+from lerobot.policies.vqbet.configuration_vqbet import VQBeTConfig
+from lerobot.policies.vqbet.modeling_vqbet import VQBeTPolicy
+from lerobot.utils.constants import ACTION, OBS_IMAGE, OBS_STATE
+from lerobot.utils.random_utils import set_seed
+
+SMALL_POLICY_FEATURES = {
+    "input_features": {
+        OBS_STATE: PolicyFeature(type=FeatureType.STATE, shape=(2,)),
+        OBS_IMAGE: PolicyFeature(type=FeatureType.VISUAL, shape=(3, 64, 64)),
+    },
+    "output_features": {ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(2,))},
+    "device": "cpu",
+}
+
+SMALL_POLICIES = {
+    "act": lambda: ACTPolicy(
+        ACTConfig(pretrained_backbone_weights=None, dim_model=64, **SMALL_POLICY_FEATURES)
+    ),
+    "diffusion": lambda: DiffusionPolicy(
+        DiffusionConfig(
+            crop_shape=(56, 56),
+            horizon=8,
+            n_action_steps=4,
+            down_dims=(16, 32),
+            noise_scheduler_type="DDIM",
+            num_inference_steps=3,
+            **SMALL_POLICY_FEATURES,
+        )
+    ),
+    "vqbet": lambda: VQBeTPolicy(
+        VQBeTConfig(
+            crop_shape=(56, 56), gpt_n_layer=2, gpt_hidden_dim=64, gpt_input_dim=64, **SMALL_POLICY_FEATURES
+        )
+    ),
+}
+
+
+def make_small_policy(name: str) -> PreTrainedPolicy:
+    set_seed(0)
+    return SMALL_POLICIES[name]().eval()
+
+
+def select_small_policy_action(policy: PreTrainedPolicy) -> torch.Tensor:
+    """Select an action for a fixed observation, with a fixed seed for the sampling policies."""
+    generator = torch.Generator().manual_seed(0)
+    batch = {
+        OBS_STATE: torch.randn(1, 2, generator=generator),
+        OBS_IMAGE: torch.rand(1, 3, 64, 64, generator=generator),
+    }
+    policy.reset()
+    torch.manual_seed(0)
+    return policy.select_action(batch)
@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+import pytest
+
+from lerobot.motors import Motor, MotorNormMode
+from lerobot.motors.dynamixel import DynamixelMotorsBus
+from lerobot.motors.feetech import FeetechMotorsBus
+from lerobot.motors.simulated_bus import LinkModel, _crc16, simulate_bus
+
+try:
+    import dynamixel_sdk as dxl
+    import scservo_sdk  # noqa: F401
+except (ImportError, ModuleNotFoundError):
+    pytest.skip("dynamixel_sdk or scservo_sdk not available", allow_module_level=True)
+
+BUSES = {
+    "feetech": (FeetechMotorsBus, "sts3215"),
+    "dynamixel": (DynamixelMotorsBus, "xl430-w250"),
+}
+
+
+def make_bus(name: str, num_motors: int = 3):
+    bus_cls, model = BUSES[name]
+    motors = {f"motor_{i}": Motor(i, model, MotorNormMode.RANGE_M100_100) for i in range(1, num_motors + 1)}
+    return bus_cls("/dev/simulated", motors)
+
+
+@pytest.fixture(params=list(BUSES))
+def bus_name(request):
+    return request.param
+
+
+def test_crc_matches_sdk():
+    packet = [0xFF, 0xFF, 0xFD, 0x00, 0x01, 0x07, 0x00, 0x02, 0x84, 0x00, 0x04, 0x00]
+    expected = dxl.PacketHandler(2.0).updateCRC(0, packet, len(packet))
+    assert _crc16(bytes(packet)) == expected
+
+
+def test_connect_and_ping(bus_name):
+    bus = make_bus(bus_name)
+    simulator = simulate_bus(bus)
+    bus.connect()
+
+    expected_model = bus.model_number_table[BUSES[bus_name][1]]
+    assert bus.is_connected
+    assert bus.ping("motor_2") == expected_model
+    assert bus.broadcast_ping() == dict.fromkeys([1, 2, 3], expected_model)
+    assert simulator.stats().instructions > 0
+
+    bus.disconnect()
+    assert not bus.is_connected
+
+
+def test_sync_read_write(bus_name):
+    bus = make_bus(bus_name)
+    simulator = simulate_bus(bus, max_velocity=1e6)
+    bus.connect()
+
+    positions = bus.sync_read("Present_Position", normalize=False)
+    assert positions == dict.fromkeys(bus.motors, 2048)
+
+    bus.enable_torque()
+    goals = {"motor_1": 1000, "motor_2": 2000, "motor_3": 3000}
+    bus.sync_write("Goal_Position", goals, normalize=False)
+    time.sleep(0.01)
+
+    assert bus.sync_read("Present_Position", normalize=False) == goals
+    assert simulator.motor(3).position == pytest.approx(3000)
+    bus.disconnect()
+
+
+def test_position_dynamics(bus_name):
+    bus = make_bus(bus_name, num_motors=1)
+    simulate_bus(bus, max_velocity=1000)
+    bus.connect()
+    bus.enable_torque()
+
+    bus.write("Goal_Position", "motor_1", 2548, normalize=False)
+    time.sleep(0.1)
+    moving_position = bus.read("Present_Position", "motor_1", normalize=False)
+    assert 2048 < moving_position < 2548
+    assert bus.read("Moving", "motor_1") == 1
+
+    time.sleep(0.5)
+    assert bus.read("Present_Position", "motor_1", normalize=False) == 2548
+    assert bus.read("Moving", "motor_1") == 0
+    bus.disconnect()
+
+
+def test_homing_offset_and_signed_values(bus_name):
+    bus = make_bus(bus_name, num_motors=1)
+    simulator = simulate_bus(bus)
+    bus.connect()
+
+    bus.write("Homing_Offset", "motor_1", -100, normalize=False)
+    assert bus.read("Homing_Offset", "motor_1", normalize=False) == -100
+    sign = -1 if bus_name == "feetech" else 1
+    assert bus.read("Present_Position", "motor_1", normalize=False) == 2048 - sign * 100
+    assert simulator.motor(1).position == 2048
+    bus.disconnect()
+
+
+def test_write_id(bus_name):
+    bus = make_bus(bus_name, num_motors=1)
+    simulator = simulate_bus(bus)
+    bus.connect()
+    bus.disable_torque()
+
+    bus.write("ID", "motor_1", 7)
+
+    assert simulator.motor(7) is not None
+    assert bus.ping(7) is not None
+    assert bus.ping(1) is None
+    bus.disconnect(disable_torque=False)
+
+
+def test_baudrate_mismatch(bus_name):
+    bus = make_bus(bus_name, num_motors=1)
+    simulate_bus(bus)
+    bus.connect()
+
+    bus.set_baudrate(57_600)
+    assert bus.ping("motor_1") is None
+    bus.set_baudrate(bus.default_baudrate)
+    assert bus.ping("motor_1") is not None
+    bus.disconnect()
+
+
+def test_transfer_time_follows_baudrate(bus_name):
+    bus = make_bus(bus_name, num_motors=6)
+    simulate_bus(bus, LinkModel(usb_latency_ms=0, processing_us=0))
+    bus.connect()
+    bus.configure_motors()
+
+    start = time.perf_counter()
+    bus.sync_read("Present_Position", normalize=False)
+    elapsed_s = time.perf_counter() - start
+
+    # One instruction and six status packets of at least 8 bytes, at 10 bits per byte
+    assert elapsed_s > (6 + 1) * 8 * 10 / bus.default_baudrate
+    bus.disconnect()
+
+
+def test_packet_loss(bus_name):
+    bus = make_bus(bus_name)
+    simulator = simulate_bus(bus)
+    bus.connect()
+    simulator.link.loss_rate = 1.0
+
+    with pytest.raises(ConnectionError):
+        bus.sync_read("Present_Position")
+    assert simulator.stats().lost_packets > 0
+    bus.disconnect(disable_torque=False)
+
+
+def test_packet_corruption(bus_name):
+    bus = make_bus(bus_name)
+    simulator = simulate_bus(bus, LinkModel(seed=0))
+    bus.connect()
+    simulator.link.corruption_rate = 1.0
+
+    with pytest.raises(ConnectionError):
+        bus.sync_read("Present_Position")
+    assert simulator.stats().corrupted_packets > 0
+    bus.disconnect(disable_torque=False)
+
+
+def test_invalid_link_model():
+    with pytest.raises(ValueError):
+        LinkModel(loss_rate=1.5)
+    with pytest.raises(ValueError):
+        LinkModel(usb_latency_ms=-1)
+
+
+def test_simulate_connected_bus_raises():
+    bus = make_bus("feetech")
+    simulate_bus(bus)
+    bus.connect()
+    with pytest.raises(RuntimeError):
+        simulate_bus(bus)
+    bus.disconnect()
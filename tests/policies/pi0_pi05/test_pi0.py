@@ -129,3 +129,77 @@ def test_config_creation():
     except Exception as e:
         print(f"Config creation failed: {e}")
         raise
+
+
+@require_cuda
+def test_sdpa_attention():
+    """Test that the SDPA attention backend gives the same actions as the eager one."""
+    from lerobot.configs.types import FeatureType, PolicyFeature
+
+    set_seed(42)
+    config = PI0Config(max_action_dim=7, max_state_dim=14, dtype="float32")
+    config.input_features = {
+        "observation.state": PolicyFeature(type=FeatureType.STATE, shape=(14,)),
+        "observation.images.base_0_rgb": PolicyFeature(type=FeatureType.VISUAL, shape=(3, 224, 224)),
+    }
+    config.output_features = {"action": PolicyFeature(type=FeatureType.ACTION, shape=(7,))}
+    policy = PI0Policy(config)
+    preprocessor, _ = make_pi0_pre_post_processors(config=config, dataset_stats=None)
+    device = config.device
+    batch = preprocessor(
+        {
+            "observation.state": torch.randn(1, 14, device=device),
+            "observation.images.base_0_rgb": torch.rand(1, 3, 224, 224, device=device),
+            "task": ["Pick up the object"],
+        }
+    )
+
+    actions = {}
+    for attention_implementation in ["eager", "sdpa"]:
+        policy.config.attention_implementation = attention_implementation
+        set_seed(0)
+        actions[attention_implementation] = policy.predict_action_chunk(batch)
+    torch.testing.assert_close(actions["sdpa"], actions["eager"], rtol=1e-4, atol=1e-4)
+
+
+@require_cuda
+def test_language_cache():
+    """Test that the language embeddings cached by task give the same actions, and are invalidated."""
+    from lerobot.configs.types import FeatureType, PolicyFeature
+
+    set_seed(42)
+    config = PI0Config(max_action_dim=7, max_state_dim=14, dtype="float32")
+    config.input_features = {
+        "observation.state": PolicyFeature(type=FeatureType.STATE, shape=(14,)),
+        "observation.images.base_0_rgb": PolicyFeature(type=FeatureType.VISUAL, shape=(3, 224, 224)),
+    }
+    config.output_features = {"action": PolicyFeature(type=FeatureType.ACTION, shape=(7,))}
+    policy = PI0Policy(config)
+    preprocessor, _ = make_pi0_pre_post_processors(config=config, dataset_stats=None)
+    device = config.device
+    batch = preprocessor(
+        {
+            "observation.state": torch.randn(1, 14, device=device),
+            "observation.images.base_0_rgb": torch.rand(1, 3, 224, 224, device=device),
+            "task": ["Pick up the object"],
+        }
+    )
+
+    actions = []
+    for _ in range(2):
+        set_seed(0)
+        actions.append(policy.predict_action_chunk(batch))
+    assert len(policy.model._language_cache) == 1
+
+    uncached_batch = {key: value for key, value in batch.items() if key != "task"}
+    set_seed(0)
+    uncached = policy.predict_action_chunk(uncached_batch)
+    torch.testing.assert_close(actions[0], uncached)
+    torch.testing.assert_close(actions[1], uncached)
+
+    # New weights invalidate the cached embeddings
+    policy.load_state_dict(policy.state_dict())
+    assert len(policy.model._language_cache) == 0
+    policy.predict_action_chunk(batch)
+    policy.train()
+    assert len(policy.model._language_cache) == 0
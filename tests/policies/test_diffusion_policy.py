@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import torch
+
+from lerobot.configs.types import FeatureType, PolicyFeature
+from lerobot.policies.diffusion.configuration_diffusion import DiffusionConfig
+from lerobot.policies.diffusion.modeling_diffusion import DiffusionPolicy
+from lerobot.utils.constants import ACTION, OBS_STATE
+from lerobot.utils.random_utils import set_seed
+
+CAMERAS = ["observation.images.top", "observation.images.wrist"]
+
+
+def _make_policy(cache_image_features: bool, separate_encoders: bool) -> DiffusionPolicy:
+    set_seed(0)
+    config = DiffusionConfig(
+        input_features={
+            OBS_STATE: PolicyFeature(type=FeatureType.STATE, shape=(2,)),
+            **{key: PolicyFeature(type=FeatureType.VISUAL, shape=(3, 32, 32)) for key in CAMERAS},
+        },
+        output_features={ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(2,))},
+        n_obs_steps=3,
+        horizon=8,
+        n_action_steps=2,
+        crop_shape=(28, 28),
+        down_dims=(16, 32),
+        # DDIM sampling is deterministic given the initial noise, unlike DDPM
+        noise_scheduler_type="DDIM",
+        num_inference_steps=3,
+        use_separate_rgb_encoder_per_camera=separate_encoders,
+        cache_image_features=cache_image_features,
+        device="cpu",
+    )
+    return DiffusionPolicy(config).eval()
+
+
+@pytest.mark.parametrize("separate_encoders", [False, True])
+def test_cache_image_features(separate_encoders):
+    cached = _make_policy(cache_image_features=True, separate_encoders=separate_encoders)
+    uncached = _make_policy(cache_image_features=False, separate_encoders=separate_encoders)
+    uncached.load_state_dict(cached.state_dict())
+
+    encoded_images = []
+    original_encode = cached.diffusion.encode_images
+
+    def encode_images(images):
+        encoded_images.append(images.shape[1])
+        return original_encode(images)
+
+    cached.diffusion.encode_images = encode_images
+
+    generator = torch.Generator().manual_seed(0)
+    for _ in range(6):
+        batch = {
+            OBS_STATE: torch.randn(1, 2, generator=generator),
+            **{key: torch.rand(1, 3, 32, 32, generator=generator) for key in CAMERAS},
+        }
+        noise = torch.randn(1, 8, 2, generator=generator)
+        torch.testing.assert_close(
+            cached.select_action(dict(batch), noise=noise.clone()),
+            uncached.select_action(dict(batch), noise=noise.clone()),
+            rtol=1e-4,
+            atol=1e-5,
+        )
+
+    # Each frame is encoded once, when it enters the observation history
+    assert encoded_images == [1] * 6
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from types import SimpleNamespace
+
+import pytest
+import torch
+
+pytest.importorskip("transformers")
+
+from lerobot.policies.flow_matching import make_denoising_times  # noqa: E402
+from lerobot.policies.rtc import make_inpainting  # noqa: E402
+from lerobot.policies.smolvla.modeling_smolvla import VLAFlowMatching  # noqa: E402
+from tests.utils import require_cuda  # noqa: E402
+
+
+def _reference_loop(denoise_step, noise, num_steps):
+    """The Euler integration of the flow matching policies, before the denoising loop could be compiled."""
+    dt = torch.tensor(-1.0 / num_steps, dtype=torch.float32)
+    x_t = noise
+    time = torch.tensor(1.0, dtype=torch.float32)
+    while time >= -dt / 2:
+        x_t = x_t + dt * denoise_step(None, None, x_t, time.expand(noise.shape[0]))
+        time += dt
+    return x_t
+
+
+@pytest.mark.parametrize("num_steps", [1, 3, 10])
+def test_make_denoising_times(num_steps):
+    times = make_denoising_times(num_steps, 2, "cpu")
+
+    assert times.shape == (num_steps, 2)
+    assert times[0, 0] == 1.0
+    assert (times[:-1] > times[1:]).all()
+
+
+def test_compiled_denoise_loop():
+    def denoise_step(prefix_pad_masks, past_key_values, x_t, timestep, suffix_attention=None):
+        return torch.sin(x_t) * timestep[:, None, None] - x_t
+
+    model = SimpleNamespace(denoise_step=denoise_step)
+    noise = torch.randn(2, 5, 3, generator=torch.Generator().manual_seed(0))
+    times = make_denoising_times(10, 2, "cpu")
+
+    def denoise_loop(noise, times):
+        return VLAFlowMatching.denoise_loop(model, None, None, noise, times, None)
+
+    expected = _reference_loop(denoise_step, noise, 10)
+    torch.testing.assert_close(denoise_loop(noise, times), expected, rtol=0, atol=0)
+    # The whole loop is captured as a single graph
+    compiled = torch.compile(denoise_loop, fullgraph=True, dynamic=False, backend="eager")
+    torch.testing.assert_close(compiled(noise, times), expected)
+
+
+@require_cuda
+def test_compiled_denoise_loop_cuda_graphs():
+    def denoise_step(prefix_pad_masks, past_key_values, x_t, timestep, suffix_attention=None):
+        return torch.sin(x_t) * timestep[:, None, None] - x_t
+
+    model = SimpleNamespace(denoise_step=denoise_step)
+    noise = torch.randn(2, 5, 3, generator=torch.Generator().manual_seed(0)).cuda()
+    times = make_denoising_times(10, 2, "cuda")
+
+    def denoise_loop(noise, times):
+        return VLAFlowMatching.denoise_loop(model, None, None, noise, times, None)
+
+    expected = _reference_loop(denoise_step, noise, 10)
+    # As with `compile_denoising`: the first calls compile the loop and record the CUDA graph, the next ones
+    # replay it. The outputs of a CUDA graph are overwritten by the next replay, so they are copied.
+    compiled = torch.compile(denoise_loop, mode="reduce-overhead", dynamic=False)
+    outputs = [compiled(noise, times).clone() for _ in range(5)]
+    for output in outputs:
+        torch.testing.assert_close(output, expected)
+        torch.testing.assert_close(output, outputs[0], rtol=0, atol=0)
+
+
+def test_denoise_loop_inpainting():
+    def denoise_step(prefix_pad_masks, past_key_values, x_t, timestep, suffix_attention=None):
+        return torch.sin(x_t) * timestep[:, None, None] - x_t
+
+    model = SimpleNamespace(denoise_step=denoise_step)
+    noise = torch.randn(2, 8, 3, generator=torch.Generator().manual_seed(0))
+    times = make_denoising_times(10, 2, "cpu")
+    prev_chunk = torch.randn(2, 5, 2, generator=torch.Generator().manual_seed(1))
+    inpainting = make_inpainting(prev_chunk, 2, chunk_size=8, action_dim=3)
+
+    free = VLAFlowMatching.denoise_loop(model, None, None, noise, times, None)
+    guided = VLAFlowMatching.denoise_loop(model, None, None, noise, times, None, inpainting)
+
+    # The actions executed during the inference are those of the previous chunk, the actions after the
+    # overlap are not guided
+    torch.testing.assert_close(guided[:, :2, :2], prev_chunk[:, :2])
+    torch.testing.assert_close(guided[:, 5:], free[:, 5:])
+    # The overlapping actions are pulled towards the previous chunk
+    assert (guided[:, 2:5, :2] - prev_chunk[:, 2:]).abs().sum() < (
+        free[:, 2:5, :2] - prev_chunk[:, 2:]
+    ).abs().sum()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+import pytest
+import torch
+from huggingface_hub import save_torch_state_dict
+from safetensors.torch import save_file
+from torch import nn
+
+from lerobot.policies.act.modeling_act import ACTPolicy
+from lerobot.policies.lazy_loading import (
+    check_checkpoint_keys,
+    empty_parameters,
+    init_empty_weights,
+    load_state_dict_lazily,
+)
+from tests.fixtures.policies import make_small_policy, select_small_policy_action
+
+
+class TiedModel(nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.embedding = nn.Embedding(4, 3)
+        self.head = nn.Linear(3, 4, bias=False)
+        self.head.weight = self.embedding.weight
+        self.norm = nn.LayerNorm(3).to(torch.float64)
+        self.register_buffer("scale", torch.full((3,), 2.0))
+        self.register_buffer("positions", torch.arange(4), persistent=False)
+
+
+def test_init_empty_weights():
+    with init_empty_weights():
+        model = TiedModel()
+
+    assert empty_parameters(model) == ["embedding.weight", "norm.weight", "norm.bias"]
+    assert model.head.weight is model.embedding.weight
+    assert model.norm.weight.dtype == torch.float64
+    torch.testing.assert_close(model.positions, torch.arange(4))
+    assert not empty_parameters(nn.Linear(2, 2))
+
+
+def test_init_empty_weights_threads():
+    register_parameter = nn.Module.register_parameter
+    models = []
+
+    def build():
+        for _ in range(20):
+            with init_empty_weights():
+                models.append(TiedModel())
+
+    threads = [threading.Thread(target=build) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(len(empty_parameters(model)) == 3 for model in models)
+    # The concurrent contexts must not leave the patch in place
+    assert nn.Module.register_parameter is register_parameter
+    assert not empty_parameters(nn.Linear(2, 2))
+
+
+def test_load_state_dict_lazily(tmp_path):
+    expected = TiedModel()
+    state_dict = {k: v for k, v in expected.state_dict().items() if k != "head.weight"}
+    save_file({k: v.float() for k, v in state_dict.items()}, tmp_path / "model.safetensors")
+    with init_empty_weights():
+        model = TiedModel()
+
+    missing_keys, unexpected_keys = load_state_dict_lazily(
+        model, [str(tmp_path / "model.safetensors")], "cpu"
+    )
+
+    assert missing_keys == []
+    assert unexpected_keys == []
+    assert not empty_parameters(model)
+    assert model.head.weight is model.embedding.weight
+    assert model.norm.weight.dtype == torch.float64
+    for key, value in expected.state_dict().items():
+        torch.testing.assert_close(model.state_dict()[key], value, msg=key)
+
+
+def test_load_state_dict_lazily_key_map(tmp_path):
+    expected = TiedModel()
+    state_dict = {f"old.{k}": v for k, v in expected.state_dict().items() if k != "head.weight"}
+    state_dict["old.extra"] = torch.zeros(1)
+    save_file(state_dict, tmp_path / "model.safetensors")
+    key_map = {key: key.removeprefix("old.") for key in state_dict if key != "old.scale"}
+    with init_empty_weights():
+        model = TiedModel()
+
+    missing_keys, unexpected_keys = load_state_dict_lazily(
+        model, [str(tmp_path / "model.safetensors")], "cpu", key_map
+    )
+
+    assert missing_keys == ["scale"]
+    assert unexpected_keys == ["old.extra"]
+    assert check_checkpoint_keys(TiedModel(), [str(tmp_path / "model.safetensors")], key_map) == (
+        missing_keys,
+        unexpected_keys,
+    )
+    torch.testing.assert_close(model.embedding.weight, expected.embedding.weight)
+
+
+@pytest.mark.parametrize("name", ["act", "diffusion"])
+def test_from_pretrained_lazy_load(name, tmp_path):
+    policy = make_small_policy(name)
+    expected = select_small_policy_action(policy)
+    policy.save_pretrained(tmp_path)
+
+    loaded = type(policy).from_pretrained(tmp_path, strict=True, lazy_load=True)
+
+    assert not empty_parameters(loaded)
+    assert not loaded.training
+    for key, value in policy.state_dict().items():
+        torch.testing.assert_close(loaded.state_dict()[key], value, msg=key)
+    torch.testing.assert_close(select_small_policy_action(loaded), expected)
+
+
+def test_from_pretrained_lazy_load_sharded(tmp_path):
+    policy = make_small_policy("act")
+    policy.config._save_pretrained(tmp_path)
+    save_torch_state_dict(policy.state_dict(), tmp_path, max_shard_size=1024 * 1024)
+    assert len(list(tmp_path.glob("*.safetensors"))) > 1
+
+    loaded = ACTPolicy.from_pretrained(tmp_path, strict=True, lazy_load=True)
+
+    for key, value in policy.state_dict().items():
+        torch.testing.assert_close(loaded.state_dict()[key], value, msg=key)
+
+
+def test_from_pretrained_lazy_load_missing_parameters(tmp_path, monkeypatch):
+    # The missing parameters are found before any weight of the checkpoint is read
+    monkeypatch.setattr("lerobot.policies.pretrained.load_state_dict_lazily", None)
+    policy = make_small_policy("act")
+    policy.config._save_pretrained(tmp_path)
+    state_dict = {k: v for k, v in policy.state_dict().items() if not k.startswith("model.action_head.")}
+    save_file(state_dict, tmp_path / "model.safetensors")
+
+    with pytest.raises(RuntimeError, match="missing keys"):
+        ACTPolicy.from_pretrained(tmp_path, strict=True, lazy_load=True)
+
+    # The parameters missing from the checkpoint keep their regular initialization
+    loaded = ACTPolicy.from_pretrained(tmp_path, lazy_load=True)
+    assert not empty_parameters(loaded)
+    torch.testing.assert_close(
+        loaded.model.encoder_img_feat_input_proj.weight, policy.model.encoder_img_feat_input_proj.weight
+    )
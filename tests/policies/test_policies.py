@@ -256,6 +256,32 @@ def test_policy_defaults(dummy_dataset_metadata, policy_name: str):
     policy_cls(policy_cfg)
 
 
+def test_make_pre_post_processors_compile_pipelines():
+    config = ACTConfig(
+        input_features={OBS_STATE: PolicyFeature(type=FeatureType.STATE, shape=(2,))},
+        output_features={ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(2,))},
+        device="cpu",
+    )
+    stats = {
+        OBS_STATE: {"mean": torch.tensor([1.0, -1.0]), "std": torch.tensor([2.0, 0.5])},
+        ACTION: {"mean": torch.tensor([0.5, 0.0]), "std": torch.tensor([1.0, 4.0])},
+    }
+    preprocessor, postprocessor = make_pre_post_processors(config, dataset_stats=stats)
+    compiled_preprocessor, compiled_postprocessor = make_pre_post_processors(
+        config, dataset_stats=stats, compile_pipelines=True
+    )
+    assert preprocessor._compiled_steps is None
+    assert compiled_preprocessor._compiled_steps is not None
+    assert compiled_postprocessor._compiled_steps is not None
+
+    batch = {OBS_STATE: torch.randn(4, 2), ACTION: torch.randn(4, 2)}
+    expected = preprocessor(dict(batch))
+    result = compiled_preprocessor(dict(batch))
+    for key in (OBS_STATE, ACTION):
+        torch.testing.assert_close(result[key], expected[key])
+    torch.testing.assert_close(compiled_postprocessor(batch[ACTION]), postprocessor(batch[ACTION]))
+
+
 @pytest.mark.parametrize("policy_name", available_policies)
 def test_save_and_load_pretrained(dummy_dataset_metadata, tmp_path, policy_name: str):
     policy_cls = get_policy_class(policy_name)
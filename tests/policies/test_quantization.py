@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import torch
+from torch import nn
+from torch.ao.nn.quantized.dynamic import Linear as DynamicQuantizedLinear
+
+from lerobot.policies.act.modeling_act import ACTPolicy
+from lerobot.policies.quantization import get_quantization, quantize_policy
+from tests.fixtures.policies import SMALL_POLICIES, make_small_policy, select_small_policy_action
+
+
+@pytest.mark.parametrize("name", list(SMALL_POLICIES))
+def test_quantize_policy(name):
+    policy = make_small_policy(name)
+    assert get_quantization(policy) is None
+
+    quantize_policy(policy, channels_last=True)
+
+    assert get_quantization(policy) == "dynamic_int8"
+    assert not any(type(module) is nn.Linear for module in policy.modules())
+    assert any(isinstance(module, DynamicQuantizedLinear) for module in policy.modules())
+    assert select_small_policy_action(policy).shape == (1, 2)
+
+
+@pytest.mark.parametrize("name", list(SMALL_POLICIES))
+def test_save_and_load_quantized(name, tmp_path):
+    policy = quantize_policy(make_small_policy(name))
+    expected = select_small_policy_action(policy)
+    policy.save_pretrained(tmp_path)
+
+    loaded = type(policy).from_pretrained(tmp_path, strict=True)
+
+    assert get_quantization(loaded) == "dynamic_int8"
+    torch.testing.assert_close(select_small_policy_action(loaded), expected)
+
+
+def test_from_pretrained_quantize(tmp_path):
+    policy = make_small_policy("act")
+    policy.save_pretrained(tmp_path)
+
+    loaded = ACTPolicy.from_pretrained(tmp_path, quantize="dynamic_int8")
+
+    assert get_quantization(loaded) == "dynamic_int8"
+    expected = quantize_policy(policy)
+    for (name, module), (_, loaded_module) in zip(
+        expected.named_modules(), loaded.named_modules(), strict=True
+    ):
+        if isinstance(module, DynamicQuantizedLinear):
+            torch.testing.assert_close(loaded_module.weight(), module.weight(), msg=name)
+
+
+def test_quantize_policy_invalid_mode():
+    with pytest.raises(ValueError, match="Unknown quantization mode"):
+        quantize_policy(nn.Linear(2, 2), "int4")
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import torch
+
+from lerobot.policies.rtc import guide_velocity, make_inpainting, make_inpainting_weights
+
+
+@pytest.mark.parametrize("prefix_len, inference_delay", [(10, 0), (10, 3), (4, 4), (30, 5)])
+def test_make_inpainting_weights(prefix_len, inference_delay):
+    chunk_size = 20
+    weights = make_inpainting_weights(prefix_len, inference_delay, chunk_size)
+    prefix_len = min(prefix_len, chunk_size)
+
+    assert weights.shape == (chunk_size,)
+    assert (weights[:inference_delay] == 1).all()
+    assert (weights[prefix_len:] == 0).all()
+    assert (weights[inference_delay:prefix_len] < 1).all()
+    assert (weights[inference_delay:prefix_len] > 0).all()
+    assert (weights[:-1] >= weights[1:]).all()
+
+
+def test_make_inpainting():
+    prev_chunk = torch.randn(2, 6, 3)
+    target, weights = make_inpainting(prev_chunk, 2, chunk_size=8, action_dim=5)
+
+    assert target.shape == (2, 8, 5)
+    torch.testing.assert_close(target[:, :6, :3], prev_chunk)
+    assert (target[:, 6:] == 0).all()
+    assert (target[:, :, 3:] == 0).all()
+    torch.testing.assert_close(weights, make_inpainting_weights(6, 2, 8))
+
+
+def test_guide_velocity_last_step():
+    """An Euler step to time 0 with the guided velocity lands on the targets weighted by the guidance weights."""
+    x_t = torch.randn(2, 4, 3)
+    v_t = torch.randn(2, 4, 3)
+    target = torch.randn(2, 4, 3)
+    weights = torch.tensor([1.0, 0.5, 0.2, 0.0])
+    time = torch.full((2,), 0.25)
+
+    denoised = x_t - 0.25 * v_t
+    guided = x_t - 0.25 * guide_velocity(x_t, v_t, time, target, weights)
+
+    torch.testing.assert_close(guided, denoised + weights[:, None] * (target - denoised))
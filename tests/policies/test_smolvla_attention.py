@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from types import SimpleNamespace
+
+import pytest
+import torch
+
+pytest.importorskip("transformers")
+
+from lerobot.policies.smolvla.modeling_smolvla import make_att_2d_masks  # noqa: E402
+from lerobot.policies.smolvla.smolvlm_with_expert import SmolVLMWithExpertModel  # noqa: E402
+
+BATCH_SIZE, HEAD_DIM, NUM_HEADS, NUM_KV_HEADS = 2, 16, 6, 2
+
+
+@pytest.mark.parametrize("query_len", [14, 4])
+def test_sdpa_matches_eager_attention(query_len):
+    # Only the attention heads are needed to call the attention functions
+    model = SimpleNamespace(num_attention_heads=NUM_HEADS, num_key_value_heads=NUM_KV_HEADS)
+    generator = torch.Generator().manual_seed(0)
+    key_len = 14
+
+    # A prefix with padding in the second sample, then a causal block, as in SmolVLA
+    pad_masks = torch.ones(BATCH_SIZE, key_len, dtype=torch.bool)
+    pad_masks[1, 7:10] = False
+    att_masks = torch.tensor([0] * 10 + [1] * 4).expand(BATCH_SIZE, key_len)
+    attention_mask = make_att_2d_masks(pad_masks, att_masks)[:, -query_len:]
+
+    query = torch.randn(BATCH_SIZE, query_len, NUM_HEADS, HEAD_DIM, generator=generator)
+    key = torch.randn(BATCH_SIZE, key_len, NUM_KV_HEADS, HEAD_DIM, generator=generator)
+    value = torch.randn(BATCH_SIZE, key_len, NUM_KV_HEADS, HEAD_DIM, generator=generator)
+    args = (attention_mask, BATCH_SIZE, HEAD_DIM, query, key, value)
+    eager = SmolVLMWithExpertModel.eager_attention_forward(model, *args)
+    sdpa = SmolVLMWithExpertModel.sdpa_attention_forward(model, *args)
+
+    assert sdpa.shape == eager.shape == (BATCH_SIZE, query_len, NUM_HEADS * HEAD_DIM)
+    # The padding tokens attend to nothing: their outputs differ, but are finite
+    attends = attention_mask.any(dim=-1)
+    torch.testing.assert_close(sdpa[attends], eager[attends], rtol=1e-5, atol=1e-5)
+    assert torch.isfinite(sdpa).all()
@@ -18,8 +18,13 @@ import tempfile
 import pytest
 import torch
 
-from lerobot.configs.types import FeatureType, PipelineFeatureType, PolicyFeature
-from lerobot.processor import DataProcessorPipeline, DeviceProcessorStep, TransitionKey
+from lerobot.configs.types import FeatureType, NormalizationMode, PipelineFeatureType, PolicyFeature
+from lerobot.processor import (
+    DataProcessorPipeline,
+    DeviceProcessorStep,
+    NormalizerProcessorStep,
+    TransitionKey,
+)
 from lerobot.processor.converters import create_transition, identity_transition
 from lerobot.utils.constants import ACTION, OBS_IMAGE, OBS_STATE
 
@@ -1156,3 +1161,107 @@ def test_mps_serialization():
     # Test load_state_dict (should be no-op)
     processor.load_state_dict({})
     assert processor.device == "mps"
+
+
+def test_compiled_pipeline_with_normalizer():
+    """Test that device and normalization steps folded by `compile` match the step-by-step execution."""
+    features = {
+        OBS_STATE: PolicyFeature(FeatureType.STATE, (2,)),
+        ACTION: PolicyFeature(FeatureType.ACTION, (2,)),
+    }
+    norm_map = {FeatureType.STATE: NormalizationMode.MEAN_STD, FeatureType.ACTION: NormalizationMode.MIN_MAX}
+    stats = {
+        OBS_STATE: {"mean": [0.5, 1.0], "std": [2.0, 0.5]},
+        ACTION: {"min": [-1.0, 0.0], "max": [1.0, 2.0]},
+    }
+    pipeline = DataProcessorPipeline(
+        [
+            DeviceProcessorStep(device="cpu", float_dtype="float64"),
+            NormalizerProcessorStep(features=features, norm_map=norm_map, stats=stats),
+        ],
+        to_transition=identity_transition,
+        to_output=identity_transition,
+    )
+    transition = create_transition(
+        observation={OBS_STATE: torch.randn(3, 2), "observation.index": torch.tensor([1, 2, 3])},
+        action=torch.randn(3, 2),
+        reward=torch.tensor(1.0, dtype=torch.float32),
+        complementary_data={"index": torch.tensor([0.5])},
+    )
+
+    expected = pipeline(transition)
+    result = pipeline.compile()(transition)
+
+    assert len(pipeline._compiled_steps) == 1
+    for key in [OBS_STATE, "observation.index"]:
+        assert result[TransitionKey.OBSERVATION][key].dtype == expected[TransitionKey.OBSERVATION][key].dtype
+        torch.testing.assert_close(
+            result[TransitionKey.OBSERVATION][key], expected[TransitionKey.OBSERVATION][key]
+        )
+    torch.testing.assert_close(result[TransitionKey.ACTION], expected[TransitionKey.ACTION])
+    assert result[TransitionKey.REWARD].dtype == torch.float64
+    assert result[TransitionKey.COMPLEMENTARY_DATA]["index"].dtype == torch.float64
+
+
+def test_pinned_transfer_options_are_ignored_on_cpu():
+    processor = DeviceProcessorStep(device="cpu", pin_memory=True, flatten_transfers=True)
+    transition = create_transition(observation={OBS_STATE: torch.randn(4)}, action=torch.randn(2))
+
+    result = processor(transition)
+
+    assert processor.supports_tensor_transform
+    assert result[TransitionKey.OBSERVATION][OBS_STATE] is transition[TransitionKey.OBSERVATION][OBS_STATE]
+    assert processor.get_config() == {
+        "device": "cpu",
+        "float_dtype": None,
+        "pin_memory": True,
+        "flatten_transfers": True,
+    }
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="CUDA not available")
+@pytest.mark.parametrize("flatten_transfers", [False, True])
+def test_pinned_batched_transfer(flatten_transfers):
+    processor = DeviceProcessorStep(
+        device="cuda", float_dtype="float16", pin_memory=True, flatten_transfers=flatten_transfers
+    )
+    observation = {
+        OBS_STATE: torch.randn(2, 6),
+        f"{OBS_IMAGE}.top": torch.rand(2, 3, 32, 32),
+        f"{OBS_IMAGE}.wrist": torch.rand(2, 3, 32, 32).pin_memory(),
+        "observation.index": torch.tensor([3, 4]),
+        "observation.cuda": torch.randn(3).cuda(),
+        "observation.name": "not a tensor",
+    }
+    transition = create_transition(
+        observation=observation,
+        action=torch.randn(2, 6),
+        reward=torch.tensor(1.0),
+        complementary_data={"index": torch.tensor([7])},
+    )
+
+    # Twice, to reuse the staging buffers
+    for _ in range(2):
+        result = processor(transition)
+        for key, value in observation.items():
+            if not isinstance(value, torch.Tensor):
+                assert result[TransitionKey.OBSERVATION][key] == value
+                continue
+            output = result[TransitionKey.OBSERVATION][key]
+            assert output.device.type == "cuda"
+            expected = value.cuda().half() if value.is_floating_point() else value.cuda()
+            torch.testing.assert_close(output, expected)
+        torch.testing.assert_close(
+            result[TransitionKey.ACTION], transition[TransitionKey.ACTION].cuda().half()
+        )
+        assert result[TransitionKey.REWARD].device.type == "cuda"
+        assert result[TransitionKey.COMPLEMENTARY_DATA]["index"].device.type == "cuda"
+
+    # Inputs are left untouched
+    assert transition[TransitionKey.OBSERVATION][OBS_STATE].device.type == "cpu"
+    # Batched transfers are not folded by compiled pipelines
+    assert not processor.supports_tensor_transform
+    pipeline = DataProcessorPipeline(
+        [processor], to_transition=identity_transition, to_output=identity_transition
+    )
+    assert pipeline.compile()._compiled_steps == [processor]
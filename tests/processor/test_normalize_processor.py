@@ -1723,10 +1723,12 @@ def test_dtype_adaptation_bfloat16_input_float32_normalizer():
     result = normalizer(transition)
 
     # Verify that:
-    # 1. Stats were automatically adapted to bfloat16
-    assert normalizer.dtype == torch.bfloat16
+    # 1. Stats keep their configured dtype, the coefficients are cached in bfloat16
+    assert normalizer.dtype == torch.float32
     for stat_tensor in normalizer._tensor_stats[OBS_STATE].values():
-        assert stat_tensor.dtype == torch.bfloat16
+        assert stat_tensor.dtype == torch.float32
+    coefficients = normalizer._affine_cache[(OBS_STATE, False, torch.device("cpu"), torch.bfloat16)]
+    assert all(coefficient.dtype == torch.bfloat16 for coefficient in coefficients)
 
     # 2. Output is in bfloat16
     output_tensor = result[TransitionKey.OBSERVATION][OBS_STATE]
@@ -1740,6 +1742,56 @@ def test_dtype_adaptation_bfloat16_input_float32_normalizer():
     assert torch.allclose(output_tensor, expected, atol=1e-2)  # bfloat16 has lower precision
 
 
+def test_mixed_dtype_inputs_use_cached_coefficients():
+    """Inputs alternating between dtypes reuse one cached coefficient copy per dtype, stats are not moved."""
+    features = {OBS_STATE: PolicyFeature(FeatureType.STATE, (3,))}
+    norm_map = {FeatureType.STATE: NormalizationMode.MIN_MAX}
+    stats = {OBS_STATE: {"min": np.array([0.0, 1.0, 2.0]), "max": np.array([2.0, 1.0, 6.0])}}
+    normalizer = NormalizerProcessorStep(features=features, norm_map=norm_map, stats=stats)
+    tensor_stats = normalizer._tensor_stats[OBS_STATE]
+
+    state = torch.tensor([1.0, 1.0, 3.0])
+    outputs = {}
+    for dtype in (torch.float32, torch.bfloat16, torch.float64, torch.float32, torch.bfloat16):
+        result = normalizer(create_transition(observation={OBS_STATE: state.to(dtype)}))
+        outputs[dtype] = result[TransitionKey.OBSERVATION][OBS_STATE]
+        assert outputs[dtype].dtype == dtype
+
+    assert len(normalizer._affine_cache) == 3
+    assert normalizer._tensor_stats[OBS_STATE] is tensor_stats
+    assert tensor_stats["min"].dtype == torch.float32
+    expected = torch.tensor([0.0, -1.0, -0.5], dtype=torch.float64)
+    torch.testing.assert_close(outputs[torch.float64], expected)
+    torch.testing.assert_close(outputs[torch.float32], expected.float())
+    torch.testing.assert_close(outputs[torch.bfloat16].double(), expected, atol=1e-2, rtol=0)
+
+
+def test_integer_tensors_keep_their_dtype_when_not_normalized():
+    """Integer tensors (e.g. indices or labels) are only cast to float when they are normalized."""
+    features = {
+        OBS_STATE: PolicyFeature(FeatureType.STATE, (3,)),
+        ACTION: PolicyFeature(FeatureType.ACTION, (3,)),
+    }
+    norm_map = {FeatureType.STATE: NormalizationMode.MEAN_STD, FeatureType.ACTION: NormalizationMode.IDENTITY}
+    stats = {
+        OBS_STATE: {"mean": np.zeros(3), "std": np.full(3, 2.0)},
+        ACTION: {"mean": np.zeros(3), "std": np.ones(3)},
+    }
+    normalizer = NormalizerProcessorStep(features=features, norm_map=norm_map, stats=stats)
+    label = torch.tensor([1, 2, 3])
+
+    action = normalizer._apply_transform(label, ACTION, FeatureType.ACTION)
+    assert action.dtype == torch.int64
+    torch.testing.assert_close(action, label)
+    # Without stats, the tensor is not transformed either
+    unknown = normalizer._apply_transform(label, "observation.index", FeatureType.STATE)
+    assert unknown.dtype == torch.int64
+
+    state = normalizer._apply_transform(label, OBS_STATE, FeatureType.STATE)
+    assert state.dtype == torch.float32
+    torch.testing.assert_close(state, torch.tensor([0.5, 1.0, 1.5]), atol=1e-6, rtol=0)
+
+
 def test_stats_override_preservation_in_load_state_dict():
     """
     Test that explicitly provided stats are preserved during load_state_dict.
@@ -2010,11 +2062,14 @@ def test_dtype_adaptation_device_processor_bfloat16_normalizer_float32():
     assert final_tensor.dtype == torch.bfloat16
     assert final_tensor.device.type == str(auto_select_torch_device())
 
-    # Verify normalizer adapted its internal state
-    assert normalizer.dtype == torch.bfloat16
+    # Verify normalizer cached coefficients matching the input, leaving its stats untouched
+    assert normalizer.dtype == torch.float32
     for stat_tensor in normalizer._tensor_stats[OBS_STATE].values():
-        assert stat_tensor.dtype == torch.bfloat16
-        assert stat_tensor.device.type == str(auto_select_torch_device())
+        assert stat_tensor.dtype == torch.float32
+    for coefficients in normalizer._affine_cache.values():
+        for coefficient in coefficients:
+            assert coefficient.dtype == torch.bfloat16
+            assert coefficient.device.type == str(auto_select_torch_device())
 
 
 def test_stats_reconstruction_after_load_state_dict():
@@ -2128,3 +2183,121 @@ def test_stats_reconstruction_after_load_state_dict():
         new_result[TransitionKey.OBSERVATION][OBS_STATE],
     )
     torch.testing.assert_close(original_result[TransitionKey.ACTION], new_result[TransitionKey.ACTION])
+
+
+@pytest.mark.parametrize(
+    "norm_mode,stats",
+    [
+        (NormalizationMode.MEAN_STD, {"mean": [0.5, -1.0], "std": [0.2, 2.0]}),
+        (NormalizationMode.MIN_MAX, {"min": [-1.0, 0.0], "max": [1.0, 0.0]}),
+        (NormalizationMode.QUANTILES, {"q01": [0.1, -2.0], "q99": [0.9, 2.0]}),
+        (NormalizationMode.QUANTILE10, {"q10": [0.2, -1.0], "q90": [0.8, 1.0]}),
+    ],
+)
+def test_compiled_pipeline_matches_step_by_step(norm_mode, stats):
+    features = {
+        OBS_STATE: PolicyFeature(FeatureType.STATE, (2,)),
+        ACTION: PolicyFeature(FeatureType.ACTION, (2,)),
+    }
+    norm_map = {FeatureType.STATE: norm_mode, FeatureType.ACTION: norm_mode}
+    all_stats = {OBS_STATE: stats, ACTION: stats}
+    pipeline = DataProcessorPipeline(
+        [
+            NormalizerProcessorStep(features=features, norm_map=norm_map, stats=all_stats),
+            IdentityProcessorStep(),
+            UnnormalizerProcessorStep(features=features, norm_map=norm_map, stats=all_stats),
+            NormalizerProcessorStep(features=features, norm_map=norm_map, stats=all_stats),
+        ],
+        to_transition=identity_transition,
+        to_output=identity_transition,
+    )
+    transition = create_transition(
+        observation={OBS_STATE: torch.randn(4, 2), "other": torch.ones(3)},
+        action=torch.randn(4, 2),
+        complementary_data={"task": ["a"] * 4},
+    )
+
+    expected = pipeline(transition)
+    pipeline.compile()
+    result = pipeline(transition)
+
+    torch.testing.assert_close(
+        result[TransitionKey.OBSERVATION][OBS_STATE], expected[TransitionKey.OBSERVATION][OBS_STATE]
+    )
+    torch.testing.assert_close(result[TransitionKey.ACTION], expected[TransitionKey.ACTION])
+    assert result[TransitionKey.OBSERVATION]["other"] is transition[TransitionKey.OBSERVATION]["other"]
+    assert result[TransitionKey.COMPLEMENTARY_DATA] == {"task": ["a"] * 4}
+    # Inputs are left untouched
+    assert (
+        transition[TransitionKey.OBSERVATION][OBS_STATE] is not result[TransitionKey.OBSERVATION][OBS_STATE]
+    )
+
+
+def test_compiled_pipeline_folds_consecutive_tensor_steps():
+    features = {OBS_STATE: PolicyFeature(FeatureType.STATE, (2,))}
+    norm_map = {FeatureType.STATE: NormalizationMode.MEAN_STD}
+    stats = {OBS_STATE: {"mean": [1.0, 2.0], "std": [2.0, 4.0]}}
+    normalizer = NormalizerProcessorStep(features=features, norm_map=norm_map, stats=stats)
+    unnormalizer = UnnormalizerProcessorStep(features=features, norm_map=norm_map, stats=stats)
+    identity = IdentityProcessorStep()
+    pipeline = DataProcessorPipeline([normalizer, unnormalizer, identity, normalizer]).compile()
+
+    assert len(pipeline._compiled_steps) == 3
+    assert pipeline._compiled_steps[0].steps == [normalizer, unnormalizer]
+    assert pipeline._compiled_steps[1] is identity
+    assert pipeline._compiled_steps[2].steps == [normalizer]
+
+
+def test_compiled_pipeline_falls_back_with_hooks():
+    features = {OBS_STATE: PolicyFeature(FeatureType.STATE, (2,))}
+    norm_map = {FeatureType.STATE: NormalizationMode.MEAN_STD}
+    stats = {OBS_STATE: {"mean": [1.0, 2.0], "std": [2.0, 4.0]}}
+    pipeline = DataProcessorPipeline(
+        [NormalizerProcessorStep(features=features, norm_map=norm_map, stats=stats)],
+        to_transition=identity_transition,
+        to_output=identity_transition,
+    ).compile()
+
+    hook_calls = []
+    pipeline.register_after_step_hook(lambda idx, transition: hook_calls.append(idx))
+    transition = create_transition(observation={OBS_STATE: torch.tensor([3.0, 6.0])})
+    result = pipeline(transition)
+
+    assert hook_calls == [0]
+    torch.testing.assert_close(result[TransitionKey.OBSERVATION][OBS_STATE], torch.tensor([1.0, 1.0]))
+
+
+def test_compiled_pipeline_action_type_validation():
+    features = {ACTION: PolicyFeature(FeatureType.ACTION, (2,))}
+    norm_map = {FeatureType.ACTION: NormalizationMode.MEAN_STD}
+    stats = {ACTION: {"mean": [0.0, 0.0], "std": [1.0, 1.0]}}
+    pipeline = DataProcessorPipeline(
+        [NormalizerProcessorStep(features=features, norm_map=norm_map, stats=stats)],
+        to_transition=identity_transition,
+        to_output=identity_transition,
+    ).compile()
+
+    with pytest.raises(ValueError, match="Action should be a PolicyAction type"):
+        pipeline(create_transition(action={"joint": 1.0}))
+
+
+def test_compiled_pipeline_hotswap_stats():
+    features = {OBS_STATE: PolicyFeature(FeatureType.STATE, (2,))}
+    norm_map = {FeatureType.STATE: NormalizationMode.MEAN_STD}
+    stats = {OBS_STATE: {"mean": [0.0, 0.0], "std": [1.0, 1.0]}}
+    pipeline = DataProcessorPipeline(
+        [NormalizerProcessorStep(features=features, norm_map=norm_map, stats=stats)],
+        to_transition=identity_transition,
+        to_output=identity_transition,
+    ).compile()
+    transition = create_transition(observation={OBS_STATE: torch.tensor([2.0, 4.0])})
+    pipeline(transition)
+
+    new_pipeline = hotswap_stats(pipeline, {OBS_STATE: {"mean": [2.0, 2.0], "std": [1.0, 2.0]}})
+
+    torch.testing.assert_close(
+        new_pipeline(transition)[TransitionKey.OBSERVATION][OBS_STATE], torch.tensor([0.0, 1.0])
+    )
+    torch.testing.assert_close(
+        pipeline(transition)[TransitionKey.OBSERVATION][OBS_STATE], torch.tensor([2.0, 4.0])
+    )
@@ -18,7 +18,9 @@
 Tests for the TokenizerProcessorStep class.
 """
 
+import copy
 import tempfile
+import threading
 from unittest.mock import patch
 
 import pytest
@@ -317,6 +319,7 @@ def test_get_config_with_tokenizer_name(mock_auto_tokenizer):
         "padding_side": "right",
         "padding": "longest",
         "truncation": False,
+        "cache_size": 64,
     }
 
     assert config == expected
@@ -344,6 +347,7 @@ def test_get_config_with_tokenizer_object():
         "padding_side": "right",
         "padding": "longest",
         "truncation": False,
+        "cache_size": 64,
     }
 
     assert config == expected
@@ -1038,3 +1042,153 @@ def test_simulated_accelerate_scenario():
     # MockTokenizer squeezes single-item batches, so shape is (max_length,) not (1, max_length)
     assert tokens.shape == (10,)  # MockTokenizer behavior for single string in list
     assert attention_mask.shape == (10,)
+
+
+@require_package("transformers")
+def test_tokenization_cache():
+    """Test that repeated tasks are served from the cache without calling the tokenizer."""
+    mock_tokenizer = MockTokenizer(vocab_size=100)
+    processor = TokenizerProcessorStep(tokenizer=mock_tokenizer, max_length=10)
+
+    transition = create_transition(
+        observation={"state": torch.tensor([1.0, 2.0])},
+        complementary_data={"task": "pick up the cube"},
+    )
+
+    with patch.object(processor, "_tokenize_text", wraps=processor._tokenize_text) as mock_tokenize:
+        result1 = processor(transition)
+        result2 = processor(transition)
+
+    assert mock_tokenize.call_count == 1
+    tokens1 = result1[TransitionKey.OBSERVATION][f"{OBS_LANGUAGE}.tokens"]
+    tokens2 = result2[TransitionKey.OBSERVATION][f"{OBS_LANGUAGE}.tokens"]
+    assert torch.equal(tokens1, tokens2)
+    assert tokens1.shape == (10,)
+
+    info = processor.cache_info()
+    assert info["hits"] == 1
+    assert info["misses"] == 1
+    assert info["size"] == 1
+    assert info["hit_rate"] == 0.5
+
+    processor.clear_cache()
+    assert processor.cache_info()["size"] == 0
+    assert processor.cache_info()["hits"] == 0
+
+
+@require_package("transformers")
+def test_tokenization_cache_batched_matches_uncached():
+    """Test that batches assembled from cached tasks match the batched tokenizer output."""
+    mock_tokenizer = MockTokenizer(vocab_size=100)
+    cached = TokenizerProcessorStep(tokenizer=mock_tokenizer, max_length=8)
+    uncached = TokenizerProcessorStep(tokenizer=mock_tokenizer, max_length=8, cache_size=0)
+
+    tasks = ["open the drawer", "close the drawer", "open the drawer", "push the button now"]
+    transition = create_transition(
+        observation={"state": torch.randn(4, 2)},
+        complementary_data={"task": tasks},
+    )
+
+    # Warm the cache with one of the tasks only
+    cached(create_transition(observation={}, complementary_data={"task": "open the drawer"}))
+    result_cached = cached(transition)
+    result_uncached = uncached(transition)
+
+    for key in [f"{OBS_LANGUAGE}.tokens", f"{OBS_LANGUAGE}.attention_mask"]:
+        assert result_cached[TransitionKey.OBSERVATION][key].shape == (4, 8)
+        assert torch.equal(
+            result_cached[TransitionKey.OBSERVATION][key], result_uncached[TransitionKey.OBSERVATION][key]
+        )
+    assert result_cached[TransitionKey.OBSERVATION][f"{OBS_LANGUAGE}.attention_mask"].dtype == torch.bool
+
+    # One single-task lookup, then four row lookups of which two were already cached
+    assert cached.cache_info()["misses"] == 3
+    assert cached.cache_info()["hits"] == 2
+    assert uncached.cache_info()["size"] == 0
+
+
+@require_package("transformers")
+def test_tokenization_cache_size_saved():
+    """Test that a non-default cache size survives saving and loading."""
+    mock_tokenizer = MockTokenizer(vocab_size=100)
+    robot_processor = DataProcessorPipeline(
+        [TokenizerProcessorStep(tokenizer=mock_tokenizer, max_length=8, cache_size=3)],
+        to_transition=identity_transition,
+        to_output=identity_transition,
+    )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        robot_processor.save_pretrained(temp_dir)
+        loaded_processor = DataProcessorPipeline.from_pretrained(
+            temp_dir,
+            config_filename="dataprocessorpipeline.json",
+            overrides={"tokenizer_processor": {"tokenizer": mock_tokenizer}},
+            to_transition=identity_transition,
+            to_output=identity_transition,
+        )
+
+    assert loaded_processor.steps[0].cache_size == 3
+
+
+@require_package("transformers")
+def test_tokenization_cache_returns_copies():
+    """Test that modifying the returned tokens in place does not modify the cache."""
+    processor = TokenizerProcessorStep(tokenizer=MockTokenizer(vocab_size=100), max_length=8)
+    transition = create_transition(observation={}, complementary_data={"task": "pick up the cube"})
+
+    tokens = processor(transition)[TransitionKey.OBSERVATION][f"{OBS_LANGUAGE}.tokens"]
+    expected = tokens.clone()
+    tokens.zero_()
+
+    assert torch.equal(processor(transition)[TransitionKey.OBSERVATION][f"{OBS_LANGUAGE}.tokens"], expected)
+
+
+@require_package("transformers")
+def test_tokenization_cache_threads():
+    """Test that the cache can be shared by several threads, and that the processor can be copied."""
+    processor = TokenizerProcessorStep(tokenizer=MockTokenizer(vocab_size=100), max_length=8, cache_size=4)
+    tasks = [f"task {i}" for i in range(8)]
+    expected = {
+        task: TokenizerProcessorStep(tokenizer=MockTokenizer(vocab_size=100), max_length=8, cache_size=0)(
+            create_transition(observation={}, complementary_data={"task": task})
+        )[TransitionKey.OBSERVATION][f"{OBS_LANGUAGE}.tokens"]
+        for task in tasks
+    }
+    errors = []
+
+    def run(offset: int):
+        try:
+            for i in range(200):
+                task = tasks[(i + offset) % len(tasks)]
+                result = processor(create_transition(observation={}, complementary_data={"task": task}))
+                assert torch.equal(
+                    result[TransitionKey.OBSERVATION][f"{OBS_LANGUAGE}.tokens"], expected[task]
+                )
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(offset,)) for offset in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    info = processor.cache_info()
+    assert info["hits"] + info["misses"] == 800
+    assert info["size"] == 4
+    assert copy.deepcopy(processor).cache_info() == info
+
+
+@require_package("transformers")
+def test_tokenization_cache_eviction():
+    """Test that the least recently used tasks are evicted first."""
+    mock_tokenizer = MockTokenizer(vocab_size=100)
+    processor = TokenizerProcessorStep(tokenizer=mock_tokenizer, max_length=4, cache_size=2)
+
+    for task in ["task a", "task b", "task a", "task c"]:
+        processor(create_transition(observation={}, complementary_data={"task": task}))
+
+    cached_tasks = {key[0] for key in processor._cache}
+    assert cached_tasks == {("task a",), ("task c",)}
+    assert processor.cache_info()["size"] == 2
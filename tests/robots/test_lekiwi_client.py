@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import socket
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from lerobot.cameras.opencv.configuration_opencv import OpenCVCameraConfig
+from lerobot.robots.lekiwi.protocol import HEADER, ObservationDecoder, ObservationEncoder
+from lerobot.utils.constants import OBS_STATE
+
+STATE = [float(i) for i in range(9)]
+
+
+def _images() -> dict[str, np.ndarray]:
+    # Smooth images, so that JPEG compression is almost lossless
+    front = np.tile(np.linspace(0, 255, 64, dtype=np.uint8)[None, :, None], (48, 1, 3))
+    wrist = np.full((64, 48, 3), 128, dtype=np.uint8)
+    return {"front": front, "wrist": wrist}
+
+
+@pytest.mark.parametrize("num_workers", [0, 2])
+def test_protocol_round_trip(num_workers):
+    encoder = ObservationEncoder(num_workers=num_workers)
+    decoder = ObservationDecoder(num_workers=num_workers)
+    images = _images()
+
+    frames = encoder.encode(STATE, images)
+    decoded = decoder.decode(frames)
+    second = decoder.decode(encoder.encode(STATE, images))
+
+    assert len(frames) == 1 + 2 * len(images)
+    np.testing.assert_array_equal(decoded.state, np.array(STATE, dtype=np.float32))
+    assert list(decoded.frames) == ["front", "wrist"]
+    for name, image in images.items():
+        assert decoded.frames[name].shape == image.shape
+        assert np.abs(decoded.frames[name].astype(int) - image).mean() < 2
+    assert second.seq == decoded.seq + 1
+    assert second.timestamp >= decoded.timestamp
+    encoder.close()
+    decoder.close()
+
+
+def test_protocol_invalid_messages():
+    decoder = ObservationDecoder()
+    frames = ObservationEncoder().encode(STATE, _images())
+
+    with pytest.raises(ValueError):
+        decoder.decode([])
+    with pytest.raises(ValueError):
+        decoder.decode(frames[:-1])
+    with pytest.raises(ValueError):
+        decoder.decode([b"\x02" + frames[0][1:], *frames[1:]])
+    with pytest.raises(ValueError):
+        decoder.decode([frames[0][: HEADER.size + 4], *frames[1:]])
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.mark.parametrize("protocol", ["binary", "json"])
+def test_host_to_client(protocol):
+    pytest.importorskip("zmq")
+    from lerobot.robots.lekiwi import LeKiwiClient, LeKiwiClientConfig
+    from lerobot.robots.lekiwi.config_lekiwi import LeKiwiHostConfig
+    from lerobot.robots.lekiwi.lekiwi_host import LeKiwiHost
+
+    port_cmd, port_obs = _free_port(), _free_port()
+    host = LeKiwiHost(
+        LeKiwiHostConfig(port_zmq_cmd=port_cmd, port_zmq_observations=port_obs, protocol=protocol)
+    )
+    cameras = {
+        "front": OpenCVCameraConfig(index_or_path=0, fps=30, width=64, height=48),
+        "wrist": OpenCVCameraConfig(index_or_path=1, fps=30, width=48, height=64),
+    }
+    client = LeKiwiClient(
+        LeKiwiClientConfig(
+            remote_ip="127.0.0.1",
+            port_zmq_cmd=port_cmd,
+            port_zmq_observations=port_obs,
+            cameras=cameras,
+            protocol=protocol,
+            polling_timeout_ms=100,
+        )
+    )
+    observation = {**dict(zip(client._state_order, STATE, strict=True)), **_images()}
+
+    stop = threading.Event()
+
+    def stream():
+        while not stop.is_set():
+            host.send_observation(observation, ["front", "wrist"])
+            time.sleep(0.01)
+
+    streamer = threading.Thread(target=stream, daemon=True)
+    streamer.start()
+    try:
+        client.connect()
+        obs = client.get_observation()
+    finally:
+        stop.set()
+        streamer.join()
+
+    np.testing.assert_array_equal(obs[OBS_STATE], np.array(STATE, dtype=np.float32))
+    assert obs["arm_gripper.pos"] == STATE[5]
+    assert obs["front"].shape == (48, 64, 3)
+    assert obs["wrist"].shape == (64, 48, 3)
+    if protocol == "binary":
+        assert client.last_remote_timestamp is not None
+
+    client.disconnect()
+    host.disconnect()
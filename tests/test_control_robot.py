@@ -121,3 +121,30 @@ def test_record_and_replay(tmp_path):
         mock_get_safe_version.return_value = "v3.0"
         mock_snapshot_download.return_value = str(tmp_path / "record_and_replay")
         replay(replay_cfg)
+
+
+def test_record_pipelined(tmp_path):
+    robot_cfg = MockRobotConfig()
+    teleop_cfg = MockTeleopConfig()
+    dataset_cfg = DatasetRecordConfig(
+        repo_id=DUMMY_REPO_ID,
+        single_task="Dummy task",
+        root=tmp_path / "record_pipelined",
+        num_episodes=1,
+        episode_time_s=0.5,
+        reset_time_s=0,
+        push_to_hub=False,
+    )
+    cfg = RecordConfig(
+        robot=robot_cfg,
+        dataset=dataset_cfg,
+        teleop=teleop_cfg,
+        play_sounds=False,
+        pipelined=True,
+    )
+
+    dataset = record(cfg)
+
+    assert dataset.meta.total_episodes == 1
+    # About one frame per tick of 1/30s
+    assert 10 <= dataset.meta.total_frames <= 16
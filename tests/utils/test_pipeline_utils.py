@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import queue
+import threading
+import time
+
+import pytest
+
+from lerobot.utils.pipeline_utils import STOP, PipelineStats, StageTimer, StageWorker, put_latest
+
+
+def test_put_latest_drops_oldest():
+    q = queue.Queue(maxsize=2)
+    assert not put_latest(q, 1)
+    assert not put_latest(q, 2)
+    assert put_latest(q, 3)
+
+    assert [q.get_nowait(), q.get_nowait()] == [2, 3]
+
+
+def test_stage_timer():
+    timer = StageTimer("stage", deadline_s=0.01)
+    for duration_s in [0.001, 0.002, 0.003, 0.02]:
+        timer.record(duration_s)
+    with timer.time():
+        time.sleep(0.001)
+
+    stats = timer.stats()
+    assert stats.name == "stage"
+    assert stats.count == 5
+    assert stats.deadline_misses == 1
+    assert stats.max_ms == pytest.approx(20.0)
+    assert 2.0 <= stats.p50_ms <= 3.0
+
+
+def test_stage_timer_empty():
+    stats = StageTimer("stage").stats()
+    assert stats.count == 0
+    assert stats.deadline_misses == 0
+
+
+def test_stage_worker_processes_until_stop():
+    inbox, outbox = queue.Queue(), queue.Queue()
+    timer = StageTimer("double")
+    worker = StageWorker(
+        "double",
+        lambda x: outbox.put(2 * x),
+        inbox,
+        threading.Event(),
+        timer,
+        on_stop=lambda: outbox.put(STOP),
+    )
+    worker.start()
+    for i in range(5):
+        inbox.put(i)
+    inbox.put(STOP)
+    worker.join(timeout=1)
+
+    assert not worker.is_alive()
+    assert [outbox.get_nowait() for _ in range(5)] == [0, 2, 4, 6, 8]
+    assert outbox.get_nowait() is STOP
+    assert timer.stats().count == 5
+
+
+def test_stage_worker_error_aborts():
+    abort = threading.Event()
+    inbox = queue.Queue()
+
+    def fail(_):
+        raise ValueError("stage failure")
+
+    worker = StageWorker("fail", fail, inbox, abort)
+    worker.start()
+    inbox.put(0)
+    worker.join(timeout=1)
+
+    assert abort.is_set()
+    assert isinstance(worker.error, ValueError)
+
+
+def test_pipeline_stats_format():
+    timer = StageTimer("observation", deadline_s=0.01)
+    timer.record(0.005)
+    stats = PipelineStats(
+        stages={"observation": timer.stats()},
+        end_to_end=StageTimer("end_to_end").stats(),
+        ticks=1,
+        overruns=0,
+        counters={"dropped_observations": 0},
+    )
+
+    text = stats.format()
+    assert "observation" in text
+    assert "dropped_observations=0" in text
@@ -679,3 +679,63 @@ def test_async_iterator_multiple_iterations():
 
     # Ensure iterator can be disposed without blocking
     del iterator
+
+
+class CountingEncoder:
+    """Stand-in for a frozen image encoder, pooling each image into a 4x4 feature map."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, images: dict[str, torch.Tensor]) -> dict[str, torch.Tensor]:
+        self.calls += 1
+        return {key: torch.nn.functional.avg_pool2d(image, 21) for key, image in images.items()}
+
+
+@pytest.mark.parametrize("optimize_memory", [False, True])
+def test_cached_image_features(optimize_memory):
+    encoder = CountingEncoder()
+    buffer = ReplayBuffer(
+        10,
+        "cpu",
+        state_dims(),
+        use_drq=True,
+        optimize_memory=optimize_memory,
+        feature_encoder=encoder,
+        feature_dtype=torch.float16,
+    )
+    states = [create_dummy_state() for _ in range(4)]
+    for i in range(3):
+        buffer.add(states[i], torch.randn(4), 1.0, states[i + 1], False, False)
+
+    # Images are encoded once per transition, and only their features are stored
+    assert encoder.calls == (3 if optimize_memory else 6)
+    assert OBS_IMAGE not in buffer.states
+    assert buffer.features[OBS_IMAGE].shape == (10, 3, 4, 4)
+    assert buffer.features[OBS_IMAGE].dtype == torch.float16
+
+    batch = buffer.sample(8)
+    calls = encoder.calls
+    assert OBS_IMAGE not in batch["state"]
+    assert batch["observation_feature"][OBS_IMAGE].shape == (3, 3, 4, 4)
+    assert batch["observation_feature"][OBS_IMAGE].dtype == torch.float32
+    assert batch["next_observation_feature"][OBS_IMAGE].shape == (3, 3, 4, 4)
+    assert encoder.calls == calls
+
+    # Features of a state and of the next state stay aligned with the rest of the transition
+    expected = {tuple(s[OBS_STATE].tolist()): encoder({OBS_IMAGE: s[OBS_IMAGE]})[OBS_IMAGE] for s in states}
+    next_expected = {
+        tuple(states[i][OBS_STATE].tolist()): expected[tuple(states[i + 1][OBS_STATE].tolist())]
+        for i in range(3)
+    }
+    for i in range(len(batch["action"])):
+        key = tuple(batch["state"][OBS_STATE][i].tolist())
+        torch.testing.assert_close(
+            batch["observation_feature"][OBS_IMAGE][i], expected[key], atol=1e-3, rtol=0
+        )
+        torch.testing.assert_close(
+            batch["next_observation_feature"][OBS_IMAGE][i], next_expected[key], atol=1e-3, rtol=0
+        )
+
+    with pytest.raises(ValueError, match="image features"):
+        buffer.to_lerobot_dataset(DUMMY_REPO_ID)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+import pytest
+
+from lerobot.utils.robot_utils import OverrunPolicy, RateScheduler, busy_wait, sleep_until
+
+
+def test_sleep_until():
+    deadline = time.perf_counter() + 0.02
+    sleep_until(deadline)
+    assert deadline <= time.perf_counter() < deadline + 0.01
+
+
+def test_busy_wait_negative():
+    start = time.perf_counter()
+    busy_wait(-1.0)
+    assert time.perf_counter() - start < 0.01
+
+
+def test_scheduler_does_not_drift():
+    fps = 100
+    scheduler = RateScheduler(fps)
+    start = time.perf_counter()
+    for _ in range(50):
+        # Iterations of varying duration, all within the period
+        time.sleep(0.002)
+        scheduler.wait()
+
+    # Sleep overshoots do not accumulate over the iterations
+    assert time.perf_counter() - start == pytest.approx(50 / fps, abs=0.01)
+    stats = scheduler.stats()
+    assert stats.ticks == 50
+    assert stats.overruns == 0
+    assert sum(stats.histogram.values()) == 50
+
+
+def test_scheduler_skip_overrun():
+    scheduler = RateScheduler(100, overrun_policy="skip")
+    start = scheduler._start
+    time.sleep(0.035)
+    scheduler.wait()
+
+    stats = scheduler.stats()
+    assert stats.overruns == 1
+    assert stats.skipped_ticks == 3
+    # The loop resumes on the schedule grid
+    assert scheduler.next_deadline == pytest.approx(start + 0.05)
+    assert time.perf_counter() - start == pytest.approx(0.04, abs=0.005)
+
+
+def test_scheduler_catch_up_overrun():
+    scheduler = RateScheduler(100, overrun_policy=OverrunPolicy.CATCH_UP)
+    time.sleep(0.035)
+    start = time.perf_counter()
+    lateness = [scheduler.wait() for _ in range(3)]
+
+    # The late iterations run back to back until the schedule is caught up
+    assert time.perf_counter() - start < 0.005
+    assert lateness[0] > lateness[1] > lateness[2] > 0
+    stats = scheduler.stats()
+    assert stats.overruns == 3
+    assert stats.skipped_ticks == 0
+
+
+def test_scheduler_reset():
+    scheduler = RateScheduler(100)
+    time.sleep(0.02)
+    scheduler.wait()
+    scheduler.reset()
+
+    assert scheduler.stats().ticks == 0
+    assert 0 < scheduler.time_left() <= 0.01
+
+
+def test_scheduler_invalid_fps():
+    with pytest.raises(ValueError):
+        RateScheduler(0)
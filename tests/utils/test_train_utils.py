@@ -17,21 +17,29 @@
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import pytest
+import torch
+from huggingface_hub.constants import SAFETENSORS_INDEX_FILE, SAFETENSORS_SINGLE_FILE
+from safetensors.torch import load_file
+
 from lerobot.utils.constants import (
     CHECKPOINTS_DIR,
     LAST_CHECKPOINT_LINK,
     OPTIMIZER_PARAM_GROUPS,
     OPTIMIZER_STATE,
+    PRETRAINED_MODEL_DIR,
     RNG_STATE,
     SCHEDULER_STATE,
     TRAINING_STATE_DIR,
     TRAINING_STEP,
 )
 from lerobot.utils.train_utils import (
+    AsyncCheckpointWriter,
     get_step_checkpoint_dir,
     get_step_identifier,
     load_training_state,
     load_training_step,
+    prune_checkpoints,
     save_checkpoint,
     save_training_state,
     save_training_step,
@@ -98,3 +106,65 @@ def test_save_load_training_state(tmp_path, optimizer, scheduler):
     assert loaded_step == 10
     assert loaded_optimizer is optimizer
     assert loaded_scheduler is scheduler
+
+
+def test_prune_checkpoints(tmp_path):
+    for step in [5, 10, 15, 20]:
+        (tmp_path / f"{step:06d}").mkdir()
+    update_last_checkpoint(tmp_path / "000020")
+    removed = prune_checkpoints(tmp_path, keep_last_n=2)
+    assert removed == [tmp_path / "000005", tmp_path / "000010"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["000015", "000020", LAST_CHECKPOINT_LINK]
+
+
+def test_prune_checkpoints_invalid(tmp_path):
+    with pytest.raises(ValueError):
+        prune_checkpoints(tmp_path, keep_last_n=0)
+
+
+def test_async_checkpoint_writer(tmp_path, optimizer, scheduler):
+    policy = torch.nn.Linear(4, 2)
+    policy.config = Mock()
+    cfg = Mock()
+    on_complete = Mock()
+    checkpoints_dir = tmp_path / CHECKPOINTS_DIR
+    writer = AsyncCheckpointWriter(keep_last_n=2)
+    for step in [10, 20, 30]:
+        checkpoint_dir = get_step_checkpoint_dir(tmp_path, 30, step)
+        future = writer.save(checkpoint_dir, step, cfg, policy, optimizer, scheduler, on_complete=on_complete)
+        expected_weight = policy.weight.detach().clone()
+        # Modifying the policy after `save` returns must not affect the checkpoint being written
+        with torch.no_grad():
+            policy.weight.add_(1.0)
+        assert future.result() == checkpoint_dir
+        state_dict = load_file(checkpoint_dir / PRETRAINED_MODEL_DIR / SAFETENSORS_SINGLE_FILE)
+        assert torch.equal(state_dict["weight"], expected_weight)
+    writer.close()
+
+    assert sorted(p.name for p in checkpoints_dir.iterdir()) == ["000020", "000030", LAST_CHECKPOINT_LINK]
+    assert (checkpoints_dir / LAST_CHECKPOINT_LINK).resolve() == checkpoints_dir / "000030"
+    assert on_complete.call_count == 3
+    assert policy.config._save_pretrained.call_count == 3
+    assert cfg.save_pretrained.call_count == 3
+
+    loaded_step, _, _ = load_training_state(checkpoints_dir / "000030", optimizer, scheduler)
+    assert loaded_step == 30
+    assert (checkpoints_dir / "000030" / TRAINING_STATE_DIR / OPTIMIZER_PARAM_GROUPS).is_file()
+    assert (checkpoints_dir / "000030" / TRAINING_STATE_DIR / SCHEDULER_STATE).is_file()
+
+
+def test_async_checkpoint_writer_sharded(tmp_path, optimizer):
+    policy = torch.nn.Sequential(torch.nn.Linear(16, 16), torch.nn.Linear(16, 16))
+    policy.config = Mock()
+    checkpoint_dir = tmp_path / "000001"
+    writer = AsyncCheckpointWriter(max_shard_size=16 * 16 * 4 + 64)
+    writer.save(checkpoint_dir, 1, Mock(), policy, optimizer)
+    writer.close()
+
+    pretrained_dir = checkpoint_dir / PRETRAINED_MODEL_DIR
+    assert not (pretrained_dir / SAFETENSORS_SINGLE_FILE).exists()
+    assert (pretrained_dir / SAFETENSORS_INDEX_FILE).is_file()
+    state_dict = {}
+    for shard_file in pretrained_dir.glob("model-*.safetensors"):
+        state_dict.update(load_file(shard_file))
+    assert state_dict.keys() == policy.state_dict().keys()
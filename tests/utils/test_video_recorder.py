@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import av
+import numpy as np
+import pytest
+
+from lerobot.utils.video_recorder import StreamingVideoRecorder
+
+
+def _decode(video_path) -> list[np.ndarray]:
+    with av.open(str(video_path)) as container:
+        return [frame.to_ndarray(format="rgb24") for frame in container.decode(video=0)]
+
+
+def test_interleaved_videos(tmp_path):
+    n_videos, n_frames = 3, 20
+    with StreamingVideoRecorder(num_workers=2, max_queued_frames=4) as recorder:
+        videos = [recorder.open(tmp_path / f"video_{i}.mp4", fps=10) for i in range(n_videos)]
+        for t in range(n_frames):
+            for i, video in enumerate(videos):
+                recorder.add_frame(video, np.full((33, 47, 3), 10 * i + t, dtype=np.uint8))
+        for video in videos:
+            recorder.close_video(video)
+
+    for i in range(n_videos):
+        frames = _decode(tmp_path / f"video_{i}.mp4")
+        assert len(frames) == n_frames
+        # Odd dimensions are cropped for yuv420p
+        assert frames[0].shape == (32, 46, 3)
+        # The frames are encoded in order
+        means = [frame.mean() for frame in frames]
+        np.testing.assert_allclose(means, [10 * i + t for t in range(n_frames)], atol=2)
+
+    stats = recorder.stats()
+    assert stats.videos == n_videos
+    assert stats.frames == n_videos * n_frames
+    assert stats.encode_ms_per_frame > 0
+
+
+def test_close_finishes_open_videos(tmp_path):
+    recorder = StreamingVideoRecorder(num_workers=1)
+    video = recorder.open(tmp_path / "video.mp4", fps=30)
+    for _ in range(5):
+        recorder.add_frame(video, np.zeros((16, 16, 3), dtype=np.uint8))
+    recorder.close()
+    recorder.close()
+
+    assert len(_decode(tmp_path / "video.mp4")) == 5
+
+
+# The errors of the workers must be reported by `close`, not raised in the worker threads
+@pytest.mark.filterwarnings("error::pytest.PytestUnhandledThreadExceptionWarning")
+def test_encoding_error(tmp_path):
+    recorder = StreamingVideoRecorder(num_workers=1, vcodec="not_a_codec")
+    for video in range(2):
+        recorder.open(tmp_path / f"video_{video}.mp4", fps=30)
+        recorder.add_frame(video, np.zeros((16, 16, 3), dtype=np.uint8))
+    with pytest.raises(RuntimeError, match="Video encoding failed"):
+        recorder.close()